@@ -1,111 +1,13 @@
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def footer():
     # Add brand fonts and icon protection
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Ensure footer styling takes precedence */
-        footer {
-            background-color: #1f2937 !important;
-            color: white !important;
-        }
-
-        /* Typography classes */
-        .heading-1 { font-size: 3rem; font-weight: 700; line-height: 1.1; }
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .sub-heading { font-size: 1.5rem; font-weight: 500; line-height: 1.4; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .button-label { font-size: 0.875rem; font-weight: 600; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-light-mist { background-color: #F2F7FB; }
-        .brand-primary-bg { background-color: #0055B8; }
-        
-        /* Footer Responsive Styles */
-        footer {
-            min-height: 64px;
-            height: auto !important;
-        }
-        
-        .footer-links {
-            display: flex;
-            gap: 1rem;
-        }
-        
-        .footer-social {
-            display: flex;
-            gap: 1rem;
-        }
-        
-        .footer-copyright {
-            display: block;
-        }
-        
-        /* Mobile Responsive */
-        @media (max-width: 768px) {
-            footer {
-                flex-direction: column !important;
-                padding: 1.5rem 1rem !important;
-                gap: 1rem !important;
-                text-align: center;
-            }
-            
-            .footer-links {
-                flex-direction: column;
-                gap: 0.5rem;
-            }
-            
-            .footer-copyright {
-                font-size: 0.75rem !important;
-                order: 3;
-            }
-            
-            .footer-social {
-                order: 2;
-                justify-content: center;
-            }
-        }
-        
-        @media (max-width: 480px) {
-            footer {
-                padding: 1rem 0.75rem !important;
-            }
-            
-            .footer-links {
-                font-size: 0.75rem !important;
-            }
-        }
-    </style>
     ''')
+    stylesheet('components/footer')
     with ui.element('footer').classes('flex items-center justify-between w-full px-4 text-white').style('background-color: #1f2937 !important; color: white !important; min-height: 64px; padding: 1rem;'):
         # Logo section
         with ui.row().classes('items-center gap-3'):
@@ -1,5 +1,6 @@
 from nicegui import ui
 from app.services.auth_utils import is_authenticated, get_current_user, logout
+from app.services.static_assets import stylesheet
 
 
 def _allow_all_html(*args):
@@ -17,361 +18,11 @@ def _build_resources_html(current_page: str, links: list[dict]) -> str:
 
 def add_global_styles():
     """Add global styles - call this once per page that needs it"""
-    ui.add_head_html('<script src="https://cdn.tailwindcss.com"></script>')
     ui.add_head_html(r'''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Ensure header styling takes precedence */
-        header {
-            background-color: rgba(255, 255, 255, 0.95) !important;
-            backdrop-filter: blur(8px) !important;
-            border-bottom: 1px solid #e5e7eb !important;
-            position: fixed !important;
-            top: 0 !important;
-            left: 0 !important;
-            right: 0 !important;
-            z-index: 1000 !important;
-            height: 64px !important;
-        }
-
-        /* Button styling protection - Brand Guidelines */
-        .q-btn, button {
-            font-family: 'Raleway', sans-serif !important;
-            font-weight: 600 !important;
-            border-radius: 8px !important;
-            padding: 10px 20px !important;
-            transition: all 0.2s ease !important;
-        }
-        
-        .q-btn:hover, button:hover {
-            transform: translateY(-1px);
-            box-shadow: 0 4px 8px rgba(0, 85, 184, 0.2);
-        }
-
-        /* Primary button styles - Brand Guidelines */
-        .brand-primary-btn {
-            background-color: #0055B8 !important;
-            color: white !important;
-            border: none !important;
-        }
-        
-        .brand-primary-btn:hover {
-            background-color: #004494 !important;
-            opacity: 0.9 !important;
-        }
-        
-        .brand-secondary-btn {
-            background-color: white !important;
-            color: #0055B8 !important;
-            border: 2px solid #0055B8 !important;
-        }
-        
-        .brand-secondary-btn:hover {
-            background-color: #F2F7FB !important;
-        }
-
-        /* Secondary button styles */
-        .bg-gray-200 {
-            background-color: #f3f4f6 !important;
-            color: #1f2937 !important;
-        }
-
-        .bg-gray-200:hover, .hover\:bg-gray-300:hover {
-            background-color: #e5e7eb !important;
-        }
-
-        /* Danger button styles */
-        .bg-red-600 {
-            background-color: #dc2626 !important;
-            color: white !important;
-        }
-
-        .bg-red-600:hover, .hover\:bg-red-700:hover {
-            background-color: #b91c1c !important;
-        }
-
-        /* Ensure header is always visible */
-        header {
-            display: flex !important;
-            visibility: visible !important;
-            opacity: 1 !important;
-        }
-        
-        .nicegui-content,
-        .nicegui-column {
-            display: block !important;
-            flex-direction: unset !important;
-            align-items: unset !important;
-            gap: 0 !important;
-            padding: 0 !important;
-        }
-
-        /* Typography classes */
-        .heading-1 { font-size: 3rem; font-weight: 700; line-height: 1.1; }
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .sub-heading { font-size: 1.5rem; font-weight: 500; line-height: 1.4; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .button-label { font-size: 0.875rem; font-weight: 600; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-light-mist { background-color: #F2F7FB; }
-        .brand-primary-bg { background-color: #0055B8; }
-
-        /* Content spacing to prevent overlap with fixed header */
-        .main-content {
-            margin-top: 4rem !important; /* 64px to match header height */
-            padding-top: 1rem !important;
-        }
-
-        /* Ensure all page containers have proper spacing */
-        .q-page, .page-container, .nicegui-content > div:first-child {
-            margin-top: 4rem !important;
-        }
-
-        /* Override any conflicting padding/margin on main content areas */
-        .nicegui-content .q-page-container,
-        .nicegui-content > .q-column,
-        .nicegui-content > div.flex.flex-col {
-            padding-top: 4rem !important;
-        }
-
-        /* Fix header overlap issue - increase pt-20 to account for fixed header */
-        .pt-20 {
-            padding-top: 4.375rem !important; /* 70px - 64px header + 6px spacing */
-        }
-
-        /* Desktop navigation visibility */
-        @media (min-width: 1024px) {
-            .lg\:\!flex {
-                display: flex !important;
-            }
-        }
-        
-        /* Mobile responsive styles */
-        @media (max-width: 1023px) {
-            header {
-                padding: 0 1rem !important;
-            }
-            
-            .logo-text {
-                font-size: 1.125rem !important;
-            }
-        }
-        
-        @media (max-width: 640px) {
-            header {
-                padding: 0 0.75rem !important;
-            }
-            
-            .logo-text {
-                font-size: 1rem !important;
-            }
-            
-            .logo-icon {
-                font-size: 1.5rem !important;
-            }
-        }
-
-        /* Mobile drawer styles */
-        .q-drawer {
-            background: white !important;
-            z-index: 10000 !important;
-        }
-        
-        .q-drawer--right {
-            right: 0 !important;
-        }
-        
-        .q-drawer__backdrop {
-            z-index: 9999 !important;
-        }
-        
-        /* Menu styles */
-        .q-menu {
-            background: white !important;
-            border: 1px solid #e5e7eb !important;
-            border-radius: 8px !important;
-            box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05) !important;
-            padding: 8px 0 !important;
-            min-width: 200px !important;
-        }
-
-        .q-item {
-            padding: 12px 16px !important;
-            color: #374151 !important;
-            font-family: 'Raleway', sans-serif !important;
-            font-weight: 400 !important;
-            transition: background-color 0.2s ease !important;
-            cursor: pointer !important;
-        }
-
-        .q-item:hover {
-            background-color: #f3f4f6 !important;
-            color: #0055B8 !important;
-        }
-
-        /* Hover dropdown styles */
-        .dropdown-hover {
-            position: relative;
-        }
-
-        .dropdown-hover .dropdown-content {
-            display: none;
-            position: absolute;
-            top: 100%;
-            left: 0;
-            background: white;
-            border: 1px solid #e5e7eb;
-            border-radius: 8px;
-            box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05);
-            padding: 8px 0;
-            min-width: 200px;
-            z-index: 1000;
-        }
-
-        .dropdown-hover:hover .dropdown-content {
-            display: block;
-        }
-
-        .dropdown-content a {
-            display: block;
-            padding: 12px 16px;
-            color: #374151;
-            text-decoration: none;
-            font-family: 'Raleway', sans-serif;
-            font-weight: 400;
-            transition: background-color 0.2s ease;
-        }
-
-        .dropdown-content a:hover {
-            background-color: #f3f4f6;
-            color: #0055B8;
-        }
-
-        /* Navigation button styles */
-        .nav-dropdown-btn {
-            background: transparent !important;
-            border: none !important;
-            color: #334155 !important; /* slate-700 */
-            font-weight: 600 !important;
-            font-family: 'Raleway', sans-serif !important;
-            padding: 8px 12px !important;
-            border-radius: 6px !important;
-            transition: all 0.2s ease !important;
-        }
-
-        .nav-dropdown-btn:hover {
-            color: #0f172a !important; /* slate-900 */
-            background-color: #f8fafb !important;
-        }
-
-        .dropdown-toggle {
-            display: flex !important;
-            align-items: center !important;
-            gap: 4px !important;
-            color: #4b5563 !important;
-            font-weight: 500 !important;
-            cursor: pointer !important;
-            padding: 8px 12px !important;
-            border-radius: 6px !important;
-            transition: all 0.2s ease !important;
-            background: transparent !important;
-            border: none !important;
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        .dropdown-toggle:hover {
-            color: #1f2937 !important;
-            background-color: #f9fafb !important;
-        }
-
-        /* Ensure dropdown menus are always visible */
-        .q-btn-dropdown {
-            background: transparent !important;
-            border: none !important;
-            box-shadow: none !important;
-        }
-
-        /* Active navigation states */
-        /* Top-level link styles */
-        .top-nav-link {
-            color: #334155 !important;
-            font-weight: 600 !important;
-            padding: 6px 10px !important;
-            border-radius: 6px !important;
-            text-decoration: none !important;
-            transition: color .2s ease, background .2s ease !important;
-        }
-
-        .top-nav-link:hover {
-            color: #0f172a !important;
-            background: #f8fafb !important;
-        }
-
-        .nav-active {
-            color: #0055B8 !important;
-            font-weight: 700 !important;
-            position: relative;
-        }
-
-        .nav-active::after {
-            content: '';
-            position: absolute;
-            bottom: -8px;
-            left: 0;
-            right: 0;
-            height: 3px;
-            background-color: #0055B8;
-            border-radius: 2px;
-        }
-
-        .dropdown-active {
-            color: #0055B8 !important;
-            font-weight: 600 !important;
-        }
-
-        .dropdown-active .dropdown-icon {
-            color: #0055B8 !important;
-        }
-
-        /* Active dropdown content item */
-        .dropdown-content a.active {
-            background-color: #f0f8ff !important;
-            color: #0055B8 !important;
-            font-weight: 500 !important;
-            border-left: 3px solid #0055B8;
-            padding-left: 13px !important;
-        }
-    </style>
     ''')
+    stylesheet('components/header')
 
 def header(current_page: str = ''):
     add_global_styles()
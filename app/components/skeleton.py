@@ -0,0 +1,15 @@
+from nicegui import ui
+
+
+def section_skeleton(lines: int = 3, height: str = '16px'):
+    """Placeholder bars shown while a dashboard section is still loading."""
+    with ui.column().classes('w-full gap-3'):
+        for i in range(lines):
+            # Vary widths so the placeholder reads as text, not a table
+            width = '100%' if i % 3 == 0 else '80%' if i % 3 == 1 else '60%'
+            ui.skeleton().style(f'width: {width}; height: {height}; border-radius: 6px;')
+
+
+def avatar_skeleton(size: str = '56px'):
+    """Circular placeholder for a profile picture."""
+    ui.skeleton('QAvatar').style(f'width: {size}; height: {size};')
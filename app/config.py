@@ -1 +1,97 @@
-API_BASE_URL = "https://dompell-server.onrender.com/api"
\ No newline at end of file
+import os
+
+# Point at a local stand-in (python stub_backend.py) with
+# API_BASE_URL=http://127.0.0.1:8900/api for load tests
+API_BASE_URL = os.getenv("API_BASE_URL", "https://dompell-server.onrender.com/api")
+
+# Credential for backend calls made on no user's behalf (warm-up prefetches,
+# background index crawls); anonymous when empty. Never a user's session token.
+API_SERVICE_TOKEN = os.getenv("API_SERVICE_TOKEN", "")
+
+# Backend connection pools, per server process
+API_POOL_MAX_CONNECTIONS = int(os.getenv("API_POOL_MAX_CONNECTIONS", "100"))
+API_POOL_MAX_KEEPALIVE = int(os.getenv("API_POOL_MAX_KEEPALIVE", "20"))
+API_SYNC_POOL_MAXSIZE = int(os.getenv("API_SYNC_POOL_MAXSIZE", "50"))
+
+# Backend traffic cassettes (see app.services.api_cassette): "record" appends
+# every backend response to API_CASSETTE_PATH, "replay" answers from it with
+# the recorded latency times API_CASSETTE_TIME_SCALE; off when empty
+API_CASSETTE_MODE = os.getenv("API_CASSETTE_MODE", "")
+API_CASSETTE_PATH = os.getenv("API_CASSETTE_PATH", ".cache/api_cassette.jsonl.gz")
+API_CASSETTE_TIME_SCALE = float(os.getenv("API_CASSETTE_TIME_SCALE", "1"))
+
+# Circuit breaker per backend endpoint group (see app.services.circuit_breaker):
+# opens after API_BREAKER_FAILURES failed or slow (API_BREAKER_SLOW_SECONDS)
+# requests in a row and probes again after API_BREAKER_OPEN_SECONDS, doubling
+# up to API_BREAKER_MAX_OPEN_SECONDS. Meanwhile cached GETs that expired less
+# than API_STALE_MAX_AGE seconds ago are served, marked stale.
+API_BREAKER_FAILURES = int(os.getenv("API_BREAKER_FAILURES", "5"))
+API_BREAKER_SLOW_SECONDS = float(os.getenv("API_BREAKER_SLOW_SECONDS", "8"))
+API_BREAKER_OPEN_SECONDS = float(os.getenv("API_BREAKER_OPEN_SECONDS", "15"))
+API_BREAKER_MAX_OPEN_SECONDS = float(os.getenv("API_BREAKER_MAX_OPEN_SECONDS", "120"))
+API_STALE_MAX_AGE = float(os.getenv("API_STALE_MAX_AGE", "3600"))
+
+# Renew a session's access token this many seconds before its JWT expires
+# (see app.services.token_manager)
+TOKEN_RENEW_MARGIN = float(os.getenv("TOKEN_RENEW_MARGIN", "60"))
+
+# Startup warm-up (see app.services.warmup): ping the backend for up to
+# WARMUP_TIMEOUT seconds, open WARMUP_CONNECTIONS connections in the requests
+# pool (the httpx client multiplexes HTTP/2 over one connection) and prefetch
+# the top-level shared lists; then ping every WARMUP_INTERVAL seconds and
+# prefetch again every WARMUP_PREFETCH_INTERVAL seconds (below the cache TTLs
+# of those lists in app.services.response_cache)
+WARMUP = os.getenv("WARMUP", "1") == "1"
+WARMUP_CONNECTIONS = int(os.getenv("WARMUP_CONNECTIONS", "4"))
+WARMUP_TIMEOUT = float(os.getenv("WARMUP_TIMEOUT", "90"))
+WARMUP_INTERVAL = float(os.getenv("WARMUP_INTERVAL", "25"))
+WARMUP_PREFETCH_INTERVAL = float(os.getenv("WARMUP_PREFETCH_INTERVAL", "240"))
+
+# Server process: `python main.py` is one development server with the
+# reloader; `python serve.py` runs WORKERS of them on WORKER_BASE_PORT,
+# WORKER_BASE_PORT + 1, ... behind a sticky proxy (see serve.py). The
+# development server binds HOST, every interface by default (containers,
+# LAN); the workers bind WORKER_HOST, loopback by default, so only the proxy
+# reaches them.
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", "8001"))
+RELOAD = os.getenv("RELOAD", "1") == "1"
+WORKERS = int(os.getenv("WORKERS", str(os.cpu_count() or 1)))
+WORKER_BASE_PORT = int(os.getenv("WORKER_BASE_PORT", "8101"))
+WORKER_HOST = os.getenv("WORKER_HOST", "127.0.0.1")
+# Seconds a stopping worker waits for open requests and connections
+GRACEFUL_TIMEOUT = float(os.getenv("GRACEFUL_TIMEOUT", "30"))
+
+# Import page modules in the background after startup (PRELOAD_PAGES=1)
+# so the first visit to each page skips the import
+PRELOAD_PAGES = os.getenv("PRELOAD_PAGES", "0") == "1"
+PRELOAD_DELAY = float(os.getenv("PRELOAD_DELAY", "2"))
+
+# Saved site search documents (see app.services.search_index)
+SEARCH_INDEX_PATH = os.getenv("SEARCH_INDEX_PATH", ".cache/search_index.json.gz")
+
+# SQLite database of job postings (see app.services.job_store)
+JOB_STORE_PATH = os.getenv("JOB_STORE_PATH", "data/jobs.db")
+
+# Session storage (app.storage.user/general): "sqlite" keeps it in one
+# SQLite database with coalesced per-key writes (see app.services.session_store),
+# "file" keeps NiceGUI's one-JSON-file-per-user default
+SESSION_STORE = os.getenv("SESSION_STORE", "sqlite")
+SESSION_STORE_PATH = os.getenv("SESSION_STORE_PATH", "data/sessions.db")
+SESSION_WRITE_DELAY = float(os.getenv("SESSION_WRITE_DELAY", "1"))
+SESSION_MAX_AGE = float(os.getenv("SESSION_MAX_AGE", str(30 * 24 * 3600)))
+
+# Logging (see app.services.log): default level, per-tag overrides such as
+# "API_SERVICE=DEBUG,DASHBOARD=WARNING", and records per message per second
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+LOG_SAMPLE_BURST = int(os.getenv("LOG_SAMPLE_BURST", "20"))
+
+# Page build profiling (see app.services.page_profiler): off by default;
+# budgets per build in ms and elements, overridable per route in PAGE_BUDGETS
+# ("/candidates/dashboard=1500:4000,/jobs=300:800")
+PAGE_PROFILE = os.getenv("PAGE_PROFILE", "0") == "1"
+PAGE_BUDGET_MS = float(os.getenv("PAGE_BUDGET_MS", "500"))
+PAGE_BUDGET_ELEMENTS = int(os.getenv("PAGE_BUDGET_ELEMENTS", "2000"))
+PAGE_BUDGETS = os.getenv("PAGE_BUDGETS", "")
+PAGE_PROFILE_REPORT = os.getenv("PAGE_PROFILE_REPORT", ".cache/page_profile.json")
@@ -3,50 +3,15 @@ Admin User Management page for Dompell Africa, modernized with brand guidelines.
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def admin_management_page():
     """Creates the admin user management page with a modern, brand-aligned layout."""
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-        <style>
-            /* Brand Typography & Colors */
-            body { font-family: 'Raleway', sans-serif !important; background: #F2F7FB !important; color: #1A1A1A !important; }
-            .heading-1 { font-size: 56px; font-weight: 700; color: #1A1A1A; }
-            .heading-2 { font-size: 40px; font-weight: 600; color: #1A1A1A; }
-            .heading-3 { font-size: 32px; font-weight: 500; color: #1A1A1A; }
-            .sub-heading { font-size: 24px; font-weight: 600; color: #1A1A1A; }
-            .sub-heading-2 { font-size: 18px; font-weight: 600; color: #1A1A1A; }
-            .body-text { font-size: 16px; font-weight: 400; color: #1A1A1A; }
-            .button-label { font-size: 14px; font-weight: 600; }
-            .form-placeholder { font-size: 14px; font-weight: 500; color: #4D4D4D; }
-            .caption { font-size: 12px; font-weight: 400; color: #4D4D4D; }
-            .brand-primary { color: #0055B8 !important; }
-            .brand-primary-bg { background-color: #0055B8 !important; }
-            .brand-charcoal { color: #1A1A1A !important; }
-            .brand-slate { color: #4D4D4D !important; }
-            .brand-light-mist-bg { background-color: #F2F7FB !important; }
-            .q-btn:not([class*="outline"]) { background-color: #0055B8 !important; color: white !important; }
-            .q-btn--outline { border-color: #0055B8 !important; color: #0055B8 !important; }
-            
-            /* Ensure Material Icons work properly */
-            .material-icons, .q-icon, i.material-icons, i[class*="material-icons"] {
-                font-family: 'Material Icons' !important;
-                font-weight: normal !important;
-                font-style: normal !important;
-                font-variant: normal !important;
-                text-transform: none !important;
-                line-height: 1 !important;
-                letter-spacing: normal !important;
-                word-wrap: normal !important;
-                white-space: nowrap !important;
-                direction: ltr !important;
-                -webkit-font-smoothing: antialiased !important;
-                -moz-osx-font-smoothing: grayscale !important;
-                -webkit-font-feature-settings: 'liga' !important;
-            }
-        </style>
     ''')
+    stylesheet('pages/admin/admin_management')
 
     with ui.column().classes('relative flex h-auto min-h-screen w-full flex-col bg-slate-50'):
         with ui.element('main').classes('flex-1 px-10 py-8 pt-20'):
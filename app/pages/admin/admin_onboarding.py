@@ -4,6 +4,7 @@ Multi-step admin onboarding workflow with system configuration and initial setup
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def admin_onboarding_page():
     """Creates the admin onboarding page with brand guidelines and icon fixes."""
@@ -12,106 +13,8 @@ def admin_onboarding_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Typography classes */
-        .heading-1 { font-size: 3rem; font-weight: 700; line-height: 1.1; }
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .sub-heading { font-size: 1.5rem; font-weight: 500; line-height: 1.4; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-light-mist { background-color: #F2F7FB; }
-
-        /* Custom styling */
-        .onboarding-card {
-            background: white;
-            border-radius: 12px;
-            border: 1px solid #E5E7EB;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }
-        
-        .step-indicator {
-            width: 40px;
-            height: 40px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: 600;
-        }
-        
-        .step-active {
-            background: #0055B8;
-            color: white;
-        }
-        
-        .step-completed {
-            background: #10B981;
-            color: white;
-        }
-        
-        .step-pending {
-            background: #E5E7EB;
-            color: #6B7280;
-        }
-        
-        .step-connector {
-            width: 2px;
-            height: 40px;
-            background: #E5E7EB;
-            margin: 0 auto;
-        }
-        
-        .step-connector.completed {
-            background: #10B981;
-        }
-        
-        .welcome-banner {
-            background: linear-gradient(135deg, #0055B8 0%, #003d82 100%);
-            border-radius: 16px;
-            color: white;
-        }
-        
-        .setup-item {
-            border: 1px solid #E5E7EB;
-            border-radius: 8px;
-            padding: 16px;
-            background: #F9FAFB;
-        }
-        
-        .setup-item.completed {
-            border-color: #10B981;
-            background: #F0FDF4;
-        }
-    </style>
     ''')
+    stylesheet('pages/admin/admin_onboarding')
     
     with ui.column().classes('w-full max-w-6xl mx-auto p-6'):
         # Welcome banner
@@ -4,6 +4,7 @@ Comprehensive email template management with editor, preview, and template libra
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def email_template_system_page():
     """Creates the email template system page with brand guidelines and icon fixes."""
@@ -12,117 +13,8 @@ def email_template_system_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Typography classes */
-        .heading-1 { font-size: 3rem; font-weight: 700; line-height: 1.1; }
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .sub-heading { font-size: 1.5rem; font-weight: 500; line-height: 1.4; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-light-mist { background-color: #F2F7FB; }
-
-        /* Custom styling */
-        .template-card {
-            background: white;
-            border-radius: 12px;
-            border: 1px solid #E5E7EB;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }
-        
-        .template-preview {
-            background: #F9FAFB;
-            border: 1px solid #E5E7EB;
-            border-radius: 8px;
-            min-height: 400px;
-        }
-        
-        .template-editor {
-            font-family: 'Monaco', 'Menlo', monospace;
-            background: #1F2937;
-            color: #F9FAFB;
-            border-radius: 8px;
-            min-height: 400px;
-        }
-        
-        .template-item {
-            border: 1px solid #E5E7EB;
-            border-radius: 8px;
-            padding: 16px;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-        
-        .template-item:hover {
-            border-color: #0055B8;
-            box-shadow: 0 2px 8px rgba(0,85,184,0.1);
-        }
-        
-        .template-item.active {
-            border-color: #0055B8;
-            background: #F0F7FF;
-        }
-        
-        .variable-tag {
-            display: inline-block;
-            padding: 2px 8px;
-            background: #E0F2FE;
-            border: 1px solid #0369A1;
-            border-radius: 12px;
-            font-size: 12px;
-            color: #0369A1;
-            margin: 2px;
-        }
-        
-        .toolbar-button {
-            padding: 8px 12px;
-            border: 1px solid #E5E7EB;
-            background: white;
-            border-radius: 6px;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-        
-        .toolbar-button:hover {
-            background: #F3F4F6;
-        }
-        
-        .email-preview {
-            background: white;
-            border: 1px solid #E5E7EB;
-            border-radius: 8px;
-            padding: 20px;
-            font-family: Arial, sans-serif;
-        }
-    </style>
     ''')
+    stylesheet('pages/admin/email_template_system')
     
     with ui.column().classes('relative flex h-auto min-h-screen w-full flex-col brand-light-mist pt-20'):
         # Header section
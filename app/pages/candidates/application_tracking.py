@@ -3,95 +3,15 @@ Job Application Tracking page for Dompell Africa.
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def application_tracking_page():
     """Creates the job application tracking page based on the template."""
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-        <style>
-            /* Brand Typography */
-            body {
-                font-family: 'Raleway', sans-serif !important;
-                background: #F2F7FB !important;
-                color: #1A1A1A !important;
-                line-height: 125% !important;
-            }
-            
-            /* Typography Hierarchy */
-            .heading-1 { font-size: 56px; font-weight: 700; color: #1A1A1A; line-height: 110%; letter-spacing: -0.02em; }
-            .heading-2 { font-size: 40px; font-weight: 600; color: #1A1A1A; line-height: 115%; letter-spacing: -0.01em; }
-            .heading-3 { font-size: 32px; font-weight: 500; color: #1A1A1A; line-height: 120%; }
-            .sub-heading { font-size: 24px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-            .sub-heading-2 { font-size: 18px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-            .body-text { font-size: 16px; font-weight: 400; color: #1A1A1A; line-height: 125%; }
-            .button-label { font-size: 14px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-            .form-placeholder { font-size: 14px; font-weight: 500; color: #4D4D4D; line-height: 125%; }
-            .caption { font-size: 12px; font-weight: 400; color: #4D4D4D; letter-spacing: 8%; line-height: 125%; }
-            
-            /* Brand Colors */
-            .brand-primary { color: #0055B8 !important; }
-            .brand-primary-bg { background-color: #0055B8 !important; }
-            .brand-charcoal { color: #1A1A1A !important; }
-            .brand-slate { color: #4D4D4D !important; }
-            .brand-light-mist { background-color: #F2F7FB !important; }
-            
-            /* Force brand font family but EXCLUDE icons */
-            *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-                font-family: 'Raleway', sans-serif !important;
-            }
-            
-            /* Ensure Material Icons work properly */
-            .material-icons, .q-icon, i.material-icons, i[class*="material-icons"] {
-                font-family: 'Material Icons' !important;
-                font-weight: normal !important;
-                font-style: normal !important;
-                font-variant: normal !important;
-                text-transform: none !important;
-                line-height: 1 !important;
-                letter-spacing: normal !important;
-                word-wrap: normal !important;
-                white-space: nowrap !important;
-                direction: ltr !important;
-                -webkit-font-smoothing: antialiased !important;
-                -moz-osx-font-smoothing: grayscale !important;
-                -webkit-font-feature-settings: 'liga' !important;
-            }
-            
-            /* Force all blue colors to brand primary */
-            .text-blue-600, .text-blue-500, .text-blue-700, .text-blue-800,
-            [class*="text-blue"], [class*="bg-blue"], .bg-blue-50,
-            .border-blue-600, [class*="border-blue"] { 
-                color: #0055B8 !important; 
-                background-color: rgba(0, 85, 184, 0.1) !important;
-                border-color: #0055B8 !important;
-            }
-            
-            /* Force all gray colors to brand colors */
-            .text-gray-400, .text-gray-500, .text-gray-600, .text-gray-700, .text-gray-800, .text-gray-900,
-            [class*="text-gray"], .text-slate-400, .text-slate-500, .text-slate-600,
-            [class*="text-slate"] { color: #4D4D4D !important; }
-            
-            .bg-gray-50, .bg-gray-100, .bg-gray-200, .bg-slate-50, .bg-slate-100, .bg-slate-200,
-            [class*="bg-gray"], [class*="bg-slate"] { background-color: #F2F7FB !important; }
-            
-            .border-gray-200, .border-gray-300, .border-slate-200, .border-slate-300,
-            [class*="border-gray"], [class*="border-slate"] { border-color: rgba(77, 77, 77, 0.3) !important; }
-            
-            /* Force all dark colors to charcoal */
-            .text-black, .text-gray-800, .text-gray-900, [class*="text-\["], h1, h2, h3, h4, h5, h6 {
-                color: #1A1A1A !important;
-            }
-            
-            /* Button colors */
-            .q-btn--outline { border-color: #0055B8 !important; color: #0055B8 !important; }
-            .q-btn:not(.q-btn--outline) { background-color: #0055B8 !important; }
-            
-            /* Card and background enforcement */
-            .q-card, .bg-white { background-color: #FFFFFF !important; }
-            body, .min-h-screen { background-color: #F2F7FB !important; }
-        </style>
     ''')
+    stylesheet('pages/candidates/application_tracking')
 
     with ui.column().classes('relative flex h-auto min-h-screen w-full flex-col brand-light-mist pt-20'):
         with ui.element('main').classes('flex-1 px-4 sm:px-6 lg:px-10 py-8'):
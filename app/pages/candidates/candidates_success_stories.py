@@ -4,6 +4,7 @@ Showcase of successful candidates and their career journeys through Dompell Afri
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def create_story_card(story: dict, index: int):
     """Create a large testimonial-style story card"""
@@ -57,57 +58,8 @@ def candidates_success_stories_page():
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-        <style>
-            body { font-family: 'Raleway', sans-serif !important; background: #F2F7FB !important; color: #1A1A1A !important; }
-            .stories-hero {
-                background: linear-gradient(135deg, #1A1A1A 0%, #0055B8 100%);
-                color: white;
-                padding: 64px 20px 48px 20px;
-                text-align: center;
-                border-radius: 0 0 32px 32px;
-                position: relative;
-                overflow: hidden;
-            }
-            .stories-hero::before {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: 0;
-                right: 0;
-                bottom: 0;
-                background-image: 
-                    radial-gradient(circle at 20% 50%, rgba(255, 255, 255, 0.1) 1px, transparent 1px),
-                    radial-gradient(circle at 80% 80%, rgba(255, 255, 255, 0.1) 1px, transparent 1px),
-                    radial-gradient(circle at 40% 20%, rgba(255, 255, 255, 0.08) 2px, transparent 2px);
-                background-size: 50px 50px, 80px 80px, 100px 100px;
-                background-position: 0 0, 40px 60px, 20px 30px;
-                opacity: 0.4;
-                z-index: 1;
-            }
-            .stories-hero::after {
-                content: '';
-                position: absolute;
-                top: -50%;
-                right: -10%;
-                width: 500px;
-                height: 500px;
-                background: radial-gradient(circle, rgba(255, 255, 255, 0.1) 0%, transparent 70%);
-                border-radius: 50%;
-                z-index: 1;
-            }
-            .stories-hero h1,
-            .stories-hero p {
-                position: relative;
-                z-index: 2;
-            }
-            .stories-hero h1 { font-size: 56px; font-weight: 900; margin-bottom: 24px; letter-spacing: -0.03em; }
-            .stories-hero p { font-size: 22px; font-weight: 400; opacity: 0.95; max-width: 800px; margin: 0 auto; line-height: 1.6; }
-            .stories-main { max-width: 1000px; margin: 48px auto 0 auto; padding: 0 20px; }
-            @media (max-width: 900px) {
-                .stories-main { padding: 0 8px; }
-            }
-        </style>
     ''')
+    stylesheet('pages/candidates/candidates_success_stories')
 
     # Hero Section
     ui.html('''
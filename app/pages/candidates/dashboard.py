@@ -1,4 +1,5 @@
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def dashboard_page():
     """The main dashboard page for a logged-in user with modern, classic design."""
@@ -7,100 +8,8 @@ def dashboard_page():
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&family=Open+Sans:wght@400;600;700&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-        <style>
-            /* Brand Typography */
-            body {
-                font-family: 'Raleway', sans-serif;
-                background: #F2F7FB !important;
-                color: #1A1A1A !important;
-                line-height: 125% !important;
-                margin: 0;
-                padding: 0;
-            }
-            
-            /* Typography Hierarchy */
-                        .heading-1 { font-size: 56px; font-weight: 700; color: #1A1A1A; line-height: 110%; letter-spacing: -0.02em; }
-            .heading-2 { font-size: 40px; font-weight: 600; color: #1A1A1A; line-height: 115%; letter-spacing: -0.01em; }
-            .heading-3 { font-size: 32px; font-weight: 500; color: #1A1A1A; line-height: 120%; }
-            .sub-heading { font-size: 24px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-            .sub-heading-2 { font-size: 18px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-            .body-text { font-size: 16px; font-weight: 400; color: #1A1A1A; }
-            .button-label { font-size: 14px; font-weight: 600; color: #1A1A1A; }
-            .form-placeholder { font-size: 14px; font-weight: 500; color: #4D4D4D; }
-            .caption { font-size: 12px; font-weight: 400; color: #4D4D4D; letter-spacing: 8%; }
-            
-            /* Brand Colors */
-            .brand-primary { color: #0055B8 !important; }
-            .brand-primary-bg { background-color: #0055B8 !important; }
-            .brand-charcoal { color: #1A1A1A !important; }
-            .brand-slate { color: #4D4D4D !important; }
-            .brand-light-mist { background-color: #F2F7FB !important; }
-            .classic-sidebar {
-                background: #ffffff !important;
-                border-right: 1px solid rgba(0, 85, 184, 0.1) !important;
-                box-shadow: 2px 0 8px rgba(0, 85, 184, 0.05) !important;
-            }
-            .classic-card {
-                background: #ffffff !important;
-                border-radius: 8px !important;
-                border: 1px solid rgba(0, 85, 184, 0.1) !important;
-                box-shadow: 0 2px 8px rgba(0, 85, 184, 0.05) !important;
-                transition: all 0.3s ease !important;
-            }
-            .classic-card:hover {
-                box-shadow: 0 4px 16px rgba(0, 85, 184, 0.1) !important;
-                transform: translateY(-2px) !important;
-            }
-            .stat-card {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                border-radius: 16px;
-                color: white;
-                padding: 24px;
-                position: relative;
-                overflow: hidden;
-            }
-            .stat-card::before {
-                content: '';
-                position: absolute;
-                top: 0;
-                right: 0;
-                width: 100px;
-                height: 100px;
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 50%;
-                transform: translate(30px, -30px);
-            }
-            .progress-ring {
-                stroke: rgba(0, 85, 184, 0.1) !important;
-                stroke-width: 8 !important;
-                fill: transparent !important;
-            }
-            .progress-ring-fill {
-                fill: transparent !important;
-                stroke: #0055B8 !important;
-                stroke-width: 8 !important;
-                stroke-linecap: round !important;
-                transition: stroke-dashoffset 0.5s ease-in-out !important;
-            }
-            .classic-nav-link {
-                padding: 12px 16px !important;
-                border-radius: 8px !important;
-                transition: all 0.3s ease !important;
-                cursor: pointer !important;
-                display: flex !important;
-                align-items: center !important;
-                gap: 12px !important;
-            }
-            .classic-nav-link:hover {
-                background: rgba(0, 85, 184, 0.1) !important;
-                transform: translateX(4px) !important;
-            }
-            .classic-nav-link.active {
-                background: #0055B8 !important;
-                color: white !important;
-            }
-        </style>
     ''')
+    stylesheet('pages/candidates/dashboard')
 
     # Main layout with proper header/footer positioning
     with ui.column().classes('min-h-screen w-full brand-light-mist'):
@@ -203,7 +112,7 @@ def _create_classic_dashboard_content():
                     with ui.row().classes('justify-center mb-6'):
                         ui.html('''
                             <div class="relative w-32 h-32">
-                                <svg class="transform -rotate-90 w-32 h-32">
+                                <svg class="-rotate-90 w-32 h-32">
                                     <circle class="progress-ring" cx="64" cy="64" r="56"></circle>
                                     <circle class="progress-ring-fill" cx="64" cy="64" r="56" 
                                             style="stroke-dasharray: 263.89; stroke-dashoffset: 65.97; stroke: #0055B8;"></circle>
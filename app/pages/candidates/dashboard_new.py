@@ -4,6 +4,7 @@ Enhanced Candidate Dashboard with Real API Data
 from nicegui import ui, app
 from app.services.api_service import api_service
 from app.services.auth_utils import get_current_user, is_authenticated
+from app.services.static_assets import stylesheet
 import asyncio
 
 def candidates_dashboard_page():
@@ -21,24 +22,9 @@ def candidates_dashboard_page():
     
     print(f"[DEBUG] Candidate Dashboard - User: {user.get('email')}")
     print(f"[DEBUG] Token available: {bool(token)}")
-    print(f"[DEBUG] Token preview: {token[:50] if token else 'None'}...")
     
     # Styling
-    ui.add_head_html('<link href="https://cdn.tailwindcss.com" rel="stylesheet">')
-    ui.add_head_html('''
-    <style>
-        .dashboard-card {
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-            padding: 24px;
-            transition: all 0.3s ease;
-        }
-        .dashboard-card:hover {
-            box-shadow: 0 4px 12px rgba(0, 85, 184, 0.15);
-        }
-    </style>
-    ''')
+    stylesheet('pages/candidates/dashboard_new')
     
     with ui.column().classes('w-full min-h-screen bg-gray-50'):
         # Header
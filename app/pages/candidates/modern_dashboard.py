@@ -7,6 +7,7 @@ from app.services.api_service import api_service
 from app.services.auth_utils import get_current_user, is_authenticated
 from app.components.header import header
 from app.components.footer import footer
+from app.services.static_assets import stylesheet
 import asyncio
 
 def modern_trainee_dashboard():
@@ -31,53 +32,9 @@ def modern_trainee_dashboard():
     
     # Add Tailwind and custom styles
     ui.add_head_html('''
-    <link href="https://cdn.tailwindcss.com" rel="stylesheet">
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * { font-family: 'Raleway', sans-serif; }
-        .modern-card {
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            padding: 24px;
-        }
-        .stat-card {
-            background: linear-gradient(135deg, #0055B8 0%, #003d82 100%);
-            border-radius: 12px;
-            padding: 20px;
-            color: white;
-        }
-        .menu-item {
-            padding: 12px 16px;
-            border-radius: 8px;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-        .menu-item:hover {
-            background: #f3f4f6;
-        }
-        .menu-item.active {
-            background: #0055B8;
-            color: white;
-        }
-        .sidebar {
-            background: white;
-            border-right: 1px solid #e5e7eb;
-            min-height: calc(100vh - 64px);
-            margin-top: 64px;
-        }
-        .dashboard-content {
-            margin-top: 64px;
-            min-height: calc(100vh - 64px - 64px);
-        }
-        .profile-input {
-            margin-bottom: 16px;
-        }
-        .profile-section {
-            margin-bottom: 24px;
-        }
-    </style>
     ''')
+    stylesheet('pages/candidates/modern_dashboard')
     
     # State for active section
     active_section = {'current': 'overview'}
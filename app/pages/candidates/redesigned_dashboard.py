@@ -4,14 +4,23 @@ A clean, professional dashboard with enhanced UX and modern design
 """
 from nicegui import ui, app
 from app.services.api_service import api_service
+from app.services.async_api_service import async_api_service
 from app.services.auth_utils import get_current_user, is_authenticated
 from app.components.header import header
 from app.components.footer import footer
+from app.components.skeleton import section_skeleton, avatar_skeleton
+from app.services.dashboard_loader import DashboardLoader
+from app.services.upload_stream import open_upload_source, stream_upload
+from app.services.static_assets import stylesheet
+from app.services.page_profiler import profile_section
+from app.services.log import get_logger
 
 import asyncio
 import mimetypes
 
-def redesigned_candidate_dashboard():
+log = get_logger('DASHBOARD')
+
+async def redesigned_candidate_dashboard():
     """Completely redesigned candidate dashboard with modern UI/UX."""
     
     # Check authentication
@@ -25,15 +34,15 @@ def redesigned_candidate_dashboard():
     token = app.storage.user.get('token')
     
     # Debug: Check token
-    print(f"[DASHBOARD] User ID: {user_id}")
-    print(f"[DASHBOARD] Token exists: {bool(token)}")
-    print(f"[DASHBOARD] Token preview: {token[:20] if token else 'None'}...")
+    log.debug('User ID: %s', user_id)
+    log.debug('Token exists: %s', bool(token))
     
     # Set token in API service
     if token:
         api_service.set_auth_token(token)
+        async_api_service.set_auth_token(token)
     else:
-        print("[DASHBOARD] WARNING: No token found!")
+        log.warning('No token found!')
     
     # Add header
     header('/candidates/dashboard')
@@ -41,590 +50,77 @@ def redesigned_candidate_dashboard():
     # Modern styling
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
-    <style>
-        * { 
-            font-family: 'Raleway', sans-serif; 
-            scroll-behavior: smooth;
-        }
-        
-        /* Layout */
-        .dashboard-wrapper {
-            background: linear-gradient(135deg, #f5f7fa 0%, #e4e9f2 100%);
-            min-height: 100vh;
-        }
-        
-        /* Sidebar */
-        .sidebar-modern {
-            position: fixed;
-            left: 0;
-            top: 64px;
-            width: 280px;
-            height: calc(100vh - 64px);
-            background: linear-gradient(180deg, #1a1a1a 0%, #0d0d0d 100%);
-            box-shadow: 4px 0 24px rgba(0, 0, 0, 0.15);
-            overflow-y: auto;
-            z-index: 100;
-            transition: width 0.3s ease;
-        }
-        
-        .sidebar-modern.collapsed {
-            width: 80px;
-        }
-        
-        .sidebar-modern.collapsed .user-profile-card {
-            padding: 12px;
-            margin: 12px;
-        }
-        
-        .sidebar-modern.collapsed .user-info,
-        .sidebar-modern.collapsed .nav-item .text-sm {
-            display: none;
-        }
-        
-        .sidebar-modern.collapsed .nav-item {
-            justify-content: center;
-            padding: 14px;
-            margin: 8px;
-        }
-        
-        .sidebar-modern.collapsed .profile-avatar {
-            width: 48px;
-            height: 48px;
-            font-size: 20px;
-        }
-        
-        .sidebar-modern::-webkit-scrollbar {
-            width: 6px;
-        }
-        
-        .sidebar-modern::-webkit-scrollbar-track {
-            background: #1A1A1A;
-        }
-        
-        .sidebar-modern::-webkit-scrollbar-thumb {
-            background: #0055B8;
-            border-radius: 3px;
-        }
-        
-        .user-profile-card {
-            background: rgba(0, 85, 184, 0.1);
-            border: 1px solid rgba(0, 85, 184, 0.3);
-            border-radius: 16px;
-            padding: 20px;
-            margin: 20px;
-        }
-        
-        .profile-avatar {
-            width: 64px;
-            height: 64px;
-            border-radius: 50%;
-            background: linear-gradient(135deg, #0055B8 0%, #003d82 100%);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 28px;
-            color: white;
-            font-weight: 700;
-            box-shadow: 0 4px 12px rgba(0, 85, 184, 0.3);
-        }
-        
-        .nav-item {
-            padding: 14px 24px;
-            margin: 8px 16px;
-            border-radius: 12px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            color: #b0b0b0;
-            font-weight: 500;
-            white-space: nowrap;
-        }
-        
-        .nav-item:hover {
-            background: rgba(0, 85, 184, 0.1);
-            color: #0055B8;
-            transform: translateX(4px);
-        }
-        
-        .nav-item.active {
-            background: linear-gradient(135deg, #0055B8 0%, #003d82 100%);
-            color: white;
-            box-shadow: 0 4px 16px rgba(0, 85, 184, 0.4);
-        }
-        
-        .nav-icon {
-            font-size: 22px;
-        }
-        
-        /* Main Content */
-        .main-content {
-            margin-left: 280px;
-            margin-top: 64px;
-            padding: 32px;
-            min-height: calc(100vh - 64px);
-            transition: margin-left 0.3s ease;
-        }
-        
-        .main-content.sidebar-collapsed {
-            margin-left: 80px;
-        }
-        
-        /* Toggle Button */
-        .menu-toggle {
-            position: absolute;
-            top: 20px;
-            right: -15px;
-            width: 30px;
-            height: 30px;
-            background: #0055B8;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            cursor: pointer;
-            box-shadow: 0 2px 8px rgba(0, 85, 184, 0.3);
-            transition: all 0.3s ease;
-            z-index: 101;
-        }
-        
-        .menu-toggle:hover {
-            background: #004494;
-            transform: scale(1.1);
-        }
-        
-        .menu-toggle .material-icons {
-            color: white;
-            font-size: 18px;
-        }
-        
-        /* Cards */
-        .glass-card {
-            background: rgba(255, 255, 255, 0.95);
-            backdrop-filter: blur(20px);
-            border-radius: 20px;
-            padding: 28px;
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08);
-            border: 1px solid rgba(255, 255, 255, 0.8);
-            transition: all 0.3s ease;
-        }
-        
-        .glass-card:hover {
-            box-shadow: 0 12px 48px rgba(0, 0, 0, 0.12);
-            transform: translateY(-4px);
-        }
-        
-        .stat-card {
-            background: linear-gradient(135deg, #003d82 0%, #002855 100%);
-            border-radius: 20px;
-            padding: 28px;
-            color: white;
-            position: relative;
-            overflow: hidden;
-            border: 1px solid #004494;
-            box-shadow: 0 4px 12px rgba(0, 61, 130, 0.3);
-            transition: all 0.3s ease;
-        }
-        
-        .stat-card:hover {
-            border-color: #0055B8;
-            box-shadow: 0 8px 20px rgba(0, 85, 184, 0.4);
-            transform: translateY(-4px);
-        }
-        
-        .stat-card::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            right: -50%;
-            width: 200%;
-            height: 200%;
-            background: radial-gradient(circle, rgba(0, 85, 184, 0.2) 0%, transparent 70%);
-            animation: pulse 4s ease-in-out infinite;
-        }
-        
-        @keyframes pulse {
-            0%, 100% { transform: scale(1); opacity: 0.5; }
-            50% { transform: scale(1.1); opacity: 0.8; }
-        }
-        
-        .stat-number {
-            font-size: 48px;
-            font-weight: 800;
-            line-height: 1;
-            margin: 12px 0;
-        }
-        
-        .stat-label {
-            font-size: 14px;
-            opacity: 0.9;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        /* Progress Bars */
-        .progress-bar-container {
-            background: #e5e7eb;
-            border-radius: 12px;
-            height: 12px;
-            overflow: hidden;
-            position: relative;
-        }
-        
-        .progress-bar-fill {
-            background: linear-gradient(90deg, #0055B8 0%, #00a8ff 100%);
-            height: 100%;
-            border-radius: 12px;
-            transition: width 1s ease;
-            box-shadow: 0 2px 8px rgba(0, 85, 184, 0.4);
-        }
-        
-        /* Badges */
-        .badge {
-            display: inline-block;
-            padding: 6px 16px;
-            border-radius: 20px;
-            font-size: 12px;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .badge-success {
-            background: linear-gradient(135deg, #48bb78 0%, #38a169 100%);
-            color: white;
-        }
-        
-        .badge-warning {
-            background: linear-gradient(135deg, #f6ad55 0%, #ed8936 100%);
-            color: white;
-        }
-        
-        .badge-info {
-            background: linear-gradient(135deg, #4299e1 0%, #3182ce 100%);
-            color: white;
-        }
-        
-        /* Buttons - Brand Guidelines Compliant */
-        .btn-primary {
-            background-color: #0055B8 !important;
-            color: white !important;
-            padding: 12px 24px;
-            border-radius: 8px;
-            font-weight: 600;
-            font-family: 'Raleway', sans-serif !important;
-            border: none;
-            cursor: pointer;
-            transition: all 0.2s ease;
-            box-shadow: 0 4px 12px rgba(0, 85, 184, 0.2);
-        }
-        
-        .btn-primary:hover {
-            background-color: #004494 !important;
-            transform: translateY(-1px);
-            box-shadow: 0 6px 16px rgba(0, 85, 184, 0.3);
-        }
-        
-        .btn-secondary {
-            background-color: white !important;
-            color: #0055B8 !important;
-            padding: 12px 24px;
-            border-radius: 8px;
-            font-weight: 600;
-            font-family: 'Raleway', sans-serif !important;
-            border: 2px solid #0055B8 !important;
-            cursor: pointer;
-            transition: all 0.2s ease;
-            box-shadow: 0 2px 8px rgba(0, 85, 184, 0.1);
-        }
-        
-        .btn-secondary:hover {
-            background-color: #F2F7FB !important;
-            transform: translateY(-1px);
-            box-shadow: 0 4px 12px rgba(0, 85, 184, 0.15);
-        }
-        
-        /* Section Headers */
-        .section-header {
-            font-size: 28px;
-            font-weight: 700;
-            color: #1A1A1A;
-            margin-bottom: 24px;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-        }
-        
-        .section-header::before {
-            content: '';
-            width: 4px;
-            height: 32px;
-            background: linear-gradient(180deg, #0055B8 0%, #003d82 100%);
-            border-radius: 2px;
-        }
-        
-        /* Skills Chips */
-        .skill-chip {
-            display: inline-flex;
-            align-items: center;
-            gap: 8px;
-            padding: 8px 16px;
-            background: linear-gradient(135deg, #0055B8 0%, #003d82 100%);
-            color: white;
-            border-radius: 20px;
-            font-size: 13px;
-            font-weight: 500;
-            margin: 4px;
-            box-shadow: 0 2px 8px rgba(0, 85, 184, 0.2);
-            transition: all 0.2s ease;
-        }
-        
-        .skill-chip:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0, 85, 184, 0.3);
-        }
-        
-        /* Timeline */
-        .timeline-item {
-            position: relative;
-            padding-left: 32px;
-            padding-bottom: 24px;
-        }
-        
-        .timeline-item::before {
-            content: '';
-            position: absolute;
-            left: 8px;
-            top: 8px;
-            bottom: -16px;
-            width: 2px;
-            background: linear-gradient(180deg, #0055B8 0%, transparent 100%);
-        }
-        
-        .timeline-dot {
-            position: absolute;
-            left: 0;
-            top: 8px;
-            width: 16px;
-            height: 16px;
-            border-radius: 50%;
-            background: #0055B8;
-            box-shadow: 0 0 0 4px rgba(0, 85, 184, 0.2);
-        }
-        
-        /* Animations */
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        
-        .fade-in {
-            animation: fadeIn 0.6s ease forwards;
-        }
-        
-        /* Responsive */
-        @media (max-width: 1024px) {
-            .sidebar-modern {
-                transform: translateX(-100%);
-                transition: transform 0.3s ease;
-            }
-            
-            .sidebar-modern.open {
-                transform: translateX(0);
-            }
-            
-            .main-content {
-                margin-left: 0;
-            }
-        }
-        /* Professional Card System (aligned with institution dashboard) */
-        .pro-card {
-            background: white;
-            border-radius: 8px;
-            border: 1px solid #e2e8f0;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
-            padding: 12px;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        }
-        .pro-card:hover {
-            box-shadow: 0 3px 10px rgba(0, 85, 184, 0.08);
-            transform: translateY(-1px);
-        }
-        /* Metric Cards */
-        .metric-card {
-            background: linear-gradient(135deg, #ffffff 0%, #f8fafc 100%);
-            border-radius: 10px;
-            border: 1px solid #e2e8f0;
-            padding: 12px;
-            margin: 8px 0;
-            transition: all 0.3s ease;
-            position: relative;
-            overflow: hidden;
-        }
-        .metric-card::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            right: 0;
-            width: 100px;
-            height: 100px;
-            background: radial-gradient(circle, rgba(0, 85, 184, 0.05) 0%, transparent 70%);
-            border-radius: 50%;
-            transform: translate(30%, -30%);
-        }
-        .metric-label { font-size: 10px; color: #64748b; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; }
-        .metric-value { font-size: 20px; font-weight: 800; color: #0055B8; line-height: 1; margin: 6px 0 4px 0; }
-        .metric-trend { font-size: 11px; color: #10b981; font-weight: 600; margin-top: 4px; }
-        /* Grid for metrics */
-        .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 12px; margin-bottom: 20px; padding-left: 20px; padding-right: 20px; }
-
-        /* Reusable row and pill styles */
-        .item-row {
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            gap: 12px;
-            padding: 12px 14px;
-            background: #f9fafb;
-            border: 1px solid #e2e8f0;
-            border-radius: 12px;
-            transition: background 0.2s ease;
-        }
-        .item-row:hover { background: #f3f6fa; }
-        .status-pill {
-            display: inline-flex;
-            align-items: center;
-            padding: 6px 12px;
-            border-radius: 999px;
-            font-size: 11px;
-            font-weight: 700;
-            letter-spacing: 0.3px;
-            text-transform: uppercase;
-        }
-        .status-under-review { background: #fff7ed; color: #c2410c; border: 1px solid #fed7aa; }
-        .status-interview { background: #ecfccb; color: #3f6212; border: 1px solid #bef264; }
-        .status-applied { background: #e2e8f0; color: #334155; border: 1px solid #cbd5e1; }
-
-        /* ==========================
-           Table Brand Enforcement - Strict Brand Guidelines
-           ========================== */
-        /* Apply to all tables including Quasar q-table */
-        table, .q-table, .q-table * {
-            font-family: 'Raleway', sans-serif !important;
-            color: #1A1A1A !important;
-        }
-        /* Container */
-        .q-table, table {
-            background: #FFFFFF !important;
-            border: 1px solid #e5e7eb !important;
-            border-radius: 8px !important;
-            box-shadow: 0 2px 8px rgba(0, 85, 184, 0.08) !important;
-        }
-        /* Header cells - Brand Colors */
-        .q-table thead tr, thead tr {
-            background: #F2F7FB !important;
-            border-bottom: 2px solid #0055B8 !important;
-        }
-        .q-th, thead th {
-            text-transform: uppercase !important;
-            letter-spacing: 0.5px !important;
-            font-weight: 700 !important;
-            font-size: 12px !important;
-            color: #1A1A1A !important;
-            padding: 12px 16px !important;
-            font-family: 'Raleway', sans-serif !important;
-        }
-        /* Body cells */
-        .q-td, tbody td {
-            font-size: 14px !important;
-            color: #4D4D4D !important;
-            padding: 14px 16px !important;
-            border-bottom: 1px solid #e5e7eb !important;
-            font-family: 'Raleway', sans-serif !important;
-        }
-        /* Rows */
-        .q-tr:hover, tbody tr:hover {
-            background: #F2F7FB !important;
-        }
-        tbody tr:last-child .q-td, tbody tr:last-child td {
-            border-bottom: none !important;
-        }
-        /* Links and action buttons inside tables - Brand Blue */
-        .q-table a, table a { 
-            color: #0055B8 !important; 
-            text-decoration: none !important;
-            font-weight: 600 !important;
-            font-family: 'Raleway', sans-serif !important;
-        }
-        .q-table a:hover, table a:hover { 
-            text-decoration: underline !important;
-            color: #004494 !important;
-        }
-        .q-table .q-btn, table .q-btn {
-            background-color: #0055B8 !important;
-            color: white !important;
-            font-family: 'Raleway', sans-serif !important;
-            font-weight: 600 !important;
-            border-radius: 6px !important;
-            padding: 8px 16px !important;
-        }
-        .q-table .q-btn:hover, table .q-btn:hover {
-            background-color: #004494 !important;
-        }
-        /* Pagination/footer area */
-        .q-table__bottom, .q-table__separator { 
-            border-color: #e5e7eb !important;
-            background: #F2F7FB !important;
-        }
-        .q-table__bottom .q-btn {
-            color: #0055B8 !important;
-            font-family: 'Raleway', sans-serif !important;
-        }
-    </style>
     ''')
+    stylesheet('pages/candidates/redesigned_dashboard')
     
     # State management
     active_section = {'current': 'overview'}
     user_data = {'profile': None}
     
     # Load user profile
-    def load_user_profile():
-        """Load complete user profile from API (synchronous)."""
+    async def load_user_profile():
+        """Load complete user profile from API without blocking the event loop."""
         try:
-            print(f"[PROFILE_LOAD] Attempting to load profile for user: {user_id}")
-            print(f"[PROFILE_LOAD] API service has token: {bool(api_service.token)}")
+            log.debug('Profile load: Attempting to load profile for user: %s', user_id)
+            log.debug('Profile load: API service has token: %s', bool(async_api_service.token))
             
-            response = api_service._make_request('GET', f'/users/{user_id}')
+            response = await async_api_service.get_user_profile(user_id)
             
-            print(f"[PROFILE_LOAD] Response status: {response.status_code}")
+            log.debug('Profile load: Response status: %s', response.status_code)
             
-            if response.ok:
+            if response.is_success:
                 data = response.json()
                 user_data['profile'] = data.get('data', {})
-                print(f"[PROFILE_LOAD] Profile loaded successfully")
-                print(f"[PROFILE_LOAD] Full profile structure: {user_data['profile']}")
+                log.debug('Profile load: Profile loaded successfully')
+                log.debug('Profile load: Full profile structure: %s', user_data['profile'])
                 return user_data['profile']
             elif response.status_code == 401:
                 # Session expired - redirect to login
-                print(f"[ERROR] Session expired: {response.text}")
+                log.warning('Session expired: %s', response.text)
                 from app.services.auth_utils import logout
                 ui.notify('Your session has expired. Please log in again.', type='warning')
                 logout()
                 return None
             else:
-                print(f"[ERROR] Failed to load profile: {response.status_code}")
-                print(f"[ERROR] Response body: {response.text}")
+                log.warning('Failed to load profile: %s', response.status_code)
+                log.warning('Response body: %s', response.text)
                 return None
         except Exception as e:
-            print(f"[ERROR] Loading profile: {e}")
+            log.warning('Loading profile: %s', e)
             import traceback
             traceback.print_exc()
             return None
     
-    # Load profile data BEFORE rendering UI
-    load_user_profile()
+    async def load_trainee_profile():
+        """Load the trainee profile record (source of the profile id for the lists below)."""
+        response = await async_api_service.get_trainee_by_user(user_id)
+        if response.is_success and response.content:
+            return response.json().get('data') or {}
+        return None
+    
+    def make_list_loader(fetch):
+        async def _load():
+            trainee = await loader.get('trainee')
+            profile_id = (trainee or {}).get('id') or (trainee or {}).get('_id')
+            if not profile_id:
+                return []
+            response = await fetch(profile_id)
+            if response.is_success and response.content:
+                data = response.json().get('data')
+                return data if isinstance(data, list) else []
+            return []
+        return _load
+    
+    # Fire all dashboard requests at once; the shell renders immediately and
+    # each section fills in as its data arrives
+    loader = DashboardLoader()
+    loader.section('profile', load_user_profile)
+    loader.section('trainee', load_trainee_profile)
+    loader.section('education', make_list_loader(async_api_service.list_education))
+    loader.section('experience', make_list_loader(async_api_service.list_experience))
+    loader.section('certifications', make_list_loader(async_api_service.list_certifications))
+    loader.section('portfolio', make_list_loader(async_api_service.list_portfolio))
+    loader.start()
     
     # Main dashboard wrapper
     with ui.element('div').classes('dashboard-wrapper'):
@@ -652,29 +148,39 @@ def redesigned_candidate_dashboard():
             
             toggle_btn.on('click', toggle_sidebar)
             
-            # User Profile Card
-            with ui.element('div').classes('user-profile-card'):
-                with ui.row().classes('items-center gap-4'):
+            @profile_section
+            def render_avatar(_profile=None):
+                """Fill the sidebar avatar once the profile section has loaded."""
+                avatar_slot.clear()
+                with avatar_slot:
                     # Avatar - Always try to show profile picture from loaded profile
                     profile_pic_url = ''
                     if user_data.get('profile'):
                         tp = user_data['profile'].get('traineeProfile') or {}
                         profile_pic_url = tp.get('profilePictureUrl') or ''
-                        print(f"[SIDEBAR] Profile picture URL: {profile_pic_url}")
+                        log.debug('Sidebar: Profile picture URL: %s', profile_pic_url)
                     else:
-                        print(f"[SIDEBAR] No profile data available")
+                        log.debug('Sidebar: No profile data available')
                     
                     # Show image if URL exists, otherwise show initials
                     if profile_pic_url and profile_pic_url.strip():
-                        print(f"[SIDEBAR] Rendering profile image")
+                        log.debug('Sidebar: Rendering profile image')
                         with ui.element('div').style('width: 56px; height: 56px; border-radius: 50%; overflow: hidden; border: 3px solid rgba(255,255,255,0.4); box-shadow: 0 4px 12px rgba(0,0,0,0.3); display: flex; align-items: center; justify-content: center;'):
                             ui.image(profile_pic_url).style('width: 100%; height: 100%; object-fit: cover; object-position: center;')
                     else:
                         # Fallback to initials avatar
-                        print(f"[SIDEBAR] Rendering initials avatar")
+                        log.debug('Sidebar: Rendering initials avatar')
                         initials = ''.join([n[0].upper() for n in user.get('name', 'U').split()[:2]])
                         with ui.element('div').classes('profile-avatar'):
                             ui.label(initials)
+            
+            # User Profile Card
+            with ui.element('div').classes('user-profile-card'):
+                with ui.row().classes('items-center gap-4'):
+                    avatar_slot = ui.element('div')
+                    with avatar_slot:
+                        avatar_skeleton()
+                    loader.on_ready('profile', render_avatar)
                     
                     # User info
                     with ui.column().classes('gap-1 user-info'):
@@ -769,6 +275,7 @@ def redesigned_candidate_dashboard():
             dialog_content.set_content(content)
             file_dialog.open()
         
+        @profile_section
         def render_section(section):
             """Render content based on active section."""
             if section == 'overview':
@@ -780,6 +287,7 @@ def redesigned_candidate_dashboard():
             elif section == 'settings':
                 render_settings()
         
+        @profile_section
         def render_dashboard():
             """Main dashboard overview."""
             with ui.element('div').classes('fade-in'):
@@ -884,6 +392,38 @@ def redesigned_candidate_dashboard():
                                     ui.label(trend).classes('metric-trend').style(f'color: {color} !important;')
                                 ui.icon(icon, size='24px').style(f'color: {color} !important; opacity: 0.3;')
                 
+                # Background sections stream in independently of the profile
+                with ui.element('div').classes('stats-grid'):
+                    background_sections = [
+                        ('education', 'Education', 'school', '#0055B8'),
+                        ('experience', 'Experience', 'work', '#48bb78'),
+                        ('certifications', 'Certifications', 'workspace_premium', '#f6ad55'),
+                        ('portfolio', 'Portfolio', 'collections', '#9f7aea'),
+                    ]
+                    for key, label, icon, color in background_sections:
+                        with ui.card().classes('metric-card'):
+                            with ui.row().classes('items-start justify-between w-full'):
+                                with ui.column().classes('gap-0 flex-1'):
+                                    ui.label(label).classes('metric-label')
+                                    value_slot = ui.column().classes('gap-0 w-full')
+                                    with value_slot:
+                                        section_skeleton(lines=2, height='20px')
+                                ui.icon(icon, size='24px').style(f'color: {color} !important; opacity: 0.3;')
+                        
+                        def fill_section(items, slot=value_slot, section_key=key, section_color=color):
+                            if slot.is_deleted:
+                                return
+                            slot.clear()
+                            with slot:
+                                if items is None:
+                                    ui.label('—').classes('metric-value').style('color: #cbd5e1 !important;')
+                                    ui.label('Unavailable' if loader.errors.get(section_key) != 'timeout' else 'Timed out').classes('metric-trend')
+                                else:
+                                    ui.label(str(len(items))).classes('metric-value').style(f'color: {section_color} !important;')
+                                    ui.label(f'{len(items)} added').classes('metric-trend').style(f'color: {section_color} !important;')
+                        
+                        loader.on_ready(key, fill_section)
+                
                 # Two-column layout
                 with ui.row().classes('w-full gap-6'):
                     # Left column - Profile Completion
@@ -1075,6 +615,7 @@ def redesigned_candidate_dashboard():
                             
                             ui.button('Edit Profile', icon='edit', on_click=go_to_profile).classes('btn-primary w-full')
         
+        @profile_section
         def render_profile_section():
             """Enhanced profile management."""
             with ui.element('div').classes('fade-in'):
@@ -1213,16 +754,16 @@ def redesigned_candidate_dashboard():
                                     files['avatar'] = (avatar_state['name'], avatar_state['content'], avatar_state['type'])
 
                                 ui.notify('Creating profile...', type='info')
-                                resp = api_service.create_trainee_profile(user_id, form=form, files=files)
+                                resp = await async_api_service.create_trainee_profile(user_id, form=form, files=files)
                                 try:
-                                    print(f"[PROFILE_CREATE] status={resp.status_code}")
-                                    print(f"[PROFILE_CREATE] body={resp.text}")
+                                    log.debug('Profile create: status=%s', resp.status_code)
+                                    log.debug('Profile create: body=%s', resp.text)
                                 except Exception:
                                     pass
-                                if resp.ok:
+                                if resp.is_success:
                                     ui.notify('Profile created!', type='positive')
                                     # Refresh profile and rerender
-                                    load_user_profile()
+                                    await load_user_profile()
                                     content_area.clear()
                                     with content_area:
                                         render_profile_section()
@@ -1277,15 +818,15 @@ def redesigned_candidate_dashboard():
                                             ui.notify('Profile picture URL is required by the server. Please upload an avatar or paste a valid URL.', type='warning')
                                             return
 
-                                        fb_resp = api_service.create_trainee_profile(user_id, form=fb_form, files=None)
+                                        fb_resp = await async_api_service.create_trainee_profile(user_id, form=fb_form, files=None)
                                         try:
-                                            print(f"[PROFILE_CREATE_FALLBACK] status={fb_resp.status_code}")
-                                            print(f"[PROFILE_CREATE_FALLBACK] body={fb_resp.text}")
+                                            log.debug('Profile create fallback: status=%s', fb_resp.status_code)
+                                            log.debug('Profile create fallback: body=%s', fb_resp.text)
                                         except Exception:
                                             pass
-                                        if fb_resp.ok:
+                                        if fb_resp.is_success:
                                             ui.notify('Profile created!', type='positive')
-                                            load_user_profile()
+                                            await load_user_profile()
                                             content_area.clear()
                                             with content_area:
                                                 render_profile_section()
@@ -1315,17 +856,16 @@ def redesigned_candidate_dashboard():
                     or construct a URL based on common S3 patterns.
                     """
                     try:
-                        print(f"[UPLOAD] Starting upload: {file_name}, Type: {file_type}, Path: {upload_path}")
-                        
-                        # Prepare multipart form data
-                        files = {'file': (file_name, file_content, file_type)}
+                        log.debug('Upload: Starting upload: %s, Type: %s, Path: %s', file_name, file_type, upload_path)
                         
-                        response = api_service._make_request('POST', '/upload', files=files)
+                        # Stream the multipart body instead of buffering the file
+                        source = open_upload_source(file_content, file_name, file_type)
+                        response = await stream_upload(source)
                         
-                        print(f"[UPLOAD] Response status: {response.status_code}")
-                        print(f"[UPLOAD] Response body: {response.text}")
+                        log.debug('Upload: Response status: %s', response.status_code)
+                        log.debug('Upload: Response body: %s', response.text)
                         
-                        if response.ok:
+                        if response.is_success:
                             data = response.json()
                             
                             # Try multiple possible URL locations in response
@@ -1356,16 +896,16 @@ def redesigned_candidate_dashboard():
                                 
                                 file_url = f"https://ajuraconnect.s3.amazonaws.com/{constructed_path}"
                                 
-                                print(f"[UPLOAD] ⚠️  Backend returned no URL. Using constructed URL: {file_url}")
-                                print(f"[UPLOAD] ⚠️  Note: This is a workaround. Backend should return the actual S3 URL.")
+                                log.warning('Upload: Backend returned no URL. Using constructed URL: %s', file_url)
+                                log.warning('Upload: Note: This is a workaround. Backend should return the actual S3 URL.')
                             
-                            print(f"[UPLOAD] Final URL: {file_url}")
+                            log.debug('Upload: Final URL: %s', file_url)
                             return file_url
                         else:
-                            print(f"[UPLOAD] Failed: {response.text}")
+                            log.warning('Upload: Failed: %s', response.text)
                             return None
                     except Exception as e:
-                        print(f"[UPLOAD] Error: {e}")
+                        log.warning('Upload: Error: %s', e)
                         import traceback
                         traceback.print_exc()
                         return None
@@ -1376,17 +916,20 @@ def redesigned_candidate_dashboard():
                     try:
                         ui.notify('Uploading profile image...', type='info')
                         
-                        # Store file info - e.content is the file object itself
-                        file_content = e.content
-                        file_name = e.name
-                        file_type = e.type or 'image/jpeg'
+                        # Wrap the upload spool; it is streamed, not read into memory
+                        file_content = open_upload_source(e)
+                        if file_content is None:
+                            ui.notify('No image selected', type='warning')
+                            return
+                        file_name = file_content.name
+                        file_type = file_content.content_type or 'image/jpeg'
                         
-                        print(f"[PROFILE_IMG] Uploading: {file_name}, Type: {file_type}")
+                        log.debug('Profile img: Uploading: %s, Type: %s', file_name, file_type)
                         
                         # Upload to S3
                         file_url = await upload_file_to_s3(file_content, file_name, file_type)
                         
-                        print(f"[PROFILE_IMG] Returned URL: {file_url}")
+                        log.debug('Profile img: Returned URL: %s', file_url)
                         
                         if file_url:
                             # Update profile state
@@ -1399,14 +942,14 @@ def redesigned_candidate_dashboard():
                                 'email': profile.get('email'),
                             }
                             
-                            print(f"[PROFILE_IMG] Updating profile with minimal payload")
-                            print(f"[PROFILE_IMG] Payload: {update_data}")
-                            print(f"[PROFILE_IMG] Note: Backend rejects trainee fields in PATCH. File uploaded to: {file_url}")
+                            log.debug('Profile img: Updating profile with minimal payload')
+                            log.debug('Profile img: Payload: %s', update_data)
+                            log.debug('Profile img: Note: Backend rejects trainee fields in PATCH. File uploaded to: %s', file_url)
                             
                             # Update profile
-                            response = api_service._make_request('PATCH', f'/users/{user_id}', data=update_data)
+                            response = await async_api_service.update_user(user_id, update_data)
                             
-                            if response.ok:
+                            if response.is_success:
                                 ui.notify('Profile image uploaded to S3!', type='positive')
                                 ui.notify(f'Image URL: {file_url}', type='info')
                                 # Reload profile and refresh
@@ -1417,10 +960,10 @@ def redesigned_candidate_dashboard():
                             else:
                                 error_msg = response.json().get('message', 'Update failed')
                                 ui.notify(f'Profile update failed: {error_msg}', type='negative')
-                                print(f"[ERROR] Profile update failed: {response.text}")
+                                log.warning('Profile update failed: %s', response.text)
                         else:
                             # Even if no URL, the file was uploaded. Let's refresh and see if backend auto-updated
-                            print(f"[PROFILE_IMG] No URL returned, but file was uploaded. Refreshing profile...")
+                            log.debug('Profile img: No URL returned, but file was uploaded. Refreshing profile...')
                             ui.notify('File uploaded. Checking if profile was auto-updated...', type='info')
                             await asyncio.sleep(2)  # Give backend time to process
                             await load_user_profile()
@@ -1429,7 +972,7 @@ def redesigned_candidate_dashboard():
                                 render_profile_section()
                             
                     except Exception as ex:
-                        print(f"[ERROR] Profile image upload: {ex}")
+                        log.warning('Profile image upload: %s', ex)
                         import traceback
                         traceback.print_exc()
                         ui.notify('Profile image upload error', type='negative')
@@ -1445,7 +988,7 @@ def redesigned_candidate_dashboard():
                     'portfolio': trainee_profile.get('portfolio') or '',
                 }
                 
-                def update_profile():
+                async def update_profile():
                     h = (edit_state['headline'] or '').strip()
                     b = (edit_state['bio'] or '').strip()
                     l = (edit_state['location'] or '').strip()
@@ -1468,15 +1011,15 @@ def redesigned_candidate_dashboard():
                     if pf:
                         form['portfolio'] = pf
                     
-                    r = api_service.create_trainee_profile(user_id, form=form, files=None)
+                    r = await async_api_service.create_trainee_profile(user_id, form=form, files=None)
                     try:
-                        print(f"[PROFILE_UPDATE] status={r.status_code}")
-                        print(f"[PROFILE_UPDATE] body={r.text}")
+                        log.debug('Profile update: status=%s', r.status_code)
+                        log.debug('Profile update: body=%s', r.text)
                     except Exception:
                         pass
-                    if r.ok:
+                    if r.is_success:
                         ui.notify('Profile updated successfully!', type='positive')
-                        load_user_profile()
+                        await load_user_profile()
                         content_area.clear()
                         with content_area:
                             render_profile_section()
@@ -1723,12 +1266,12 @@ def redesigned_candidate_dashboard():
                                             skill_id = skill.get('id') or skill.get('_id')
                                         
                                         def _make_delete_handler(sid=skill_id):
-                                            def _handler():
+                                            async def _handler():
                                                 pid = (trainee_profile.get('id') if trainee_profile else None) or (trainee_profile.get('_id') if trainee_profile else None)
                                                 if not pid:
                                                     try:
-                                                        r = api_service.get_trainee_by_user(user_id)
-                                                        if r.ok and r.content:
+                                                        r = await async_api_service.get_trainee_by_user(user_id)
+                                                        if r.is_success and r.content:
                                                             data = r.json().get('data', {})
                                                             pid = data.get('id') or data.get('_id')
                                                     except:
@@ -1739,10 +1282,10 @@ def redesigned_candidate_dashboard():
                                                 if not sid:
                                                     ui.notify('Cannot delete this skill (missing id).', type='warning')
                                                     return
-                                                resp = api_service.delete_skill(sid, pid)
-                                                if resp.ok:
+                                                resp = await async_api_service.delete_skill(sid, pid)
+                                                if resp.is_success:
                                                     ui.notify('Skill removed', type='positive')
-                                                    load_and_render_profile()
+                                                    await load_and_render_profile()
                                                 else:
                                                     try:
                                                         msg = resp.json().get('message', 'Failed to remove skill')
@@ -1793,7 +1336,7 @@ def redesigned_candidate_dashboard():
                                         ui.checkbox(skill_name, on_change=make_skill_handler()).props('dense').style('font-size: 12px;')
                         
                         # Save selected skills button
-                        def save_selected_skills():
+                        async def save_selected_skills():
                             if not skills_to_add:
                                 ui.notify('Please select at least one skill', type='warning')
                                 return
@@ -1801,8 +1344,8 @@ def redesigned_candidate_dashboard():
                             trainee_profile_id = (trainee_profile.get('id') if trainee_profile else None) or (trainee_profile.get('_id') if trainee_profile else None)
                             if not trainee_profile_id:
                                 try:
-                                    resp = api_service.get_trainee_by_user(user_id)
-                                    if resp.ok and resp.content:
+                                    resp = await async_api_service.get_trainee_by_user(user_id)
+                                    if resp.is_success and resp.content:
                                         data = resp.json().get('data', {})
                                         trainee_profile_id = data.get('id') or data.get('_id')
                                 except:
@@ -1815,14 +1358,14 @@ def redesigned_candidate_dashboard():
                             # Add all selected skills
                             success_count = 0
                             for skill_name in skills_to_add:
-                                r = api_service.add_skill(trainee_profile_id, skill_name)
-                                if r.ok:
+                                r = await async_api_service.add_skill(trainee_profile_id, skill_name)
+                                if r.is_success:
                                     success_count += 1
                             
                             if success_count > 0:
                                 ui.notify(f'{success_count} skill(s) added successfully!', type='positive')
                                 skills_to_add.clear()
-                                load_and_render_profile()
+                                await load_and_render_profile()
                             else:
                                 ui.notify('Failed to add skills', type='negative')
                         
@@ -1830,6 +1373,7 @@ def redesigned_candidate_dashboard():
                             ui.button('Save Selected Skills', icon='add_circle', on_click=save_selected_skills).props('flat').style('background: #0055B8 !important; color: white !important; flex: 1; font-family: "Raleway", sans-serif !important;')
                             ui.button('Clear Selection', icon='clear', on_click=lambda: skills_to_add.clear()).props('flat outlined').style('color: #6b7280 !important; border-color: #e5e7eb !important; font-family: "Raleway", sans-serif !important;')
         
+        @profile_section
         def render_applications():
             """Applications tracking."""
             with ui.element('div').classes('fade-in'):
@@ -1838,6 +1382,7 @@ def redesigned_candidate_dashboard():
                     ui.label('No applications yet. Start applying to opportunities!').classes('text-gray-600 text-center py-12')
                     ui.button('Browse Opportunities', icon='search').classes('btn-primary')
         
+        @profile_section
         def render_documents():
             """Documents management - Shows all uploaded documents."""
             with ui.element('div').classes('fade-in'):
@@ -2011,6 +1556,7 @@ def redesigned_candidate_dashboard():
                                 
                                 ui.button(icon='delete', on_click=lambda fi=file_info: ui.notify('Delete functionality coming soon', type='info')).props('flat outlined').style('color: #ef4444; border-color: #fee2e2; min-width: 40px;')
         
+        @profile_section
         def render_messages():
             """Messages section."""
             with ui.element('div').classes('fade-in'):
@@ -2019,6 +1565,7 @@ def redesigned_candidate_dashboard():
                 with ui.element('div').classes('glass-card'):
                     ui.label('No messages yet').classes('text-gray-600 text-center py-12')
         
+        @profile_section
         def render_calendar():
             """Calendar & appointments."""
             with ui.element('div').classes('fade-in'):
@@ -2027,6 +1574,7 @@ def redesigned_candidate_dashboard():
                 with ui.element('div').classes('glass-card'):
                     ui.label('No upcoming events').classes('text-gray-600 text-center py-12')
         
+        @profile_section
         def render_settings():
             """Settings page."""
             with ui.element('div').classes('fade-in'):
@@ -2051,24 +1599,25 @@ def redesigned_candidate_dashboard():
                                 ui.label(desc).style('font-size: 13px; color: #6b7280;')
                             ui.switch(value=True)
         
-        def load_and_render_profile():
+        async def load_and_render_profile():
             """Load profile and re-render."""
-            load_user_profile()
+            await load_user_profile()
             with content_area:
                 content_area.clear()
                 render_profile_section()
         
-        # Initial render - load profile then show dashboard
-        def load_profile_then_render():
-            """Load profile data then render dashboard."""
-            load_user_profile()
+        # Initial render - show the dashboard as soon as the profile section lands
+        @profile_section
+        def render_overview_when_ready(_profile):
+            if active_section['current'] != 'overview':
+                return
+            content_area.clear()
             with content_area:
-                content_area.clear()
                 render_dashboard()
         
         with content_area:
-            # Load profile first
-            ui.timer(0.1, load_profile_then_render, once=True)
+            section_skeleton(lines=6, height='24px')
+        loader.on_ready('profile', render_overview_when_ready)
     
     # Add footer
     footer()
@@ -8,10 +8,13 @@ Comprehensive document upload system for trainees to manage:
 Integrated with real Dompell API for file uploads to AWS S3.
 """
 
-import asyncio
 from nicegui import ui
-from app.services.api_service import api_service
+from app.services.upload_queue import upload_queue
 from app.services.auth_utils import is_authenticated, get_user_role
+from app.services.static_assets import stylesheet
+from app.services.log import get_logger
+
+log = get_logger('UPLOAD')
 
 def trainee_documents_page():
     """Render the trainee documents management page."""
@@ -20,80 +23,8 @@ def trainee_documents_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-        
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-        }
-        
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-primary-bg { background-color: #0055B8; }
-        
-        /* Document card styling */
-        .doc-card {
-            background: white;
-            border-radius: 12px;
-            padding: 24px;
-            margin-bottom: 16px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-            transition: all 0.3s ease;
-        }
-        
-        .doc-card:hover {
-            box-shadow: 0 4px 16px rgba(0, 0, 0, 0.15);
-        }
-        
-        /* Upload zone */
-        .upload-zone {
-            background: #F8FAFC;
-            border: 2px dashed #CBD5E1;
-            border-radius: 12px;
-            padding: 40px 20px;
-            text-align: center;
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }
-        
-        .upload-zone:hover {
-            border-color: #0055B8;
-            background: #F2F7FB;
-        }
-        
-        /* File item */
-        .file-item {
-            background: #F8FAFC;
-            border-radius: 8px;
-            padding: 16px;
-            margin-bottom: 12px;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-        }
-        
-        /* Category badge */
-        .category-badge {
-            display: inline-block;
-            padding: 4px 12px;
-            border-radius: 16px;
-            font-size: 12px;
-            font-weight: 600;
-        }
-        
-        .badge-resume { background: #DBEAFE; color: #1E40AF; }
-        .badge-portfolio { background: #D1FAE5; color: #065F46; }
-        .badge-certificate { background: #FEF3C7; color: #92400E; }
-        .badge-cover { background: #E0E7FF; color: #3730A3; }
-    </style>
     ''')
+    stylesheet('pages/candidates/trainee_documents')
     
     # Check authentication
     if not is_authenticated():
@@ -121,73 +52,57 @@ def trainee_documents_page():
             'certificates': [],
             'cover_letters': []
         },
-        'uploading': False,
+        'jobs': [],
         'active_category': 'resume',
         'upload_success': None,
         'upload_error': None,
         'needs_refresh': False
     }
     
-    async def handle_file_upload(category: str, e):
-        """Handle file upload to S3 via API."""
-        if not e.content:
-            print(f"[UPLOAD] No file selected")
+    def handle_file_upload(category: str, e):
+        """Queue the uploaded file; the upload queue streams it to S3 in the background."""
+        job = upload_queue.submit(e, max_size=10 * 1024 * 1024)
+        if job is None:
+            log.debug('No file selected')
             return
         
-        state['uploading'] = True
+        state['jobs'].append(job)
         
-        try:
-            # Get file info
-            file_name = e.name
-            file_content = e.content.read()
-            file_size = len(file_content)
-            
-            # Validate file size (max 10MB)
-            max_size = 10 * 1024 * 1024
-            if file_size > max_size:
-                print(f"[UPLOAD] File too large: {file_size} bytes")
-                state['uploading'] = False
-                state['upload_error'] = f"File too large. Maximum size is 10MB."
+        def on_job_change(job):
+            if not job.finished:
                 return
-            
-            
-            # Prepare file data for upload
-            files = {
-                'file': (file_name, file_content)
-            }
-            
-            # Call API
-            response = api_service.upload_file(files)
-            
-            if response.status_code in [200, 201]:
-                result = response.json()
-                file_url = result.get('url', '')
+            state['jobs'].remove(job)
+            if job.status == 'done':
+                try:
+                    file_url = job.response.json().get('url', '')
+                except Exception:
+                    file_url = ''
                 
                 # Add to documents list
                 state['documents'][category].append({
-                    'name': file_name,
+                    'name': job.name,
                     'url': file_url,
-                    'size': file_size,
+                    'size': job.source.bytes_sent,
                     'uploaded_at': 'Just now',
                     'category': category
                 })
                 
-                print(f"[UPLOAD] File uploaded successfully: {file_name}")
-                state['upload_success'] = f"File uploaded successfully: {file_name}"
+                log.debug('File uploaded successfully: %s', job.name)
+                state['upload_success'] = f"File uploaded successfully: {job.name}"
                 state['needs_refresh'] = True
             else:
-                print(f"[UPLOAD] Upload failed: {response.status_code}")
-                state['upload_error'] = f"Upload failed: {response.status_code}"
+                log.warning('Upload failed: %s', job.error)
+                state['upload_error'] = job.error
         
-        except Exception as e:
-            print(f"[UPLOAD] Error uploading file: {str(e)}")
-            state['upload_error'] = f"Error uploading file: {str(e)}"
-        
-        finally:
-            state['uploading'] = False
+        job.subscribe(on_job_change)
     
     def check_upload_status():
         """Check for upload status updates and show notifications"""
+        jobs = state['jobs']
+        upload_progress_bar.set_visibility(bool(jobs))
+        if jobs:
+            upload_progress_bar.set_value(sum(job.progress for job in jobs) / len(jobs))
+        
         if state.get('upload_success'):
             ui.notify(state['upload_success'], color='positive')
             state['upload_success'] = None
@@ -258,7 +173,7 @@ def trainee_documents_page():
                     upload_component = ui.upload(
                         label='Choose File to Upload',
                         auto_upload=True,
-                        on_upload=lambda e, cat=category: asyncio.create_task(handle_file_upload(cat, e))
+                        on_upload=lambda e, cat=category: handle_file_upload(cat, e)
                     ).props('accept=".pdf,.doc,.docx,.jpg,.jpeg,.png,.zip,.txt" max-file-size=10485760')
                     upload_component.classes('w-full max-w-xs')
                     upload_component.props('color=primary')
@@ -361,6 +276,10 @@ def trainee_documents_page():
                         ui.label(format_file_size(total_size)).classes('text-3xl font-bold text-blue-600')
                         ui.label('Total Storage').classes('brand-slate')
         
+        # Upload progress (updated by check_upload_status)
+        upload_progress_bar = ui.linear_progress(value=0, show_value=False).classes('w-full max-w-6xl mx-auto')
+        upload_progress_bar.set_visibility(False)
+        
         # Documents container
         container = ui.column().classes('w-full max-w-6xl mx-auto')
         
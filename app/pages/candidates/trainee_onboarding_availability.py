@@ -4,6 +4,7 @@ Availability setup with calendar integration and schedule management using brand
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def trainee_onboarding_availability_page():
     """Creates the trainee onboarding availability setup page with brand guidelines and icon fixes."""
@@ -12,140 +13,8 @@ def trainee_onboarding_availability_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Typography classes */
-        .heading-1 { font-size: 3rem; font-weight: 700; line-height: 1.1; }
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .sub-heading { font-size: 1.5rem; font-weight: 500; line-height: 1.4; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .button-label { font-size: 0.875rem; font-weight: 600; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-light-mist { background-color: #F2F7FB; }
-        .brand-primary-bg { background-color: #0055B8; }
-
-        /* Custom styling */
-        .availability-card {
-            background: white;
-            border-radius: 12px;
-            padding: 24px;
-            margin-bottom: 16px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        }
-
-        .time-slot {
-            background: #F8FAFC;
-            border: 2px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 12px 16px;
-            margin: 4px;
-            cursor: pointer;
-            transition: all 0.2s;
-            text-align: center;
-        }
-
-        .time-slot:hover {
-            border-color: #0055B8;
-            background: #F2F7FB;
-        }
-
-        .time-slot.selected {
-            border-color: #0055B8;
-            background: #0055B8;
-            color: white;
-        }
-
-        .day-selector {
-            background: #F8FAFC;
-            border: 2px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 16px;
-            margin: 8px 4px;
-            cursor: pointer;
-            transition: all 0.2s;
-            text-align: center;
-            min-width: 120px;
-        }
-
-        .day-selector:hover {
-            border-color: #0055B8;
-            background: #F2F7FB;
-        }
-
-        .day-selector.selected {
-            border-color: #0055B8;
-            background: #0055B8;
-            color: white;
-        }
-
-        .progress-bar {
-            background: #E5E7EB;
-            height: 8px;
-            border-radius: 4px;
-            overflow: hidden;
-        }
-
-        .progress-fill {
-            background: #0055B8;
-            height: 100%;
-            transition: width 0.3s ease;
-        }
-
-        .availability-summary {
-            background: #F0F9FF;
-            border: 1px solid #0EA5E9;
-            border-radius: 8px;
-            padding: 16px;
-        }
-
-        .location-option {
-            background: white;
-            border: 2px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 16px;
-            margin-bottom: 12px;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-
-        .location-option:hover {
-            border-color: #0055B8;
-            box-shadow: 0 2px 8px rgba(0, 85, 184, 0.1);
-        }
-
-        .location-option.selected {
-            border-color: #0055B8;
-            background: #F2F7FB;
-        }
-    </style>
     ''')
+    stylesheet('pages/candidates/trainee_onboarding_availability')
 
     with ui.column().classes('relative flex h-auto min-h-screen w-full flex-col brand-light-mist pt-20'):
         # Progress indicator
@@ -4,6 +4,7 @@ Portfolio upload with file management and project showcases using brand guidelin
 """
 
 from nicegui import ui, app
+from app.services.static_assets import stylesheet
 import asyncio
 
 def trainee_onboarding_portfolio_page():
@@ -147,157 +148,8 @@ def trainee_onboarding_portfolio_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Typography classes */
-        .heading-1 { font-size: 3rem; font-weight: 700; line-height: 1.1; }
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .sub-heading { font-size: 1.5rem; font-weight: 500; line-height: 1.4; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .button-label { font-size: 0.875rem; font-weight: 600; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-light-mist { background-color: #F2F7FB; }
-        .brand-primary-bg { background-color: #0055B8; }
-
-        /* Custom styling */
-        .portfolio-card {
-            background: white;
-            border-radius: 12px;
-            padding: 24px;
-            margin-bottom: 16px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        }
-
-        .upload-zone {
-            background: #F8FAFC;
-            border: 2px dashed #CBD5E1;
-            border-radius: 12px;
-            padding: 40px 20px;
-            text-align: center;
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }
-
-        .upload-zone:hover {
-            border-color: #0055B8;
-            background: #F2F7FB;
-        }
-
-        .upload-zone.dragover {
-            border-color: #0055B8;
-            background: #EBF4FF;
-        }
-
-        .project-item {
-            background: white;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 16px;
-            margin-bottom: 12px;
-            transition: all 0.2s;
-        }
-
-        .project-item:hover {
-            border-color: #0055B8;
-            box-shadow: 0 2px 8px rgba(0, 85, 184, 0.1);
-        }
-
-        .file-item {
-            background: #F8FAFC;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 12px 16px;
-            margin: 8px 0;
-            display: flex;
-            align-items: center;
-            justify-content: between;
-        }
-
-        .skill-chip {
-            background: #EBF4FF;
-            color: #0055B8;
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 0.75rem;
-            font-weight: 600;
-            margin: 2px 4px;
-            display: inline-block;
-        }
-
-        .progress-bar {
-            background: #E5E7EB;
-            height: 8px;
-            border-radius: 4px;
-            overflow: hidden;
-        }
-
-        .progress-fill {
-            background: #0055B8;
-            height: 100%;
-            transition: width 0.3s ease;
-        }
-
-        .portfolio-preview {
-            background: #F0F9FF;
-            border: 1px solid #0EA5E9;
-            border-radius: 8px;
-            padding: 16px;
-        }
-
-        .portfolio-stats {
-            background: white;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 16px;
-            text-align: center;
-        }
-
-        .project-category {
-            background: #F3F4F6;
-            border-radius: 6px;
-            padding: 8px 12px;
-            margin: 4px;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-
-        .project-category:hover {
-            background: #E5E7EB;
-        }
-
-        .project-category.selected {
-            background: #0055B8;
-            color: white;
-        }
-    </style>
     ''')
+    stylesheet('pages/candidates/trainee_onboarding_portfolio')
 
     with ui.column().classes('relative flex h-auto min-h-screen w-full flex-col brand-light-mist pt-20'):
         # Progress indicator
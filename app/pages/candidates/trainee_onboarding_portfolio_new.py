@@ -7,6 +7,8 @@ from nicegui import ui, app
 import asyncio
 from urllib.parse import urlparse
 import mimetypes
+from app.services.upload_stream import open_upload_source, stream_upload
+from app.services.static_assets import stylesheet
 
 def trainee_onboarding_portfolio_page():
     """Functional trainee onboarding portfolio upload page."""
@@ -93,10 +95,10 @@ def trainee_onboarding_portfolio_page():
         """Upload file to S3 via API."""
         try:
             print(f"[ONBOARDING] Uploading: {file_name}")
-            files = {'file': (file_name, file_content, file_type)}
-            response = api_service._make_request('POST', '/upload', files=files)
+            source = open_upload_source(file_content, file_name, file_type)
+            response = await stream_upload(source)
             
-            if response.ok:
+            if response.is_success:
                 from urllib.parse import quote
                 # Construct S3 URL (backend doesn't return it)
                 # The backend saves files to a path like: <user_id>/<original_filename>
@@ -196,7 +198,8 @@ def trainee_onboarding_portfolio_page():
                     else:
                         name = getattr(f, 'name', None) or getattr(f, 'filename', None)
                         mime = getattr(f, 'content_type', None) or getattr(f, 'type', None) or 'application/octet-stream'
-                        content = await f.read() if hasattr(f, 'read') else None
+                        # Pass the spool itself; it is streamed to the backend
+                        content = f if hasattr(f, 'read') or hasattr(f, 'iterate') else None
                     if (name is not None) and (content is not None):
                         items.append((name, content, mime))
             else:
@@ -205,8 +208,8 @@ def trainee_onboarding_portfolio_page():
                 if file_obj is not None:
                     if isinstance(file_obj, dict):
                         content = file_obj.get('content')
-                    elif hasattr(file_obj, 'read'):
-                        content = await file_obj.read()
+                    elif hasattr(file_obj, 'read') or hasattr(file_obj, 'iterate'):
+                        content = file_obj
                 if (name is not None) and (content is not None):
                     items.append((name, content, mime))
 
@@ -216,9 +219,10 @@ def trainee_onboarding_portfolio_page():
 
             for name, content, mime in items:
                 ui.notify(f'Uploading {name}...', type='info')
-                file_url = await upload_file_to_s3(content, name, mime)
+                source = open_upload_source(content, name, mime)
+                file_url = await upload_file_to_s3(source, name, mime)
                 if file_url:
-                    size_kb = f"{len(content) / 1024:.1f} KB" if hasattr(content, '__len__') else 'Unknown'
+                    size_kb = f"{source.bytes_sent / 1024:.1f} KB"
                     uploaded_files.append({'name': name, 'url': file_url, 'type': mime, 'size': size_kb})
                     ui.notify(f'{name} uploaded successfully!', type='positive')
                     ui.notify(f'URL: {file_url}', type='info', close_button=True, timeout=8000)
@@ -417,6 +421,9 @@ def trainee_onboarding_portfolio_page():
                         except Exception:
                             pass
                         if f1.ok:
+                            # Raw session call bypasses _make_request, so drop cached trainee reads here
+                            from app.services.response_cache import response_cache
+                            response_cache.invalidate_for(f"/trainee/create/{user_id}")
                             try:
                                 created = f1.json().get('data') if f1.content else None
                                 if created:
@@ -470,31 +477,8 @@ def trainee_onboarding_portfolio_page():
     # UI
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-        .onboarding-container {
-            background: linear-gradient(135deg, #F2F7FB 0%, #E8F4F8 100%);
-            min-height: 100vh;
-            padding: 40px 20px;
-        }
-        .onboarding-card {
-            background: white;
-            border-radius: 16px;
-            padding: 32px;
-            box-shadow: 0 8px 24px rgba(0,85,184,0.1);
-            margin-bottom: 24px;
-        }
-        .file-item {
-            background: #F8FAFC;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 16px;
-            margin: 12px 0;
-        }
-    </style>
     ''')
+    stylesheet('pages/candidates/trainee_onboarding_portfolio_new')
     
     current_step = {'value': 1}
     steps_meta = [
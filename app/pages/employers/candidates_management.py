@@ -6,12 +6,14 @@ Browse, search, filter, and manage candidate profiles with hiring pipeline.
 from nicegui import ui, app
 from app.services.api_service import api_service
 from app.services.auth_utils import get_current_user
+from app.services.static_assets import stylesheet
+from app.services.candidate_index import candidate_index
+from app.services.paged_source import PagedSource
 import asyncio
 
 # State management
 state = {
     'candidates': [],
-    'filtered_candidates': [],
     'search_query': '',
     'filters': {
         'skills': 'All Skills',
@@ -20,58 +22,44 @@ state = {
         'availability': 'All Availability'
     },
     'sort_by': 'Relevance',
-    'current_page': 1,
     'items_per_page': 9,
     'selected_candidate': None,
     'loading': False
 }
 
+# Experience filter options -> (min, max) whole years
+EXPERIENCE_BANDS = {
+    'Entry Level (0-1 years)': (0, 1),
+    '1-2 years': (1, 2),
+    '3-5 years': (3, 5),
+    '5+ years': (5, None),
+}
+
+# Sort options -> candidate_index sort orders
+SORT_ORDERS = {
+    'Relevance': 'relevance',
+    'Experience (High to Low)': 'experience',
+    'Rating (High to Low)': 'rating',
+    'Recently Updated': 'recent',
+    'Name (A-Z)': 'name',
+}
+
+AVAILABILITY_COLORS = {
+    'Available': 'green',
+    'Available Soon': 'orange',
+    'Busy': 'red'
+}
+
+# Skill badges shown on a card before the '+N more' badge
+CARD_SKILLS = 5
+
 def candidates_management_page():
     """Creates the enhanced candidates management page for employers."""
     # Add brand table enforcement (applies if/when tables are used)
-    ui.add_head_html('''
-    <style>
-        /* ==========================
-           Table Brand Enforcement
-           ========================== */
-        table, .q-table, .q-table * {
-            font-family: 'Raleway', sans-serif !important;
-            color: #1A1A1A !important;
-        }
-        .q-table, table {
-            background: #FFFFFF !important;
-            border: 1px solid #e2e8f0 !important;
-            border-radius: 8px !important;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.05) !important;
-        }
-        .q-table thead tr, thead tr {
-            background: #f8fafc !important;
-            border-bottom: 2px solid #e2e8f0 !important;
-        }
-        .q-th, thead th {
-            text-transform: uppercase !important;
-            letter-spacing: 0.5px !important;
-            font-weight: 700 !important;
-            font-size: 11px !important;
-            color: #475569 !important;
-            padding: 10px 12px !important;
-        }
-        .q-td, tbody td {
-            font-size: 13px !important;
-            color: #334155 !important;
-            padding: 12px !important;
-            border-bottom: 1px solid #f1f5f9 !important;
-        }
-        .q-tr:hover, tbody tr:hover { background: #f8fafc !important; }
-        tbody tr:last-child .q-td, tbody tr:last-child td { border-bottom: none !important; }
-        .q-table a, table a { color: #0055B8 !important; text-decoration: none !important; }
-        .q-table a:hover, table a:hover { text-decoration: underline !important; }
-        .q-table .q-btn, table .q-btn { color: #0055B8 !important; }
-        .q-table__bottom, .q-table__separator { border-color: #e2e8f0 !important; }
-    </style>
-    ''')
+    stylesheet('pages/employers/candidates_management')
     
     user = get_current_user()
+    grid = CandidateGrid(state['items_per_page'])
     
     with ui.column().classes('w-full min-h-screen bg-slate-50'):
         # Header
@@ -88,24 +76,21 @@ def candidates_management_page():
         # Main content
         with ui.column().classes('flex-1 px-8 py-6 max-w-7xl mx-auto w-full'):
             # Search and Filters Section
-            create_search_filters()
+            create_search_filters(grid)
             
             # Results and Controls
-            create_results_header()
+            create_results_header(grid)
             
             # Candidates Grid
-            candidates_grid_container = ui.column().classes('w-full')
-            
-            with candidates_grid_container:
-                create_candidates_grid()
+            grid.build()
             
             # Pagination
-            create_pagination()
+            create_pagination(grid)
     
     # Load initial data
-    asyncio.create_task(load_candidates())
+    asyncio.create_task(load_candidates(grid))
 
-def create_search_filters():
+def create_search_filters(grid):
     """Creates the search and filter section."""
     with ui.card().classes('w-full p-6 mb-6'):
         ui.label('Search & Filter Candidates').classes('text-xl font-semibold mb-4')
@@ -120,13 +105,13 @@ def create_search_filters():
             ui.button(
                 'Search', 
                 icon='search',
-                on_click=apply_filters
+                on_click=lambda: apply_filters(grid)
             ).classes('bg-[#0055B8] text-white px-6')
             
             ui.button(
                 'Clear Filters',
                 icon='refresh',
-                on_click=clear_filters
+                on_click=lambda: clear_filters(grid)
             ).props('outline color=grey')
         
         # Filter dropdowns
@@ -137,14 +122,14 @@ def create_search_filters():
                  'Mobile Development', 'Product Management', 'Digital Marketing'],
                 value=state['filters']['skills'],
                 label='Skills',
-                on_change=lambda e: update_filter('skills', e.value)
+                on_change=lambda e: update_filter(grid, 'skills', e.value)
             ).props('outlined dense').classes('w-full')
             
             ui.select(
                 ['All Experience', 'Entry Level (0-1 years)', '1-2 years', '3-5 years', '5+ years'],
                 value=state['filters']['experience'],
                 label='Experience Level',
-                on_change=lambda e: update_filter('experience', e.value)
+                on_change=lambda e: update_filter(grid, 'experience', e.value)
             ).props('outlined dense').classes('w-full')
             
             ui.select(
@@ -152,169 +137,229 @@ def create_search_filters():
                  'Accra, Ghana', 'Dar es Salaam, Tanzania', 'Kigali, Rwanda', 'Remote'],
                 value=state['filters']['location'],
                 label='Location',
-                on_change=lambda e: update_filter('location', e.value)
+                on_change=lambda e: update_filter(grid, 'location', e.value)
             ).props('outlined dense').classes('w-full')
             
             ui.select(
                 ['All Availability', 'Available', 'Available Soon', 'Busy'],
                 value=state['filters']['availability'],
                 label='Availability',
-                on_change=lambda e: update_filter('availability', e.value)
+                on_change=lambda e: update_filter(grid, 'availability', e.value)
             ).props('outlined dense').classes('w-full')
 
-def create_results_header():
+def create_results_header(grid):
     """Creates the results summary and sort controls."""
     with ui.row().classes('w-full items-center justify-between mb-6'):
-        results_label = ui.label().classes('text-lg font-semibold text-gray-900')
-        update_results_count(results_label)
+        grid.results_label = ui.label().classes('text-lg font-semibold text-gray-900')
+        update_results_count(grid)
         
         with ui.row().classes('items-center gap-4'):
             ui.label('Sort by:').classes('text-sm text-gray-600')
             ui.select(
-                ['Relevance', 'Experience (High to Low)', 'Rating (High to Low)', 'Recently Updated', 'Name (A-Z)'],
+                list(SORT_ORDERS),
                 value=state['sort_by'],
-                on_change=lambda e: update_sort(e.value)
+                on_change=lambda e: update_sort(grid, e.value)
             ).props('outlined dense').classes('w-48')
 
-def create_candidates_grid():
-    """Creates the grid of candidate cards."""
-    if state['loading']:
-        with ui.row().classes('w-full justify-center py-20'):
-            ui.spinner(size='lg', color='primary')
-            ui.label('Loading candidates...').classes('text-gray-600 ml-4')
-        return
-    
-    if not state['filtered_candidates']:
-        with ui.column().classes('w-full items-center justify-center py-20'):
-            ui.icon('search_off', size='64px').classes('text-gray-300 mb-4')
-            ui.label('No candidates found').classes('text-2xl font-bold text-gray-600 mb-2')
-            ui.label('Try adjusting your search or filters').classes('text-gray-500')
-            ui.button('Clear All Filters', on_click=clear_filters).classes('mt-4').props('outline')
-        return
-    
-    # Calculate pagination
-    start_idx = (state['current_page'] - 1) * state['items_per_page']
-    end_idx = start_idx + state['items_per_page']
-    page_candidates = state['filtered_candidates'][start_idx:end_idx]
-    
-    with ui.row().classes('w-full grid grid-cols-1 lg:grid-cols-2 xl:grid-cols-3 gap-6'):
-        for candidate in page_candidates:
-            create_candidate_card(candidate)
-
-def create_candidate_card(candidate):
-    """Creates an individual candidate profile card."""
-    with ui.card().classes('p-6 hover:shadow-xl transition-shadow cursor-pointer border-2 border-transparent hover:border-blue-200'):
-        # Header with avatar and basic info
-        with ui.row().classes('items-start mb-4'):
-            # Avatar
-            with ui.element('div').classes('w-16 h-16 rounded-full bg-gradient-to-br from-blue-400 to-purple-500 flex items-center justify-center text-3xl mr-4'):
-                ui.label(candidate.get('avatar', '👤'))
+class CandidateCard:
+    """A candidate card whose elements are refilled rather than recreated."""
+
+    def __init__(self):
+        self.candidate = None
+        with ui.card().classes('p-6 hover:shadow-xl transition-shadow cursor-pointer border-2 border-transparent hover:border-blue-200') as self.card:
+            # Header with avatar and basic info
+            with ui.row().classes('items-start mb-4'):
+                # Avatar
+                with ui.element('div').classes('w-16 h-16 rounded-full bg-gradient-to-br from-blue-400 to-purple-500 flex items-center justify-center text-3xl mr-4'):
+                    self.avatar = ui.label()
+                
+                with ui.column().classes('flex-1'):
+                    self.name = ui.label().classes('text-xl font-bold text-gray-900 mb-1')
+                    self.title = ui.label().classes('text-base text-gray-600 mb-2')
+                    with ui.row().classes('items-center text-sm text-gray-500 gap-2'):
+                        ui.icon('location_on', size='16px')
+                        self.location = ui.label()
             
-            with ui.column().classes('flex-1'):
-                ui.label(candidate['name']).classes('text-xl font-bold text-gray-900 mb-1')
-                ui.label(candidate['title']).classes('text-base text-gray-600 mb-2')
-                with ui.row().classes('items-center text-sm text-gray-500 gap-2'):
-                    ui.icon('location_on', size='16px')
-                    ui.label(candidate['location'])
-        
-        # Bio/Summary
-        ui.label(candidate.get('bio', 'No bio available.')).classes(
-            'text-gray-700 text-sm mb-4 leading-relaxed line-clamp-3'
-        )
-        
-        # Skills (limited display)
-        ui.label('Key Skills:').classes('text-xs font-medium text-gray-700 mb-2')
-        with ui.row().classes('flex-wrap gap-2 mb-4'):
-            for skill in candidate.get('skills', [])[:5]:
-                ui.badge(skill).props('color=blue-1 text-color=blue-9')
+            # Bio/Summary
+            self.bio = ui.label().classes('text-gray-700 text-sm mb-4 leading-relaxed line-clamp-3')
             
-            if len(candidate.get('skills', [])) > 5:
-                ui.badge(f'+{len(candidate["skills"]) - 5} more').props('color=grey-3 text-color=grey-7')
-        
-        # Experience and Education
-        with ui.row().classes('justify-between text-sm mb-4 gap-4'):
-            with ui.column().classes('flex-1'):
-                ui.label('Experience').classes('font-medium text-gray-700 text-xs')
-                ui.label(candidate.get('experience', 'N/A')).classes('text-gray-600')
+            # Skills (limited display)
+            ui.label('Key Skills:').classes('text-xs font-medium text-gray-700 mb-2')
+            with ui.row().classes('flex-wrap gap-2 mb-4'):
+                self.skills = [ui.badge().props('color=blue-1 text-color=blue-9') for _ in range(CARD_SKILLS)]
+                self.more_skills = ui.badge().props('color=grey-3 text-color=grey-7')
             
-            with ui.column().classes('flex-1'):
-                ui.label('Education').classes('font-medium text-gray-700 text-xs')
-                ui.label(candidate.get('education', 'N/A')).classes('text-gray-600')
-        
-        # Rating and Availability
-        with ui.row().classes('items-center justify-between mb-4'):
-            with ui.row().classes('items-center gap-1'):
-                ui.icon('star', size='18px').classes('text-yellow-500')
-                ui.label(f"{candidate.get('rating', 0)}/5.0").classes('font-medium text-gray-900 text-sm')
-                ui.label(f'({candidate.get("reviews", 0)} reviews)').classes('text-xs text-gray-500 ml-1')
+            # Experience and Education
+            with ui.row().classes('justify-between text-sm mb-4 gap-4'):
+                with ui.column().classes('flex-1'):
+                    ui.label('Experience').classes('font-medium text-gray-700 text-xs')
+                    self.experience = ui.label().classes('text-gray-600')
+                
+                with ui.column().classes('flex-1'):
+                    ui.label('Education').classes('font-medium text-gray-700 text-xs')
+                    self.education = ui.label().classes('text-gray-600')
             
-            availability = candidate.get('availability', 'Unknown')
-            availability_props = {
-                'Available': 'color=green',
-                'Available Soon': 'color=orange',
-                'Busy': 'color=red'
-            }
-            ui.badge(availability).props(availability_props.get(availability, 'color=grey'))
+            # Rating and Availability
+            with ui.row().classes('items-center justify-between mb-4'):
+                with ui.row().classes('items-center gap-1'):
+                    ui.icon('star', size='18px').classes('text-yellow-500')
+                    self.rating = ui.label().classes('font-medium text-gray-900 text-sm')
+                    self.reviews = ui.label().classes('text-xs text-gray-500 ml-1')
+                
+                self.availability = ui.badge()
+            
+            # Action Buttons (they act on whichever candidate the card shows)
+            with ui.row().classes('gap-2 w-full'):
+                ui.button(
+                    'View Profile',
+                    icon='person',
+                    on_click=lambda: show_candidate_profile(self.candidate)
+                ).props('outline color=primary').classes('flex-1')
+                
+                ui.button(
+                    'Contact',
+                    icon='email',
+                    on_click=lambda: contact_candidate(self.candidate)
+                ).classes('flex-1 bg-[#0055B8] text-white')
+                
+                # Save/bookmark button
+                ui.button(icon='bookmark_border', on_click=lambda: save_candidate(self.candidate)).props('flat color=grey')
+
+    def show(self, candidate):
+        """Fill the card with candidate, or hide it when candidate is None."""
+        self.candidate = candidate
+        self.card.set_visibility(candidate is not None)
+        if candidate is None:
+            return
+        self.avatar.set_text(candidate.get('avatar', '👤'))
+        self.name.set_text(candidate['name'])
+        self.title.set_text(candidate['title'])
+        self.location.set_text(candidate['location'])
+        self.bio.set_text(candidate.get('bio', 'No bio available.'))
         
-        # Action Buttons
-        with ui.row().classes('gap-2 w-full'):
-            ui.button(
-                'View Profile',
-                icon='person',
-                on_click=lambda c=candidate: show_candidate_profile(c)
-            ).props('outline color=primary').classes('flex-1')
+        skills = list(candidate.get('skills', []))
+        for badge, skill in zip(self.skills, skills + [None] * CARD_SKILLS):
+            badge.set_visibility(skill is not None)
+            if skill is not None:
+                badge.set_text(skill)
+        self.more_skills.set_visibility(len(skills) > CARD_SKILLS)
+        self.more_skills.set_text(f'+{len(skills) - CARD_SKILLS} more')
+        
+        self.experience.set_text(candidate.get('experience', 'N/A'))
+        self.education.set_text(candidate.get('education', 'N/A'))
+        self.rating.set_text(f"{candidate.get('rating', 0)}/5.0")
+        self.reviews.set_text(f'({candidate.get("reviews", 0)} reviews)')
+        
+        availability = candidate.get('availability', 'Unknown')
+        self.availability.set_text(availability)
+        self.availability.props(f"color={AVAILABILITY_COLORS.get(availability, 'grey')}")
+
+class CandidateGrid:
+    """
+    The current page of candidates.
+
+    Only one window of results is held (see PagedSource), and the grid owns a
+    fixed set of cards that are refilled on every page change, so the number
+    of elements per client does not grow with the result set.
+    """
+
+    def __init__(self, page_size):
+        self.source = PagedSource(fetch_candidates_page, page_size)
+        self.cards = []
+        self.results_label = None
+        self.pagination = None
+        self.page_label = None
+        self.prev_button = None
+        self.next_button = None
+
+    def build(self):
+        with ui.column().classes('w-full'):
+            with ui.row().classes('w-full justify-center py-20') as self.loading:
+                ui.spinner(size='lg', color='primary')
+                ui.label('Loading candidates...').classes('text-gray-600 ml-4')
             
-            ui.button(
-                'Contact',
-                icon='email',
-                on_click=lambda c=candidate: contact_candidate(c)
-            ).classes('flex-1 bg-[#0055B8] text-white')
+            with ui.column().classes('w-full items-center justify-center py-20') as self.empty:
+                ui.icon('search_off', size='64px').classes('text-gray-300 mb-4')
+                ui.label('No candidates found').classes('text-2xl font-bold text-gray-600 mb-2')
+                ui.label('Try adjusting your search or filters').classes('text-gray-500')
+                ui.button('Clear All Filters', on_click=lambda: clear_filters(self)).classes('mt-4').props('outline')
             
-            # Save/bookmark button
-            ui.button(icon='bookmark_border', on_click=lambda c=candidate: save_candidate(c)).props('flat color=grey')
+            with ui.row().classes('w-full grid grid-cols-1 lg:grid-cols-2 xl:grid-cols-3 gap-6') as self.grid:
+                self.cards = [CandidateCard() for _ in range(self.source.page_size)]
+        self.render()
+
+    def render(self):
+        """Show the current window in the existing cards."""
+        loading = state['loading'] and not self.source.total
+        self.loading.set_visibility(loading)
+        self.empty.set_visibility(not loading and not self.source.total)
+        self.grid.set_visibility(bool(self.source.total))
+        items = self.source.items
+        for i, card in enumerate(self.cards):
+            card.show(items[i] if i < len(items) else None)
+        update_results_count(self)
+        update_pagination(self)
+
+    async def reload(self):
+        """Start over from the first page (query, filters or sort changed)."""
+        await self.source.first()
+        self.render()
+
+def fetch_candidates_page(after, before, limit):
+    """Fetch one window of the current search from the candidate index."""
+    filters = state['filters']
+    min_years, max_years = EXPERIENCE_BANDS.get(filters['experience'], (None, None))
+    # Postings and filter bitmaps are intersected in the index; no list scan
+    return candidate_index.page(
+        state['search_query'],
+        sort=SORT_ORDERS.get(state['sort_by'], 'relevance'),
+        after=after,
+        before=before,
+        limit=limit,
+        skill=None if filters['skills'] == 'All Skills' else filters['skills'],
+        location=None if filters['location'] == 'All Locations' else filters['location'],
+        availability=None if filters['availability'] == 'All Availability' else filters['availability'],
+        min_years=min_years,
+        max_years=max_years,
+    )
 
-def create_pagination():
+def create_pagination(grid):
     """Creates pagination controls."""
-    total_pages = (len(state['filtered_candidates']) + state['items_per_page'] - 1) // state['items_per_page']
-    
-    if total_pages <= 1:
-        return
-    
-    with ui.row().classes('w-full items-center justify-center mt-8 gap-2'):
+    with ui.row().classes('w-full items-center justify-center mt-8 gap-4') as grid.pagination:
         # Previous button
-        ui.button(
+        grid.prev_button = ui.button(
             'Previous',
             icon='chevron_left',
-            on_click=lambda: change_page(state['current_page'] - 1)
-        ).props('outline' if state['current_page'] > 1 else 'flat disable')
-        
-        # Page numbers
-        for page in range(1, min(total_pages + 1, 6)):
-            if page == state['current_page']:
-                ui.button(str(page)).classes('bg-[#0055B8] text-white')
-            else:
-                ui.button(str(page), on_click=lambda p=page: change_page(p)).props('outline')
+            on_click=lambda: change_page(grid, -1)
+        )
         
-        if total_pages > 5:
-            ui.label('...').classes('text-gray-500')
-            if state['current_page'] == total_pages:
-                ui.button(str(total_pages)).classes('bg-[#0055B8] text-white')
-            else:
-                ui.button(str(total_pages), on_click=lambda: change_page(total_pages)).props('outline')
+        grid.page_label = ui.label().classes('text-gray-600')
         
         # Next button
-        ui.button(
+        grid.next_button = ui.button(
             'Next',
             icon='chevron_right',
-            on_click=lambda: change_page(state['current_page'] + 1)
-        ).props('outline' if state['current_page'] < total_pages else 'flat disable').classes('icon-right')
+            on_click=lambda: change_page(grid, 1)
+        ).classes('icon-right')
+    update_pagination(grid)
+
+def update_pagination(grid):
+    """Update pagination controls for the current page."""
+    if grid.pagination is None:
+        return
+    source = grid.source
+    grid.pagination.set_visibility(source.pages > 1)
+    grid.page_label.set_text(f'Page {source.number:,} of {source.pages:,}')
+    for button, enabled in ((grid.prev_button, source.has_prev), (grid.next_button, source.has_next)):
+        button.props(remove='outline flat').props('outline' if enabled else 'flat')
+        button.set_enabled(enabled)
 
 # Event handlers and utility functions
 
-async def load_candidates():
+async def load_candidates(grid):
     """Load candidates from API or use sample data."""
     state['loading'] = True
-    ui.update()
+    grid.render()
     
     try:
         user = get_current_user()
@@ -326,88 +371,35 @@ async def load_candidates():
         # For now, use sample data
         await asyncio.sleep(0.5)  # Simulate network delay
         state['candidates'] = get_sample_candidates()
-        state['filtered_candidates'] = state['candidates'].copy()
         
     except Exception as e:
         print(f"[CANDIDATES] Error loading candidates: {e}")
         state['candidates'] = get_sample_candidates()
-        state['filtered_candidates'] = state['candidates'].copy()
     
     finally:
+        candidate_index.rebuild(state['candidates'])
         state['loading'] = False
-        ui.update()
+        await grid.reload()
 
 def update_search(query):
     """Update search query."""
     state['search_query'] = query.lower()
 
-def update_filter(filter_name, value):
+async def update_filter(grid, filter_name, value):
     """Update a filter value."""
     state['filters'][filter_name] = value
-    apply_filters()
+    await apply_filters(grid)
 
-def update_sort(sort_value):
+async def update_sort(grid, sort_value):
     """Update sort order."""
     state['sort_by'] = sort_value
-    apply_sorting()
-    ui.update()
+    await grid.reload()
 
-def apply_filters():
-    """Apply current filters and search to candidates list."""
-    filtered = state['candidates'].copy()
-    
-    # Apply search
-    if state['search_query']:
-        filtered = [c for c in filtered if (
-            state['search_query'] in c['name'].lower() or
-            state['search_query'] in c['title'].lower() or
-            state['search_query'] in c['location'].lower() or
-            any(state['search_query'] in skill.lower() for skill in c.get('skills', []))
-        )]
-    
-    # Apply skill filter
-    if state['filters']['skills'] != 'All Skills':
-        skill = state['filters']['skills']
-        filtered = [c for c in filtered if skill in c.get('skills', [])]
-    
-    # Apply experience filter
-    if state['filters']['experience'] != 'All Experience':
-        exp_filter = state['filters']['experience']
-        # Simple filtering logic (can be enhanced)
-        if 'Entry Level' in exp_filter:
-            filtered = [c for c in filtered if '0' in c.get('experience', '') or '1' in c.get('experience', '')]
-        elif '1-2' in exp_filter:
-            filtered = [c for c in filtered if '1' in c.get('experience', '') or '2' in c.get('experience', '')]
-        elif '3-5' in exp_filter:
-            filtered = [c for c in filtered if any(x in c.get('experience', '') for x in ['3', '4', '5'])]
-        elif '5+' in exp_filter:
-            filtered = [c for c in filtered if any(x in c.get('experience', '') for x in ['5', '6', '7', '8', '9'])]
-    
-    # Apply location filter
-    if state['filters']['location'] != 'All Locations':
-        location = state['filters']['location']
-        filtered = [c for c in filtered if location in c.get('location', '')]
-    
-    # Apply availability filter
-    if state['filters']['availability'] != 'All Availability':
-        availability = state['filters']['availability']
-        filtered = [c for c in filtered if c.get('availability', '') == availability]
-    
-    state['filtered_candidates'] = filtered
-    state['current_page'] = 1  # Reset to first page
-    apply_sorting()
-    ui.update()
-
-def apply_sorting():
-    """Sort the filtered candidates based on sort_by value."""
-    if state['sort_by'] == 'Experience (High to Low)':
-        state['filtered_candidates'].sort(key=lambda c: int(c.get('experience', '0').split()[0]), reverse=True)
-    elif state['sort_by'] == 'Rating (High to Low)':
-        state['filtered_candidates'].sort(key=lambda c: c.get('rating', 0), reverse=True)
-    elif state['sort_by'] == 'Name (A-Z)':
-        state['filtered_candidates'].sort(key=lambda c: c.get('name', ''))
-
-def clear_filters():
+async def apply_filters(grid):
+    """Apply current filters and search, starting again from the first page."""
+    await grid.reload()
+
+async def clear_filters(grid):
     """Reset all filters and search."""
     state['search_query'] = ''
     state['filters'] = {
@@ -417,24 +409,25 @@ def clear_filters():
         'availability': 'All Availability'
     }
     state['sort_by'] = 'Relevance'
-    state['current_page'] = 1
-    state['filtered_candidates'] = state['candidates'].copy()
-    ui.update()
+    await grid.reload()
     ui.notify('Filters cleared', type='info')
 
-def change_page(page):
-    """Change current page."""
-    total_pages = (len(state['filtered_candidates']) + state['items_per_page'] - 1) // state['items_per_page']
-    if 1 <= page <= total_pages:
-        state['current_page'] = page
-        ui.update()
-        # Scroll to top
-        ui.run_javascript('window.scrollTo({top: 0, behavior: "smooth"})')
+async def change_page(grid, step):
+    """Move to the next (step=1) or previous (step=-1) page."""
+    if step > 0:
+        await grid.source.next()
+    else:
+        await grid.source.prev()
+    grid.render()
+    # Scroll to top
+    ui.run_javascript('window.scrollTo({top: 0, behavior: "smooth"})')
 
-def update_results_count(label_element):
+def update_results_count(grid):
     """Update the results count label."""
-    count = len(state['filtered_candidates'])
-    label_element.set_text(f'{count} candidate{"s" if count != 1 else ""} found')
+    if grid.results_label is None:
+        return
+    count = grid.source.total
+    grid.results_label.set_text(f'{count:,} candidate{"s" if count != 1 else ""} found')
 
 def show_candidate_profile(candidate):
     """Show detailed candidate profile in a dialog."""
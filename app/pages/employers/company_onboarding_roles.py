@@ -4,6 +4,7 @@ Setup company hiring preferences and role requirements using brand guidelines.
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def company_onboarding_roles_page():
     """Creates the company roles and preferences setup page with brand guidelines and icon fixes."""
@@ -12,141 +13,8 @@ def company_onboarding_roles_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Typography classes */
-        .heading-1 { font-size: 3rem; font-weight: 700; line-height: 1.1; }
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .sub-heading { font-size: 1.5rem; font-weight: 500; line-height: 1.4; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .button-label { font-size: 0.875rem; font-weight: 600; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-light-mist { background-color: #F2F7FB; }
-        .brand-primary-bg { background-color: #0055B8; }
-
-        /* Custom styling for forms */
-        .form-section {
-            background: white;
-            border-radius: 12px;
-            padding: 24px;
-            margin-bottom: 24px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        }
-
-        /* Progress indicator */
-        .progress-step {
-            width: 40px;
-            height: 40px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: 600;
-            margin-right: 16px;
-        }
-        
-        .step-active {
-            background-color: #0055B8;
-            color: white;
-        }
-        
-        .step-completed {
-            background-color: #10B981;
-            color: white;
-        }
-        
-        .step-pending {
-            background-color: #E5E7EB;
-            color: #6B7280;
-        }
-
-        /* Skills and role cards */
-        .skill-chip {
-            background-color: #EBF4FF;
-            color: #0055B8;
-            padding: 8px 16px;
-            border-radius: 20px;
-            margin: 4px;
-            cursor: pointer;
-            border: 2px solid transparent;
-            transition: all 0.2s;
-        }
-
-        .skill-chip:hover {
-            border-color: #0055B8;
-        }
-
-        .skill-chip.selected {
-            background-color: #0055B8;
-            color: white;
-        }
-        
-        /* ==========================
-           Table Brand Enforcement
-           ========================== */
-        table, .q-table, .q-table * {
-            font-family: 'Raleway', sans-serif !important;
-            color: #1A1A1A !important;
-        }
-        .q-table, table {
-            background: #FFFFFF !important;
-            border: 1px solid #e2e8f0 !important;
-            border-radius: 8px !important;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.05) !important;
-        }
-        .q-table thead tr, thead tr {
-            background: #f8fafc !important;
-            border-bottom: 2px solid #e2e8f0 !important;
-        }
-        .q-th, thead th {
-            text-transform: uppercase !important;
-            letter-spacing: 0.5px !important;
-            font-weight: 700 !important;
-            font-size: 11px !important;
-            color: #475569 !important;
-            padding: 10px 12px !important;
-        }
-        .q-td, tbody td {
-            font-size: 13px !important;
-            color: #334155 !important;
-            padding: 12px !important;
-            border-bottom: 1px solid #f1f5f9 !important;
-        }
-        .q-tr:hover, tbody tr:hover { background: #f8fafc !important; }
-        tbody tr:last-child .q-td, tbody tr:last-child td { border-bottom: none !important; }
-        .q-table a, table a { color: #0055B8 !important; text-decoration: none !important; }
-        .q-table a:hover, table a:hover { text-decoration: underline !important; }
-        .q-table .q-btn, table .q-btn { color: #0055B8 !important; }
-        .q-table__bottom, .q-table__separator { border-color: #e2e8f0 !important; }
-    </style>
     ''')
+    stylesheet('pages/employers/company_onboarding_roles')
 
     with ui.column().classes('relative flex h-auto min-h-screen w-full flex-col brand-light-mist pt-20'):
         # Progress indicator
@@ -4,6 +4,7 @@ Browse and filter trainees for hiring opportunities using brand guidelines.
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def company_trainee_directory_page():
     """Creates the company trainee directory browse page with brand guidelines and icon fixes."""
@@ -12,119 +13,8 @@ def company_trainee_directory_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Typography classes */
-        .heading-1 { font-size: 3rem; font-weight: 700; line-height: 1.1; }
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .sub-heading { font-size: 1.5rem; font-weight: 500; line-height: 1.4; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .button-label { font-size: 0.875rem; font-weight: 600; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors - TalentConnect Africa Official */
-        .brand-primary { color: #0055B8 !important; }
-        .brand-charcoal { color: #1A1A1A !important; }
-        .brand-slate { color: #4D4D4D !important; }
-        .brand-light-gray { color: #4D4D4D !important; }
-        .brand-light-mist { background-color: #F2F7FB !important; }
-        .brand-primary-bg { background-color: #0055B8 !important; }
-        .brand-success { color: #0055B8 !important; }
-        .brand-warning { color: #4D4D4D !important; }
-        .brand-info { color: #0055B8 !important; }
-
-        /* Custom styling */
-        .filter-sidebar {
-            background: white;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            padding: 24px;
-            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-            height: fit-content;
-            position: sticky;
-            top: 24px;
-        }
-
-        .trainee-card {
-            background: white;
-            border: 1px solid #E5E7EB;
-            border-radius: 12px;
-            padding: 24px;
-            margin-bottom: 16px;
-            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-            transition: all 0.2s ease;
-            cursor: pointer;
-        }
-
-        .trainee-card:hover {
-            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.15);
-            transform: translateY(-2px);
-            border-color: #0055B8;
-        }
-
-        .skill-tag {
-            background-color: #F2F7FB;
-            color: #0055B8;
-            padding: 4px 12px;
-            border-radius: 16px;
-            font-size: 0.875rem;
-            font-weight: 500;
-            margin: 2px;
-        }
-
-        .status-badge {
-            padding: 6px 12px;
-            border-radius: 20px;
-            font-size: 0.75rem;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.025em;
-        }
-
-        .status-available {
-            background-color: #F2F7FB;
-            color: #0055B8;
-        }
-
-        .status-training {
-            background-color: #F5F5F5;
-            color: #4D4D4D;
-        }
-
-        .status-employed {
-            background-color: #F0F0F0;
-            color: #1A1A1A;
-        }
-
-        /* Icon colors - Brand Guidelines */
-        .icon-primary { color: #0055B8; }
-        .icon-secondary { color: #4D4D4D; }
-        .icon-success { color: #0055B8; }
-        .icon-warning { color: #4D4D4D; }
-    </style>
     ''')
+    stylesheet('pages/employers/company_trainee_directory')
 
     with ui.column().classes('relative flex h-auto min-h-screen w-full flex-col bg-gray-50 pt-20'):
         # Header section
@@ -3,6 +3,7 @@ Employer Dashboard page for Dompell Africa with brand guidelines.
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def employer_dashboard_page():
     """Creates the employer dashboard page following brand guidelines with classic design."""
@@ -10,107 +11,8 @@ def employer_dashboard_page():
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&family=Open+Sans:wght@400;600;700&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-        <style>
-            /* Brand Typography */
-            body {
-                font-family: 'Raleway', sans-serif;
-                background: #F2F7FB !important;
-                color: #1A1A1A !important;
-                line-height: 125% !important;
-                margin: 0;
-                padding: 0;
-            }
-            
-            /* Typography Hierarchy */
-            .heading-1 { font-size: 56px; font-weight: 700; color: #1A1A1A; line-height: 110%; letter-spacing: -0.02em; }
-            .heading-2 { font-size: 40px; font-weight: 600; color: #1A1A1A; line-height: 115%; letter-spacing: -0.01em; }
-            .heading-3 { font-size: 32px; font-weight: 500; color: #1A1A1A; line-height: 120%; }
-            .sub-heading { font-size: 24px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-            .sub-heading-2 { font-size: 18px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-            .body-text { font-size: 16px; font-weight: 400; color: #1A1A1A; }
-            .button-label { font-size: 14px; font-weight: 600; color: #1A1A1A; }
-            .form-placeholder { font-size: 14px; font-weight: 500; color: #4D4D4D; }
-            .caption { font-size: 12px; font-weight: 400; color: #4D4D4D; letter-spacing: 8%; }
-            
-            /* Brand Colors */
-            .brand-primary { color: #0055B8 !important; }
-            .brand-primary-bg { background-color: #0055B8 !important; }
-            .brand-charcoal { color: #1A1A1A !important; }
-            .brand-slate { color: #4D4D4D !important; }
-            .brand-light-mist { background-color: #F2F7FB !important; }
-            .classic-sidebar {
-                background: #ffffff !important;
-                border-right: 1px solid rgba(0, 85, 184, 0.1) !important;
-                box-shadow: 2px 0 8px rgba(0, 85, 184, 0.05) !important;
-            }
-            .classic-card {
-                background: #ffffff !important;
-                border-radius: 8px !important;
-                border: 1px solid rgba(0, 85, 184, 0.1) !important;
-                box-shadow: 0 2px 8px rgba(0, 85, 184, 0.05) !important;
-                transition: all 0.3s ease !important;
-            }
-            .classic-card:hover {
-                box-shadow: 0 4px 16px rgba(0, 85, 184, 0.1) !important;
-                transform: translateY(-2px) !important;
-            }
-            .classic-nav-link {
-                padding: 12px 16px !important;
-                border-radius: 8px !important;
-                transition: all 0.3s ease !important;
-                cursor: pointer !important;
-                display: flex !important;
-                align-items: center !important;
-                gap: 12px !important;
-            }
-            .classic-nav-link:hover {
-                background: rgba(0, 85, 184, 0.1) !important;
-                transform: translateX(4px) !important;
-            }
-            .classic-nav-link.active {
-                background: #0055B8 !important;
-                color: white !important;
-            }
-            
-            /* ==========================
-               Table Brand Enforcement
-               ========================== */
-            table, .q-table, .q-table * {
-                font-family: 'Raleway', sans-serif !important;
-                color: #1A1A1A !important;
-            }
-            .q-table, table {
-                background: #FFFFFF !important;
-                border: 1px solid #e2e8f0 !important;
-                border-radius: 8px !important;
-                box-shadow: 0 1px 3px rgba(0,0,0,0.05) !important;
-            }
-            .q-table thead tr, thead tr {
-                background: #f8fafc !important;
-                border-bottom: 2px solid #e2e8f0 !important;
-            }
-            .q-th, thead th {
-                text-transform: uppercase !important;
-                letter-spacing: 0.5px !important;
-                font-weight: 700 !important;
-                font-size: 11px !important;
-                color: #475569 !important;
-                padding: 10px 12px !important;
-            }
-            .q-td, tbody td {
-                font-size: 13px !important;
-                color: #334155 !important;
-                padding: 12px !important;
-                border-bottom: 1px solid #f1f5f9 !important;
-            }
-            .q-tr:hover, tbody tr:hover { background: #f8fafc !important; }
-            tbody tr:last-child .q-td, tbody tr:last-child td { border-bottom: none !important; }
-            .q-table a, table a { color: #0055B8 !important; text-decoration: none !important; }
-            .q-table a:hover, table a:hover { text-decoration: underline !important; }
-            .q-table .q-btn, table .q-btn { color: #0055B8 !important; }
-            .q-table__bottom, .q-table__separator { border-color: #e2e8f0 !important; }
-        </style>
     ''')
+    stylesheet('pages/employers/employer_dashboard')
 
     # Main layout with brand styling
     with ui.column().classes('min-h-screen w-full brand-light-mist'):
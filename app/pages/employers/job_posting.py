@@ -2,9 +2,11 @@
 Employer Job Posting page for Dompell Africa.
 """
 
-from nicegui import ui, app
+from nicegui import ui
 from app.services.api_service import api_service
 from app.services.auth_utils import get_current_user, is_authenticated
+from app.services.static_assets import stylesheet
+from app.services.job_store import job_store
 from datetime import datetime
 import uuid
 
@@ -40,117 +42,8 @@ def job_posting_page():
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-        <style>
-            /* Brand Typography */
-            body {
-                font-family: 'Raleway', sans-serif !important;
-                background: #F2F7FB !important;
-                color: #1A1A1A !important;
-                line-height: 125% !important;
-            }
-            
-            /* Typography Hierarchy */
-            .heading-1 { font-size: 56px; font-weight: 700; color: #1A1A1A; line-height: 110%; letter-spacing: -0.02em; }
-            .heading-2 { font-size: 40px; font-weight: 600; color: #1A1A1A; line-height: 115%; letter-spacing: -0.01em; }
-            .heading-3 { font-size: 32px; font-weight: 500; color: #1A1A1A; line-height: 120%; }
-            .sub-heading { font-size: 24px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-            .sub-heading-2 { font-size: 18px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-            .body-text { font-size: 16px; font-weight: 400; color: #1A1A1A; line-height: 125%; }
-            .button-label { font-size: 14px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-            .form-placeholder { font-size: 14px; font-weight: 500; color: #4D4D4D; line-height: 125%; }
-            .caption { font-size: 12px; font-weight: 400; color: #4D4D4D; letter-spacing: 8%; line-height: 125%; }
-            
-            /* Brand Colors */
-            .brand-primary { color: #0055B8 !important; }
-            .brand-primary-bg { background-color: #0055B8 !important; }
-            .brand-charcoal { color: #1A1A1A !important; }
-            .brand-slate { color: #4D4D4D !important; }
-            .brand-light-mist { background-color: #F2F7FB !important; }
-            
-            /* Force brand font family but EXCLUDE icons */
-            *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-                font-family: 'Raleway', sans-serif !important;
-            }
-            
-            /* Ensure Material Icons work properly */
-            .material-icons, .q-icon, i.material-icons, i[class*="material-icons"] {
-                font-family: 'Material Icons' !important;
-                font-weight: normal !important;
-                font-style: normal !important;
-                font-variant: normal !important;
-                text-transform: none !important;
-                line-height: 1 !important;
-                letter-spacing: normal !important;
-                word-wrap: normal !important;
-                white-space: nowrap !important;
-                direction: ltr !important;
-                -webkit-font-smoothing: antialiased !important;
-                -moz-osx-font-smoothing: grayscale !important;
-                -webkit-font-feature-settings: 'liga' !important;
-            }
-            
-            /* Force all colors to brand colors */
-            [class*="text-gray"], [class*="text-slate"] {
-                color: #4D4D4D !important;
-            }
-            
-            h1, h2, h3, h4, h5, h6, .text-black {
-                color: #1A1A1A !important;
-            }
-            
-            [class*="bg-gray"], [class*="bg-slate"], .bg-slate-100 {
-                background-color: #F2F7FB !important;
-            }
-            
-            .bg-white { background-color: #FFFFFF !important; }
-            body, .min-h-screen { background-color: #F2F7FB !important; }
-            
-            [class*="border-gray"], [class*="border-slate"] {
-                border-color: rgba(77, 77, 77, 0.2) !important;
-            }
-            
-            .q-btn:not([class*="outline"]) { background-color: #0055B8 !important; color: white !important; }
-            .q-input { border-color: rgba(77, 77, 77, 0.3) !important; }
-            
-            /* ==========================
-               Table Brand Enforcement
-               ========================== */
-            table, .q-table, .q-table * {
-                font-family: 'Raleway', sans-serif !important;
-                color: #1A1A1A !important;
-            }
-            .q-table, table {
-                background: #FFFFFF !important;
-                border: 1px solid #e2e8f0 !important;
-                border-radius: 8px !important;
-                box-shadow: 0 1px 3px rgba(0,0,0,0.05) !important;
-            }
-            .q-table thead tr, thead tr {
-                background: #f8fafc !important;
-                border-bottom: 2px solid #e2e8f0 !important;
-            }
-            .q-th, thead th {
-                text-transform: uppercase !important;
-                letter-spacing: 0.5px !important;
-                font-weight: 700 !important;
-                font-size: 11px !important;
-                color: #475569 !important;
-                padding: 10px 12px !important;
-            }
-            .q-td, tbody td {
-                font-size: 13px !important;
-                color: #334155 !important;
-                padding: 12px !important;
-                border-bottom: 1px solid #f1f5f9 !important;
-            }
-            .q-tr:hover, tbody tr:hover { background: #f8fafc !important; }
-            tbody tr:last-child .q-td, tbody tr:last-child td { border-bottom: none !important; }
-            .q-table a, table a { color: #0055B8 !important; text-decoration: none !important; }
-            .q-table a:hover, table a:hover { text-decoration: underline !important; }
-            .q-table .q-btn, table .q-btn { color: #0055B8 !important; }
-            .q-table__bottom, .q-table__separator { border-color: #e2e8f0 !important; }
-        </style>
     ''')
+    stylesheet('pages/employers/job_posting')
 
     async def post_job():
         """Post a new job - currently stores locally, can be updated to use API when available."""
@@ -176,19 +69,17 @@ def job_posting_page():
             'industry': form_data['industry'],
             'deadline': form_data['applicationDeadline'],
             'salary': form_data['salary'],
-            'experience': form_data['experienceLevel'],
+            'experienceLevel': form_data['experienceLevel'],
             'status': 'active',
             'employerId': user.get('id'),
             'employerName': user.get('name'),
             'companyName': user.get('employerProfile', {}).get('companyName', user.get('name')),
-            'postedDate': datetime.now().isoformat(),
+            'postedDate': datetime.now().strftime('%Y-%m-%d'),
             'applications': 0
         }
         
-        # Store in session (temporary until API is ready)
-        job_postings = app.storage.user.get('job_postings', [])
-        job_postings.append(job_posting)
-        app.storage.user['job_postings'] = job_postings
+        # Store in the shared job store (until the API has a jobs endpoint)
+        job_store.add(job_posting)
         
         # TODO: When API is ready, use this:
         # response = api_service.post('/api/jobs', job_posting)
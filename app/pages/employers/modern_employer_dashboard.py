@@ -7,8 +7,14 @@ from app.services.api_service import api_service
 from app.services.auth_utils import get_current_user, is_authenticated
 from app.components.header import header
 from app.components.footer import footer
+from app.services.static_assets import stylesheet
+from app.services.page_profiler import profile_section
+from app.services.job_store import job_store
+from app.services.log import get_logger
 import asyncio
 
+log = get_logger('EMPLOYER_DASHBOARD')
+
 def modern_employer_dashboard():
     """A modern employer dashboard with a clean UI/UX, no icons."""
     
@@ -51,46 +57,14 @@ def modern_employer_dashboard():
         'active_postings': 0,
         'pending_applications': 0
     }
-    # Default to session-stored postings if present, else demo data (ensures overview table is populated)
+    # Postings live in the shared job store; the overview only needs the latest few
     try:
-        dashboard_data['job_postings'] = app.storage.user.get('job_postings', []) or []
-        if not dashboard_data['job_postings']:
-            dashboard_data['job_postings'] = [
-                {
-                    'id': 'demo-1',
-                    'title': 'Software Engineer',
-                    'location': 'Lagos, NG',
-                    'type': 'Full-time',
-                    'experienceLevel': 'Mid Level (2-5 years)',
-                    'status': 'active',
-                    'applications': 14,
-                    'postedDate': '2025-10-15'
-                },
-                {
-                    'id': 'demo-2',
-                    'title': 'Data Analyst',
-                    'location': 'Accra, GH',
-                    'type': 'Contract',
-                    'experienceLevel': 'Entry Level (0-2 years)',
-                    'status': 'active',
-                    'applications': 9,
-                    'postedDate': '2025-10-14'
-                },
-                {
-                    'id': 'demo-3',
-                    'title': 'UI/UX Designer',
-                    'location': 'Remote',
-                    'type': 'Full-time',
-                    'experienceLevel': 'Senior Level (5+ years)',
-                    'status': 'closed',
-                    'applications': 22,
-                    'postedDate': '2025-10-10'
-                },
-            ]
-        dashboard_data['active_postings'] = len([j for j in dashboard_data['job_postings'] if j.get('status') == 'active'])
-        dashboard_data['pending_applications'] = sum(j.get('applications', 0) for j in dashboard_data['job_postings'])
-    except Exception:
-        pass
+        dashboard_data['job_postings'] = job_store.query(employer_id=user_id, sort='Posted', limit=5)['items']
+        summary = job_store.summary(employer_id=user_id)
+        dashboard_data['active_postings'] = summary['active']
+        dashboard_data['pending_applications'] = summary['applications']
+    except Exception as e:
+        log.warning('Could not load job postings: %s', e)
     
     async def fetch_dashboard_data():
         """Fetch all dashboard data from API."""
@@ -114,480 +88,9 @@ def modern_employer_dashboard():
     
     # Professional Modern Dashboard Styles (from institution dashboard)
     ui.add_head_html('''
-    <link href="https://cdn.tailwindcss.com" rel="stylesheet">
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap" rel="stylesheet">
-    <style>
-        * { 
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-            box-sizing: border-box;
-        }
-        
-        body {
-            background: #FFFFFF;
-            font-size: 14px;
-            line-height: 1.5;
-        }
-        
-        /* Professional Card System */
-        .pro-card {
-            background: white;
-            border-radius: 8px;
-            border: 1px solid #e2e8f0;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
-            padding: 12px;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        }
-        
-        .pro-card:hover {
-            box-shadow: 0 3px 10px rgba(0, 85, 184, 0.08);
-            transform: translateY(-1px);
-        }
-        
-        /* Metric Cards - Dark Blue Analytics Cards */
-        .metric-card {
-            background: linear-gradient(135deg, #003d82 0%, #002855 100%);
-            border-radius: 20px;
-            border: 1px solid #004494;
-            padding: 28px;
-            margin: 8px 0;
-            margin-left: 15px;
-            margin-right: 15px;
-            transition: all 0.3s ease;
-            position: relative;
-            overflow: hidden;
-            box-shadow: 0 4px 12px rgba(0, 61, 130, 0.3);
-            color: white;
-        }
-        
-        .metric-card::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            right: -50%;
-            width: 200%;
-            height: 200%;
-            background: radial-gradient(circle, rgba(0, 85, 184, 0.2) 0%, transparent 70%);
-            animation: pulse 4s ease-in-out infinite;
-        }
-        
-        @keyframes pulse {
-            0%, 100% { transform: scale(1); opacity: 0.5; }
-            50% { transform: scale(1.1); opacity: 0.8; }
-        }
-        
-        .metric-card:hover {
-            border-color: #0055B8 !important;
-            box-shadow: 0 8px 20px rgba(0, 85, 184, 0.4) !important;
-            transform: translateY(-4px);
-        }
-        
-        /* White text for metric cards */
-        .metric-card * {
-            color: white !important;
-        }
-        
-        .metric-value {
-            font-size: 20px;
-            font-weight: 800;
-            color: white !important;
-            line-height: 1;
-            margin: 6px 0 4px 0;
-        }
-        
-        .metric-label {
-            font-size: 10px;
-            color: rgba(255, 255, 255, 0.8) !important;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .metric-trend {
-            font-size: 11px;
-            color: #4ade80 !important;
-            font-weight: 600;
-            margin-top: 4px;
-        }
-        
-        /* Dark Sidebar Design */
-        .pro-sidebar {
-            background: linear-gradient(180deg, #1e293b 0%, #0f172a 100%);
-            border-right: 1px solid #334155;
-            height: 100vh;
-            position: fixed;
-            left: 0;
-            top: 64px;
-            width: 280px;
-            z-index: 1001;
-            transition: transform 0.3s ease;
-        }
-        
-        /* Mobile Responsive Styles */
-        @media (max-width: 1023px) {
-            .pro-sidebar {
-                transform: translateX(-100%);
-                box-shadow: 2px 0 8px rgba(0, 0, 0, 0.1);
-            }
-            
-            .pro-sidebar.mobile-open {
-                transform: translateX(0);
-            }
-            
-            .dashboard-main-content {
-                margin-left: 0 !important;
-                padding: 16px !important;
-            }
-            
-            .metric-card {
-                margin: 8px 0 !important;
-            }
-            
-            .metric-value {
-                font-size: 18px !important;
-            }
-            
-            .pro-card {
-                padding: 12px !important;
-            }
-            
-            /* Stack cards vertically on mobile */
-            .grid {
-                grid-template-columns: 1fr !important;
-            }
-            
-            /* Mobile hamburger menu button */
-            .mobile-hamburger {
-                display: flex !important;
-                position: fixed;
-                top: 72px;
-                left: 16px;
-                width: 44px;
-                height: 44px;
-                background: #0055B8;
-                border-radius: 8px;
-                align-items: center;
-                justify-content: center;
-                box-shadow: 0 2px 8px rgba(0, 85, 184, 0.3);
-                z-index: 999;
-                cursor: pointer;
-                transition: all 0.3s ease;
-            }
-            
-            .mobile-hamburger:hover {
-                background: #004494;
-                box-shadow: 0 4px 12px rgba(0, 85, 184, 0.4);
-            }
-            
-            .mobile-hamburger .material-icons {
-                color: white;
-                font-size: 24px;
-            }
-        }
-        
-        @media (min-width: 1024px) {
-            .mobile-hamburger {
-                display: none !important;
-            }
-            
-            .dashboard-main-content {
-                margin-left: 280px;
-            }
-        }
-        
-        /* Mobile overlay */
-        .mobile-overlay {
-            display: none;
-            position: fixed;
-            top: 64px;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: rgba(0, 0, 0, 0.5);
-            z-index: 1000;
-        }
-        
-        .mobile-overlay.active {
-            display: block;
-        }
-        
-        /* Dark Navigation */
-        .nav-item {
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            width: 100%;
-            padding: 12px 16px;
-            margin: 4px 0;
-            border-radius: 10px;
-            text-align: left;
-            transition: all 0.2s ease;
-            background: transparent;
-            border: none;
-            font-size: 14px;
-            font-weight: 500;
-            color: #94a3b8;
-            cursor: pointer;
-        }
-        
-        .nav-item:hover {
-            background: rgba(255, 255, 255, 0.08);
-            color: #ffffff !important;
-        }
-        
-        .nav-item.active {
-            background: linear-gradient(135deg, #0055B8 0%, #003d82 100%) !important;
-            color: white !important;
-            box-shadow: 0 4px 12px rgba(0, 85, 184, 0.4) !important;
-        }
-        
-        /* Professional Buttons */
-        .pro-btn-primary, .pro-btn-primary * {
-            background: linear-gradient(135deg, #0055B8 0%, #003d82 100%) !important;
-            color: white !important;
-            padding: 8px 16px !important;
-            border-radius: 8px !important;
-            font-weight: 600 !important;
-            border: none !important;
-            transition: all 0.3s ease !important;
-            font-size: 13px !important;
-            box-shadow: 0 2px 8px rgba(0, 85, 184, 0.2) !important;
-        }
-        
-        .pro-btn-primary:hover, .pro-btn-primary:hover * {
-            box-shadow: 0 4px 12px rgba(0, 85, 184, 0.3) !important;
-            transform: translateY(-1px) !important;
-            background: linear-gradient(135deg, #0055B8 0%, #003d82 100%) !important;
-            color: white !important;
-        }
-        
-        .pro-btn-secondary, .pro-btn-secondary * {
-            background: white !important;
-            color: #0055B8 !important;
-            padding: 7px 14px !important;
-            border-radius: 8px !important;
-            font-weight: 600 !important;
-            border: 2px solid #e2e8f0 !important;
-            transition: all 0.3s ease !important;
-            font-size: 12px !important;
-        }
-        
-        .pro-btn-secondary:hover, .pro-btn-secondary:hover * {
-            background: #f8fafc !important;
-            border-color: #0055B8 !important;
-            transform: translateY(-1px) !important;
-            color: #0055B8 !important;
-        }
-        
-        /* Force all buttons to follow brand profile */
-        button, .q-btn {
-            font-family: 'Inter', sans-serif !important;
-        }
-        
-        button.pro-btn-primary, .q-btn.pro-btn-primary {
-            background: linear-gradient(135deg, #0055B8 0%, #003d82 100%) !important;
-            color: white !important;
-            border: none !important;
-        }
-        
-        button.pro-btn-secondary, .q-btn.pro-btn-secondary {
-            background: white !important;
-            color: #0055B8 !important;
-            border: 2px solid #e2e8f0 !important;
-        }
-        
-        /* Action Buttons - Redesigned */
-        .action-button-primary {
-            background: linear-gradient(135deg, #0055B8 0%, #003d82 100%);
-            color: white;
-            padding: 12px 20px;
-            border-radius: 10px;
-            font-weight: 600;
-            font-size: 14px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            box-shadow: 0 2px 8px rgba(0, 85, 184, 0.25);
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            flex: 1;
-            min-width: 180px;
-        }
-        
-        .action-button-primary:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 16px rgba(0, 85, 184, 0.35);
-        }
-        
-        .action-button-primary * {
-            color: white !important;
-        }
-        
-        .action-button-secondary {
-            background: white;
-            color: #0055B8;
-            padding: 12px 20px;
-            border-radius: 10px;
-            font-weight: 600;
-            font-size: 14px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            border: 2px solid #e2e8f0;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            flex: 1;
-            min-width: 180px;
-        }
-        
-        .action-button-secondary:hover {
-            background: #f8fafc;
-            border-color: #0055B8;
-            transform: translateY(-2px);
-            box-shadow: 0 2px 8px rgba(0, 85, 184, 0.15);
-        }
-        
-        .action-button-secondary * {
-            color: #0055B8 !important;
-        }
-        
-        @media (max-width: 768px) {
-            .action-button-primary,
-            .action-button-secondary {
-                flex: 1 1 100%;
-                min-width: 100%;
-            }
-        }
-        
-        /* Section Header */
-        .section-header {
-            margin-bottom: 16px;
-            padding-bottom: 12px;
-            border-bottom: 2px solid #e2e8f0;
-        }
-        
-        .section-title {
-            font-size: 20px;
-            font-weight: 800;
-            color: #0f172a;
-            line-height: 1.2;
-        }
-        
-        .section-subtitle {
-            font-size: 13px;
-            color: #64748b;
-            margin-top: 3px;
-        }
-
-        /* ==========================
-           Table Brand Enforcement
-           ========================== */
-        table, .q-table, .q-table * {
-            font-family: 'Inter', sans-serif !important;
-            color: #1A1A1A !important;
-        }
-        .q-table, table {
-            background: #FFFFFF !important;
-            border: 1px solid #e2e8f0 !important;
-            border-radius: 8px !important;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.05) !important;
-        }
-        .q-table thead tr, thead tr {
-            background: #f8fafc !important;
-            border-bottom: 2px solid #e2e8f0 !important;
-        }
-        .q-th, thead th {
-            text-transform: uppercase !important;
-            letter-spacing: 0.5px !important;
-            font-weight: 700 !important;
-            font-size: 11px !important;
-            color: #475569 !important;
-            padding: 10px 12px !important;
-        }
-        .q-td, tbody td {
-            font-size: 13px !important;
-            color: #334155 !important;
-            padding: 12px !important;
-            border-bottom: 1px solid #f1f5f9 !important;
-        }
-        .q-tr:hover, tbody tr:hover { background: #f8fafc !important; }
-        tbody tr:last-child .q-td, tbody tr:last-child td { border-bottom: none !important; }
-        .q-table a, table a { color: #0055B8 !important; text-decoration: none !important; }
-        .q-table a:hover, table a:hover { text-decoration: underline !important; }
-        .q-table .q-btn, table .q-btn { color: #0055B8 !important; }
-        .q-table__bottom, .q-table__separator { border-color: #e2e8f0 !important; }
-        
-        /* Table Responsive - Horizontal Scroll */
-        .table-container {
-            overflow-x: auto;
-            -webkit-overflow-scrolling: touch;
-        }
-        
-        table {
-            min-width: 600px;
-            width: 100%;
-        }
-        
-        /* Overview Table - More elegant spacing */
-        .overview-table th {
-            background: #f8fafc;
-            padding: 14px 16px;
-            text-align: left;
-            font-size: 11px;
-            font-weight: 700;
-            color: #475569;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            border-bottom: 2px solid #e2e8f0;
-        }
-        
-        .overview-table td {
-            padding: 18px 16px;
-            border-bottom: 1px solid #f1f5f9;
-            font-size: 13px;
-            color: #334155;
-        }
-        
-        .overview-table tr:hover {
-            background: #fafbfc;
-        }
-        
-        .overview-table tr:last-child td {
-            border-bottom: none;
-        }
-        
-        /* Grid Layouts */
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-            gap: 12px;
-            margin-bottom: 20px;
-        }
-        
-        .content-grid {
-            display: grid;
-            gap: 14px;
-        }
-        
-        /* Scrollbar */
-        ::-webkit-scrollbar {
-            width: 8px;
-            height: 8px;
-        }
-        
-        ::-webkit-scrollbar-track {
-            background: #f1f5f9;
-        }
-        
-        ::-webkit-scrollbar-thumb {
-            background: #cbd5e1;
-            border-radius: 4px;
-        }
-        
-        ::-webkit-scrollbar-thumb:hover {
-            background: #94a3b8;
-        }
-    </style>
     ''')
+    stylesheet('pages/employers/modern_employer_dashboard')
     
     # State management
     active_section = {'current': 'overview'}
@@ -708,6 +211,7 @@ def modern_employer_dashboard():
             with content_area:
                 render_section(section)
         
+        @profile_section
         def render_section(section):
             """Render content based on active section."""
             with ui.element('div').classes('fade-in'):
@@ -724,6 +228,7 @@ def modern_employer_dashboard():
                 elif section == 'settings':
                     render_settings()
         
+        @profile_section
         def render_overview():
             """Render the overview dashboard section."""
             # Welcome Header
@@ -811,47 +316,12 @@ def modern_employer_dashboard():
                             ui.icon('business', size='20px')
                             ui.label('Company Profile')
         
+        @profile_section
         def render_job_postings():
             """Render job postings section."""
             # State for showing create form
             show_create_form = {'visible': False}
             
-            # Get jobs from session storage
-            posted_jobs = app.storage.user.get('job_postings', [])
-            if not posted_jobs:
-                posted_jobs = [
-                    {
-                        'id': 'demo-1',
-                        'title': 'Software Engineer',
-                        'location': 'Lagos, NG',
-                        'type': 'Full-time',
-                        'experienceLevel': 'Mid Level (2-5 years)',
-                        'status': 'active',
-                        'applications': 14,
-                        'postedDate': '2025-10-15'
-                    },
-                    {
-                        'id': 'demo-2',
-                        'title': 'Data Analyst',
-                        'location': 'Accra, GH',
-                        'type': 'Contract',
-                        'experienceLevel': 'Entry Level (0-2 years)',
-                        'status': 'active',
-                        'applications': 9,
-                        'postedDate': '2025-10-14'
-                    },
-                    {
-                        'id': 'demo-3',
-                        'title': 'UI/UX Designer',
-                        'location': 'Remote',
-                        'type': 'Full-time',
-                        'experienceLevel': 'Senior Level (5+ years)',
-                        'status': 'closed',
-                        'applications': 22,
-                        'postedDate': '2025-10-10'
-                    },
-                ]
-            
             def toggle_create_form():
                 show_create_form['visible'] = not show_create_form['visible']
                 navigate_to_section('postings')
@@ -887,36 +357,23 @@ def modern_employer_dashboard():
                     ui.select([10, 20, 50], value=postings_state['page_size'], label='Page size')\
                         .props('outlined dense').on('update:model-value', lambda e: (postings_state.update({'page_size': int(e.value), 'page': 1}), navigate_to_section('postings')))
 
-            # Apply filters
-            filtered = posted_jobs
-            if postings_state['status_filter'] != 'All':
-                filtered = [j for j in filtered if (j.get('status') or '').lower() == postings_state['status_filter'].lower()]
-            if postings_state['type_filter'] != 'All':
-                filtered = [j for j in filtered if (j.get('type') or '') == postings_state['type_filter']]
-
-            # Apply sorting
-            key = postings_state['sort_by']
-            reverse = postings_state['sort_dir'] == 'desc'
-            def sort_key(j):
-                if key == 'Applications':
-                    return j.get('applications', 0)
-                if key == 'Posted':
-                    return j.get('postedDate', '')
-                if key == 'Experience':
-                    return j.get('experienceLevel', '')
-                return (j.get(key.lower(), '') if key in ['Title','Location','Type','Status'] else '')
-            try:
-                filtered = sorted(filtered, key=sort_key, reverse=reverse)
-            except Exception:
-                pass
-
-            # Pagination
-            total = len(filtered)
+            # Filter, sort and page in the job store
             page_size = int(postings_state['page_size'])
-            total_pages = max(1, (total + page_size - 1) // page_size)
-            postings_state['page'] = min(max(1, postings_state['page']), total_pages)
-            start = (postings_state['page'] - 1) * page_size
-            page_rows = filtered[start:start+page_size]
+            query = {
+                'employer_id': user_id,
+                'status': None if postings_state['status_filter'] == 'All' else postings_state['status_filter'],
+                'type': None if postings_state['type_filter'] == 'All' else postings_state['type_filter'],
+                'sort': postings_state['sort_by'],
+                'direction': postings_state['sort_dir'],
+            }
+            postings_state['page'] = max(1, postings_state['page'])
+            result = job_store.query(**query, limit=page_size, offset=(postings_state['page'] - 1) * page_size)
+            total_pages = max(1, (result['total'] + page_size - 1) // page_size)
+            if postings_state['page'] > total_pages:
+                # Postings were closed or filtered away; fall back to the last page
+                postings_state['page'] = total_pages
+                result = job_store.query(**query, limit=page_size, offset=(total_pages - 1) * page_size)
+            page_rows = result['items']
             
             if page_rows:
                 # Render as a brand-styled table
@@ -969,16 +426,14 @@ def modern_employer_dashboard():
         
         def close_job_posting(job_id):
             """Close/deactivate a job posting."""
-            jobs = app.storage.user.get('job_postings', [])
-            for job in jobs:
-                if job.get('id') == job_id:
-                    job['status'] = 'closed'
-                    app.storage.user['job_postings'] = jobs
-                    ui.notify(f"Job posting '{job.get('title')}' has been closed", type='positive')
-                    # Refresh the section
-                    navigate_to_section('postings')
-                    break
+            job = job_store.get(job_id)
+            if job and str(job.get('employerId')) == str(user_id):
+                job_store.set_status(job_id, 'closed')
+                ui.notify(f"Job posting '{job.get('title')}' has been closed", type='positive')
+                # Refresh the section
+                navigate_to_section('postings')
         
+        @profile_section
         def render_create_job_form(on_cancel):
             """Render inline job creation form."""
             from datetime import datetime
@@ -1014,13 +469,12 @@ def modern_employer_dashboard():
                     'salary': job_data['salary'],
                     'status': 'active',
                     'applications': 0,
-                    'postedDate': datetime.now().strftime('%Y-%m-%d')
+                    'postedDate': datetime.now().strftime('%Y-%m-%d'),
+                    'employerId': user_id,
+                    'companyName': company_name,
                 }
                 
-                # Save to storage
-                jobs = app.storage.user.get('job_postings', [])
-                jobs.append(new_job)
-                app.storage.user['job_postings'] = jobs
+                job_store.add(new_job)
                 
                 ui.notify(f"Job posting '{job_data['title']}' created successfully!", type='positive')
                 navigate_to_section('postings')
@@ -1045,6 +499,7 @@ def modern_employer_dashboard():
                         ui.button('Create Job Posting', on_click=save_job).classes('btn-primary')
 
         
+        @profile_section
         def render_applications():
             """Render applications section as a table."""
             # Load applications from session if available, else sample
@@ -1125,6 +580,7 @@ def modern_employer_dashboard():
                 ui.label(f"Page {applications_state['page']} of {total_pages}").classes('text-sm text-gray-600')
                 ui.button('Next', on_click=lambda: (applications_state.update({'page': min(total_pages, applications_state['page']+1)}), navigate_to_section('applications'))).props('outline size=sm')
 
+        @profile_section
         def render_candidates():
             """Render candidates section as a table."""
             # Load candidates from session if available, else sample
@@ -1164,6 +620,7 @@ def modern_employer_dashboard():
                                             ui.button('Contact', on_click=lambda cand=c: ui.notify(f"Contacting {cand.get('name')}"))\
                                                 .props('flat size=sm')
         
+        @profile_section
         def render_company_profile():
             """Render company profile section."""
             ui.label('Company Profile').classes('section-header')
@@ -1195,6 +652,7 @@ def modern_employer_dashboard():
                     ui.icon('edit', size='20px')
                     ui.label('Edit Company Profile')
         
+        @profile_section
         def render_settings():
             """Render settings section."""
             ui.label('Account Settings').classes('section-header')
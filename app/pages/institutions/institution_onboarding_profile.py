@@ -5,9 +5,11 @@ Comprehensive institution onboarding with profile setup using brand guidelines.
 
 from nicegui import ui, app
 from app.services.api_service import api_service
+from app.services.upload_queue import upload_queue
+from app.services.organization_index import organization_index
 from app.services.auth_utils import get_current_user, is_authenticated
+from app.services.static_assets import stylesheet
 from urllib.parse import quote
-import base64
 
 def institution_onboarding_profile_page():
     """Creates the institution profile creation page with brand guidelines."""
@@ -62,131 +64,30 @@ def institution_onboarding_profile_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Typography classes */
-        .heading-1 { font-size: 3rem; font-weight: 700; line-height: 1.1; }
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .sub-heading { font-size: 1.5rem; font-weight: 500; line-height: 1.4; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .button-label { font-size: 0.875rem; font-weight: 600; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-light-mist { background-color: #F2F7FB; }
-        .brand-primary-bg { background-color: #0055B8; }
-
-        /* Custom styling for forms */
-        .form-section {
-            background: white;
-            border-radius: 12px;
-            padding: 24px;
-            margin-bottom: 24px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        }
-
-        /* Progress indicator */
-        .progress-step {
-            width: 40px;
-            height: 40px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: 600;
-            margin-right: 16px;
-        }
-        
-        .step-active {
-            background-color: #0055B8;
-            color: white;
-        }
-        
-        .step-completed {
-            background-color: #10B981;
-            color: white;
-        }
-        
-        .step-pending {
-            background-color: #E5E7EB;
-            color: #6B7280;
-        }
-        
-        .logo-preview {
-            width: 120px;
-            height: 120px;
-            border-radius: 12px;
-            object-fit: cover;
-            border: 2px solid #E5E7EB;
-        }
-    </style>
     ''')
+    stylesheet('pages/institutions/institution_onboarding_profile')
     
     # Helper functions
-    async def upload_logo_to_s3(file_content, file_name, file_type):
-        """Upload logo to S3 and return URL."""
-        try:
-            upload_path = f"institution_logos/{user_id}"
-            response = api_service.upload_file(
-                file_content=file_content,
-                file_name=file_name,
-                file_type=file_type,
-                upload_path=upload_path
-            )
-            
-            if response and response.get('success'):
-                # Construct S3 URL
-                encoded_filename = quote(file_name)
-                s3_url = f"https://ajuraconnect.s3.amazonaws.com/{user_id}/{encoded_filename}"
-                ui.notify("Logo uploaded successfully!", type='positive')
-                return s3_url
-            else:
-                ui.notify(f"Upload failed: {response.get('message', 'Unknown error')}", type='negative')
-                return None
-        except Exception as e:
-            ui.notify(f"Error uploading logo: {str(e)}", type='negative')
-            return None
+    def logo_url_for(file_name):
+        """S3 URL of an uploaded logo (the backend does not return it)."""
+        encoded_filename = quote(file_name)
+        return f"https://ajuraconnect.s3.amazonaws.com/{user_id}/{encoded_filename}"
     
     # State for dynamic UI elements
     logo_preview_container = {'img': None}
     
-    async def handle_logo_upload(e):
-        """Handle logo file upload."""
-        if e.content:
-            file_name = e.name
-            file_type = e.type
-            # Read the file content from SpooledTemporaryFile
-            content = e.content.read()
-            file_content = base64.b64encode(content).decode('utf-8')
-            
-            logo_url = await upload_logo_to_s3(file_content, file_name, file_type)
-            if logo_url:
+    def handle_logo_upload(e):
+        """Queue the logo upload; the preview updates when the job finishes."""
+        job = upload_queue.submit(e)
+        if job is None:
+            return
+        ui.notify("Uploading logo...", type='info')
+        
+        def on_job_change(job):
+            if job.status == 'done':
+                logo_url = logo_url_for(job.name)
                 form_data['logoUrl'] = logo_url
+                ui.notify("Logo uploaded successfully!", type='positive')
                 # Update preview
                 if logo_preview_container['img']:
                     logo_preview_container['img'].set_source(logo_url)
@@ -196,6 +97,10 @@ def institution_onboarding_profile_page():
                         logo_preview_parent.clear()
                         logo_preview_container['img'] = ui.image(logo_url).classes('logo-preview')
                 update_preview()
+            elif job.status == 'failed':
+                ui.notify(f"Upload failed: {job.error}", type='negative')
+        
+        job.subscribe(on_job_change)
     
     async def save_profile():
         """Save institution profile data via API."""
@@ -238,6 +143,7 @@ def institution_onboarding_profile_page():
                 # Success
                 response_data = response.json()
                 ui.notify("Institution profile created successfully!", type='positive')
+                organization_index.upsert(response_data.get('data'))
                 
                 # Update session storage
                 user_data = app.storage.user.get('user_data', {})
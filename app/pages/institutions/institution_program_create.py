@@ -10,6 +10,7 @@ from app.services.api_service import api_service
 from app.services.auth_utils import get_current_user
 from app.components.header import header
 from app.components.footer import footer
+from app.services.static_assets import stylesheet
 
 
 def institution_program_create_page():
@@ -23,8 +24,8 @@ def institution_program_create_page():
     
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Work+Sans:wght@400;500;600;700;800;900&display=swap" rel="stylesheet" />
-        <style> body { font-family: 'Work Sans', sans-serif; } </style>
     ''')
+    stylesheet('pages/institutions/institution_program_create')
     
     header('/institution/programs')
     
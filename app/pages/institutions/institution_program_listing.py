@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 import uuid
 from app.services.api_service import api_service
 from app.services.auth_utils import get_current_user
+from app.services.static_assets import stylesheet
 
 def institution_program_listing_page():
     """Creates the institution program listing page based on the template."""
@@ -19,8 +20,8 @@ def institution_program_listing_page():
     
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Work+Sans:wght@400;500;600;700;800;900&display=swap" rel="stylesheet" />
-        <style> body { font-family: 'Work Sans', sans-serif; } </style>
     ''')
+    stylesheet('pages/institutions/institution_program_listing')
 
     # Fetch programs from backend API
     programs = []
@@ -3,6 +3,7 @@ Institution Settings Page for Dompell Africa
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def institution_settings_page():
     """Creates the institution settings page with brand guidelines."""
@@ -11,37 +12,8 @@ def institution_settings_page():
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-        <style>
-            * { font-family: 'Raleway', sans-serif !important; }
-            
-            .heading-1 { font-size: 48px; font-weight: 700; color: #1A1A1A; line-height: 110%; }
-            .heading-2 { font-size: 32px; font-weight: 600; color: #1A1A1A; line-height: 115%; }
-            .sub-heading { font-size: 24px; font-weight: 600; color: #1A1A1A; }
-            .body-text { font-size: 16px; font-weight: 400; color: #1A1A1A; }
-            .caption { font-size: 12px; font-weight: 400; color: #4D4D4D; }
-            
-            .brand-primary { color: #0055B8 !important; }
-            .brand-primary-bg { background-color: #0055B8 !important; }
-            
-            .settings-card {
-                background: white;
-                border-radius: 12px;
-                border: 1px solid rgba(0, 85, 184, 0.1);
-                box-shadow: 0 2px 8px rgba(0, 85, 184, 0.05);
-                padding: 24px;
-                margin-bottom: 24px;
-            }
-            
-            .settings-section {
-                border-bottom: 1px solid #E5E7EB;
-                padding: 20px 0;
-            }
-            
-            .settings-section:last-child {
-                border-bottom: none;
-            }
-        </style>
     ''')
+    stylesheet('pages/institutions/institution_settings')
     
     with ui.column().classes('w-full min-h-screen').style('background: #F2F7FB; padding-top: 5rem;'):
         with ui.column().classes('w-full max-w-5xl mx-auto px-6 py-8'):
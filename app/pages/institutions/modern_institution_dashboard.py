@@ -6,11 +6,18 @@ Complete redesign with modern UI, API integration, and analytics
 from nicegui import ui, app
 from app.services.auth_utils import get_current_user, is_authenticated, logout
 from app.services.api_service import ApiService
+from app.services.async_api_service import async_api_service
+from app.services.organization_index import organization_index
+from app.services.static_assets import stylesheet
+from app.services.page_profiler import profile_section
+from app.services.log import get_logger
 import json
 from pathlib import Path
 from datetime import datetime
 
-def modern_institution_dashboard():
+log = get_logger('INSTITUTION_DASH')
+
+async def modern_institution_dashboard():
     """Classic professional institution dashboard with brand colors."""
     
     # Check authentication
@@ -43,32 +50,16 @@ def modern_institution_dashboard():
         'active_section': 'overview'
     }
     
-    def load_organization_data():
+    async def load_organization_data():
         """Load organization profile from API."""
         try:
-            # Try to get all organizations and find user's org
-            response = api_service.get_all_organizations()
-            print(f"[INSTITUTION_DASH] Organization API Response: {response.status_code}")
-            
-            if response.ok and response.content:
-                data = response.json()
-                orgs = data.get('data', [])
-                # Find organization for current user
-                user_org = next((org for org in orgs if org.get('userId') == user_id), None)
-                if user_org:
-                    state['organization'] = user_org
-                    print(f"[INSTITUTION_DASH] Loaded organization: {user_org.get('name')}")
-                else:
-                    print(f"[INSTITUTION_DASH] No organization found for user")
-                    state['organization'] = {
-                        'name': user.get('name', 'MEST Ghana'),
-                        'description': 'Professional training institution',
-                        'website': '',
-                        'location': '',
-                        '_demo': True
-                    }
+            # Direct userId lookup in the locally maintained organization index
+            user_org = await organization_index.lookup(user_id, async_api_service)
+            if user_org:
+                state['organization'] = user_org
+                log.debug('Loaded organization: %s', user_org.get('name'))
             else:
-                print(f"[INSTITUTION_DASH] Failed to load organization, using demo")
+                log.debug('No organization found for user, using demo')
                 state['organization'] = {
                     'name': user.get('name', 'MEST Ghana'),
                     'description': 'Professional training institution',
@@ -83,19 +74,19 @@ def modern_institution_dashboard():
                 '_demo': True
             }
     
-    def load_dashboard_data():
+    async def load_dashboard_data():
         """Loads dashboard data from API with demo fallback."""
         print(f"[INSTITUTION_DASH] Loading data for user: {user_id}")
         
         # Load organization first
-        load_organization_data()
+        await load_organization_data()
         
         try:
             # Try to load programs from API
-            response = api_service.get_new_programs(user_id)
+            response = await async_api_service.get_new_programs(user_id)
             print(f"[INSTITUTION_DASH] API Response status: {response.status_code}")
             
-            if response.ok and response.content:
+            if response.is_success and response.content:
                 data = response.json()
                 api_programs = data.get('data', [])
                 print(f"[INSTITUTION_DASH] Loaded {len(api_programs)} programs from API")
@@ -189,472 +180,12 @@ def modern_institution_dashboard():
     
     # Professional Modern Dashboard Styles
     ui.add_head_html('''
-    <link href="https://cdn.tailwindcss.com" rel="stylesheet">
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap" rel="stylesheet">
-    <style>
-        * { 
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-            box-sizing: border-box;
-        }
-        
-        body {
-            background: #f8fafc;
-            font-size: 14px;
-            line-height: 1.5;
-        }
-        
-        /* Professional Card System */
-        .pro-card {
-            background: white;
-            border-radius: 8px;
-            border: 1px solid #e2e8f0;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
-            padding: 12px;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        }
-        
-        .pro-card:hover {
-            box-shadow: 0 3px 10px rgba(0, 85, 184, 0.08);
-            transform: translateY(-1px);
-        }
-        
-        /* Metric Cards - Dark Blue Analytics Cards */
-        .metric-card {
-            background: linear-gradient(135deg, #003d82 0%, #002855 100%);
-            border-radius: 20px;
-            border: 1px solid #004494;
-            padding: 28px;
-            margin: 8px 0;
-            margin-left: 15px;
-            margin-right: 15px;
-            transition: all 0.3s ease;
-            position: relative;
-            overflow: hidden;
-            box-shadow: 0 4px 12px rgba(0, 61, 130, 0.3);
-            color: white;
-        }
-        
-        .metric-card::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            right: -50%;
-            width: 200%;
-            height: 200%;
-            background: radial-gradient(circle, rgba(0, 85, 184, 0.2) 0%, transparent 70%);
-            animation: pulse 4s ease-in-out infinite;
-        }
-        
-        @keyframes pulse {
-            0%, 100% { transform: scale(1); opacity: 0.5; }
-            50% { transform: scale(1.1); opacity: 0.8; }
-        }
-        
-        .metric-card:hover {
-            border-color: #0055B8 !important;
-            box-shadow: 0 8px 20px rgba(0, 85, 184, 0.4) !important;
-            transform: translateY(-4px);
-        }
-        
-        /* White text for metric cards */
-        .metric-card * {
-            color: white !important;
-        }
-        
-        .metric-value {
-            font-size: 20px;
-            font-weight: 800;
-            color: white !important;
-            line-height: 1;
-            margin: 6px 0 4px 0;
-        }
-        
-        .metric-label {
-            font-size: 10px;
-            color: rgba(255, 255, 255, 0.8) !important;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .metric-trend {
-            font-size: 11px;
-            color: #4ade80 !important;
-            font-weight: 600;
-            margin-top: 4px;
-        }
-        
-        /* Dark Sidebar Design */
-        .pro-sidebar {
-            background: linear-gradient(180deg, #1e293b 0%, #0f172a 100%);
-            border-right: 1px solid #334155;
-            height: 100vh;
-            position: fixed;
-            left: 0;
-            top: 64px;
-            width: 280px;
-            z-index: 1001;
-            transition: transform 0.3s ease;
-        }
-        
-        /* Mobile Responsive Styles */
-        @media (max-width: 1023px) {
-            .pro-sidebar {
-                transform: translateX(-100%);
-                box-shadow: 2px 0 8px rgba(0, 0, 0, 0.1);
-            }
-            
-            .pro-sidebar.mobile-open {
-                transform: translateX(0);
-            }
-            
-            .dashboard-main-content {
-                margin-left: 0 !important;
-                padding: 16px !important;
-            }
-            
-            .metric-card {
-                margin: 8px 0 !important;
-            }
-            
-            .metric-value {
-                font-size: 18px !important;
-            }
-            
-            .pro-card {
-                padding: 12px !important;
-            }
-            
-            /* Stack cards vertically on mobile */
-            .grid {
-                grid-template-columns: 1fr !important;
-            }
-            
-            /* Mobile hamburger menu button */
-            .mobile-hamburger {
-                display: flex !important;
-                position: fixed;
-                top: 72px;
-                left: 16px;
-                width: 44px;
-                height: 44px;
-                background: #0055B8;
-                border-radius: 8px;
-                align-items: center;
-                justify-content: center;
-                box-shadow: 0 2px 8px rgba(0, 85, 184, 0.3);
-                z-index: 999;
-                cursor: pointer;
-                transition: all 0.3s ease;
-            }
-            
-            .mobile-hamburger:hover {
-                background: #004494;
-                box-shadow: 0 4px 12px rgba(0, 85, 184, 0.4);
-            }
-            
-            .mobile-hamburger .material-icons {
-                color: white;
-                font-size: 24px;
-            }
-        }
-        
-        @media (min-width: 1024px) {
-            .mobile-hamburger {
-                display: none !important;
-            }
-            
-            .dashboard-main-content {
-                margin-left: 280px;
-            }
-        }
-        
-        /* Mobile overlay */
-        .mobile-overlay {
-            display: none;
-            position: fixed;
-            top: 64px;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: rgba(0, 0, 0, 0.5);
-            z-index: 1000;
-        }
-        
-        .mobile-overlay.active {
-            display: block;
-        }
-        
-        /* Dark Navigation */
-        .nav-item {
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            width: 100%;
-            padding: 12px 16px;
-            margin: 4px 0;
-            border-radius: 10px;
-            text-align: left;
-            transition: all 0.2s ease;
-            background: transparent;
-            border: none;
-            font-size: 14px;
-            font-weight: 500;
-            color: #94a3b8;
-            cursor: pointer;
-        }
-        
-        .nav-item:hover {
-            background: rgba(255, 255, 255, 0.08);
-            color: #ffffff !important;
-        }
-        
-        .nav-item.active {
-            background: linear-gradient(135deg, #0055B8 0%, #003d82 100%) !important;
-            color: white !important;
-            box-shadow: 0 4px 12px rgba(0, 85, 184, 0.4) !important;
-        }
-        
-        /* Program Card */
-        .program-item {
-            background: white;
-            border-radius: 8px;
-            border: 1px solid #e2e8f0;
-            padding: 10px;
-            transition: all 0.3s ease;
-            position: relative;
-            overflow: hidden;
-        }
-        
-        .program-item::before {
-            content: '';
-            position: absolute;
-            left: 0;
-            top: 0;
-            width: 3px;
-            height: 100%;
-            background: linear-gradient(180deg, #0055B8 0%, #003d82 100%) !important;
-            transition: width 0.3s ease;
-        }
-        
-        .program-item:hover {
-            box-shadow: 0 6px 12px rgba(0, 0, 0, 0.08);
-            transform: translateX(3px);
-        }
-        
-        .program-item:hover::before {
-            width: 5px;
-        }
-        
-        /* Status Badge */
-        .status-badge {
-            display: inline-flex;
-            align-items: center;
-            gap: 4px;
-            padding: 4px 10px;
-            border-radius: 16px;
-            font-size: 10px;
-            font-weight: 700;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .status-badge.active {
-            background: linear-gradient(135deg, #dcfce7 0%, #bbf7d0 100%);
-            color: #166534;
-        }
-        
-        .status-badge.pending {
-            background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);
-            color: #92400e;
-        }
-        
-        .status-badge.completed {
-            background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);
-            color: #1e40af;
-        }
-        
-        /* Professional Buttons */
-        .pro-btn-primary {
-            background: linear-gradient(135deg, #0055B8 0%, #003d82 100%) !important;
-            color: white !important;
-            padding: 8px 16px;
-            border-radius: 8px;
-            font-weight: 600;
-            border: none !important;
-            transition: all 0.3s ease;
-            font-size: 13px;
-            box-shadow: 0 2px 8px rgba(0, 85, 184, 0.2) !important;
-        }
-        
-        .pro-btn-primary:hover {
-            box-shadow: 0 4px 12px rgba(0, 85, 184, 0.3) !important;
-            transform: translateY(-1px);
-        }
-        
-        .pro-btn-secondary {
-            background: white !important;
-            color: #0055B8 !important;
-            padding: 7px 14px;
-            border-radius: 8px;
-            font-weight: 600;
-            border: 2px solid #e2e8f0 !important;
-            transition: all 0.3s ease;
-            font-size: 12px;
-        }
-        
-        .pro-btn-secondary:hover {
-            background: #f8fafc !important;
-            border-color: #0055B8 !important;
-            transform: translateY(-1px);
-        }
-        
-        /* Section Header */
-        .section-header {
-            margin-bottom: 16px;
-            padding-bottom: 12px;
-            border-bottom: 2px solid #e2e8f0;
-        }
-        
-        .section-title {
-            font-size: 20px;
-            font-weight: 800;
-            color: #0f172a;
-            line-height: 1.2;
-        }
-        
-        .section-subtitle {
-            font-size: 13px;
-            color: #64748b;
-            margin-top: 3px;
-        }
-        
-        /* Icon Circle */
-        .icon-circle {
-            width: 36px;
-            height: 36px;
-            border-radius: 8px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            background: linear-gradient(135deg, rgba(0, 85, 184, 0.1) 0%, rgba(0, 85, 184, 0.05) 100%);
-        }
-        
-        /* Empty State */
-        .empty-state {
-            text-align: center;
-            padding: 40px 32px;
-        }
-        
-        .empty-icon {
-            width: 64px;
-            height: 64px;
-            margin: 0 auto 16px;
-            border-radius: 50%;
-            background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }
-        
-        /* Table Styles */
-        .data-table {
-            width: 100%;
-            border-collapse: separate;
-            border-spacing: 0;
-        }
-        
-        .data-table th {
-            background: #f8fafc;
-            padding: 10px 12px;
-            text-align: left;
-            font-size: 11px;
-            font-weight: 700;
-            color: #475569;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            border-bottom: 2px solid #e2e8f0;
-        }
-        
-        .data-table td {
-            padding: 12px;
-            border-bottom: 1px solid #f1f5f9;
-            font-size: 13px;
-            color: #334155;
-        }
-        
-        /* Overview Table - More elegant spacing */
-        .overview-table th {
-            background: #f8fafc;
-            padding: 14px 16px;
-            text-align: left;
-            font-size: 11px;
-            font-weight: 700;
-            color: #475569;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            border-bottom: 2px solid #e2e8f0;
-        }
-        
-        .overview-table td {
-            padding: 18px 16px;
-            border-bottom: 1px solid #f1f5f9;
-            font-size: 13px;
-            color: #334155;
-        }
-        
-        .overview-table tr:hover {
-            background: #fafbfc;
-        }
-        
-        .overview-table tr:last-child td {
-            border-bottom: none;
-        }
-        
-        .data-table tr:hover {
-            background: #f8fafc;
-        }
-        
-        .data-table tr:last-child td {
-            border-bottom: none;
-        }
-        
-        /* Grid Layouts */
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-            gap: 12px;
-            margin-bottom: 20px;
-        }
-        
-        .content-grid {
-            display: grid;
-            gap: 14px;
-        }
-        
-        /* Scrollbar */
-        ::-webkit-scrollbar {
-            width: 8px;
-            height: 8px;
-        }
-        
-        ::-webkit-scrollbar-track {
-            background: #f1f5f9;
-        }
-        
-        ::-webkit-scrollbar-thumb {
-            background: #cbd5e1;
-            border-radius: 4px;
-        }
-        
-        ::-webkit-scrollbar-thumb:hover {
-            background: #94a3b8;
-        }
-    </style>
     ''')
+    stylesheet('pages/institutions/modern_institution_dashboard')
     
     # Load dashboard data
-    load_dashboard_data()
+    await load_dashboard_data()
     
     # Professional Dashboard Layout
     with ui.row().classes('w-full').style('min-height: 100vh; gap: 0; margin: 0; padding-top: 64px;'):
@@ -745,6 +276,7 @@ def modern_institution_dashboard():
         
         mobile_hamburger.on('click', toggle_mobile_menu)
         
+        @profile_section
         def render_content(section):
             """Render content based on active section."""
             if section == 'overview':
@@ -762,6 +294,7 @@ def modern_institution_dashboard():
             elif section == 'settings':
                 render_settings()
         
+        @profile_section
         def render_overview():
             """Professional overview dashboard."""
             # Welcome Header
@@ -878,6 +411,7 @@ def modern_institution_dashboard():
                         ui.label('No Programs Yet').style('font-size: 18px; font-weight: 700; color: #64748b; margin-bottom: 8px;')
                         ui.label('Get started by creating your first training program using the sidebar menu').style('font-size: 14px; color: #94a3b8; margin-bottom: 20px;')
         
+        @profile_section
         def render_programs():
             """Professional programs listing with redesigned table."""
             # Section Header
@@ -1031,6 +565,7 @@ def modern_institution_dashboard():
                             on_click=lambda: ui.navigate.to('/institution/program/create'))\
                         .classes('pro-btn-primary')
         
+        @profile_section
         def render_trainees():
             """Professional trainees view with table."""
             with ui.element('div').classes('section-header'):
@@ -1114,6 +649,7 @@ def modern_institution_dashboard():
                                         ui.button(icon='visibility').props('flat round size=sm').style('color: #0055B8 !important;')
                                         ui.button(icon='edit').props('flat round size=sm').style('color: #64748b !important;')
         
+        @profile_section
         def render_applications():
             """Professional applications view."""
             with ui.element('div').classes('section-header'):
@@ -1277,6 +813,7 @@ def modern_institution_dashboard():
                                             ui.button('Approve').props('flat dense').style('min-width: auto; height: 24px; font-size: 10px; padding: 0 8px; color: #10b981 !important; font-weight: 600;')
                                             ui.button('Reject').props('flat dense').style('min-width: auto; height: 24px; font-size: 10px; padding: 0 8px; color: #ef4444 !important; font-weight: 600;')
         
+        @profile_section
         def render_analytics():
             """Classic analytics dashboard with clean, professional design."""
             # Header with controls
@@ -1548,6 +1085,7 @@ def modern_institution_dashboard():
                                     
                                     ui.label(f'{percentage}%').style(f'color: {color}; font-size: 16px; font-weight: 700; min-width: 50px; text-align: right;')
         
+        @profile_section
         def render_create_program():
             """Create new training program form with modern wizard-style interface."""
             from datetime import datetime, timedelta
@@ -1681,7 +1219,7 @@ def modern_institution_dashboard():
                         with ui.row().classes('gap-3'):
                             ui.button('Cancel', icon='close', on_click=lambda: (content_container.clear(), render_content('programs'))).props('outline size=lg').style('color: #64748b; border-color: #e2e8f0; padding: 12px 32px; font-weight: 600;')
                             
-                            def handle_create_program():
+                            async def handle_create_program():
                                 """Handle program creation via API."""
                                 try:
                                     # Validate required fields
@@ -1719,7 +1257,7 @@ def modern_institution_dashboard():
                                         ui.notify('Program created successfully!', type='positive')
                                         print(f"[CREATE_PROGRAM] Success: {response.json()}")
                                         # Reload programs
-                                        load_dashboard_data()
+                                        await load_dashboard_data()
                                         # Navigate back to programs view
                                         content_container.clear()
                                         with content_container:
@@ -1742,6 +1280,7 @@ def modern_institution_dashboard():
                             
                             ui.button('Create Program', icon='rocket_launch', on_click=handle_create_program).props('size=lg').style('background: linear-gradient(135deg, #0055B8 0%, #003d82 100%); color: white; padding: 12px 40px; font-weight: 700; font-size: 14px; box-shadow: 0 4px 12px rgba(0, 85, 184, 0.3);')
         
+        @profile_section
         def render_students():
             """Students directory and management."""
             with ui.element('div').classes('section-header'):
@@ -1878,6 +1417,7 @@ def modern_institution_dashboard():
                 </table>
                 ''', sanitize=lambda s: s)
         
+        @profile_section
         def render_onboarding():
             """Institution onboarding and profile setup."""
             with ui.element('div').classes('section-header'):
@@ -1893,6 +1433,7 @@ def modern_institution_dashboard():
                     ui.textarea('Address', value='Akoka, Yaba, Lagos State, Nigeria').classes('w-full').props('outlined rows=3')
                     ui.button('Save Profile', icon='save').classes('pro-btn-primary')
         
+        @profile_section
         def render_settings():
             """Institution settings and preferences."""
             with ui.element('div').classes('section-header'):
@@ -1,4 +1,5 @@
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def about_page():
     """Creates the About Us page for Dompell."""
@@ -6,34 +7,8 @@ def about_page():
     # Add brand guidelines
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
-    <style>
-        /* Brand Typography */
-        body {
-            font-family: 'Raleway', sans-serif !important;
-            background: #F2F7FB !important;
-            color: #1A1A1A !important;
-            line-height: 125% !important;
-        }
-        
-        /* Typography Hierarchy */
-        .heading-1 { font-size: 56px; font-weight: 700; color: #1A1A1A; line-height: 110%; letter-spacing: -0.02em; }
-        .heading-2 { font-size: 40px; font-weight: 600; color: #1A1A1A; line-height: 115%; letter-spacing: -0.01em; }
-        .heading-3 { font-size: 32px; font-weight: 500; color: #1A1A1A; line-height: 120%; }
-        .sub-heading { font-size: 24px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-        .sub-heading-2 { font-size: 18px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-        .body-text { font-size: 16px; font-weight: 400; color: #1A1A1A; line-height: 125%; }
-        .button-label { font-size: 14px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-        .form-placeholder { font-size: 14px; font-weight: 500; color: #4D4D4D; line-height: 125%; }
-        .caption { font-size: 12px; font-weight: 400; color: #4D4D4D; letter-spacing: 8%; line-height: 125%; }
-        
-        /* Brand Colors */
-        .brand-primary { color: #0055B8 !important; }
-        .brand-primary-bg { background-color: #0055B8 !important; }
-        .brand-charcoal { color: #1A1A1A !important; }
-        .brand-slate { color: #4D4D4D !important; }
-        .brand-light-mist { background-color: #F2F7FB !important; }
-    </style>
     ''')
+    stylesheet('pages/shared/about')
     
     with ui.column().classes('w-full brand-light-mist'):
         # Modernized Hero with improved overlay and responsive text
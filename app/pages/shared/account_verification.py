@@ -7,6 +7,7 @@ import requests
 from nicegui import ui, app
 from app.config import API_BASE_URL
 from app.services.api_service import api_service
+from app.services.static_assets import stylesheet
 
 def account_verification_page():
     """Creates the modern account verification page."""
@@ -100,20 +101,12 @@ def account_verification_page():
         registration_token = app.storage.user.get('verification_token') or app.storage.browser.get('verification_token')
         
         if registration_token:
-            print(f"[DEBUG] Found registration token: {registration_token[:50]}...")
-            
             try:
                 # CORRECT FORMAT: Token as query parameter, code in JSON body
                 response = api_service.verify_account(registration_token, code)
                 
                 print(f"[DEBUG] API Response Status: {response.status_code}")
                 
-                try:
-                    response_data = response.json()
-                    print(f"[DEBUG] API Response: {response_data}")
-                except:
-                    print(f"[DEBUG] API Response Text: {response.text}")
-                
                 if response.status_code == 200:
                     print("[DEBUG] ✅ Verification successful with correct format!")
                     ui.notify('Account verified successfully! ✨', type='positive')
@@ -229,14 +222,6 @@ def account_verification_page():
             
             print(f"[DEBUG] Resend API Response: Status {response.status_code}")
             
-            # Log response body for debugging
-            try:
-                resend_response_data = response.json()
-                print(f"[DEBUG] Resend API Response Body: {resend_response_data}")
-            except:
-                resend_response_text = response.text
-                print(f"[DEBUG] Resend API Response Text: {resend_response_text}")
-            
             if response.status_code == 200:
                 ui.notify('New verification code sent! Check your email.', type='positive')
                 print("[DEBUG] Resend successful - code sent")
@@ -285,82 +270,6 @@ def account_verification_page():
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-        <style>
-            body, * { font-family: 'Raleway', sans-serif !important; }
-            body { background: #F2F7FB !important; color: #1A1A1A !important; }
-            .material-icons { font-family: 'Material Icons' !important; }
-            .sub-heading { font-size: 24px; font-weight: 600; color: #1A1A1A; }
-            .body-text { font-size: 16px; font-weight: 400; color: #4D4D4D; }
-            .button-label { font-size: 14px; font-weight: 600; }
-            .brand-primary { color: #0055B8 !important; }
-            .brand-slate { color: #4D4D4D !important; }
-            .brand-charcoal { color: #1A1A1A !important; }
-            .auth-card {
-                background: #ffffff !important;
-                border-radius: 16px !important;
-                box-shadow: 0 8px 32px rgba(0, 85, 184, 0.1) !important;
-                border: 1px solid rgba(0, 85, 184, 0.1) !important;
-            }
-            .gradient-btn {
-                background: #0055B8 !important;
-                border-radius: 12px !important;
-                font-weight: 600 !important;
-                color: white !important;
-            }
-            .code-input {
-                width: 56px !important;
-                height: 64px !important;
-                text-align: center !important;
-                font-size: 24px !important;
-                font-weight: 700 !important;
-                border-radius: 12px !important;
-                border: 2px solid rgba(0, 85, 184, 0.15) !important;
-                background: #ffffff !important;
-                color: #1A1A1A !important;
-                transition: all 0.2s ease !important;
-                outline: none !important;
-            }
-            .code-input:focus {
-                border-color: #0055B8 !important;
-                box-shadow: 0 0 0 4px rgba(0, 85, 184, 0.12) !important;
-                background: #ffffff !important;
-                transform: scale(1.02) !important;
-            }
-            .code-input:hover:not(:focus) {
-                border-color: rgba(0, 85, 184, 0.3) !important;
-            }
-            .code-input.filled {
-                border-color: #28a745 !important;
-                background: rgba(40, 167, 69, 0.05) !important;
-            }
-            .code-input.error {
-                border-color: #dc3545 !important;
-                background: rgba(220, 53, 69, 0.05) !important;
-                animation: shake 0.3s ease-in-out !important;
-            }
-            @keyframes shake {
-                0%, 100% { transform: translateX(0); }
-                25% { transform: translateX(-4px); }
-                75% { transform: translateX(4px); }
-            }
-            .verification-info {
-                background: rgba(0, 85, 184, 0.05) !important;
-                border: 1px solid rgba(0, 85, 184, 0.15) !important;
-                border-radius: 12px !important;
-                padding: 16px !important;
-                margin: 16px 0 !important;
-            }
-            .resend-timer {
-                color: #6c757d !important;
-                font-size: 14px !important;
-                font-weight: 500 !important;
-            }
-            .resend-available {
-                color: #0055B8 !important;
-                font-weight: 600 !important;
-            }
-            a { color: #0055B8 !important; text-decoration: none; }
-        </style>
         <script>
             // Disable problematic event handlers after page load
             document.addEventListener('DOMContentLoaded', function() {
@@ -375,6 +284,7 @@ def account_verification_page():
             });
         </script>
     ''')
+    stylesheet('pages/shared/account_verification')
 
     with ui.column().classes('w-full py-16 px-8 min-h-screen flex items-center justify-center'):
         with ui.card().classes('auth-card w-full max-w-lg p-0 mx-auto'):
@@ -399,7 +309,7 @@ def account_verification_page():
                 if user_token:
                     try:
                         app.storage.browser['verification_token'] = user_token
-                        print(f"[DEBUG] Set verification token in browser storage: {user_token[:50]}...")
+                        print("[DEBUG] Set verification token in browser storage")
                     except:
                         print("[DEBUG] Could not set token in browser storage - already built")
                 
@@ -4,6 +4,7 @@ Application confirmation with submission details and next steps using brand guid
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def application_submission_confirmation_page():
     """Creates the application submission confirmation page with brand guidelines and icon fixes."""
@@ -12,149 +13,8 @@ def application_submission_confirmation_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Typography classes */
-        .heading-1 { font-size: 3rem; font-weight: 700; line-height: 1.1; }
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .sub-heading { font-size: 1.5rem; font-weight: 500; line-height: 1.4; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .button-label { font-size: 0.875rem; font-weight: 600; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-light-mist { background-color: #F2F7FB; }
-        .brand-primary-bg { background-color: #0055B8; }
-
-        /* Custom styling */
-        .confirmation-card {
-            background: white;
-            border-radius: 12px;
-            padding: 24px;
-            margin-bottom: 16px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        }
-
-        .success-banner {
-            background: linear-gradient(135deg, #10B981 0%, #059669 100%);
-            color: white;
-            border-radius: 12px;
-            padding: 32px;
-            text-align: center;
-            margin-bottom: 24px;
-        }
-
-        .application-summary {
-            background: #F0F9FF;
-            border: 1px solid #0EA5E9;
-            border-radius: 8px;
-            padding: 16px;
-        }
-
-        .next-step {
-            background: white;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 16px;
-            margin-bottom: 12px;
-            transition: all 0.2s;
-        }
-
-        .next-step:hover {
-            border-color: #0055B8;
-            box-shadow: 0 2px 8px rgba(0, 85, 184, 0.1);
-        }
-
-        .status-badge {
-            background: #10B981;
-            color: white;
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 0.75rem;
-            font-weight: 600;
-        }
-
-        .timeline-item {
-            position: relative;
-            padding-left: 32px;
-            margin-bottom: 24px;
-        }
-
-        .timeline-item::before {
-            content: '';
-            position: absolute;
-            left: 8px;
-            top: 8px;
-            width: 16px;
-            height: 16px;
-            background: #0055B8;
-            border-radius: 50%;
-        }
-
-        .timeline-item.completed::before {
-            background: #10B981;
-        }
-
-        .timeline-item.pending::before {
-            background: #F59E0B;
-        }
-
-        .timeline-item::after {
-            content: '';
-            position: absolute;
-            left: 15px;
-            top: 24px;
-            width: 2px;
-            height: calc(100% + 8px);
-            background: #E5E7EB;
-        }
-
-        .timeline-item:last-child::after {
-            display: none;
-        }
-
-        .contact-card {
-            background: #F8FAFC;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 16px;
-        }
-
-        .application-id {
-            background: #FEF3C7;
-            color: #92400E;
-            padding: 8px 16px;
-            border-radius: 6px;
-            font-family: 'Monaco', 'Consolas', monospace;
-            font-weight: 600;
-        }
-    </style>
     ''')
+    stylesheet('pages/shared/application_submission_confirmation')
 
     with ui.column().classes('relative flex h-auto min-h-screen w-full flex-col brand-light-mist pt-20'):
         # Success banner
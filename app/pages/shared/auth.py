@@ -5,8 +5,12 @@ Authentication page for TalentConnect Africa, directly interacting with the back
 from nicegui import ui, app
 import asyncio
 import re
-from app.services.api_service import api_service
+from app.services.async_api_service import async_api_service
 from app.state import auth_events
+from app.services.static_assets import stylesheet
+from app.services.log import get_logger
+
+log = get_logger('LOGIN')
 
 def auth_page(initial_tab: str = 'login', role: str = 'candidate'):
     """Creates a tabbed authentication page for login and registration."""
@@ -14,168 +18,8 @@ def auth_page(initial_tab: str = 'login', role: str = 'candidate'):
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-        <style>
-            /* Brand Typography */
-            :root { --brand-primary: #0055B8; --brand-primary-600: #00479a; --brand-primary-700: #003d82; --brand-primary-bg: #EEF6FF; }
-            body, .raleway-font { font-family: 'Raleway', sans-serif !important; }
-
-            /* Soft gradient background with subtle pattern */
-            body {
-                background: radial-gradient(1200px 600px at 10% -10%, rgba(0,85,184,0.08), transparent 60%),
-                            radial-gradient(900px 500px at 110% 20%, rgba(16,185,129,0.06), transparent 60%),
-                            linear-gradient(180deg, #F2F7FB 0%, #F8FAFC 100%);
-            }
-
-            /* Auth card visual uplift */
-            .auth-card {
-                background: #ffffff;
-                border-radius: 18px;
-                box-shadow: 0 16px 40px rgba(2, 48, 99, 0.10), 0 6px 16px rgba(0, 85, 184, 0.06);
-                border: 1px solid rgba(0, 85, 184, 0.12);
-                overflow: hidden;
-                margin: 0 auto;
-            }
-
-            /* Inputs: keep structure, enhance visuals with more spacing */
-            .modern-input {
-                border-radius: 12px;
-                border: 2px solid rgba(0, 85, 184, 0.18);
-                background: rgba(0, 85, 184, 0.03);
-                transition: box-shadow .2s ease, border-color .2s ease;
-                margin-bottom: 32px !important;
-                padding: 18px !important;
-                font-size: 15px !important;
-            }
-            .modern-input:focus-within {
-                border-color: var(--brand-primary);
-                box-shadow: 0 0 0 4px rgba(0, 85, 184, 0.18);
-            }
-            
-            /* Add spacing to input fields */
-            .modern-input .q-field__control {
-                min-height: 60px !important;
-                padding: 0 18px !important;
-            }
-            
-            .modern-input .q-field__native {
-                padding: 18px 0 !important;
-                font-size: 15px !important;
-            }
-
-            /* Stronger specificity to override Quasar defaults - ENFORCE BRAND COLORS */
-            .gradient-btn, .q-btn.gradient-btn, button.gradient-btn {
-                background: #0055B8 !important;
-                color: #ffffff !important;
-                border-radius: 12px !important;
-                border: 0 !important;
-                font-weight: 700 !important;
-                letter-spacing: .2px !important;
-                transition: background .15s ease, box-shadow .2s ease, transform .12s ease !important;
-                min-height: 56px !important;
-                font-size: 16px !important;
-                padding: 16px 32px !important;
-            }
-            .q-btn.gradient-btn .q-btn__content { color: #ffffff !important; }
-            .gradient-btn:hover, .q-btn.gradient-btn:hover, button.gradient-btn:hover { 
-                background: #00479a !important; 
-                box-shadow: 0 8px 20px rgba(0, 85, 184, 0.25) !important; 
-                transform: translateY(-1px) !important; 
-            }
-            .gradient-btn:active, .q-btn.gradient-btn:active, button.gradient-btn:active { 
-                background: #003d82 !important; 
-                box-shadow: 0 4px 12px rgba(0, 85, 184, 0.20) !important; 
-                transform: translateY(0) !important; 
-            }
-            .gradient-btn:focus, .q-btn.gradient-btn:focus, button.gradient-btn:focus { 
-                outline: none !important; 
-                box-shadow: 0 0 0 4px rgba(0, 85, 184, 0.18) !important; 
-            }
-            .gradient-btn[disabled], .q-btn.gradient-btn[disabled], .q-btn.gradient-btn.q-btn--disabled { 
-                opacity: 0.7 !important; 
-                filter: grayscale(10%) !important; 
-                box-shadow: none !important; 
-                cursor: not-allowed !important; 
-            }
-
-            /* Tabs aesthetics (active underlines and weight already set) */
-            .q-tabs { background: #F8FAFC; border-bottom: 1px solid #E2E8F0; }
-            .q-tab { color: #475569; font-weight: 600; }
-            .tab-active { color: var(--brand-primary) !important; font-weight: 700 !important; }
-            .q-tabs__content { gap: 2px; }
-
-            /* Small helper text consistency */
-            .text-primary { color: var(--brand-primary) !important; }
-
-            /* Header links above card */
-            .auth-header { color: #475569; }
-            .auth-link {
-                padding: 8px 14px;
-                border-radius: 9999px;
-                font-weight: 700;
-                color: #0f172a;
-                transition: background .2s ease, color .2s ease, transform .15s ease;
-            }
-            .auth-link:hover { background: #EEF2F7; color: #0b1324; transform: translateY(-1px); }
-            .auth-link-primary { background: var(--brand-primary-bg); color: var(--brand-primary); }
-
-            /* Role tabs (Trainee/Employer/Institution) branding */
-            .role-tabs { background: var(--brand-primary-bg); border: 1px solid rgba(0,85,184,0.18); border-radius: 12px; padding: 4px; }
-            .role-tab { color: var(--brand-primary); font-weight: 700; border-radius: 10px; }
-            .role-active { background: var(--brand-primary); color: #ffffff !important; }
-            .role-tabs .q-tab__indicator { display: none !important; }
-
-            /* Hero panel */
-            .auth-hero {
-                background: radial-gradient(900px 500px at -10% 0%, rgba(0,85,184,0.10), transparent 60%),
-                            radial-gradient(700px 400px at 120% 20%, rgba(16,185,129,0.08), transparent 60%),
-                            linear-gradient(180deg, #ffffff 0%, #F2F7FB 100%);
-                border: 1px solid rgba(0, 85, 184, 0.10);
-                border-radius: 16px;
-                box-shadow: 0 8px 28px rgba(2,48,99,0.08);
-            }
-            .hero-badge { background: #EEF6FF; color: #066CE0; font-weight: 700; padding: 6px 12px; border-radius: 9999px; font-size: 12px; display: inline-flex; align-items: center; gap: 6px; }
-            .hero-title { font-size: 28px; line-height: 1.2; font-weight: 800; color: #0f172a; }
-            .hero-sub { color: #475569; }
-            .hero-bullets li { display: flex; align-items: start; gap: 10px; margin: 8px 0; color: #334155; }
-            .hero-dot { width: 8px; height: 8px; border-radius: 50%; background: #0055B8; margin-top: 6px; }
-
-            /* Progress bar on submit */
-            .submit-progress { height: 3px; background: linear-gradient(90deg, #0055B8, #10b981); border-radius: 2px; transition: opacity .2s ease; }
-
-            /* Checkbox styling */
-            .auth-checkbox .q-checkbox__inner {
-                width: 20px !important;
-                height: 20px !important;
-                min-width: 20px !important;
-            }
-            .auth-checkbox .q-checkbox__bg {
-                border: 2px solid rgba(0, 85, 184, 0.3) !important;
-                border-radius: 6px !important;
-            }
-            .auth-checkbox .q-checkbox__inner--truthy .q-checkbox__bg {
-                background: #0055B8 !important;
-                border-color: #0055B8 !important;
-            }
-            .auth-checkbox .q-checkbox__label {
-                color: #334155 !important;
-                font-size: 14px !important;
-                font-weight: 500 !important;
-                padding-left: 8px !important;
-            }
-            .auth-checkbox:hover .q-checkbox__bg {
-                border-color: #0055B8 !important;
-            }
-
-            /* Responsive split without Tailwind utilities */
-            .auth-split { display: flex; flex-direction: column; gap: 2rem; }
-            @media (min-width: 900px) { .auth-split { flex-direction: row; } }
-            .auth-hero-container { display: none; }
-            @media (min-width: 900px) { .auth-hero-container { display: flex; width: 50%; } }
-            .auth-form-container { width: 100%; }
-            @media (min-width: 900px) { .auth-form-container { width: 50%; }
-            }
-        </style>
     ''')
+    stylesheet('pages/shared/auth')
 
     with ui.column().classes('w-full py-16 px-8 min-h-screen flex items-center justify-center bg-[#F2F7FB]'):
         # Small page title
@@ -236,14 +80,12 @@ def _create_login_form():
             # Normalize credentials
             email = (state["email"] or "").strip().lower()
             password = (state["password"] or "").strip()
-            response = api_service.login(email, password)
+            response = await async_api_service.login(email, password)
             
-            print(f"[LOGIN] Response status: {response.status_code}")
-            print(f"[LOGIN] Response content: {response.text}")
+            log.debug('Login response status: %s', response.status_code)
             
-            if response.ok:
+            if response.is_success:
                 response_data = response.json()
-                print(f"[LOGIN] Response data: {response_data}")
                 
                 # Extract data from nested structure: data.user and data.token.{accessToken, refreshToken}
                 data = response_data.get('data', {})
@@ -252,8 +94,8 @@ def _create_login_form():
                 token = token_data.get('accessToken')
                 refresh_token = token_data.get('refreshToken')
                 
-                print(f"[LOGIN] User data: {user_data}")
-                print(f"[LOGIN] Token: {token[:50] if token else 'None'}...")
+                log.info('Login succeeded (role %s, token %s)', user_data.get('role'),
+                         'received' if token else 'missing')
                 
                 ui.notify("Login successful! Redirecting...", color='positive')
                 
@@ -278,6 +120,7 @@ def _create_login_form():
                     ui.navigate.to('/candidates/dashboard')
 
             else:
+                log.info('Login failed with status %s', response.status_code)
                 try:
                     error_data = response.json()
                     error_msg = error_data.get('message', 'Login failed. Please check your credentials.')
@@ -294,7 +137,7 @@ def _create_login_form():
                     ui.navigate.to('/account-verification')
 
         except Exception as e:
-            print(f"[LOGIN] Unexpected error: {e}")
+            log.error('Unexpected login error: %s', e)
             ui.notify("An unexpected error occurred during login.", color='negative')
         
         finally:
@@ -425,47 +268,32 @@ def _create_signup_form(role='candidate'):
                 "role": user_role                                # Valid role
             }
             
-            response = api_service.register(user_data)
+            response = await async_api_service.register(user_data)
             
-            print(f"[REGISTRATION] Response status: {response.status_code}")
-            print(f"[REGISTRATION] Response content: {response.text}")
+            log.debug('Registration response status: %s', response.status_code)
             
-            if response.ok:
+            if response.is_success:
                 # Parse the response to extract the verification token
                 response_data = response.json()
-                print(f"[DEBUG] Registration successful, status: {response.status_code}")
-                print(f"[DEBUG] Full response data: {response_data}")
+                log.info('Registration succeeded (status %s)', response.status_code)
                 
                 # Store email for verification page
                 app.storage.user['verification_email'] = user_data["email"]
                 app.storage.user['registration_name'] = user_data["name"]
-                print(f"[DEBUG] Stored email: {app.storage.user.get('verification_email')}")
                 
                 # Extract and store the verification token from response
                 # Format: {"status": 201, "message": "...", "data": {"token": "..."}}
-                print(f"[DEBUG] Checking for token in response...")
-                print(f"[DEBUG] 'data' in response_data: {'data' in response_data}")
-                if 'data' in response_data:
-                    print(f"[DEBUG] response_data['data']: {response_data['data']}")
-                    print(f"[DEBUG] 'token' in response_data['data']: {'token' in response_data['data']}")
-                
                 if 'data' in response_data and 'token' in response_data['data']:
                     verification_token = response_data['data']['token']
                     app.storage.user['verification_token'] = verification_token
-                    print(f"[DEBUG] ✅ Stored verification token: {verification_token[:50]}...")
-                    print(f"[DEBUG] ✅ Verification from storage: {app.storage.user.get('verification_token', 'NONE')[:50]}...")
                 else:
-                    print(f"[DEBUG] ❌ No token found in registration response")
-                    print(f"[DEBUG] ❌ Response structure: {list(response_data.keys())}")
-                    if 'data' in response_data:
-                        print(f"[DEBUG] ❌ Data keys: {list(response_data['data'].keys())}")
+                    log.warning('No verification token in registration response')
                 
                 ui.notify("Account created successfully! Redirecting to verification...", color='positive')
-                print(f"[REGISTRATION] Redirecting to verification page...")
                 await asyncio.sleep(1)  # Reduced from 2 to 1 second
                 ui.navigate.to('/account-verification')
-                print(f"[REGISTRATION] Navigation command executed")
             else:
+                log.info('Registration failed with status %s', response.status_code)
                 try:
                     error_data = response.json()
                     error_msg = error_data.get('message', 'Registration failed. Please try again.')
@@ -488,7 +316,7 @@ def _create_signup_form(role='candidate'):
                     ui.notify(f'Registration failed with status {response.status_code}. Please try again.', color='negative')
 
         except Exception as e:
-            print(f"[SIGNUP] Unexpected error: {e}")
+            log.error('Unexpected registration error: %s', e)
             ui.notify("An unexpected error occurred during registration.", color='negative')
         
         finally:
@@ -1,32 +1,12 @@
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def contact_page():
     """Creates the Contact page for Dompell."""
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800;900&display=swap" rel="stylesheet">
-        <style>
-            body { font-family: 'Inter', sans-serif; background: #F7FAFC; color: #1A202C; }
-            .contact-hero {
-                background: linear-gradient(135deg, #0055B8 0%, #003d8f 100%);
-                color: white;
-                padding: 64px 20px 48px 20px;
-                text-align: center;
-                border-radius: 0 0 32px 32px;
-                position: relative;
-                overflow: hidden;
-            }
-            .contact-hero h1 { font-size: 48px; font-weight: 900; margin-bottom: 16px; letter-spacing: -0.02em; }
-            .contact-hero p { font-size: 20px; font-weight: 400; opacity: 0.95; max-width: 700px; margin: 0 auto; }
-            .contact-section { max-width: 900px; margin: 48px auto 0 auto; padding: 0 20px; }
-            .contact-title { font-size: 28px; font-weight: 800; color: #1A202C; margin-bottom: 16px; }
-            .contact-card { background: white; border-radius: 16px; box-shadow: 0 2px 12px rgba(0,0,0,0.04); padding: 32px; margin-bottom: 32px; }
-            .contact-label { font-size: 16px; font-weight: 700; color: #0055B8; margin-bottom: 6px; }
-            .contact-value { font-size: 16px; color: #2D3748; margin-bottom: 12px; }
-            .map-section { max-width: 900px; margin: 0 auto 48px auto; padding: 0 20px; }
-            .map-title { font-size: 22px; font-weight: 700; color: #1A202C; margin-bottom: 12px; }
-            .map-embed { width: 100%; height: 340px; border: none; border-radius: 16px; box-shadow: 0 2px 12px rgba(0,0,0,0.04); }
-        </style>
     ''')
+    stylesheet('pages/shared/contact')
 
     # Hero Section
     ui.html('''
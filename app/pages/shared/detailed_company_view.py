@@ -4,6 +4,7 @@ Comprehensive company profile with job listings, reviews, and application interf
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def detailed_company_view_page():
     """Creates the detailed company view page with brand guidelines and icon fixes."""
@@ -12,156 +13,8 @@ def detailed_company_view_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Typography classes */
-        .heading-1 { font-size: 3rem; font-weight: 700; line-height: 1.1; }
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .sub-heading { font-size: 1.5rem; font-weight: 500; line-height: 1.4; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .button-label { font-size: 0.875rem; font-weight: 600; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-light-mist { background-color: #F2F7FB; }
-        .brand-primary-bg { background-color: #0055B8; }
-
-        /* Custom styling */
-        .company-card {
-            background: white;
-            border-radius: 12px;
-            padding: 24px;
-            margin-bottom: 16px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        }
-
-        .company-header {
-            background: linear-gradient(135deg, #0055B8 0%, #003d82 100%);
-            color: white;
-            border-radius: 12px;
-            padding: 32px;
-            margin-bottom: 24px;
-        }
-
-        .job-card {
-            background: white;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 20px;
-            margin-bottom: 16px;
-            transition: all 0.2s;
-            cursor: pointer;
-        }
-
-        .job-card:hover {
-            border-color: #0055B8;
-            box-shadow: 0 4px 12px rgba(0, 85, 184, 0.1);
-        }
-
-        .review-card {
-            background: #F8FAFC;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 16px;
-            margin-bottom: 12px;
-        }
-
-        .rating-stars {
-            display: flex;
-            gap: 2px;
-        }
-
-        .rating-star {
-            color: #FCD34D;
-        }
-
-        .rating-star.filled {
-            color: #F59E0B;
-        }
-
-        .company-stat {
-            text-align: center;
-            padding: 16px;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 8px;
-            margin: 8px;
-        }
-
-        .benefit-chip {
-            background: #EBF4FF;
-            color: #0055B8;
-            padding: 6px 12px;
-            border-radius: 20px;
-            font-size: 0.75rem;
-            font-weight: 600;
-            margin: 4px;
-            display: inline-block;
-        }
-
-        .job-type-badge {
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 0.75rem;
-            font-weight: 600;
-        }
-
-        .badge-fulltime {
-            background: #D1FAE5;
-            color: #065F46;
-        }
-
-        .badge-parttime {
-            background: #FEF3C7;
-            color: #92400E;
-        }
-
-        .badge-contract {
-            background: #E0E7FF;
-            color: #3730A3;
-        }
-
-        .badge-remote {
-            background: #F3E8FF;
-            color: #6B21A8;
-        }
-
-        .gallery-image {
-            border-radius: 8px;
-            overflow: hidden;
-            cursor: pointer;
-            transition: transform 0.2s;
-        }
-
-        .gallery-image:hover {
-            transform: scale(1.05);
-        }
-    </style>
     ''')
+    stylesheet('pages/shared/detailed_company_view')
 
     with ui.column().classes('relative flex h-auto min-h-screen w-full flex-col brand-light-mist pt-20'):
         # Company header section
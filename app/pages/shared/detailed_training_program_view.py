@@ -4,6 +4,7 @@ Comprehensive training program details with curriculum, instructors, and enrollm
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def detailed_training_program_view_page():
     """Creates the detailed training program view page with brand guidelines and icon fixes."""
@@ -12,128 +13,8 @@ def detailed_training_program_view_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Typography classes */
-        .heading-1 { font-size: 3rem; font-weight: 700; line-height: 1.1; }
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .sub-heading { font-size: 1.5rem; font-weight: 500; line-height: 1.4; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-light-mist { background-color: #F2F7FB; }
-        .brand-primary-bg { background-color: #0055B8; }
-
-        /* Custom styling */
-        .program-card {
-            background: white;
-            border-radius: 12px;
-            padding: 24px;
-            margin-bottom: 16px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        }
-
-        .program-hero {
-            background: linear-gradient(135deg, #0055B8 0%, #003d82 100%);
-            color: white;
-            border-radius: 16px;
-            padding: 40px;
-            margin-bottom: 32px;
-        }
-
-        .curriculum-item {
-            background: #F8FAFC;
-            border: 1px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 16px;
-            margin-bottom: 12px;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-
-        .curriculum-item:hover {
-            border-color: #0055B8;
-            background: #F2F7FB;
-        }
-
-        .instructor-card {
-            background: white;
-            border: 1px solid #E2E8F0;
-            border-radius: 12px;
-            padding: 20px;
-            text-align: center;
-            transition: all 0.2s;
-        }
-
-        .instructor-card:hover {
-            border-color: #0055B8;
-            box-shadow: 0 4px 12px rgba(0, 85, 184, 0.1);
-        }
-
-        .rating-star {
-            color: #F59E0B;
-        }
-
-        .program-badge {
-            padding: 6px 12px;
-            border-radius: 20px;
-            font-size: 0.75rem;
-            font-weight: 600;
-            margin: 4px;
-        }
-
-        .badge-beginner {
-            background: #D1FAE5;
-            color: #065F46;
-        }
-
-        .badge-online {
-            background: #EBF4FF;
-            color: #0055B8;
-        }
-
-        .video-thumbnail {
-            background: #F1F5F9;
-            border-radius: 8px;
-            height: 200px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-
-        .video-thumbnail:hover {
-            background: #E2E8F0;
-        }
-    </style>
     ''')
+    stylesheet('pages/shared/detailed_training_program_view')
 
     with ui.column().classes('relative flex h-auto min-h-screen w-full flex-col brand-light-mist pt-20'):
         # Program hero section
@@ -141,7 +22,7 @@ def detailed_training_program_view_page():
             with ui.element('div').classes('program-hero w-full'):
                 with ui.row().classes('items-start gap-8'):
                     # Program logo/image
-                    with ui.element('div').classes('w-32 h-32 bg-white bg-opacity-20 rounded-lg flex items-center justify-center'):
+                    with ui.element('div').classes('w-32 h-32 bg-white/20 rounded-lg flex items-center justify-center'):
                         pass  # Program logo was removed
                     
                     with ui.column().classes('flex-1'):
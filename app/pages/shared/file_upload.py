@@ -5,7 +5,7 @@ Integrated with real Dompell API.
 """
 
 from nicegui import ui
-from app.services.api_service import api_service
+from app.services.upload_queue import upload_queue
 from app.services.auth_utils import get_user_id, get_user_role
 import os
 
@@ -26,72 +26,67 @@ def file_upload_page():
     # Page state
     state = {
         'uploaded_files': [],
-        'uploading': False,
-        'upload_progress': 0
+        'jobs': []
     }
     
-    async def handle_file_upload(e):
-        """Handle file upload to S3."""
-        if not e.content:
+    def handle_file_upload(e):
+        """Queue the file for upload to S3 and follow its job."""
+        job = upload_queue.submit(e, max_size=10 * 1024 * 1024)
+        if job is None:
             ui.notify("No file selected", color='negative')
             return
         
-        state['uploading'] = True
-        upload_status.set_text('Uploading...')
-        progress_bar.set_visibility(True)
+        state['jobs'].append(job)
+        update_upload_status()
         
-        try:
-            # Get file info
-            file_name = e.name
-            file_content = e.content.read()
-            file_size = len(file_content)
-            
-            # Validate file size (max 10MB)
-            max_size = 10 * 1024 * 1024  # 10MB
-            if file_size > max_size:
-                ui.notify(f"File too large. Maximum size is 10MB.", color='negative')
-                state['uploading'] = False
-                upload_status.set_text('Ready to upload')
-                progress_bar.set_visibility(False)
-                return
-            
-            # Prepare file data for upload
-            files = {
-                'file': (file_name, file_content)
-            }
-            
-            # Call API
-            response = api_service.upload_file(files)
-            
-            if response.status_code in [200, 201]:
-                result = response.json()
-                file_url = result.get('url', '')
+        def on_job_change(job):
+            if job.status == 'done':
+                try:
+                    file_url = job.response.json().get('url', '')
+                except Exception:
+                    file_url = ''
                 
                 # Add to uploaded files list
                 state['uploaded_files'].append({
-                    'name': file_name,
+                    'name': job.name,
                     'url': file_url,
-                    'size': file_size,
+                    'size': job.source.bytes_sent,
                     'uploaded_at': 'Just now'
                 })
                 
-                ui.notify(f"File uploaded successfully: {file_name}", color='positive')
+                ui.notify(f"File uploaded successfully: {job.name}", color='positive')
                 render_uploaded_files()
-                
-            elif response.status_code == 401:
-                ui.notify("Session expired. Please login again.", color='negative')
-                ui.navigate.to('/login')
-            else:
-                error_msg = response.json().get('message', 'Failed to upload file')
-                ui.notify(f"Upload failed: {error_msg}", color='negative')
-        
-        except Exception as e:
-            ui.notify(f"Error uploading file: {str(e)}", color='negative')
+            
+            elif job.status == 'failed':
+                if getattr(job.response, 'status_code', None) == 401:
+                    ui.notify("Session expired. Please login again.", color='negative')
+                    ui.navigate.to('/login')
+                else:
+                    ui.notify(f"Upload failed: {job.error}", color='negative')
+            
+            if job.finished and job in state['jobs']:
+                state['jobs'].remove(job)
+            update_upload_status()
         
-        finally:
-            state['uploading'] = False
+        job.subscribe(on_job_change)
+    
+    def update_upload_status():
+        """Reflect queued/running upload jobs in the status label and progress bar."""
+        jobs = state['jobs']
+        if not jobs:
             upload_status.set_text('Ready to upload')
             progress_bar.set_visibility(False)
+            return
+        retrying = [job for job in jobs if job.status == 'retrying']
+        queued = [job for job in jobs if job.status == 'queued']
+        if retrying:
+            upload_status.set_text(f'Retrying {retrying[0].name} (attempt {retrying[0].attempts + 1})...')
+        elif len(jobs) == len(queued):
+            upload_status.set_text('Waiting for upload slot...')
+        else:
+            upload_status.set_text(f'Uploading {len(jobs)} file(s)...')
+        progress_bar.set_visibility(True)
+        progress_bar.set_value(sum(job.progress for job in jobs) / len(jobs))
     
     def render_uploaded_files():
         """Render the list of uploaded files."""
@@ -187,6 +182,7 @@ def file_upload_page():
                 # Progress bar (initially hidden)
                 progress_bar = ui.linear_progress(value=0).classes('w-full')
                 progress_bar.set_visibility(False)
+                ui.timer(0.5, update_upload_status)
                 
                 # File upload button
                 ui.upload(
@@ -6,6 +6,7 @@ Dedicated password recovery page with email input and security workflow using br
 import requests
 from nicegui import ui
 from app.config import API_BASE_URL
+from app.services.static_assets import stylesheet
 
 def forgot_password_page():
     """Creates the forgot password page with modern brand guidelines and API integration."""
@@ -39,72 +40,8 @@ def forgot_password_page():
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-        <style>
-            /* Brand Typography & Base */
-            body, * {
-                font-family: 'Raleway', sans-serif !important;
-            }
-            body {
-                background: #F2F7FB !important;
-                color: #1A1A1A !important;
-            }
-            
-            /* Icon Font Fix */
-            .material-icons {
-                font-family: 'Material Icons' !important;
-            }
-
-            /* Typography Hierarchy */
-            .sub-heading { font-size: 24px; font-weight: 600; color: #1A1A1A; }
-            .body-text { font-size: 16px; font-weight: 400; color: #4D4D4D; }
-            .button-label { font-size: 14px; font-weight: 600; }
-            
-            /* Brand Colors & Styles */
-            .brand-primary { color: #0055B8 !important; }
-            .brand-slate { color: #4D4D4D !important; }
-            .brand-charcoal { color: #1A1A1A !important; }
-            
-            .auth-card {
-                background: #ffffff !important;
-                border-radius: 16px !important;
-                box-shadow: 0 8px 32px rgba(0, 85, 184, 0.1) !important;
-                border: 1px solid rgba(0, 85, 184, 0.1) !important;
-            }
-            .modern-input {
-                border-radius: 12px !important;
-                transition: all 0.3s ease;
-                border: 2px solid rgba(0, 85, 184, 0.2) !important;
-                background: rgba(0, 85, 184, 0.02) !important;
-            }
-            .modern-input:focus-within {
-                border-color: #0055B8 !important;
-                box-shadow: 0 0 0 3px rgba(0, 85, 184, 0.1) !important;
-                background: #ffffff !important;
-            }
-            .gradient-btn {
-                background: #0055B8 !important;
-                border-radius: 12px !important;
-                transition: all 0.3s ease;
-                border: none !important;
-                font-weight: 600 !important;
-                letter-spacing: 0.025em;
-                color: white !important;
-            }
-            .gradient-btn:hover {
-                transform: translateY(-2px);
-                box-shadow: 0 8px 20px rgba(0, 85, 184, 0.3) !important;
-                background: #003d85 !important;
-            }
-            a {
-                color: #0055B8 !important;
-                text-decoration: none;
-                transition: opacity 0.3s;
-            }
-            a:hover {
-                opacity: 0.8;
-            }
-        </style>
     ''')
+    stylesheet('pages/shared/forgot_password')
     
     with ui.column().classes('w-full py-16 px-8 min-h-screen flex items-center justify-center'):
         # Brand logo
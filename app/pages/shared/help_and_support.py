@@ -3,38 +3,13 @@ Help & Support (FAQ) page for TalentConnect Africa.
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def help_and_support_page():
     """Creates the Help & Support page based on the template."""
 
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800;900&display=swap" rel="stylesheet">
-        <style>
-            body { font-family: 'Inter', sans-serif; background: #F7FAFC; color: #1A202C; }
-            .help-hero {
-                background: linear-gradient(135deg, #0055B8 0%, #003d8f 100%);
-                color: white;
-                padding: 64px 20px 48px 20px;
-                text-align: center;
-                border-radius: 0 0 32px 32px;
-                position: relative;
-                overflow: hidden;
-            }
-            .help-hero h1 { font-size: 48px; font-weight: 900; margin-bottom: 16px; letter-spacing: -0.02em; }
-            .help-hero p { font-size: 20px; font-weight: 400; opacity: 0.95; max-width: 700px; margin: 0 auto; }
-            .faq-section { max-width: 900px; margin: 48px auto 0 auto; padding: 0 20px; }
-            .faq-title { font-size: 32px; font-weight: 800; color: #1A202C; margin-bottom: 24px; text-align: center; }
-            .faq-accordion { background: white; border-radius: 16px; box-shadow: 0 2px 12px rgba(0,0,0,0.04); margin-bottom: 16px; }
-            .faq-question { font-size: 18px; font-weight: 700; color: #0055B8; padding: 20px 28px; cursor: pointer; border-bottom: 1px solid #E2E8F0; }
-            .faq-answer { font-size: 16px; color: #2D3748; padding: 0 28px 20px 28px; display: none; }
-            .faq-accordion.active .faq-answer { display: block; }
-            .faq-accordion.active .faq-question { background: #F0F6FF; }
-            .contact-section { max-width: 900px; margin: 64px auto 0 auto; padding: 0 20px; }
-            .contact-title { font-size: 28px; font-weight: 800; color: #1A202C; margin-bottom: 16px; }
-            .contact-card { background: white; border-radius: 16px; box-shadow: 0 2px 12px rgba(0,0,0,0.04); padding: 32px; }
-            .contact-label { font-size: 16px; font-weight: 700; color: #0055B8; margin-bottom: 6px; }
-            .contact-value { font-size: 16px; color: #2D3748; margin-bottom: 12px; }
-        </style>
         <script>
             document.addEventListener('DOMContentLoaded', function() {
                 document.querySelectorAll('.faq-question').forEach(function(q) {
@@ -46,6 +21,7 @@ def help_and_support_page():
             });
         </script>
     ''')
+    stylesheet('pages/shared/help_and_support')
 
     # Hero Section
     ui.html('''
@@ -1,4 +1,5 @@
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def home_page():
     """Creates the new home page for TalentConnect Africa."""
@@ -16,64 +17,8 @@ def _create_new_hero_section():
     # Add brand guidelines and custom animations
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
-    <style>
-        /* Brand Typography */
-        body {
-            font-family: 'Raleway', sans-serif !important;
-            background: #F2F7FB !important;
-            color: #1A1A1A !important;
-            line-height: 125% !important;
-        }
-        
-        /* Typography Hierarchy */
-        .heading-1 { font-size: 56px; font-weight: 700; color: #1A1A1A; line-height: 110%; letter-spacing: -0.02em; }
-        .hero-text { font-size: 72px; font-weight: 800; line-height: 100%; letter-spacing: -0.03em; }
-        
-        /* Responsive Typography */
-        @media (max-width: 768px) {
-            .hero-text { font-size: 48px; line-height: 105%; }
-            .heading-1 { font-size: 40px; }
-            .heading-2 { font-size: 28px; }
-        }
-        @media (max-width: 480px) {
-            .hero-text { font-size: 36px; line-height: 110%; }
-            .heading-1 { font-size: 32px; }
-            .heading-2 { font-size: 24px; }
-        }
-        .heading-2 { font-size: 40px; font-weight: 600; color: #1A1A1A; line-height: 115%; letter-spacing: -0.01em; }
-        .heading-3 { font-size: 32px; font-weight: 500; color: #1A1A1A; line-height: 120%; }
-        .sub-heading { font-size: 24px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-        .sub-heading-2 { font-size: 18px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-        .body-text { font-size: 16px; font-weight: 400; color: #1A1A1A; line-height: 125%; }
-        .button-label { font-size: 14px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-        .form-placeholder { font-size: 14px; font-weight: 500; color: #4D4D4D; line-height: 125%; }
-        .caption { font-size: 12px; font-weight: 400; color: #4D4D4D; letter-spacing: 8%; line-height: 125%; }
-        
-        /* Brand Colors */
-        .brand-primary { color: #0055B8 !important; }
-        .brand-primary-bg { background-color: #0055B8 !important; }
-        .brand-charcoal { color: #1A1A1A !important; }
-        .brand-slate { color: #4D4D4D !important; }
-        .brand-light-mist { background-color: #F2F7FB !important; }
-        
-        /* Custom Animations */
-        @keyframes fade-in-up {
-            from { opacity: 0; transform: translateY(30px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        @keyframes dot-pulse {
-            0%, 100% { transform: scale(1); opacity: 0.5; }
-            50% { transform: scale(1.5); opacity: 1; }
-        }
-        @keyframes slide-right {
-            from { transform: translateX(-100%); }
-            to { transform: translateX(0); }
-        }
-        .fade-in-up { animation: fade-in-up 0.8s ease-out; }
-        .dot-pulse { animation: dot-pulse 2s ease-in-out infinite; }
-        .accent-line { animation: slide-right 1s ease-out; }
-    </style>
     ''')
+    stylesheet('pages/shared/home')
     
     with ui.element('section').classes('relative w-full bg-white pt-24 pb-24 overflow-hidden'):
         # Decorative dots pattern
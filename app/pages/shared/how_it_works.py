@@ -3,267 +3,14 @@
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def how_it_works_page():
     """Creates the 'How It Works' page with completely fresh bold design."""
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800;900&display=swap" rel="stylesheet">
-        <style>
-            * {
-                font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-                box-sizing: border-box;
-                margin: 0;
-                padding: 0;
-            }
-            
-            body {
-                background: #ffffff;
-                color: #1e293b;
-                line-height: 1.6;
-            }
-            
-            /* Tab Navigation Bar */
-            .tabs-nav-bar {
-                background: white;
-                border-bottom: 2px solid #e2e8f0;
-                padding: 20px 20px;
-                position: sticky;
-                top: 0;
-                z-index: 1000;
-            }
-            
-            /* Hero Section */
-            .hero-wrapper {
-                background: linear-gradient(135deg, #0055B8 0%, #003d8f 100%);
-                padding: 80px 20px 100px;
-                position: relative;
-                overflow: hidden;
-            }
-            
-            .hero-wrapper::after {
-                content: '';
-                position: absolute;
-                bottom: 0;
-                left: 0;
-                right: 0;
-                height: 40px;
-                background: white;
-                clip-path: polygon(0 100%, 100% 100%, 100% 0);
-            }
-            
-            .hero-content {
-                max-width: 1200px;
-                margin: 0 auto;
-                text-align: center;
-                position: relative;
-                z-index: 1;
-            }
-            
-            .hero-title {
-                font-size: 64px;
-                font-weight: 900;
-                color: white;
-                margin-bottom: 20px;
-                letter-spacing: -0.03em;
-                line-height: 1.1;
-            }
-            
-            .hero-subtitle {
-                font-size: 22px;
-                font-weight: 400;
-                color: rgba(255, 255, 255, 0.95);
-                max-width: 800px;
-                margin: 0 auto;
-                line-height: 1.6;
-            }
-            
-            /* Tab Pills (in nav bar) */
-            .tabs-container {
-                display: flex;
-                justify-content: center;
-                gap: 12px;
-                flex-wrap: wrap;
-                max-width: 1200px;
-                margin: 0 auto;
-            }
-            
-            .tab-pill {
-                padding: 14px 36px;
-                background: #f8fafc;
-                border: 2px solid #e2e8f0;
-                border-radius: 50px;
-                font-size: 15px;
-                font-weight: 700;
-                color: #64748b;
-                cursor: pointer;
-                transition: all 0.3s ease;
-                white-space: nowrap;
-            }
-            
-            .tab-pill:hover {
-                background: #f1f5f9;
-                border-color: #0055B8;
-                color: #0055B8;
-                transform: translateY(-1px);
-            }
-            
-            .tab-pill.active {
-                background: #0055B8;
-                border-color: #0055B8;
-                color: white;
-                box-shadow: 0 4px 12px rgba(0, 85, 184, 0.25);
-            }
-            
-            /* Main Content */
-            .main-content {
-                max-width: 1400px;
-                margin: 0 auto;
-                padding: 80px 40px;
-            }
-            
-            /* Process Steps */
-            .process-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-                gap: 32px;
-            }
-            
-            .process-card {
-                background: #ffffff;
-                border-radius: 24px;
-                padding: 0;
-                position: relative;
-                overflow: hidden;
-                box-shadow: 0 4px 20px rgba(0, 0, 0, 0.06);
-                transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-            }
-            
-            .process-card:hover {
-                transform: translateY(-8px);
-                box-shadow: 0 20px 40px rgba(0, 85, 184, 0.15);
-            }
-            
-            .card-top {
-                background: linear-gradient(135deg, #0055B8 0%, #0066d6 100%);
-                padding: 10px 14px 8px 14px;
-                min-height: 38px;
-                border-radius: 14px 14px 0 0;
-                position: relative;
-            }
-            
-            .process-number {
-                font-size: 72px;
-                font-weight: 900;
-                color: rgba(255, 255, 255, 0.2);
-                line-height: 1;
-                margin-bottom: 12px;
-            }
-            
-            .process-title {
-                font-size: 24px;
-                font-weight: 800;
-                color: white;
-                margin: 0;
-                line-height: 1.3;
-            }
-            
-            .card-content {
-                padding: 32px;
-            }
-            
-            .process-description {
-                font-size: 16px;
-                font-weight: 400;
-                color: #475569;
-                line-height: 1.7;
-                margin: 0;
-            }
-            
-            /* Decorative Elements */
-            .process-card::before {
-                content: '';
-                position: absolute;
-                top: 0;
-                right: -50px;
-                width: 150px;
-                height: 150px;
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 50%;
-                transition: all 0.4s ease;
-            }
-            
-            .process-card:hover::before {
-                transform: scale(1.5);
-                opacity: 0.3;
-            }
-            
-            /* Responsive Design */
-            @media (max-width: 1200px) {
-                .main-content {
-                    padding: 60px 30px;
-                }
-                
-                .process-grid {
-                    grid-template-columns: repeat(2, 1fr);
-                    gap: 24px;
-                }
-            }
-            
-            @media (max-width: 768px) {
-                .hero-wrapper {
-                    padding: 60px 20px 80px;
-                }
-                
-                .hero-title {
-                    font-size: 40px;
-                }
-                
-                .hero-subtitle {
-                    font-size: 18px;
-                }
-                
-                .tabs-container {
-                    flex-direction: column;
-                    gap: 12px;
-                    padding: 0 20px;
-                }
-                
-                .tab-pill {
-                    padding: 12px 28px;
-                    font-size: 14px;
-                }
-                
-                .main-content {
-                    padding: 40px 20px;
-                }
-                
-                .process-grid {
-                    grid-template-columns: 1fr;
-                    gap: 24px;
-                }
-                
-                .process-number {
-                    font-size: 56px;
-                }
-                
-                .process-title {
-                    font-size: 20px;
-                }
-                
-                .card-top {
-                    padding: 32px 24px;
-                }
-                
-                .card-content {
-                    padding: 24px;
-                }
-                
-                .process-description {
-                    font-size: 15px;
-                }
-            }
-        </style>
     ''')
+    stylesheet('pages/shared/how_it_works')
 
     # Tab state
     tab_state = {'active': 'trainees'}
@@ -4,6 +4,7 @@ Experience feedback system with rating forms, detailed assessments, and feedback
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def immersion_experience_feedback_page():
     """Creates the immersion experience feedback page with brand guidelines and icon fixes."""
@@ -12,77 +13,8 @@ def immersion_experience_feedback_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Typography classes */
-        .heading-1 { font-size: 3rem; font-weight: 700; line-height: 1.1; }
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .sub-heading { font-size: 1.5rem; font-weight: 500; line-height: 1.4; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-light-mist { background-color: #F2F7FB; }
-
-        /* Custom styling */
-        .feedback-card {
-            background: white;
-            border-radius: 12px;
-            border: 1px solid #E5E7EB;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }
-        
-        .rating-container {
-            display: flex;
-            gap: 8px;
-            align-items: center;
-        }
-        
-        .star-rating {
-            color: #FFA500;
-            cursor: pointer;
-            font-size: 24px;
-        }
-        
-        .star-rating.inactive {
-            color: #D1D5DB;
-        }
-        
-        .progress-ring {
-            transform: rotate(-90deg);
-        }
-        
-        .feedback-section {
-            border-left: 4px solid #0055B8;
-            background: #F8FAFC;
-        }
-    </style>
     ''')
+    stylesheet('pages/shared/immersion_experience_feedback')
     
     # Outer page container with top spacing
     with ui.column().classes('min-h-screen w-full flex-col brand-light-mist pt-20'):
@@ -4,6 +4,7 @@ Enhanced messaging interface with file sharing, threading, and video calls using
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def in_app_messaging_interface_page():
     """Creates the enhanced messaging interface page with brand guidelines and icon fixes."""
@@ -12,124 +13,8 @@ def in_app_messaging_interface_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Typography classes */
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-light-mist { background-color: #F2F7FB; }
-
-        /* Custom styling */
-        .messaging-container {
-            height: calc(100vh - 120px);
-            background: white;
-            border-radius: 12px;
-            overflow: hidden;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-        }
-
-        .conversation-item {
-            padding: 16px;
-            border-bottom: 1px solid #F1F5F9;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-
-        .conversation-item:hover {
-            background: #F8FAFC;
-        }
-
-        .conversation-item.active {
-            background: #EBF4FF;
-            border-right: 3px solid #0055B8;
-        }
-
-        .message-bubble {
-            max-width: 70%;
-            padding: 12px 16px;
-            border-radius: 12px;
-            margin-bottom: 8px;
-        }
-
-        .message-sent {
-            background: #0055B8;
-            color: white;
-            margin-left: auto;
-            border-bottom-right-radius: 4px;
-        }
-
-        .message-received {
-            background: #F1F5F9;
-            color: #1F2937;
-            margin-right: auto;
-            border-bottom-left-radius: 4px;
-        }
-
-        .chat-input {
-            background: #F8FAFC;
-            border: 1px solid #E5E7EB;
-            border-radius: 24px;
-            padding: 12px 20px;
-            resize: none;
-            outline: none;
-        }
-
-        .chat-input:focus {
-            border-color: #0055B8;
-            background: white;
-        }
-
-        .file-attachment {
-            background: #F3F4F6;
-            border: 1px solid #D1D5DB;
-            border-radius: 8px;
-            padding: 8px 12px;
-            margin: 4px 0;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }
-
-        .online-indicator {
-            width: 12px;
-            height: 12px;
-            background: #10B981;
-            border: 2px solid white;
-            border-radius: 50%;
-            position: absolute;
-            bottom: 0;
-            right: 0;
-        }
-    </style>
     ''')
+    stylesheet('pages/shared/in_app_messaging_interface')
 
     with ui.column().classes('relative flex h-auto min-h-screen w-full flex-col brand-light-mist pt-20'):
         # Header
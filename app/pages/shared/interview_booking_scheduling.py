@@ -4,6 +4,7 @@ Interview scheduling system with calendar integration and video call setup using
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def interview_booking_scheduling_page():
     """Creates the interview booking and scheduling page with brand guidelines and icon fixes."""
@@ -12,120 +13,8 @@ def interview_booking_scheduling_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Typography classes */
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .sub-heading { font-size: 1.5rem; font-weight: 500; line-height: 1.4; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-light-mist { background-color: #F2F7FB; }
-
-        /* Custom styling */
-        .interview-card {
-            background: white;
-            border-radius: 12px;
-            padding: 24px;
-            margin-bottom: 16px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        }
-
-        .time-slot {
-            background: #F8FAFC;
-            border: 2px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 12px 16px;
-            margin: 4px;
-            cursor: pointer;
-            transition: all 0.2s;
-            text-align: center;
-        }
-
-        .time-slot:hover {
-            border-color: #0055B8;
-            background: #F2F7FB;
-        }
-
-        .time-slot.selected {
-            border-color: #0055B8;
-            background: #0055B8;
-            color: white;
-        }
-
-        .time-slot.unavailable {
-            background: #F3F4F6;
-            border-color: #D1D5DB;
-            color: #9CA3AF;
-            cursor: not-allowed;
-        }
-
-        .calendar-day {
-            min-height: 100px;
-            border: 1px solid #E5E7EB;
-            padding: 8px;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-
-        .calendar-day:hover {
-            background: #F9FAFB;
-        }
-
-        .calendar-day.selected {
-            background: #EBF4FF;
-            border-color: #0055B8;
-        }
-
-        .calendar-day.has-slots {
-            border-color: #10B981;
-        }
-
-        .interview-type-card {
-            background: white;
-            border: 2px solid #E2E8F0;
-            border-radius: 8px;
-            padding: 16px;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-
-        .interview-type-card:hover {
-            border-color: #0055B8;
-        }
-
-        .interview-type-card.selected {
-            border-color: #0055B8;
-            background: #F2F7FB;
-        }
-    </style>
     ''')
+    stylesheet('pages/shared/interview_booking_scheduling')
 
     with ui.column().classes('relative flex h-auto min-h-screen w-full flex-col brand-light-mist pt-20'):
         # Header
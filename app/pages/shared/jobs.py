@@ -41,7 +41,10 @@ Jobs page for Dompell Africa
 """
 
 from nicegui import ui
-from app.data import SAMPLE_JOBS
+from app.services.job_store import job_store
+from app.services.static_assets import stylesheet
+
+JOBS_PER_PAGE = 50
 
 
 def jobs_page():
@@ -49,25 +52,8 @@ def jobs_page():
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-        <style>
-            body { font-family: 'Raleway', sans-serif !important; background: #F2F7FB !important; color: #1A1A1A !important; }
-            .jobs-hero {
-                background: linear-gradient(135deg, #1A1A1A 0%, #0055B8 100%);
-                color: white;
-                padding: 64px 20px 48px 20px;
-                text-align: center;
-                border-radius: 0 0 32px 32px;
-                position: relative;
-                overflow: hidden;
-            }
-            .jobs-hero h1 { font-size: 48px; font-weight: 900; margin-bottom: 16px; letter-spacing: -0.02em; }
-            .jobs-hero p { font-size: 20px; font-weight: 400; opacity: 0.95; max-width: 700px; margin: 0 auto; }
-            .jobs-main { max-width: 1200px; margin: 48px auto 0 auto; padding: 0 20px; }
-            @media (max-width: 900px) {
-                .jobs-main { padding: 0 8px; }
-            }
-        </style>
     ''')
+    stylesheet('pages/shared/jobs')
 
     # Hero Section with page title
     ui.html('''
@@ -87,16 +73,29 @@ def jobs_page():
                 experience_select = ui.select(["All Levels", "Entry Level", "Mid Level", "Senior Level"], value="All Levels").classes("flex-1 min-w-[150px] border-2 rounded-lg").props("outlined dense")
                 remote_select = ui.select(["All", "Remote Only", "On-site Only", "Hybrid"], value="All").classes("flex-1 min-w-[150px] border-2 rounded-lg").props("outlined dense")
                 ui.button("Search Jobs", icon="search").classes("px-6 py-3 button-label rounded-lg transition-all").style("background-color: #0055B8 !important; color: white !important;")
+        # Open postings from every employer, newest first
+        listings = job_store.query(status="active", sort="Posted", limit=JOBS_PER_PAGE)
         # Results header
         with ui.row().classes("items-center justify-between mb-8"):
-            ui.label(f"{len(SAMPLE_JOBS)} jobs found").classes("sub-heading-2 brand-slate")
+            ui.label(f"{listings['total']} jobs found").classes("sub-heading-2 brand-slate")
             with ui.row().classes("items-center gap-3"):
                 ui.label("Sort by:").classes("button-label brand-slate")
                 sort_select = ui.select(["Most Recent", "Relevance", "Company A-Z"], value="Most Recent").classes("w-40 border-2 rounded-lg").props("outlined dense")
         # Job listings
         with ui.column().classes("gap-4"):
-            for job in SAMPLE_JOBS:
-                create_job_card(job)
+            for job in listings["items"]:
+                create_job_card(_listing(job))
+
+
+def _listing(job: dict) -> dict:
+    """Card fields of a stored posting (dashboard postings carry companyName and postedDate)."""
+    return dict(
+        job,
+        company=job.get("company") or job.get("companyName") or job.get("employerName") or "Employer",
+        location=job.get("location") or "Remote",
+        type=job.get("type") or "Full-time",
+        posted=job.get("posted") or f"Posted {job.get('postedDate', '')[:10]}",
+    )
 
 
 def apply_job(job_id: int):
@@ -3,88 +3,15 @@ Messaging page for Dompell Africa.
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def messaging_page():
     """Creates the messaging page based on the template."""
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-        <style>
-            /* Brand Typography */
-            body {
-                font-family: 'Raleway', sans-serif !important;
-                background: #F2F7FB !important;
-                color: #1A1A1A !important;
-                line-height: 125% !important;
-            }
-            
-            /* Typography Hierarchy */
-            .heading-1 { font-size: 56px; font-weight: 700; color: #1A1A1A; line-height: 110%; letter-spacing: -0.02em; }
-            .heading-2 { font-size: 40px; font-weight: 600; color: #1A1A1A; line-height: 115%; letter-spacing: -0.01em; }
-            .heading-3 { font-size: 32px; font-weight: 500; color: #1A1A1A; line-height: 120%; }
-            .sub-heading { font-size: 24px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-            .sub-heading-2 { font-size: 18px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-            .body-text { font-size: 16px; font-weight: 400; color: #1A1A1A; line-height: 125%; }
-            .button-label { font-size: 14px; font-weight: 600; color: #1A1A1A; line-height: 125%; }
-            .form-placeholder { font-size: 14px; font-weight: 500; color: #4D4D4D; line-height: 125%; }
-            .caption { font-size: 12px; font-weight: 400; color: #4D4D4D; letter-spacing: 8%; line-height: 125%; }
-            
-            /* Brand Colors */
-            .brand-primary { color: #0055B8 !important; }
-            .brand-primary-bg { background-color: #0055B8 !important; }
-            .brand-charcoal { color: #1A1A1A !important; }
-            .brand-slate { color: #4D4D4D !important; }
-            .brand-light-mist { background-color: #F2F7FB !important; }
-            
-            /* Force brand font family but EXCLUDE icons */
-            *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-                font-family: 'Raleway', sans-serif !important;
-            }
-            
-            /* Ensure Material Icons work properly */
-            .material-icons, .q-icon, i.material-icons, i[class*="material-icons"] {
-                font-family: 'Material Icons' !important;
-                font-weight: normal !important;
-                font-style: normal !important;
-                font-variant: normal !important;
-                text-transform: none !important;
-                line-height: 1 !important;
-                letter-spacing: normal !important;
-                word-wrap: normal !important;
-                white-space: nowrap !important;
-                direction: ltr !important;
-                -webkit-font-smoothing: antialiased !important;
-                -moz-osx-font-smoothing: grayscale !important;
-                -webkit-font-feature-settings: 'liga' !important;
-            }
-            
-            /* Override all colors to brand colors */
-            [class*="text-gray"], [class*="text-slate"], .text-\\[\\#47709e\\], .text-\\[\\#0d141c\\] {
-                color: #4D4D4D !important;
-            }
-            
-            h1, h2, h3, h4, h5, h6, .text-black {
-                color: #1A1A1A !important;
-            }
-            
-            [class*="bg-gray"], [class*="bg-slate"], .bg-slate-50, .bg-slate-100 {
-                background-color: #F2F7FB !important;
-            }
-            
-            [class*="bg-blue"], .bg-blue-50 {
-                background-color: rgba(0, 85, 184, 0.1) !important;
-            }
-            
-            .bg-white { background-color: #FFFFFF !important; }
-            body, .min-h-screen { background-color: #F2F7FB !important; }
-            
-            [class*="border-slate"] {
-                border-color: rgba(77, 77, 77, 0.2) !important;
-            }
-            
-            .q-btn { background-color: #0055B8 !important; color: white !important; }
-        </style>
     ''')
+    stylesheet('pages/shared/messaging')
 
     with ui.column().classes('min-h-screen brand-light-mist pt-20'):
         with ui.row().classes('flex h-[calc(100vh-5rem)] w-full max-w-7xl mx-auto'):
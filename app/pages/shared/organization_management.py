@@ -7,6 +7,7 @@ NO ICONS - Brand guidelines compliant
 from nicegui import ui, app
 from app.services.api_service import api_service
 from app.services.auth_utils import get_user_id, get_current_user, is_authenticated, has_role
+from app.services.static_assets import stylesheet
 import asyncio
 from typing import Optional, Dict, Any, List
 
@@ -31,152 +32,8 @@ def organization_management_page():
     # Add brand styling - NO ICONS
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
-    <style>
-        body, * { font-family: 'Raleway', sans-serif !important; }
-        
-        .org-card {
-            background: white;
-            border-radius: 16px;
-            padding: 32px;
-            box-shadow: 0 4px 16px rgba(0, 0, 0, 0.1);
-            margin-bottom: 24px;
-        }
-        
-        .org-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 32px;
-            padding-bottom: 24px;
-            border-bottom: 2px solid #F2F7FB;
-        }
-        
-        .page-title {
-            font-size: 32px;
-            font-weight: 700;
-            color: #1A1A1A;
-        }
-        
-        .section-title {
-            font-size: 20px;
-            font-weight: 600;
-            color: #1A1A1A;
-            margin-bottom: 16px;
-        }
-        
-        .btn-primary {
-            background: #0055B8;
-            color: white;
-            padding: 12px 24px;
-            border-radius: 8px;
-            font-weight: 600;
-            border: none;
-            cursor: pointer;
-            transition: all 0.3s;
-        }
-        
-        .btn-primary:hover {
-            background: #003d85;
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0, 85, 184, 0.3);
-        }
-        
-        .btn-secondary {
-            background: #F2F7FB;
-            color: #0055B8;
-            padding: 12px 24px;
-            border-radius: 8px;
-            font-weight: 600;
-            border: 2px solid #0055B8;
-            cursor: pointer;
-            transition: all 0.3s;
-        }
-        
-        .btn-secondary:hover {
-            background: #E6F0FA;
-        }
-        
-        .btn-danger {
-            background: #DC2626;
-            color: white;
-            padding: 8px 16px;
-            border-radius: 6px;
-            font-weight: 500;
-            border: none;
-            cursor: pointer;
-        }
-        
-        .btn-danger:hover {
-            background: #B91C1C;
-        }
-        
-        .org-item {
-            background: white;
-            border: 2px solid #F2F7FB;
-            border-radius: 12px;
-            padding: 24px;
-            margin-bottom: 16px;
-            transition: all 0.3s;
-        }
-        
-        .org-item:hover {
-            border-color: #0055B8;
-            box-shadow: 0 4px 12px rgba(0, 85, 184, 0.1);
-        }
-        
-        .org-name {
-            font-size: 20px;
-            font-weight: 600;
-            color: #1A1A1A;
-            margin-bottom: 8px;
-        }
-        
-        .org-detail {
-            font-size: 14px;
-            color: #4D4D4D;
-            margin-bottom: 4px;
-        }
-        
-        .badge {
-            display: inline-block;
-            padding: 4px 12px;
-            border-radius: 16px;
-            font-size: 12px;
-            font-weight: 600;
-            margin-right: 8px;
-        }
-        
-        .badge-employer {
-            background: #DBEAFE;
-            color: #1E40AF;
-        }
-        
-        .badge-institution {
-            background: #FCE7F3;
-            color: #BE185D;
-        }
-        
-        .form-label {
-            font-size: 14px;
-            font-weight: 600;
-            color: #1A1A1A;
-            margin-bottom: 8px;
-        }
-        
-        .empty-state {
-            text-align: center;
-            padding: 48px 24px;
-            color: #4D4D4D;
-        }
-        
-        .empty-state-title {
-            font-size: 24px;
-            font-weight: 600;
-            color: #1A1A1A;
-            margin-bottom: 12px;
-        }
-    </style>
     ''')
+    stylesheet('pages/shared/organization_management')
     
     # State management
     state = {
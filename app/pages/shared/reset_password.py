@@ -8,6 +8,7 @@ import asyncio
 import re
 from nicegui import app, ui
 from app.config import API_BASE_URL
+from app.services.static_assets import stylesheet
 
 def reset_password_page():
     """Creates the modern, branded password reset page."""
@@ -85,36 +86,8 @@ def reset_password_page():
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-        <style>
-            body, * { font-family: 'Raleway', sans-serif !important; }
-            body { background: #F2F7FB !important; color: #1A1A1A !important; }
-            .material-icons { font-family: 'Material Icons' !important; }
-            .sub-heading { font-size: 24px; font-weight: 600; color: #1A1A1A; }
-            .body-text { font-size: 16px; font-weight: 400; color: #4D4D4D; }
-            .button-label { font-size: 14px; font-weight: 600; }
-            .brand-primary { color: #0055B8 !important; }
-            .brand-slate { color: #4D4D4D !important; }
-            .brand-charcoal { color: #1A1A1A !important; }
-            .auth-card {
-                background: #ffffff !important;
-                border-radius: 16px !important;
-                box-shadow: 0 8px 32px rgba(0, 85, 184, 0.1) !important;
-                border: 1px solid rgba(0, 85, 184, 0.1) !important;
-            }
-            .modern-input {
-                border-radius: 12px !important;
-                border: 2px solid rgba(0, 85, 184, 0.2) !important;
-                background: rgba(0, 85, 184, 0.02) !important;
-            }
-            .gradient-btn {
-                background: #0055B8 !important;
-                border-radius: 12px !important;
-                font-weight: 600 !important;
-                color: white !important;
-            }
-            a { color: #0055B8 !important; text-decoration: none; }
-        </style>
     ''')
+    stylesheet('pages/shared/reset_password')
 
     with ui.column().classes('w-full py-16 px-8 min-h-screen flex items-center justify-center'):
         with ui.card().classes('auth-card w-full max-w-md p-0 mx-auto'):
@@ -3,6 +3,7 @@ Test Login page for easy access to different user roles with prefilled credentia
 """
 
 from nicegui import ui, app
+from app.services.static_assets import stylesheet
 
 def test_login_page():
     """Creates a test login page with quick access buttons for different roles."""
@@ -25,47 +26,8 @@ def test_login_page():
     
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
-        <style>
-            body, .raleway-font { font-family: 'Raleway', sans-serif !important; }
-            
-            body {
-                background: radial-gradient(1200px 600px at 10% -10%, rgba(0,85,184,0.08), transparent 60%),
-                            radial-gradient(900px 500px at 110% 20%, rgba(16,185,129,0.06), transparent 60%),
-                            linear-gradient(180deg, #F2F7FB 0%, #F8FAFC 100%);
-            }
-            
-            .test-card {
-                background: #ffffff;
-                border-radius: 18px;
-                box-shadow: 0 16px 40px rgba(2, 48, 99, 0.10), 0 6px 16px rgba(0, 85, 184, 0.06);
-                border: 1px solid rgba(0, 85, 184, 0.12);
-                overflow: hidden;
-            }
-            
-            .role-button {
-                border-radius: 12px;
-                border: 2px solid transparent;
-                transition: all .2s ease;
-                cursor: pointer;
-            }
-            
-            .role-button:hover {
-                transform: translateY(-2px);
-                box-shadow: 0 8px 20px rgba(0, 85, 184, 0.25);
-            }
-            
-            .badge {
-                background: rgba(0, 85, 184, 0.1);
-                color: #0055B8;
-                font-weight: 700;
-                padding: 4px 12px;
-                border-radius: 9999px;
-                font-size: 11px;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }
-        </style>
     ''')
+    stylesheet('pages/shared/test_login')
     
     with ui.column().classes('w-full min-h-screen flex items-center justify-center py-16 px-4'):
         with ui.column().classes('w-full max-w-7xl mx-auto gap-6'):
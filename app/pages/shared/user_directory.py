@@ -5,7 +5,7 @@ Integrated with real Dompell API.
 """
 
 from nicegui import ui
-from app.services.api_service import api_service
+from app.services.async_api_service import async_api_service
 from app.services.auth_utils import get_user_id, get_user_role
 
 def user_directory_page():
@@ -52,7 +52,7 @@ def user_directory_page():
             # Check if in dev mode - if so, don't call API at all
             
             # Call API for real accounts only
-            response = api_service.get_all_users()
+            response = await async_api_service.get_all_users()
             
             if response.status_code == 200:
                 state['users'] = response.json()
@@ -6,6 +6,7 @@ View and edit user profile with real API integration
 from nicegui import ui, app
 from app.services.api_service import api_service
 from app.services.auth_utils import get_user_id, get_current_user, is_authenticated
+from app.services.static_assets import stylesheet
 import asyncio
 from typing import Optional, Dict, Any
 
@@ -22,78 +23,8 @@ def user_profile_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        body, * { font-family: 'Raleway', sans-serif !important; }
-        .material-icons { font-family: 'Material Icons' !important; }
-        
-        .profile-card {
-            background: white;
-            border-radius: 16px;
-            padding: 32px;
-            box-shadow: 0 4px 16px rgba(0, 0, 0, 0.1);
-        }
-        
-        .profile-header {
-            display: flex;
-            align-items: center;
-            gap: 24px;
-            margin-bottom: 32px;
-            padding-bottom: 24px;
-            border-bottom: 2px solid #F2F7FB;
-        }
-        
-        .profile-avatar {
-            width: 120px;
-            height: 120px;
-            border-radius: 50%;
-            background: linear-gradient(135deg, #0055B8 0%, #003d85 100%);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-size: 48px;
-            font-weight: 700;
-        }
-        
-        .section-title {
-            font-size: 20px;
-            font-weight: 600;
-            color: #1A1A1A;
-            margin-bottom: 16px;
-        }
-        
-        .info-row {
-            display: flex;
-            padding: 16px 0;
-            border-bottom: 1px solid #F2F7FB;
-        }
-        
-        .info-label {
-            font-weight: 600;
-            color: #4D4D4D;
-            width: 150px;
-        }
-        
-        .info-value {
-            color: #1A1A1A;
-            flex: 1;
-        }
-        
-        .edit-button {
-            background: #0055B8;
-            color: white;
-            padding: 12px 24px;
-            border-radius: 8px;
-            font-weight: 600;
-            border: none;
-            cursor: pointer;
-        }
-        
-        .edit-button:hover {
-            background: #003d85;
-        }
-    </style>
     ''')
+    stylesheet('pages/shared/user_profile')
     
     # State for profile data
     profile_data = {
@@ -7,6 +7,7 @@ featuring robust validation and API handling.
 from nicegui import ui, app
 import re
 from app.services.api_service import api_service
+from app.services.static_assets import stylesheet
 
 def user_registration_1_page():
     """Creates a modern, branded registration page with validation and API integration."""
@@ -15,39 +16,8 @@ def user_registration_1_page():
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-        <style>
-            body, * { font-family: 'Raleway', sans-serif !important; }
-            body { background: #F2F7FB !important; color: #1A1A1A !important; }
-            .material-icons { font-family: 'Material Icons' !important; }
-            .sub-heading { font-size: 24px; font-weight: 600; color: #1A1A1A; }
-            .body-text { font-size: 16px; font-weight: 400; color: #4D4D4D; }
-            .button-label { font-size: 14px; font-weight: 600; }
-            .caption { font-size: 12px; font-weight: 400; color: #4D4D4D; }
-            .brand-primary { color: #0055B8 !important; }
-            .brand-slate { color: #4D4D4D !important; }
-            .brand-charcoal { color: #1A1A1A !important; }
-            .auth-card {
-                background: #ffffff !important;
-                border-radius: 16px !important;
-                box-shadow: 0 8px 32px rgba(0, 85, 184, 0.1) !important;
-                border: 1px solid rgba(0, 85, 184, 0.1) !important;
-            }
-            .modern-input {
-                border-radius: 12px !important;
-                border: 2px solid rgba(0, 85, 184, 0.2) !important;
-                background: rgba(0, 85, 184, 0.02) !important;
-            }
-            .gradient-btn {
-                background: #0055B8 !important;
-                border-radius: 12px !important;
-                font-weight: 600 !important;
-                color: white !important;
-            }
-            a { color: #0055B8 !important; text-decoration: none; }
-            .q-tab { text-transform: none !important; font-weight: 600 !important; }
-            .q-tab--active { color: #0055B8 !important; }
-        </style>
     ''')
+    stylesheet('pages/shared/user_registration_1')
 
     # --- State and Validation Logic ---
     state = {
@@ -120,7 +90,7 @@ def user_registration_1_page():
                 if token:
                     app.storage.user['verification_token'] = token  # Contains OTP code for fallback
                     app.storage.browser['verification_token'] = token  # More persistent
-                    print(f"[DEBUG] Stored verification token: {token[:50]}...")
+                    print("[DEBUG] Stored verification token")
                 
                 # Registration succeeded - backend attempted to send email
                 # Even if email service has issues, user can still verify using token
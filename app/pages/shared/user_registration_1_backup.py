@@ -11,6 +11,7 @@ import os
 from concurrent.futures import ThreadPoolExecutor
 import json
 from app.config import API_BASE_URL
+from app.services.static_assets import stylesheet
 
 # Configure requests session with proper settings
 session = requests.Session()
@@ -378,21 +379,7 @@ def user_registration_1_backup_page():
             state["is_submitting"] = False
             submit_button.props('loading=false')
             update_validation_status()    # Add custom CSS for better styling
-    ui.add_head_html('''
-    <style>
-        .role-card {
-            transition: all 0.3s ease;
-            cursor: pointer;
-        }
-        .role-card:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-        }
-        .validation-status {
-            min-height: 60px;
-        }
-    </style>
-    ''')
+    stylesheet('pages/shared/user_registration_1_backup')
     
     # Main UI Layout
     with ui.column().classes('min-h-screen bg-gradient-to-br from-blue-50 to-indigo-100 py-8'):
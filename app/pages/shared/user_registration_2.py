@@ -5,6 +5,7 @@ aligning with the main authentication flow.
 """
 
 from nicegui import ui, app
+from app.services.static_assets import stylesheet
 
 def user_registration_2_page():
     """Creates the second step of user registration for profile completion."""
@@ -13,48 +14,8 @@ def user_registration_2_page():
     ui.add_head_html('''
         <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-        <style>
-            body, * { font-family: 'Raleway', sans-serif !important; }
-            body { background: #F2F7FB !important; color: #1A1A1A !important; }
-            .material-icons { font-family: 'Material Icons' !important; }
-            .sub-heading { font-size: 24px; font-weight: 600; color: #1A1A1A; }
-            .body-text { font-size: 16px; font-weight: 400; color: #4D4D4D; }
-            .button-label { font-size: 14px; font-weight: 600; }
-            .caption { font-size: 12px; font-weight: 400; color: #4D4D4D; }
-            .brand-primary { color: #0055B8 !important; }
-            .brand-slate { color: #4D4D4D !important; }
-            .brand-charcoal { color: #1A1A1A !important; }
-            .auth-card {
-                background: #ffffff !important;
-                border-radius: 16px !important;
-                box-shadow: 0 8px 32px rgba(0, 85, 184, 0.1) !important;
-                border: 1px solid rgba(0, 85, 184, 0.1) !important;
-            }
-            .modern-input {
-                border-radius: 12px !important;
-                border: 2px solid rgba(0, 85, 184, 0.2) !important;
-                background: rgba(0, 85, 184, 0.02) !important;
-            }
-            .gradient-btn {
-                background: #0055B8 !important;
-                border-radius: 12px !important;
-                font-weight: 600 !important;
-                color: white !important;
-            }
-            a { color: #0055B8 !important; text-decoration: none; }
-            .step-indicator {
-                width: 32px; height: 32px; border-radius: 50%;
-                display: flex; align-items: center; justify-content: center;
-                font-weight: 600; font-size: 14px;
-                transition: all 0.3s ease;
-            }
-            .step-completed { background: #10B981; color: white; }
-            .step-active { background: #0055B8; color: white; }
-            .step-inactive { background: #E0E0E0; color: #6B7280; }
-            .step-connector { flex-grow: 1; height: 2px; background: #E0E0E0; }
-            .step-connector.completed { background: #10B981; }
-        </style>
     ''')
+    stylesheet('pages/shared/user_registration_2')
 
     # --- State Management ---
     # In a real app, this would be pre-populated or handled more robustly
@@ -4,6 +4,7 @@ Comprehensive user settings with profile management, privacy controls, and prefe
 """
 
 from nicegui import ui
+from app.services.static_assets import stylesheet
 
 def user_settings_profile_management_page():
     """Creates the user settings and profile management page with brand guidelines and icon fixes."""
@@ -12,99 +13,8 @@ def user_settings_profile_management_page():
     ui.add_head_html('''
     <link href="https://fonts.googleapis.com/css2?family=Raleway:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-    <style>
-        /* Brand typography - excludes icons to prevent font override */
-        *:not(.material-icons):not(.q-icon):not([class*="material-icons"]):not(i) {
-            font-family: 'Raleway', sans-serif !important;
-        }
-
-        /* Material Icons properties */
-        .material-icons {
-            font-family: 'Material Icons' !important;
-            font-weight: normal;
-            font-style: normal;
-            font-size: 24px;
-            line-height: 1;
-            letter-spacing: normal;
-            text-transform: none;
-            display: inline-block;
-            white-space: nowrap;
-            word-wrap: normal;
-            direction: ltr;
-            font-feature-settings: 'liga';
-            -webkit-font-smoothing: antialiased;
-            -webkit-font-feature-settings: 'liga';
-        }
-
-        /* Typography classes */
-        .heading-2 { font-size: 2.25rem; font-weight: 600; line-height: 1.2; }
-        .sub-heading { font-size: 1.5rem; font-weight: 500; line-height: 1.4; }
-        .body-text { font-size: 1rem; font-weight: 400; line-height: 1.6; }
-        .caption { font-size: 0.75rem; font-weight: 400; }
-
-        /* Brand colors */
-        .brand-primary { color: #0055B8; }
-        .brand-charcoal { color: #1A1A1A; }
-        .brand-slate { color: #4D4D4D; }
-        .brand-light-mist { background-color: #F2F7FB; }
-
-        /* Custom styling */
-        .settings-card {
-            background: white;
-            border-radius: 12px;
-            border: 1px solid #E5E7EB;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }
-        
-        .settings-nav {
-            border-right: 1px solid #E5E7EB;
-            background: #F9FAFB;
-        }
-        
-        .nav-item {
-            padding: 12px 16px;
-            cursor: pointer;
-            border-radius: 8px;
-            margin: 4px;
-            transition: all 0.2s;
-        }
-        
-        .nav-item:hover {
-            background: #E5E7EB;
-        }
-        
-        .nav-item.active {
-            background: #0055B8;
-            color: white;
-        }
-        
-        .profile-avatar {
-            width: 100px;
-            height: 100px;
-            border-radius: 50%;
-            border: 3px solid #E5E7EB;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            background: #F3F4F6;
-        }
-        
-        .privacy-option {
-            padding: 16px;
-            border: 1px solid #E5E7EB;
-            border-radius: 8px;
-            background: #FAFAFA;
-        }
-        
-        .notification-item {
-            padding: 12px;
-            border-bottom: 1px solid #E5E7EB;
-            display: flex;
-            align-items: center;
-            justify-content: between;
-        }
-    </style>
     ''')
+    stylesheet('pages/shared/user_settings_profile_management')
     
     with ui.column().classes('relative flex h-auto min-h-screen w-full flex-col brand-light-mist pt-20'):
         # Header
@@ -0,0 +1,353 @@
+"""
+Backend traffic cassettes for Dompell Africa
+Records what the backend answers to ApiService and AsyncApiService, and
+serves it back later without a network, for offline, repeatable
+performance runs with real payload sizes.
+
+- API_CASSETTE_MODE=record passes requests through and appends one entry per
+  response to API_CASSETTE_PATH: gzip-compressed JSON lines, opened in append
+  mode so several runs add to one file.
+- API_CASSETTE_MODE=replay answers from the file. A request is matched on
+  method, path, query and request body (failing that, on method and path);
+  repeated requests get the recorded responses in order, then the last one
+  again. Each answer is delayed by its
+  recorded latency times API_CASSETTE_TIME_SCALE (0 for no delay). Requests
+  that were never recorded get a 404.
+- Credentials never reach the file: Authorization and cookie headers are
+  not stored, token/password/secret/code fields in bodies and query strings
+  are replaced by [REDACTED], as are JWTs anywhere else, and multipart
+  bodies (uploads) are stored as their size only.
+
+Both clients are hooked at the transport (a requests adapter and an httpx
+transport), so caching, retries and token refresh run as they do live.
+
+Summary of a cassette, per endpoint:
+    python -m app.services.api_cassette [.cache/api_cassette.jsonl.gz]
+"""
+
+import asyncio
+import atexit
+import base64
+import gzip
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+from urllib.parse import urlsplit, parse_qsl
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from app.config import API_BASE_URL, API_CASSETTE_MODE, API_CASSETTE_PATH, API_CASSETTE_TIME_SCALE
+from app.services.log import get_logger, redact
+
+log = get_logger('API_CASSETTE')
+
+REDACTED = '[REDACTED]'
+# Field and query parameter names whose values are never stored (containing
+# one of SECRET_WORDS, or one of SECRET_KEYS exactly)
+SECRET_WORDS = ('token', 'password', 'secret', 'authorization', 'cookie')
+SECRET_KEYS = ('code',)
+# Response headers replayed along with the body
+KEPT_HEADERS = ('content-type', 'etag', 'last-modified', 'cache-control')
+
+
+def _is_secret(key: Any) -> bool:
+    key = str(key).lower()
+    return key in SECRET_KEYS or any(word in key for word in SECRET_WORDS)
+
+
+def scrub(value: Any) -> Any:
+    """Copy of a decoded JSON value with credentials replaced."""
+    if isinstance(value, dict):
+        return {k: REDACTED if _is_secret(k) and isinstance(v, (str, int)) else scrub(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [scrub(item) for item in value]
+    if isinstance(value, str):
+        return redact(value)
+    return value
+
+
+def _request_body(content_type: str, body: Optional[bytes]) -> Any:
+    """Redacted request body as stored and matched on: JSON, form fields, or {'size': n}."""
+    if not body:
+        return None
+    if 'json' in content_type:
+        try:
+            value = json.loads(body)
+        except ValueError:
+            return {'size': len(body)}
+        # A bare JSON string is the refresh token
+        return REDACTED if isinstance(value, str) else scrub(value)
+    if 'x-www-form-urlencoded' in content_type:
+        return scrub(dict(parse_qsl(body.decode('utf-8', 'replace'))))
+    return {'size': len(body)}
+
+
+def _endpoint(url: str) -> str:
+    """'https://host/api/users/1?x=y' -> '/users/1' (independent of where the backend was)."""
+    path = urlsplit(url).path
+    prefix = urlsplit(API_BASE_URL).path.rstrip('/')
+    return path[len(prefix):] or '/' if prefix and path.startswith(prefix) else path
+
+
+def _query(url: str) -> List[List[str]]:
+    return [[k, REDACTED if _is_secret(k) else v] for k, v in sorted(parse_qsl(urlsplit(url).query))]
+
+
+def _match_key(method: str, path: str, query: List[List[str]], body: Any) -> tuple:
+    digest = hashlib.sha1(json.dumps(body, sort_keys=True).encode()).hexdigest() if body is not None else ''
+    return method, path, json.dumps(query), digest
+
+
+def _response_body(content_type: str, content: bytes) -> Dict[str, Any]:
+    if 'json' in content_type:
+        try:
+            return {'json': scrub(json.loads(content))} if content else {'text': ''}
+        except ValueError:
+            pass
+    try:
+        return {'text': redact(content.decode('utf-8'))}
+    except UnicodeDecodeError:
+        return {'base64': base64.b64encode(content).decode('ascii')}
+
+
+def _content(entry: Dict[str, Any]) -> bytes:
+    if 'json' in entry:
+        return json.dumps(entry['json']).encode('utf-8')
+    if 'base64' in entry:
+        return base64.b64decode(entry['base64'])
+    return entry.get('text', '').encode('utf-8')
+
+
+class Cassette:
+    """One cassette file, either being recorded or replayed."""
+
+    def __init__(self, path: str = API_CASSETTE_PATH, mode: str = API_CASSETTE_MODE,
+                 time_scale: float = API_CASSETTE_TIME_SCALE):
+        self.path = path
+        self.mode = mode
+        self.time_scale = time_scale
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._writer: Optional[gzip.GzipFile] = None
+        self._opened = 0.0
+        self._tapes: Optional[Dict[tuple, deque]] = None
+        self._fallback: Dict[tuple, deque] = {}
+
+    # ----- recording -----
+
+    def record(self, method: str, url: str, request_headers: Any, request_body: Optional[bytes],
+               status: int, headers: Any, content: bytes, elapsed: float):
+        content_type = str(headers.get('content-type', ''))
+        entry = {
+            'method': method.upper(),
+            'path': _endpoint(url),
+            'query': _query(url),
+            'body': _request_body(str(request_headers.get('content-type', '')), request_body),
+            'status': status,
+            'headers': {name: headers[name] for name in KEPT_HEADERS if name in headers},
+            'elapsed': round(elapsed, 4),
+            'response': _response_body(content_type, content),
+        }
+        with self._lock:
+            if self._writer is None:
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                # Each run appends its own gzip member; readers see one stream
+                self._writer = gzip.open(self.path, 'ab')
+                self._opened = time.monotonic() - elapsed
+                atexit.register(self.close)
+            # Start of the request, relative to the start of this run's recording
+            entry['t'] = round(max(0.0, time.monotonic() - elapsed - self._opened), 4)
+            self._writer.write((json.dumps(entry, separators=(',', ':')) + '\n').encode('utf-8'))
+            self._writer.flush()
+            self.recorded += 1
+
+    def close(self):
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    # ----- replay -----
+
+    def _load(self):
+        tapes: Dict[tuple, deque] = defaultdict(deque)
+        fallback: Dict[tuple, deque] = defaultdict(deque)
+        for entry in read_entries(self.path):
+            tapes[_match_key(entry['method'], entry['path'], entry['query'], entry['body'])].append(entry)
+            fallback[(entry['method'], entry['path'])].append(entry)
+        self._tapes, self._fallback = dict(tapes), dict(fallback)
+        log.info('Loaded %s recorded responses from %s', sum(len(t) for t in tapes.values()), self.path)
+
+    def play(self, method: str, url: str, content_type: str, body: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        """Next recorded entry for a request, or None."""
+        path = _endpoint(url)
+        key = _match_key(method.upper(), path, _query(url), _request_body(content_type, body))
+        with self._lock:
+            if self._tapes is None:
+                self._load()
+            # Same request recorded with another body (or query): closest we have
+            tape = self._tapes.get(key) or self._fallback.get((key[0], path))
+            if not tape:
+                self.misses += 1
+                log.warning('No recorded response for %s %s', method.upper(), path)
+                return None
+            self.replayed += 1
+            return tape.popleft() if len(tape) > 1 else tape[0]
+
+    def delay(self, entry: Optional[Dict[str, Any]]) -> float:
+        return entry['elapsed'] * self.time_scale if entry is not None else 0.0
+
+    @staticmethod
+    def answer(entry: Optional[Dict[str, Any]], method: str, url: str) -> tuple:
+        """(status, headers, content) of a recorded entry, or of the 404 for a miss."""
+        if entry is None:
+            content = json.dumps({'status': 404, 'message': f'No recorded response for {method} {_endpoint(url)}'})
+            return 404, {'content-type': 'application/json', 'x-cassette': 'miss'}, content.encode('utf-8')
+        return entry['status'], dict(entry['headers'], **{'x-cassette': 'replay'}), _content(entry['response'])
+
+
+def read_entries(path: str) -> List[Dict[str, Any]]:
+    """Entries of a cassette file; a tail cut off by a crash is skipped."""
+    entries = []
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as cassette:
+            for line in cassette:
+                if line.strip():
+                    entries.append(json.loads(line))
+    except FileNotFoundError:
+        log.warning('Cassette %s does not exist', path)
+    except (EOFError, gzip.BadGzipFile, ValueError) as e:
+        log.warning('Cassette %s is truncated after %s entries: %s', path, len(entries), e)
+    return entries
+
+
+# Global cassette instance
+api_cassette = Cassette()
+
+
+# ----- requests (ApiService) -----
+
+class RecordingAdapter(HTTPAdapter):
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        started = time.perf_counter()
+        response = super().send(request, **kwargs)
+        body = request.body.encode('utf-8') if isinstance(request.body, str) else request.body
+        api_cassette.record(request.method, request.url, request.headers, body if isinstance(body, bytes) else None,
+                            response.status_code, response.headers, response.content,
+                            time.perf_counter() - started)
+        return response
+
+
+class ReplayAdapter(HTTPAdapter):
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        body = request.body.encode('utf-8') if isinstance(request.body, str) else request.body
+        entry = api_cassette.play(request.method, request.url, request.headers.get('content-type', ''),
+                                  body if isinstance(body, bytes) else None)
+        time.sleep(api_cassette.delay(entry))
+        status, headers, content = api_cassette.answer(entry, request.method, request.url)
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = content
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def http_adapter(**kwargs) -> HTTPAdapter:
+    """requests adapter for API_CASSETTE_MODE (a plain HTTPAdapter when off)."""
+    adapter_class = {'record': RecordingAdapter, 'replay': ReplayAdapter}.get(api_cassette.mode, HTTPAdapter)
+    return adapter_class(**kwargs)
+
+
+# ----- httpx (AsyncApiService) -----
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        # Streamed bodies (uploads) are gone once sent; only their size is known
+        try:
+            body: Optional[bytes] = request.content
+        except httpx.RequestNotRead:
+            body = None
+        response = await self.transport.handle_async_request(request)
+        try:
+            raw = b''.join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        elapsed = time.perf_counter() - started
+        decoded = httpx.Response(response.status_code, headers=response.headers, content=raw)
+        api_cassette.record(request.method, str(request.url), request.headers, body,
+                            response.status_code, response.headers, decoded.content, elapsed)
+        return httpx.Response(response.status_code, headers=response.headers, content=raw,
+                              request=request, extensions=response.extensions)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        try:
+            body: Optional[bytes] = request.content
+        except httpx.RequestNotRead:
+            # Consume the stream as the server would, so size limits still apply while sending
+            async for _ in request.stream:
+                pass
+            body = None
+        entry = api_cassette.play(request.method, str(request.url), request.headers.get('content-type', ''), body)
+        await asyncio.sleep(api_cassette.delay(entry))
+        status, headers, content = api_cassette.answer(entry, request.method, str(request.url))
+        return httpx.Response(status, headers=headers, content=content, request=request)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+def async_transport(transport: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport:
+    """transport wrapped for API_CASSETTE_MODE (unchanged when off)."""
+    wrapper = {'record': RecordingTransport, 'replay': ReplayTransport}.get(api_cassette.mode)
+    return wrapper(transport) if wrapper else transport
+
+
+# ----- summary -----
+
+def summarize(entries: List[Dict[str, Any]]) -> str:
+    from app.services.api_metrics import endpoint_template
+
+    groups: Dict[tuple, List[Dict[str, Any]]] = defaultdict(list)
+    for entry in entries:
+        groups[(entry['method'], endpoint_template(entry['path']))].append(entry)
+    lines = [f"{'endpoint':<48} {'count':>6} {'avg ms':>8} {'avg KB':>8} {'max KB':>8}"]
+    for (method, path), group in sorted(groups.items(), key=lambda item: -len(item[1])):
+        sizes = [len(_content(entry['response'])) / 1024 for entry in group]
+        avg_ms = sum(entry['elapsed'] for entry in group) / len(group) * 1000
+        lines.append(f"{method + ' ' + path:<48} {len(group):>6} {avg_ms:>8.0f} "
+                     f"{sum(sizes) / len(sizes):>8.1f} {max(sizes):>8.1f}")
+    lines.append(f'{len(entries)} responses')
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    print(summarize(read_entries(args[0] if args else API_CASSETTE_PATH)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Backend API metrics for Dompell Africa
+Per-endpoint instrumentation of ApiService and AsyncApiService: latency and
+payload-size histograms, responses by status class, retries (transport and
+status retries, and retries after a token refresh) and connection-pool
+saturation, exposed in the Prometheus text format on /metrics.
+
+Endpoints are grouped by template, so '/users/42' and '/users/43' both count
+as '/users/{id}'. Recording one request costs a couple of microseconds (a
+cached template lookup, three bisects and a few integer increments), so it
+stays on in production.
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple, Callable
+
+# Upper bounds (le) of the histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+METRICS_PATH = '/metrics'
+
+STATUS_CLASSES = {n: f'{n}xx' for n in range(1, 6)}
+
+# Path segments that identify a record rather than a route
+_ID_SEGMENT = re.compile(
+    r'^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+    r'|[0-9a-fA-F]{16,}|(?=[a-z0-9]*\d)[a-z0-9]{20,}|[^/]*@[^/]*)$')
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(endpoint: str) -> str:
+    """'/trainee/skill/3f1c...' -> '/trainee/skill/{id}'."""
+    return '/'.join('{id}' if _ID_SEGMENT.match(segment) else segment for segment in endpoint.split('/'))
+
+
+def _histogram(bounds: tuple) -> List[float]:
+    # One counter per bucket plus +Inf, then the sum
+    return [0] * (len(bounds) + 1) + [0.0]
+
+
+def _body_size(message: Any, read: bool) -> int:
+    """Bytes of a request/response body without forcing a streamed body to be read."""
+    if read:
+        try:
+            return len(message.content)
+        except Exception:
+            pass
+    try:
+        length = message.headers.get('content-length')
+        return int(length) if length else 0
+    except (AttributeError, ValueError):
+        return 0
+
+
+class EndpointStats:
+    """Counters of one (client, method, endpoint template)."""
+
+    __slots__ = ('latency', 'bytes_in', 'bytes_out', 'statuses', 'retries', 'refresh_retries')
+
+    def __init__(self):
+        self.latency = _histogram(LATENCY_BUCKETS)
+        self.bytes_in = _histogram(SIZE_BUCKETS)
+        self.bytes_out = _histogram(SIZE_BUCKETS)
+        # '2xx' ... '5xx', or 'error' when no response came back
+        self.statuses: Dict[str, int] = {}
+        self.retries = 0
+        self.refresh_retries = 0
+
+
+class ApiMetrics:
+    """Registry of EndpointStats plus the pool usage counters to export."""
+
+    def __init__(self):
+        self._stats: Dict[Tuple[str, str, str], EndpointStats] = {}
+        self._lock = threading.Lock()
+        # client name -> PoolUsage (see app.services.api_service)
+        self.pools: Dict[str, Any] = {}
+        # Called with (client, method, endpoint, seconds) for every recorded request
+        self.observers: List[Callable[[str, str, str, float], None]] = []
+        # Return extra exposition lines for render() (e.g. circuit breaker states)
+        self.collectors: List[Callable[[], List[str]]] = []
+
+    def record(self, client: str, method: str, endpoint: str, response: Any, seconds: float,
+               retries: int = 0, refreshed: bool = False):
+        """Record one upstream request (response is None if it failed without one)."""
+        key = (client, method, endpoint_template(endpoint))
+        if response is None:
+            status, size_in, size_out = 'error', None, None
+        else:
+            status = STATUS_CLASSES.get(response.status_code // 100, 'other')
+            size_in = _body_size(response, read=True)
+            size_out = _body_size(getattr(response, 'request', None), read=False)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = EndpointStats()
+            latency = stats.latency
+            latency[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            latency[-1] += seconds
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            if size_in is not None:
+                stats.bytes_in[bisect_left(SIZE_BUCKETS, size_in)] += 1
+                stats.bytes_in[-1] += size_in
+                stats.bytes_out[bisect_left(SIZE_BUCKETS, size_out)] += 1
+                stats.bytes_out[-1] += size_out
+            stats.retries += retries
+            if refreshed:
+                stats.refresh_retries += 1
+        for observer in self.observers:
+            observer(client, method, endpoint, seconds)
+
+    def watch_pool(self, client: str, usage: Any):
+        self.pools[client] = usage
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def snapshot(self) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+        with self._lock:
+            return {key: {'latency': list(s.latency), 'bytes_in': list(s.bytes_in), 'bytes_out': list(s.bytes_out),
+                          'statuses': dict(s.statuses), 'retries': s.retries, 'refresh_retries': s.refresh_retries}
+                    for key, s in self._stats.items()}
+
+    # ----- Prometheus text format -----
+
+    def render(self) -> str:
+        lines: List[str] = []
+        snapshot = self.snapshot()
+
+        def labels(key, **extra) -> str:
+            client, method, endpoint = key
+            pairs = {'client': client, 'method': method, 'endpoint': endpoint, **extra}
+            return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs.items()) + '}'
+
+        def histogram(name: str, help_text: str, field: str, bounds: tuple):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} histogram')
+            for key, stats in snapshot.items():
+                counts = stats[field]
+                total = sum(counts[:-1])
+                if not total:
+                    continue
+                cumulative = 0
+                for bound, count in zip(bounds, counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{labels(key, le=_number(bound))} {cumulative}')
+                lines.append(f'{name}_bucket{labels(key, le="+Inf")} {total}')
+                lines.append(f'{name}_sum{labels(key)} {_number(counts[-1])}')
+                lines.append(f'{name}_count{labels(key)} {total}')
+
+        def counter(name: str, help_text: str, values):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} counter')
+            lines.extend(f'{name}{label} {value}' for label, value in values)
+
+        histogram('dompell_api_request_duration_seconds', 'Backend request latency, including retries.',
+                  'latency', LATENCY_BUCKETS)
+        histogram('dompell_api_response_bytes', 'Backend response body size.', 'bytes_in', SIZE_BUCKETS)
+        histogram('dompell_api_request_bytes', 'Backend request body size.', 'bytes_out', SIZE_BUCKETS)
+        counter('dompell_api_responses_total', 'Backend requests by status class (error: no response).',
+                [(labels(key, status=status), count)
+                 for key, stats in snapshot.items() for status, count in sorted(stats['statuses'].items())])
+        counter('dompell_api_retries_total', 'Connection and status retries of backend requests.',
+                [(labels(key), stats['retries']) for key, stats in snapshot.items()])
+        counter('dompell_api_token_refresh_retries_total', 'Requests repeated after refreshing the access token.',
+                [(labels(key), stats['refresh_retries']) for key, stats in snapshot.items()])
+
+        pools = {client: usage.snapshot() for client, usage in self.pools.items()}
+        gauges = (
+            ('dompell_api_pool_capacity', 'gauge', 'Pooled connections available.', 'capacity'),
+            ('dompell_api_pool_in_flight', 'gauge', 'Backend requests in flight.', 'in_flight'),
+            ('dompell_api_pool_peak_in_flight', 'gauge', 'Most backend requests in flight at once.', 'peak_in_flight'),
+            ('dompell_api_pool_requests_total', 'counter', 'Requests sent through the pool.', 'total_requests'),
+            ('dompell_api_pool_waits_total', 'counter',
+             'Requests sent while every pooled connection was busy (they waited or opened an extra socket).',
+             'saturated_requests'),
+        )
+        for name, kind, help_text, field in gauges:
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            lines.extend(f'{name}{{client="{client}"}} {snapshot_[field]}' for client, snapshot_ in pools.items())
+        for collect in self.collectors:
+            lines.extend(collect())
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def register_metrics_route(path: str = METRICS_PATH):
+    """Serve api_metrics (Prometheus text format) on the NiceGUI app."""
+    from fastapi.responses import PlainTextResponse
+    from nicegui import app
+
+    @app.get(path, include_in_schema=False)
+    def metrics():
+        return PlainTextResponse(api_metrics.render(), media_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+# Global API metrics instance
+api_metrics = ApiMetrics()
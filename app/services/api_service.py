@@ -4,45 +4,202 @@ This module handles all interactions with the Dompell backend API.
 Updated based on API documentation: https://dompell-server.onrender.com/api-docs
 """
 
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional, List
-from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, List, Callable
 from urllib3.util.retry import Retry
-from app.config import API_BASE_URL
+from app.config import API_BASE_URL, API_SYNC_POOL_MAXSIZE
+from app.services.api_cassette import http_adapter
+from app.services.api_metrics import api_metrics
+from app.services.circuit_breaker import circuit_breakers, is_failure
+from app.services.response_cache import response_cache, note_stale
+from app.services.single_flight import single_flight, request_key, successful
+from app.services.log import get_logger
+
+log = get_logger('API_SERVICE')
+
+# Connection pool shared by every ApiService instance
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = API_SYNC_POOL_MAXSIZE
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+class PoolUsage:
+    """Thread-safe in-flight request counter used to report pool saturation."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.total_requests = 0
+        self.saturated_requests = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with self._lock:
+            self.in_flight += 1
+            self.total_requests += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            if self.in_flight > self.capacity:
+                # More requests than pooled connections: this one waits or opens an extra socket
+                self.saturated_requests += 1
+        return self
+
+    def __exit__(self, *exc):
+        with self._lock:
+            self.in_flight -= 1
+        return False
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'capacity': self.capacity,
+                'in_flight': self.in_flight,
+                'peak_in_flight': self.peak_in_flight,
+                'total_requests': self.total_requests,
+                'saturated_requests': self.saturated_requests,
+                'saturation': self.in_flight / self.capacity if self.capacity else 0.0,
+            }
+
+
+sync_pool_usage = PoolUsage(POOL_MAXSIZE)
+api_metrics.watch_pool('sync', sync_pool_usage)
+
+
+def _configure_session(session: requests.Session):
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["GET", "POST", "PATCH", "DELETE"]),
+        raise_on_status=False,
+    )
+    adapter = http_adapter(max_retries=retry, pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # Prefer keep-alive; we will force close on retry if needed
+    session.headers.update({'Connection': 'keep-alive'})
+
+
+def get_shared_session() -> requests.Session:
+    """Return the process-wide requests.Session, creating it on first use."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = requests.Session()
+            _configure_session(_shared_session)
+        return _shared_session
+
 
 class ApiService:
-    """A service class for handling API requests to the Dompell API."""
+    """A service class for handling API requests to the Dompell API.
+
+    Instances are lightweight credential holders: the Authorization header is
+    added per request, so any number of them can share one connection pool.
+    """
     
-    def __init__(self):
+    def __init__(self, token: Optional[str] = None, refresh_token: Optional[str] = None,
+                 session: Optional[requests.Session] = None):
         self.base_url = API_BASE_URL
-        self.session = requests.Session()
-        self.token = None  # Initialize token attribute
-        self.refresh_token = None
-        self._configure_session()
-
-    def _configure_session(self):
-        retry = Retry(
-            total=3,
-            connect=3,
-            read=3,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=frozenset(["GET", "POST", "PATCH", "DELETE"]),
-            raise_on_status=False,
-        )
-        adapter = HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=10)
-        self.session.mount('https://', adapter)
-        self.session.mount('http://', adapter)
-        # Prefer keep-alive; we will force close on retry if needed
-        self.session.headers.update({'Connection': 'keep-alive'})
+        self.session = session or get_shared_session()
+        self.token = token
+        self.refresh_token = refresh_token
+        # Called with the new access token after an automatic refresh
+        self.on_token_refresh: Optional[Callable[[str], None]] = None
+        # Renews the token ahead of expiry (a TokenManager, set per session by the client registry)
+        self.token_manager: Optional[Any] = None
+
+    def _auth_headers(self, headers: Optional[Dict]) -> Dict[str, str]:
+        hdrs = {}
+        if self.token:
+            hdrs['Authorization'] = f'Bearer {self.token}'
+        if headers:
+            hdrs.update(headers)
+        return hdrs
 
     def _make_request(self, method: str, endpoint: str, data: Optional[Any] = None, 
                      params: Optional[Dict] = None, headers: Optional[Dict] = None,
-                     files: Optional[Dict] = None, timeout: float = 30.0) -> requests.Response:
-        """Make a generic API request with error handling."""
+                     files: Optional[Dict] = None, timeout: float = 30.0,
+                     cache: bool = True) -> requests.Response:
+        """Make an API request, serving GETs through the response cache."""
+        if self.token_manager is not None and not endpoint.startswith('/auth/'):
+            self.token_manager.ensure_fresh_sync()
+        if method.upper() == 'GET' and cache:
+            entry = response_cache.lookup(endpoint, params, self.token)
+            if entry is not None and entry.is_fresh():
+                return entry.response
+            hdrs = response_cache.conditional_headers(entry, headers)
+
+            def _fetch():
+                # While the backend fails, the last good copy (if any) is served stale
+                try:
+                    resp = self._send_request(method, endpoint, params=params, headers=hdrs, timeout=timeout)
+                except requests.RequestException:
+                    stale = response_cache.stale_fallback(endpoint, entry)
+                    if stale is None:
+                        raise
+                    return stale
+                if is_failure(resp):
+                    stale = response_cache.stale_fallback(endpoint, entry)
+                    if stale is not None:
+                        return stale
+                return response_cache.store(endpoint, params, self.token, resp, entry)
+
+            # Identical concurrent GETs share one upstream request
+            scope = response_cache.scope_for(endpoint, self.token)
+            key = request_key('sync', endpoint, params, scope)
+            # Across users only successes are shared; a waiter retries with its own token
+            share = successful if scope == 'shared' else None
+            return note_stale(endpoint, single_flight.do(key, _fetch, share))
+        resp = self._send_request(method, endpoint, data=data, params=params, headers=headers,
+                                  files=files, timeout=timeout)
+        if method.upper() != 'GET' and resp is not None and 200 <= resp.status_code < 300:
+            response_cache.invalidate_for(endpoint)
+        return resp
+
+    def _send_request(self, method: str, endpoint: str, data: Optional[Any] = None,
+                      params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                      files: Optional[Dict] = None, timeout: float = 30.0) -> requests.Response:
+        """Make a generic API request, recording it in api_metrics (503 at once while its circuit is open)."""
+        breaker = circuit_breakers.for_endpoint(endpoint)
+        if not breaker.allow():
+            return breaker.rejection(f"{self.base_url}{endpoint}")
+        attempts = {'retries': 0, 'refreshed': False}
+        resp = None
+        started = time.perf_counter()
+        try:
+            resp = self._send_with_recovery(method, endpoint, attempts, data=data, params=params,
+                                            headers=headers, files=files, timeout=timeout)
+            return resp
+        finally:
+            elapsed = time.perf_counter() - started
+            api_metrics.record('sync', method.upper(), endpoint, resp, elapsed,
+                               attempts['retries'], attempts['refreshed'])
+            breaker.record(resp, elapsed)
+
+    def _send_with_recovery(self, method: str, endpoint: str, attempts: Dict[str, Any],
+                            data: Optional[Any] = None, params: Optional[Dict] = None,
+                            headers: Optional[Dict] = None, files: Optional[Dict] = None,
+                            timeout: float = 30.0) -> requests.Response:
+        """Make a generic API request with error handling, counting retries in attempts."""
         url = f"{self.base_url}{endpoint}"
         
         def _do_request(hdrs: Optional[Dict]):
+            hdrs = self._auth_headers(hdrs)
+            with sync_pool_usage:
+                resp = _send(hdrs)
+            # Retries done inside urllib3 (connect errors and retryable statuses)
+            history = getattr(getattr(resp.raw, 'retries', None), 'history', None)
+            if history:
+                attempts['retries'] += len(history)
+            return resp
+
+        def _send(hdrs: Dict):
             if method.upper() == 'GET':
                 return self.session.get(url, params=params, headers=hdrs, timeout=timeout)
             elif method.upper() == 'POST':
@@ -58,50 +215,63 @@ class ApiService:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
         try:
+            sent_token = self.token
             resp = _do_request(headers)
             # Auto-refresh if unauthorized/forbidden and we have a refresh token
             if resp is not None and resp.status_code in (401, 403) and self.refresh_token and endpoint != '/auth/refresh-token':
                 try:
-                    rt_resp = self.refresh_access_token(self.refresh_token)
-                    if rt_resp.ok:
-                        try:
-                            payload = rt_resp.json() if rt_resp.content else {}
-                        except Exception:
-                            payload = {}
-                        # Handle possible shapes
-                        new_access = (
-                            (payload.get('data') or {}).get('accessToken')
-                            or payload.get('accessToken')
-                            or ((payload.get('token') or {}).get('accessToken'))
-                        )
-                        if new_access:
-                            self.set_auth_token(new_access)
-                            # Retry original request once, without overriding Authorization header
-                            retry_headers = dict(headers or {})
-                            retry_headers.pop('Authorization', None)
-                            return _do_request(retry_headers)
+                    if self.token_manager is not None:
+                        # Joins a renewal already under way; the session gets the new token
+                        new_access = self.token_manager.renew_sync(sent_token)
+                    else:
+                        new_access = self._refresh_now()
+                    if new_access:
+                        # Retry original request once, without overriding Authorization header
+                        retry_headers = dict(headers or {})
+                        retry_headers.pop('Authorization', None)
+                        attempts['refreshed'] = True
+                        return _do_request(retry_headers)
                 except Exception as _:
                     pass
             return resp
         except requests.RequestException as e:
-            # Fallback: reinitialize session and retry once with Connection: close
-            print(f"[API_SERVICE] Request error: {e}. Retrying once with a fresh session and Connection: close")
+            # Fallback: drop pooled connections and retry once with Connection: close.
+            # The session itself is shared, so it is reset in place rather than replaced.
+            log.warning('Request error: %s. Retrying once with fresh connections and Connection: close', e)
             try:
                 self.session.close()
             except Exception:
                 pass
-            self.session = requests.Session()
-            self._configure_session()
-            if self.token:
-                self.session.headers.update({'Authorization': f'Bearer {self.token}'})
             retry_headers = dict(headers or {})
             retry_headers['Connection'] = 'close'
+            attempts['retries'] += 1
             try:
                 return _do_request(retry_headers)
             except requests.RequestException as e2:
-                print(f"[API_SERVICE] Retry failed: {e2}")
+                log.error('Retry failed: %s', e2)
                 raise
 
+    def _refresh_now(self) -> Optional[str]:
+        """Exchange the refresh token for a new access token and adopt it."""
+        rt_resp = self.refresh_access_token(self.refresh_token)
+        if not rt_resp.ok:
+            return None
+        try:
+            payload = rt_resp.json() if rt_resp.content else {}
+        except Exception:
+            payload = {}
+        # Handle possible shapes
+        new_access = (
+            (payload.get('data') or {}).get('accessToken')
+            or payload.get('accessToken')
+            or ((payload.get('token') or {}).get('accessToken'))
+        )
+        if new_access:
+            self.set_auth_token(new_access)
+            if self.on_token_refresh:
+                self.on_token_refresh(new_access)
+        return new_access
+
     # ===== AUTHENTICATION ENDPOINTS =====
     
     def register(self, user_data: Dict[str, Any]) -> requests.Response:
@@ -564,18 +734,15 @@ class ApiService:
         Args:
             token: The JWT token
         """
-        self.token = token  # Store token
-        self.session.headers.update({'Authorization': f'Bearer {token}'})
-        print(f"[API_SERVICE] Token set: {token[:20]}...")
+        self.token = token  # Sent per request; shared session headers stay credential-free
+        log.debug('Token set')
 
     def set_refresh_token(self, refresh_token: str):
         self.refresh_token = refresh_token
 
     def clear_auth_token(self):
-        """Remove the authorization token from session headers."""
+        """Remove the authorization token."""
         self.token = None
-        if 'Authorization' in self.session.headers:
-            del self.session.headers['Authorization']
 
     def get_api_status(self) -> requests.Response:
         """
@@ -586,5 +753,33 @@ class ApiService:
         """
         return self._make_request('GET', '')
 
-# Create a singleton instance of the API service
-api_service = ApiService()
\ No newline at end of file
+class SessionBoundApiService:
+    """
+    Module-level stand-in for a per-session service instance.
+
+    Attribute access is forwarded to the current browser session's context from
+    the client registry, so tokens set by one user never leak into another
+    user's requests. Outside of a session (startup, background tasks) the
+    anonymous fallback instance is used.
+    """
+
+    def __init__(self, fallback: Any, kind: str):
+        object.__setattr__(self, '_fallback', fallback)
+        object.__setattr__(self, '_kind', kind)
+
+    def _resolve(self):
+        from app.services.client_registry import client_registry
+        context = client_registry.current()
+        if context is None:
+            return self._fallback
+        return context.api if self._kind == 'sync' else context.aio
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._resolve(), name, value)
+
+
+# Session-bound entry point to the API service (see app.services.client_registry)
+api_service = SessionBoundApiService(ApiService(), 'sync')
\ No newline at end of file
@@ -0,0 +1,485 @@
+"""
+Async API Service for Dompell Africa
+Non-blocking twin of ApiService built on a pooled httpx.AsyncClient so that
+page handlers can await backend calls without stalling the NiceGUI event loop.
+"""
+
+import asyncio
+import time
+import httpx
+from typing import Dict, Any, Optional, Callable, AsyncIterator
+from app.config import API_BASE_URL, API_POOL_MAX_CONNECTIONS, API_POOL_MAX_KEEPALIVE
+from app.services.api_service import PoolUsage, SessionBoundApiService
+from app.services.api_cassette import async_transport
+from app.services.api_metrics import api_metrics
+from app.services.circuit_breaker import circuit_breakers, is_failure
+from app.services.response_cache import response_cache, note_stale
+from app.services.single_flight import single_flight, request_key, successful
+from app.services.log import get_logger
+
+log = get_logger('ASYNC_API_SERVICE')
+
+# Connection pool shared by every AsyncApiService instance
+POOL_MAX_CONNECTIONS = API_POOL_MAX_CONNECTIONS
+POOL_MAX_KEEPALIVE = API_POOL_MAX_KEEPALIVE
+KEEPALIVE_EXPIRY = 30.0
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0, pool=5.0)
+
+# Mirrors the urllib3 Retry policy used by the synchronous ApiService
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_FORCELIST = frozenset([429, 500, 502, 503, 504])
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+async_pool_usage = PoolUsage(POOL_MAX_CONNECTIONS)
+api_metrics.watch_pool('async', async_pool_usage)
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the process-wide AsyncClient, creating it on first use."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        # Pool limits live on the transport; connect errors are retried there too
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=RETRY_TOTAL,
+            limits=httpx.Limits(
+                max_connections=POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=POOL_MAX_KEEPALIVE,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
+        _shared_client = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, transport=async_transport(transport))
+    return _shared_client
+
+
+async def close_shared_client():
+    """Close the shared AsyncClient (register with app.on_shutdown)."""
+    global _shared_client
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
+
+
+def extract_access_token(payload: Dict[str, Any]) -> Optional[str]:
+    """Pull the access token out of any of the refresh-token response shapes."""
+    return (
+        (payload.get('data') or {}).get('accessToken')
+        or payload.get('accessToken')
+        or ((payload.get('token') or {}).get('accessToken'))
+    )
+
+
+class AsyncApiService:
+    """An awaitable service class for handling API requests to the Dompell API."""
+
+    def __init__(self, token: Optional[str] = None, refresh_token: Optional[str] = None):
+        self.base_url = API_BASE_URL
+        self.token = token
+        self.refresh_token = refresh_token
+        # Called with the new access token after an automatic refresh
+        self.on_token_refresh: Optional[Callable[[str], None]] = None
+        # Renews the token ahead of expiry (a TokenManager, set per session by the client registry)
+        self.token_manager: Optional[Any] = None
+
+    def _auth_headers(self, headers: Optional[Dict]) -> Dict[str, str]:
+        hdrs = {}
+        if self.token:
+            hdrs['Authorization'] = f'Bearer {self.token}'
+        if headers:
+            hdrs.update(headers)
+        return hdrs
+
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Any] = None,
+                            params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                            files: Optional[Dict] = None, timeout: Optional[float] = None,
+                            cache: bool = True) -> httpx.Response:
+        """Make an API request, serving GETs through the response cache."""
+        if self.token_manager is not None and not endpoint.startswith('/auth/'):
+            await self.token_manager.ensure_fresh()
+        if method.upper() == 'GET' and cache:
+            entry = response_cache.lookup(endpoint, params, self.token, flavor='async')
+            if entry is not None and entry.is_fresh():
+                return entry.response
+            hdrs = response_cache.conditional_headers(entry, headers)
+
+            async def _fetch():
+                # While the backend fails, the last good copy (if any) is served stale
+                try:
+                    resp = await self._send_request(method, endpoint, params=params, headers=hdrs, timeout=timeout)
+                except httpx.TransportError:
+                    stale = response_cache.stale_fallback(endpoint, entry)
+                    if stale is None:
+                        raise
+                    return stale
+                if is_failure(resp):
+                    stale = response_cache.stale_fallback(endpoint, entry)
+                    if stale is not None:
+                        return stale
+                return response_cache.store(endpoint, params, self.token, resp, entry, flavor='async')
+
+            # Identical concurrent GETs share one upstream request
+            scope = response_cache.scope_for(endpoint, self.token)
+            key = request_key('async', endpoint, params, scope)
+            # Across users only successes are shared; a waiter retries with its own token
+            share = successful if scope == 'shared' else None
+            return note_stale(endpoint, await single_flight.do_async(key, _fetch, share))
+        resp = await self._send_request(method, endpoint, data=data, params=params, headers=headers,
+                                        files=files, timeout=timeout)
+        if method.upper() != 'GET' and 200 <= resp.status_code < 300:
+            response_cache.invalidate_for(endpoint)
+        return resp
+
+    async def _send_request(self, method: str, endpoint: str, data: Optional[Any] = None,
+                            params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                            files: Optional[Dict] = None,
+                            timeout: Optional[float] = None) -> httpx.Response:
+        """Make a generic API request, recording it in api_metrics (503 at once while its circuit is open)."""
+        breaker = circuit_breakers.for_endpoint(endpoint)
+        if not breaker.allow():
+            return breaker.rejection_async(method.upper(), f"{self.base_url}{endpoint}")
+        attempts = {'retries': 0, 'refreshed': False}
+        resp = None
+        started = time.perf_counter()
+        try:
+            resp = await self._send_with_recovery(method, endpoint, attempts, data=data, params=params,
+                                                  headers=headers, files=files, timeout=timeout)
+            return resp
+        finally:
+            elapsed = time.perf_counter() - started
+            api_metrics.record('async', method.upper(), endpoint, resp, elapsed,
+                               attempts['retries'], attempts['refreshed'])
+            breaker.record(resp, elapsed)
+
+    async def _send_with_recovery(self, method: str, endpoint: str, attempts: Dict[str, Any],
+                                  data: Optional[Any] = None, params: Optional[Dict] = None,
+                                  headers: Optional[Dict] = None, files: Optional[Dict] = None,
+                                  timeout: Optional[float] = None) -> httpx.Response:
+        """Make a generic API request with retries and token refresh, counting them in attempts."""
+        method = method.upper()
+        if method not in ('GET', 'POST', 'PATCH', 'DELETE'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        url = f"{self.base_url}{endpoint}"
+        client = get_shared_client()
+        call_timeout = DEFAULT_TIMEOUT if timeout is None else httpx.Timeout(timeout, connect=min(timeout, 10.0))
+
+        async def _do_request(hdrs: Dict[str, str]) -> httpx.Response:
+            kwargs: Dict[str, Any] = {'params': params, 'headers': hdrs, 'timeout': call_timeout}
+            if method in ('POST', 'PATCH'):
+                if files:
+                    kwargs['data'] = data
+                    kwargs['files'] = files
+                else:
+                    kwargs['json'] = data
+            resp = None
+            for attempt in range(RETRY_TOTAL + 1):
+                with async_pool_usage:
+                    resp = await client.request(method, url, **kwargs)
+                if resp.status_code not in RETRY_STATUS_FORCELIST or attempt == RETRY_TOTAL:
+                    break
+                await resp.aclose()
+                attempts['retries'] += 1
+                await asyncio.sleep(RETRY_BACKOFF_FACTOR * (2 ** attempt))
+            return resp
+
+        try:
+            sent_token = self.token
+            resp = await _do_request(self._auth_headers(headers))
+            # Auto-refresh if unauthorized/forbidden and we have a refresh token
+            if resp.status_code in (401, 403) and self.refresh_token and endpoint != '/auth/refresh-token':
+                try:
+                    if self.token_manager is not None:
+                        # Joins a renewal already under way; the session gets the new token
+                        new_access = await self.token_manager.renew(sent_token)
+                    else:
+                        new_access = await self._refresh_now()
+                    if new_access:
+                        # Retry original request once, without overriding Authorization header
+                        retry_headers = dict(headers or {})
+                        retry_headers.pop('Authorization', None)
+                        attempts['refreshed'] = True
+                        return await _do_request(self._auth_headers(retry_headers))
+                except Exception as _:
+                    pass
+            return resp
+        except httpx.TransportError as e:
+            log.warning('Request error: %s', e)
+            raise
+
+    async def _refresh_now(self) -> Optional[str]:
+        """Exchange the refresh token for a new access token and adopt it."""
+        rt_resp = await self.refresh_access_token(self.refresh_token)
+        if not rt_resp.is_success:
+            return None
+        try:
+            payload = rt_resp.json() if rt_resp.content else {}
+        except Exception:
+            payload = {}
+        new_access = extract_access_token(payload)
+        if new_access:
+            self.set_auth_token(new_access)
+            if self.on_token_refresh:
+                self.on_token_refresh(new_access)
+        return new_access
+
+    # ===== AUTHENTICATION ENDPOINTS =====
+
+    async def register(self, user_data: Dict[str, Any]) -> httpx.Response:
+        """Register a new user."""
+        return await self._make_request('POST', '/auth/register', data=user_data)
+
+    async def verify_account(self, token: str, code: str) -> httpx.Response:
+        """Verify a user account (token as query param, code in JSON body)."""
+        return await self._make_request('POST', '/auth/verify-account', data={'code': code},
+                                        params={'token': token})
+
+    async def login(self, email: str, password: str) -> httpx.Response:
+        """Authenticate a user and return login response."""
+        payload = {
+            "email": email,
+            "password": password,
+        }
+        return await self._make_request('POST', '/auth/login', data=payload)
+
+    async def forgot_password(self, email: str) -> httpx.Response:
+        """Send password reset code to user email."""
+        return await self._make_request('POST', '/auth/forgot-password', data={"email": email})
+
+    async def reset_password(self, reset_data: Dict[str, Any]) -> httpx.Response:
+        """Reset user password using verification code."""
+        return await self._make_request('POST', '/auth/reset-password', data=reset_data)
+
+    async def resend_code(self, email: str) -> httpx.Response:
+        """Resend verification code to user."""
+        return await self._make_request('POST', '/auth/resend-code', data={"email": email})
+
+    async def resend_email(self, email: str) -> httpx.Response:
+        """Resend verification email to user."""
+        return await self._make_request('POST', '/auth/resend-email', data={"email": email})
+
+    async def refresh_access_token(self, refresh_token: str) -> httpx.Response:
+        """Generate a new access token using refresh token."""
+        return await self._make_request('POST', '/auth/refresh-token', data=refresh_token)
+
+    # ===== USER ENDPOINTS =====
+
+    async def get_all_users(self, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', '/users/all', headers=headers)
+
+    async def get_user_profile(self, user_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', f'/users/{user_id}', headers=headers)
+
+    async def update_user(self, user_id: str, user_data: Dict[str, Any],
+                          headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('PATCH', f'/users/{user_id}', data=user_data, headers=headers)
+
+    async def delete_user(self, user_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('DELETE', f'/users/{user_id}', headers=headers)
+
+    # ===== FILE UPLOAD ENDPOINTS =====
+
+    async def upload_file(self, file_data: Dict, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('POST', '/upload', files=file_data, headers=headers)
+
+    async def upload_file_stream(self, body: AsyncIterator[bytes], content_type: str,
+                                 headers: Optional[Dict] = None,
+                                 timeout: Optional[float] = None) -> httpx.Response:
+        """
+        Stream a pre-encoded multipart body to /upload without buffering it.
+
+        A streamed body cannot be replayed, so unlike _make_request there are
+        no status retries and no refresh-and-retry on 401; an expiring token
+        is renewed before the body is sent instead.
+        """
+        breaker = circuit_breakers.for_endpoint('/upload')
+        if not breaker.allow():
+            return breaker.rejection_async('POST', f"{self.base_url}/upload")
+        if self.token_manager is not None:
+            await self.token_manager.ensure_fresh()
+        hdrs = self._auth_headers(headers)
+        hdrs['Content-Type'] = content_type
+        call_timeout = DEFAULT_TIMEOUT if timeout is None else httpx.Timeout(timeout, connect=min(timeout, 10.0))
+        resp = None
+        started = time.perf_counter()
+        try:
+            with async_pool_usage:
+                resp = await get_shared_client().post(f"{self.base_url}/upload", content=body,
+                                                      headers=hdrs, timeout=call_timeout)
+            return resp
+        finally:
+            elapsed = time.perf_counter() - started
+            api_metrics.record('async', 'POST', '/upload', resp, elapsed)
+            # Upload time grows with the file, so only failures count
+            breaker.record(resp)
+
+    # ===== TRAINEE PROFILE ENDPOINTS =====
+
+    async def create_trainee_profile(self, user_id: str, form: Dict[str, Any], files: Optional[Dict] = None,
+                                     headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('POST', f"/trainee/create/{user_id}", data=form, files=files, headers=headers)
+
+    async def list_trainees(self, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', '/trainee', headers=headers)
+
+    async def get_trainee_by_user(self, user_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', f"/trainee/{user_id}", headers=headers)
+
+    async def delete_trainee(self, trainee_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('DELETE', f"/trainee/{trainee_id}", headers=headers)
+
+    # ===== TRAINEE SKILLS ENDPOINTS =====
+
+    async def add_skill(self, trainee_profile_id: str, name: str, headers: Optional[Dict] = None) -> httpx.Response:
+        payload = {"name": name}
+        return await self._make_request('POST', f"/trainee/skill/{trainee_profile_id}", data=payload, headers=headers)
+
+    async def update_skill(self, skill_id: str, update_data: Dict[str, Any], headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('PATCH', f"/trainee/skill/{skill_id}", data=update_data, headers=headers)
+
+    async def delete_skill(self, skill_id: str, trainee_profile_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('DELETE', f"/trainee/skill/{skill_id}/{trainee_profile_id}", headers=headers)
+
+    # ===== TRAINEE EDUCATION ENDPOINTS =====
+
+    async def list_education(self, trainee_profile_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', f"/trainee/education/{trainee_profile_id}", headers=headers)
+
+    async def create_education(self, trainee_profile_id: str, dto: Dict[str, Any], headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('POST', f"/trainee/education/create/{trainee_profile_id}", data=dto, headers=headers)
+
+    async def get_education(self, education_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', f"/trainee/education/{education_id}", headers=headers)
+
+    async def update_education(self, education_id: str, dto: Dict[str, Any], headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('PATCH', f"/trainee/education/{education_id}", data=dto, headers=headers)
+
+    async def delete_education(self, education_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('DELETE', f"/trainee/education/{education_id}", headers=headers)
+
+    # ===== TRAINEE EXPERIENCE ENDPOINTS =====
+
+    async def list_experience(self, trainee_profile_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', f"/trainee/experience/{trainee_profile_id}", headers=headers)
+
+    async def create_experience(self, trainee_profile_id: str, dto: Dict[str, Any], headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('POST', f"/trainee/experience/create/{trainee_profile_id}", data=dto, headers=headers)
+
+    async def get_experience(self, experience_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', f"/trainee/experience/{experience_id}", headers=headers)
+
+    async def update_experience(self, experience_id: str, dto: Dict[str, Any], headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('PATCH', f"/trainee/experience/{experience_id}", data=dto, headers=headers)
+
+    async def delete_experience(self, experience_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('DELETE', f"/trainee/experience/{experience_id}", headers=headers)
+
+    # ===== TRAINEE CERTIFICATION ENDPOINTS =====
+
+    async def list_certifications(self, trainee_profile_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', f"/trainee/certification/{trainee_profile_id}", headers=headers)
+
+    async def create_certification(self, trainee_profile_id: str, dto: Dict[str, Any], headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('POST', f"/trainee/certification/create/{trainee_profile_id}", data=dto, headers=headers)
+
+    async def get_certification(self, certification_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', f"/trainee/certification/{certification_id}", headers=headers)
+
+    async def update_certification(self, certification_id: str, dto: Dict[str, Any], headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('PATCH', f"/trainee/certification/{certification_id}", data=dto, headers=headers)
+
+    async def delete_certification(self, certification_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('DELETE', f"/trainee/certification/{certification_id}", headers=headers)
+
+    # ===== TRAINEE PORTFOLIO ENDPOINTS =====
+
+    async def list_portfolio(self, trainee_profile_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', f"/trainee/portfolio/{trainee_profile_id}", headers=headers)
+
+    async def create_portfolio(self, trainee_profile_id: str, dto: Dict[str, Any], headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('POST', f"/trainee/portfolio/create/{trainee_profile_id}", data=dto, headers=headers)
+
+    async def get_portfolio_item(self, portfolio_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', f"/trainee/portfolio/{portfolio_id}", headers=headers)
+
+    async def update_portfolio_item(self, portfolio_id: str, dto: Dict[str, Any], headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('PATCH', f"/trainee/portfolio/{portfolio_id}", data=dto, headers=headers)
+
+    async def delete_portfolio_item(self, portfolio_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('DELETE', f"/trainee/portfolio/{portfolio_id}", headers=headers)
+
+    # ===== ORGANIZATION ENDPOINTS =====
+
+    async def create_organization(self, user_id: str, org_data: Dict[str, Any],
+                                  headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('POST', f'/organization/create/{user_id}', data=org_data, headers=headers)
+
+    async def create_organization_multipart(self, user_id: str, form: Dict[str, Any], files: Optional[Dict] = None,
+                                            headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('POST', f'/organization/create/{user_id}', data=form, files=files, headers=headers)
+
+    async def get_all_organizations(self, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', '/organization', headers=headers)
+
+    async def get_organization(self, org_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', f'/organization/{org_id}', headers=headers)
+
+    async def delete_organization(self, org_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('DELETE', f'/organization/{org_id}', headers=headers)
+
+    async def get_organization_programs(self, org_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', f'/organization/programs/{org_id}', headers=headers)
+
+    # ===== TRAINING PROGRAMS ENDPOINTS =====
+
+    async def create_training_program(self, user_id: str, program_data: Dict[str, Any],
+                                      headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('POST', f'/programs/create/{user_id}', data=program_data, headers=headers)
+
+    async def get_new_programs(self, user_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', f'/programs/new/{user_id}', headers=headers)
+
+    async def get_upcoming_programs(self, user_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        """Get upcoming programs, falling back to the spec variant without a slash."""
+        resp = await self._make_request('GET', f'/programs/upcoming/{user_id}', headers=headers)
+        if 200 <= resp.status_code < 400:
+            return resp
+        return await self._make_request('GET', f'/programs/upcoming{user_id}', headers=headers)
+
+    # ===== EMPLOYER ENDPOINTS =====
+
+    async def create_employer_profile(self, user_id: str, form: Dict[str, Any], files: Optional[Dict] = None,
+                                      headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('POST', f"/employer/create/{user_id}", data=form, files=files, headers=headers)
+
+    async def get_employer(self, employer_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', f"/employer/{employer_id}", headers=headers)
+
+    async def get_employer_by_user(self, user_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', f"/employer/{user_id}", headers=headers)
+
+    async def list_employers(self, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('GET', '/employer', headers=headers)
+
+    async def delete_employer(self, employer_id: str, headers: Optional[Dict] = None) -> httpx.Response:
+        return await self._make_request('DELETE', f"/employer/{employer_id}", headers=headers)
+
+    # ===== UTILITY METHODS =====
+
+    def set_auth_token(self, token: str):
+        """Set the authorization token for all subsequent requests from this instance."""
+        self.token = token
+
+    def set_refresh_token(self, refresh_token: str):
+        self.refresh_token = refresh_token
+
+    def clear_auth_token(self):
+        """Remove the authorization token."""
+        self.token = None
+
+    async def get_api_status(self) -> httpx.Response:
+        """Check API server status."""
+        return await self._make_request('GET', '')
+
+# Session-bound entry point to the async API service (see app.services.client_registry)
+async_api_service = SessionBoundApiService(AsyncApiService(), 'async')
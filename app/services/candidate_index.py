@@ -0,0 +1,360 @@
+"""
+Candidate search index for Dompell Africa
+Keeps trainee profiles in an in-process index so employer search does not
+rescan every candidate per query: text fields are tokenized into inverted
+postings, experience is normalized to years, and categorical fields (skills,
+location, availability, whole years of experience) are kept as bitmaps. A query
+intersects postings and bitmaps; records can be added, updated and removed
+one at a time.
+"""
+
+import bisect
+import re
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Iterable, Set
+from app.services.log import get_logger
+
+log = get_logger('CANDIDATE_INDEX')
+
+# Fields whose words are searchable from the search box
+TEXT_FIELDS = ('name', 'title', 'location', 'skills', 'bio')
+# Exact-match filters, stored as one bitmap per (normalized) value
+FACET_FIELDS = ('skills', 'location', 'availability')
+# Experience is bucketed per whole year; everything above lands in the last bucket
+MAX_EXPERIENCE_YEARS = 50
+# Sort orders understood by page(); relevance keeps insertion order
+SORT_ORDERS = ('relevance', 'experience', 'rating', 'name', 'recent')
+# Sorted result sets kept for paging through (each holds one key per match)
+ORDERED_CACHE_SIZE = 4
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+_NUMBER = re.compile(r'\d+(?:\.\d+)?')
+# Set bit positions of every byte value, for decoding bitmaps
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+def tokenize(text: Any) -> List[str]:
+    if not text:
+        return []
+    if isinstance(text, (list, tuple, set)):
+        text = ' '.join(str(item) for item in text)
+    return _TOKEN.findall(str(text).lower())
+
+
+def _normalize(value: Any) -> str:
+    return ' '.join(str(value).lower().split())
+
+
+def parse_experience_years(value: Any) -> float:
+    """Normalize '3 years', '5+ years', '1-2 years', '6 months' or 4 to years."""
+    if isinstance(value, (int, float)):
+        return max(float(value), 0.0)
+    text = str(value or '').lower()
+    numbers = [float(n) for n in _NUMBER.findall(text)]
+    if not numbers:
+        return 0.0
+    # A range counts as its lower bound, like the '+' in '5+ years'
+    years = numbers[0]
+    if 'month' in text:
+        years /= 12
+    return years
+
+
+def _timestamp(value: Any) -> float:
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def to_bitmap(docs: Iterable[int]) -> int:
+    """Build an int bitmap from doc numbers in one pass."""
+    docs = list(docs)
+    if not docs:
+        return 0
+    buffer = bytearray(max(docs) // 8 + 1)
+    for doc in docs:
+        buffer[doc >> 3] |= 1 << (doc & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+def from_bitmap(bitmap: int) -> List[int]:
+    """Doc numbers set in bitmap, in ascending order."""
+    docs = []
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little')
+    for i, byte in enumerate(data):
+        if byte:
+            base = i * 8
+            docs.extend(base + bit for bit in _BYTE_BITS[byte])
+    return docs
+
+
+class CandidateIndex:
+    """Inverted postings plus categorical bitmaps over candidate records."""
+
+    def __init__(self):
+        # Bumped on every change; invalidates cached sorted result sets
+        self.version = 0
+        self._ordered_cache: 'OrderedDict[tuple, List[tuple]]' = OrderedDict()
+        self._reset()
+
+    def _reset(self):
+        self._records: List[Optional[Dict[str, Any]]] = []
+        self._doc_by_id: Dict[str, int] = {}
+        self._live = 0
+        self._postings: Dict[str, Set[int]] = {}
+        # Sorted vocabulary for prefix lookups of the word being typed
+        self._vocabulary: List[str] = []
+        self._facets: Dict[str, Dict[str, int]] = {field: {} for field in FACET_FIELDS}
+        self._years: List[float] = []
+        self._year_buckets: List[int] = [0] * (MAX_EXPERIENCE_YEARS + 1)
+
+    def __len__(self) -> int:
+        return len(self._doc_by_id)
+
+    # ----- maintenance -----
+
+    def rebuild(self, candidates: Iterable[Dict[str, Any]]):
+        """Replace the index contents, building postings and bitmaps in bulk."""
+        self._reset()
+        facets: Dict[str, Dict[str, List[int]]] = {field: {} for field in FACET_FIELDS}
+        buckets: List[List[int]] = [[] for _ in self._year_buckets]
+        for candidate in candidates:
+            doc = self._assign(candidate)
+            if doc is None:
+                continue
+            for token in self._tokens(candidate):
+                self._postings.setdefault(token, set()).add(doc)
+            for field, values in self._facet_values(candidate).items():
+                for value in values:
+                    facets[field].setdefault(value, []).append(doc)
+            buckets[self._bucket(doc)].append(doc)
+        self._vocabulary = sorted(self._postings)
+        self._facets = {field: {value: to_bitmap(docs) for value, docs in values.items()}
+                        for field, values in facets.items()}
+        self._year_buckets = [to_bitmap(docs) for docs in buckets]
+        self._live = to_bitmap(self._doc_by_id.values())
+        self._changed()
+        log.info('Indexed %s candidate(s), %s term(s)', len(self), len(self._vocabulary))
+
+    def upsert(self, candidate: Dict[str, Any]):
+        """Add a candidate, or re-index it if its id is already known."""
+        candidate_id = str(candidate.get('id', ''))
+        if candidate_id in self._doc_by_id:
+            self._unindex(self._doc_by_id[candidate_id])
+        doc = self._assign(candidate)
+        if doc is None:
+            return
+        for token in self._tokens(candidate):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = set()
+                bisect.insort(self._vocabulary, token)
+            postings.add(doc)
+        bit = 1 << doc
+        for field, values in self._facet_values(candidate).items():
+            for value in values:
+                self._facets[field][value] = self._facets[field].get(value, 0) | bit
+        self._year_buckets[self._bucket(doc)] |= bit
+        self._live |= bit
+        self._changed()
+
+    def remove(self, candidate_id: Any):
+        doc = self._doc_by_id.pop(str(candidate_id), None)
+        if doc is not None:
+            self._unindex(doc)
+            self._records[doc] = None
+            self._changed()
+
+    def _changed(self):
+        self.version += 1
+        self._ordered_cache.clear()
+
+    def _assign(self, candidate: Dict[str, Any]) -> Optional[int]:
+        """Store the record under its existing doc number or a new one."""
+        if not isinstance(candidate, dict):
+            return None
+        candidate_id = str(candidate.get('id', ''))
+        doc = self._doc_by_id.get(candidate_id)
+        if doc is None:
+            doc = len(self._records)
+            self._records.append(candidate)
+            self._years.append(0.0)
+            self._doc_by_id[candidate_id or f'#{doc}'] = doc
+        else:
+            self._records[doc] = candidate
+        self._years[doc] = parse_experience_years(candidate.get('experience'))
+        return doc
+
+    def _unindex(self, doc: int):
+        candidate = self._records[doc]
+        mask = ~(1 << doc)
+        for token in self._tokens(candidate):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.discard(doc)
+                if not postings:
+                    del self._postings[token]
+                    i = bisect.bisect_left(self._vocabulary, token)
+                    if i < len(self._vocabulary) and self._vocabulary[i] == token:
+                        del self._vocabulary[i]
+        for field, values in self._facet_values(candidate).items():
+            for value in values:
+                if value in self._facets[field]:
+                    self._facets[field][value] &= mask
+        self._year_buckets[self._bucket(doc)] &= mask
+        self._live &= mask
+
+    def _tokens(self, candidate: Dict[str, Any]) -> Set[str]:
+        tokens = set()
+        for field in TEXT_FIELDS:
+            tokens.update(tokenize(candidate.get(field)))
+        return tokens
+
+    @staticmethod
+    def _facet_values(candidate: Dict[str, Any]) -> Dict[str, Set[str]]:
+        values = {}
+        for field in FACET_FIELDS:
+            value = candidate.get(field)
+            items = value if isinstance(value, (list, tuple, set)) else [value]
+            values[field] = {_normalize(item) for item in items if item}
+        return values
+
+    def _bucket(self, doc: int) -> int:
+        return min(int(self._years[doc]), MAX_EXPERIENCE_YEARS)
+
+    # ----- queries -----
+
+    def _term_docs(self, token: str, prefix: bool) -> Set[int]:
+        if not prefix:
+            return self._postings.get(token, set())
+        # Union the postings of every vocabulary word starting with token
+        start = bisect.bisect_left(self._vocabulary, token)
+        end = bisect.bisect_left(self._vocabulary, token + '\uffff', start)
+        words = self._vocabulary[start:end]
+        if len(words) == 1:
+            return self._postings[words[0]]
+        docs: Set[int] = set()
+        for word in words:
+            docs |= self._postings[word]
+        return docs
+
+    def _text_bitmap(self, query: str) -> int:
+        tokens = tokenize(query)
+        # The last word may still be being typed, so it matches as a prefix
+        term_docs = [self._term_docs(token, prefix=(i == len(tokens) - 1)) for i, token in enumerate(tokens)]
+        term_docs.sort(key=len)
+        docs = set(term_docs[0])
+        for other in term_docs[1:]:
+            if not docs:
+                break
+            docs &= other
+        return to_bitmap(docs)
+
+    def _years_bitmap(self, min_years: Optional[float], max_years: Optional[float]) -> int:
+        low = max(int(min_years or 0), 0)
+        high = MAX_EXPERIENCE_YEARS if max_years is None else min(int(max_years), MAX_EXPERIENCE_YEARS)
+        bitmap = 0
+        for bucket in self._year_buckets[low:high + 1]:
+            bitmap |= bucket
+        return bitmap
+
+    def search_docs(self, query: str = '', skill: Optional[str] = None, location: Optional[str] = None,
+                    availability: Optional[str] = None, min_years: Optional[float] = None,
+                    max_years: Optional[float] = None) -> List[int]:
+        """Doc numbers matching every given criterion, in insertion order."""
+        bitmap = self._live
+        if tokenize(query):
+            bitmap &= self._text_bitmap(query)
+        for field, value in (('skills', skill), ('location', location), ('availability', availability)):
+            if value and bitmap:
+                bitmap &= self._facets[field].get(_normalize(value), 0)
+        if (min_years is not None or max_years is not None) and bitmap:
+            bitmap &= self._years_bitmap(min_years, max_years)
+        return from_bitmap(bitmap)
+
+    def search(self, query: str = '', skill: Optional[str] = None, location: Optional[str] = None,
+               availability: Optional[str] = None, min_years: Optional[float] = None,
+               max_years: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Candidates matching all of: every word of query (the last one as a
+        prefix) in a text field, the exact skill / location / availability,
+        and whole years of experience within [min_years, max_years].
+        """
+        docs = self.search_docs(query, skill, location, availability, min_years, max_years)
+        return [self._records[doc] for doc in docs]
+
+    def _sort_key(self, doc: int, sort: str) -> tuple:
+        """Unique, ascending sort key for doc; the doc number is always last."""
+        record = self._records[doc]
+        if sort == 'experience':
+            return (-self._years[doc], doc)
+        if sort == 'rating':
+            return (-float(record.get('rating') or 0), doc)
+        if sort == 'name':
+            return (str(record.get('name', '')).lower(), doc)
+        if sort == 'recent':
+            # Without timestamps, later-added records count as more recent
+            return (-_timestamp(record.get('updatedAt')), -doc, doc)
+        return (doc,)
+
+    def _ordered(self, query: str, sort: str, filters: Dict[str, Any]) -> List[tuple]:
+        key = (self.version, tuple(tokenize(query)), sort, tuple(sorted(filters.items())))
+        keys = self._ordered_cache.get(key)
+        if keys is None:
+            docs = self.search_docs(query, **filters)
+            keys = [self._sort_key(doc, sort) for doc in docs]
+            if sort != 'relevance':
+                keys.sort()
+            self._ordered_cache[key] = keys
+            while len(self._ordered_cache) > ORDERED_CACHE_SIZE:
+                self._ordered_cache.popitem(last=False)
+        else:
+            self._ordered_cache.move_to_end(key)
+        return keys
+
+    def page(self, query: str = '', sort: str = 'relevance', after: Optional[tuple] = None,
+             before: Optional[tuple] = None, limit: int = 20, **filters) -> Dict[str, Any]:
+        """
+        One window of the sorted matches (filters as for search()).
+
+        after/before are the 'next'/'prev' cursors of a previous page. Cursors
+        are sort keys, so a window stays put when other records change.
+        """
+        keys = self._ordered(query, sort, filters)
+        if after is not None:
+            start = bisect.bisect_right(keys, after)
+        elif before is not None:
+            start = max(bisect.bisect_left(keys, before) - limit, 0)
+        else:
+            start = 0
+        if start >= len(keys):
+            # Past the end (e.g. the last records were removed): show the last page
+            start = max(len(keys) - limit, 0)
+        window = keys[start:start + limit]
+        return {
+            'items': [self._records[key[-1]] for key in window],
+            'total': len(keys),
+            'offset': start,
+            'next': window[-1] if window and start + limit < len(keys) else None,
+            'prev': window[0] if window and start > 0 else None,
+        }
+
+    def years(self, candidate: Dict[str, Any]) -> float:
+        """Normalized experience of an indexed candidate (parsed if unknown)."""
+        doc = self._doc_by_id.get(str(candidate.get('id', '')))
+        if doc is not None:
+            return self._years[doc]
+        return parse_experience_years(candidate.get('experience'))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'candidates': len(self),
+            'terms': len(self._vocabulary),
+            'facets': {field: len(values) for field, values in self._facets.items()},
+        }
+
+
+# Global candidate index instance
+candidate_index = CandidateIndex()
@@ -0,0 +1,175 @@
+"""
+Circuit breakers for Dompell Africa backend calls
+One breaker per endpoint group ('/users/...', '/trainee/...', ...) stops
+sending requests to a backend that is down or cold-starting, so pages get an
+answer at once (a stale cached copy, see response_cache, or a 503) instead of
+waiting out timeouts and retries.
+
+- Closed: requests go through. API_BREAKER_FAILURES consecutive failures
+  (no response, 5xx, 429) or slow responses (API_BREAKER_SLOW_SECONDS or
+  more, retries included) open the breaker.
+- Open: requests are answered with a 503 without being sent, for
+  API_BREAKER_OPEN_SECONDS.
+- Half-open: the next request is let through as a probe. If it succeeds the
+  breaker closes; if it fails it opens again for twice as long, up to
+  API_BREAKER_MAX_OPEN_SECONDS.
+"""
+
+import json
+import threading
+import time
+from typing import Dict, Any, Optional, List
+import httpx
+import requests
+from requests.structures import CaseInsensitiveDict
+from app.config import (API_BREAKER_FAILURES, API_BREAKER_SLOW_SECONDS, API_BREAKER_OPEN_SECONDS,
+                        API_BREAKER_MAX_OPEN_SECONDS)
+from app.services.api_metrics import api_metrics
+from app.services.log import get_logger
+
+log = get_logger('CIRCUIT_BREAKER')
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+REJECTION_MESSAGE = 'The server is not responding right now. Please try again in a moment.'
+
+
+def is_failure(response: Any) -> bool:
+    """Whether a response (None: none came back) means the backend is in trouble."""
+    return response is None or response.status_code >= 500 or response.status_code == 429
+
+
+def endpoint_group(endpoint: str) -> str:
+    """'/trainee/education/42' -> 'trainee'."""
+    return endpoint.lstrip('/').split('/', 1)[0].split('?', 1)[0] or 'root'
+
+
+class CircuitBreaker:
+    """Closed / open / half-open state of one endpoint group."""
+
+    def __init__(self, name: str, failures: int = API_BREAKER_FAILURES,
+                 slow_seconds: float = API_BREAKER_SLOW_SECONDS, open_seconds: float = API_BREAKER_OPEN_SECONDS,
+                 max_open_seconds: float = API_BREAKER_MAX_OPEN_SECONDS):
+        self.name = name
+        self.failures = failures
+        self.slow_seconds = slow_seconds
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_total = 0
+        self.rejected_total = 0
+        self._open_for = open_seconds
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (in half-open state: one probe at a time)."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = time.monotonic()
+            if now >= self._retry_at:
+                # Probe; should it never report back, another one goes after open_for
+                self.state = HALF_OPEN
+                self._retry_at = now + self._open_for
+                return True
+            self.rejected_total += 1
+            return False
+
+    def record(self, response: Any, seconds: Optional[float] = None):
+        """Report the outcome of a request that was sent (seconds None: do not judge its speed)."""
+        failed = is_failure(response) or (seconds is not None and seconds >= self.slow_seconds)
+        with self._lock:
+            if not failed:
+                if self.state != CLOSED:
+                    log.info("Backend group '%s' is answering again, circuit closed", self.name)
+                self.state = CLOSED
+                self.consecutive_failures = 0
+                self._open_for = self.open_seconds
+                return
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN:
+                self._open_for = min(self._open_for * 2, self.max_open_seconds)
+                self._open()
+            elif self.state == CLOSED and self.consecutive_failures >= self.failures:
+                self._open()
+
+    def _open(self):
+        self.state = OPEN
+        self._retry_at = time.monotonic() + self._open_for
+        self.opened_total += 1
+        log.warning("Backend group '%s' failing (%s in a row), circuit open for %ss",
+                    self.name, self.consecutive_failures, self._open_for)
+
+    def retry_after(self) -> float:
+        return max(0.0, self._retry_at - time.monotonic())
+
+    # ----- answers while open -----
+
+    def _rejection(self) -> tuple:
+        headers = {'Content-Type': 'application/json', 'Retry-After': str(int(self.retry_after()) + 1),
+                   'X-Circuit': OPEN}
+        body = json.dumps({'status': 503, 'message': REJECTION_MESSAGE}).encode('utf-8')
+        return headers, body
+
+    def rejection(self, url: str) -> requests.Response:
+        """503 for ApiService, in place of a request that was not sent."""
+        headers, body = self._rejection()
+        response = requests.Response()
+        response.status_code = 503
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = body
+        response.encoding = 'utf-8'
+        response.url = url
+        return response
+
+    def rejection_async(self, method: str, url: str) -> httpx.Response:
+        """503 for AsyncApiService, in place of a request that was not sent."""
+        headers, body = self._rejection()
+        return httpx.Response(503, headers=headers, content=body, request=httpx.Request(method, url))
+
+
+class CircuitBreakers:
+    """The breakers of every endpoint group, created on first use."""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def for_endpoint(self, endpoint: str) -> CircuitBreaker:
+        name = endpoint_group(endpoint)
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(name, CircuitBreaker(name))
+        return breaker
+
+    def stats(self) -> Dict[str, Any]:
+        return {name: {'state': b.state, 'consecutive_failures': b.consecutive_failures,
+                       'opened_total': b.opened_total, 'rejected_total': b.rejected_total}
+                for name, b in list(self._breakers.items())}
+
+    def render_metrics(self) -> List[str]:
+        """Prometheus lines for api_metrics.render()."""
+        breakers = list(self._breakers.values())
+        lines = [
+            '# HELP dompell_api_circuit_state Circuit breaker state per endpoint group (0 closed, 1 half-open, 2 open).',
+            '# TYPE dompell_api_circuit_state gauge',
+        ]
+        lines.extend(f'dompell_api_circuit_state{{group="{b.name}"}} {STATE_VALUES[b.state]}' for b in breakers)
+        lines += ['# HELP dompell_api_circuit_opened_total Times the circuit of an endpoint group opened.',
+                  '# TYPE dompell_api_circuit_opened_total counter']
+        lines.extend(f'dompell_api_circuit_opened_total{{group="{b.name}"}} {b.opened_total}' for b in breakers)
+        lines += ['# HELP dompell_api_circuit_rejected_total Requests answered without being sent.',
+                  '# TYPE dompell_api_circuit_rejected_total counter']
+        lines.extend(f'dompell_api_circuit_rejected_total{{group="{b.name}"}} {b.rejected_total}' for b in breakers)
+        return lines
+
+
+# Global circuit breakers instance
+circuit_breakers = CircuitBreakers()
+api_metrics.collectors.append(circuit_breakers.render_metrics)
@@ -0,0 +1,170 @@
+"""
+Per-session API client registry for Dompell Africa
+Hands out lightweight per-user credential contexts keyed by the NiceGUI browser
+session. Every context shares the process-wide connection pools, so isolating
+users' tokens does not cost a new TCP/TLS handshake per user.
+"""
+
+import threading
+import time
+from typing import Dict, Any, Optional
+from nicegui import app
+from app.services.api_service import ApiService, sync_pool_usage
+from app.services.async_api_service import AsyncApiService, async_pool_usage
+from app.services.token_manager import TokenManager
+from app.services.log import get_logger
+
+log = get_logger('CLIENT_REGISTRY')
+
+# Contexts unused for this long are dropped (their pooled connections are not)
+IDLE_TIMEOUT = 30 * 60
+SWEEP_INTERVAL = 60
+
+
+def _current_session_id() -> Optional[str]:
+    """Return the browser session id backing app.storage.user, if any."""
+    try:
+        return app.storage.browser.get('id')
+    except Exception:
+        # Not inside a page/request context (startup, background task, ...)
+        return None
+
+
+class SessionClientContext:
+    """Credentials for one browser session plus sync and async API views."""
+
+    def __init__(self, session_id: str, token: Optional[str] = None, refresh_token: Optional[str] = None):
+        self.session_id = session_id
+        self.api = ApiService(token, refresh_token)
+        self.aio = AsyncApiService(token, refresh_token)
+        self.api.on_token_refresh = self._store_refreshed_token
+        self.aio.on_token_refresh = self._store_refreshed_token
+        self.tokens = TokenManager(self)
+        self.api.token_manager = self.tokens
+        self.aio.token_manager = self.tokens
+        # Last credentials seen in app.storage.user, used to detect a new login
+        self._stored_token = token
+        self._stored_refresh_token = refresh_token
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+    def set_credentials(self, token: Optional[str], refresh_token: Optional[str] = None):
+        """Point both API views at a new token pair."""
+        for service in (self.api, self.aio):
+            service.token = token
+            service.refresh_token = refresh_token
+        self._stored_token = token
+        self._stored_refresh_token = refresh_token
+
+    def sync_from_storage(self, token: Optional[str], refresh_token: Optional[str]):
+        """Adopt credentials written to app.storage.user by a login or logout."""
+        if token != self._stored_token or refresh_token != self._stored_refresh_token:
+            self.set_credentials(token, refresh_token)
+
+    def _store_refreshed_token(self, token: str):
+        self.store_tokens(token)
+
+    def store_tokens(self, token: str, refresh_token: Optional[str] = None):
+        """Adopt a renewed access token (and rotated refresh token) and persist them for the session.
+
+        The stored-credential markers move only once app.storage.user holds the
+        new pair; otherwise the old pair still in storage would look like a new
+        login to sync_from_storage() and replace the renewed one.
+        """
+        self.api.token = token
+        self.aio.token = token
+        if refresh_token:
+            self.api.refresh_token = refresh_token
+            self.aio.refresh_token = refresh_token
+        try:
+            app.storage.user['token'] = token
+            if refresh_token:
+                app.storage.user['refresh_token'] = refresh_token
+        except Exception as e:
+            log.warning('Could not persist renewed tokens for session %s: %s', self.session_id, e)
+            return
+        self._stored_token = token
+        if refresh_token:
+            self._stored_refresh_token = refresh_token
+
+    def close(self):
+        self.tokens.close()
+
+
+class ClientRegistry:
+    """Registry of SessionClientContext objects with idle eviction."""
+
+    def __init__(self, idle_timeout: float = IDLE_TIMEOUT, sweep_interval: float = SWEEP_INTERVAL):
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self._contexts: Dict[str, SessionClientContext] = {}
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+        self.evicted_total = 0
+
+    def current(self) -> Optional[SessionClientContext]:
+        """Return the context for the browser session of the running page or handler."""
+        session_id = _current_session_id()
+        if session_id is None:
+            return None
+        try:
+            token = app.storage.user.get('token')
+            refresh_token = app.storage.user.get('refresh_token')
+        except Exception:
+            token = refresh_token = None
+        return self.get(session_id, token, refresh_token)
+
+    def get(self, session_id: str, token: Optional[str] = None,
+            refresh_token: Optional[str] = None) -> SessionClientContext:
+        """Return (creating if needed) the context for a session id."""
+        now = time.monotonic()
+        with self._lock:
+            context = self._contexts.get(session_id)
+            if context is None:
+                context = SessionClientContext(session_id, token, refresh_token)
+                self._contexts[session_id] = context
+            else:
+                context.sync_from_storage(token, refresh_token)
+            context.last_used = now
+        if now - self._last_sweep >= self.sweep_interval:
+            self.sweep(now)
+        return context
+
+    def evict(self, session_id: str) -> bool:
+        """Drop a session's context. Returns True if one was removed."""
+        with self._lock:
+            context = self._contexts.pop(session_id, None)
+            if context is not None:
+                context.close()
+                self.evicted_total += 1
+        return context is not None
+
+    def evict_current(self) -> bool:
+        session_id = _current_session_id()
+        return self.evict(session_id) if session_id else False
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Evict contexts idle for longer than idle_timeout. Returns the count removed."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._last_sweep = now
+            stale = [sid for sid, ctx in self._contexts.items() if now - ctx.last_used > self.idle_timeout]
+            for sid in stale:
+                self._contexts.pop(sid).close()
+            self.evicted_total += len(stale)
+        return len(stale)
+
+    def stats(self) -> Dict[str, Any]:
+        """Session counts and connection pool saturation for monitoring."""
+        with self._lock:
+            sessions = len(self._contexts)
+        return {
+            'sessions': sessions,
+            'evicted_total': self.evicted_total,
+            'sync_pool': sync_pool_usage.snapshot(),
+            'async_pool': async_pool_usage.snapshot(),
+        }
+
+
+# Global client registry instance
+client_registry = ClientRegistry()
@@ -0,0 +1,102 @@
+"""
+Parallel dashboard data loader for Dompell Africa
+Fires every section's backend requests at once and hands each result to the
+page as soon as it arrives, so the page shell can render immediately and
+sections stream in behind their skeletons. If a section had to be built from
+stale cached data (backend failing), the user is told once per page.
+"""
+
+import asyncio
+from typing import Dict, Any, Optional, Callable, Awaitable, List
+from nicegui import ui
+from app.services.response_cache import collect_stale
+from app.services.log import get_logger
+
+log = get_logger('DASHBOARD_LOADER')
+
+DEFAULT_SECTION_TIMEOUT = 15.0
+STALE_NOTICE = 'The server is not responding right now; showing your last saved data.'
+
+
+class DashboardLoader:
+    """Concurrent section loader with per-section timeouts and ready callbacks."""
+
+    def __init__(self, default_timeout: float = DEFAULT_SECTION_TIMEOUT):
+        self.default_timeout = default_timeout
+        self.client = ui.context.client
+        self.results: Dict[str, Any] = {}
+        self.errors: Dict[str, str] = {}
+        # Sections built from stale cached responses
+        self.stale: List[str] = []
+        self._loaders: Dict[str, tuple] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._callbacks: Dict[str, List[Callable[[Any], None]]] = {}
+
+    def section(self, name: str, load: Callable[[], Awaitable[Any]], timeout: Optional[float] = None):
+        """Register a section. load() may await other sections via get()."""
+        self._loaders[name] = (load, timeout or self.default_timeout)
+        return self
+
+    def start(self):
+        """Start every registered section concurrently."""
+        for name in self._loaders:
+            if name not in self._tasks:
+                self._tasks[name] = asyncio.ensure_future(self._run(name))
+        return self
+
+    async def _run(self, name: str):
+        load, timeout = self._loaders[name]
+        # Enter the client so loaders may notify/navigate like a page handler
+        with self.client:
+            served_stale = collect_stale()
+            try:
+                self.results[name] = await asyncio.wait_for(load(), timeout)
+            except asyncio.TimeoutError:
+                log.warning("Section '%s' timed out after %ss", name, timeout)
+                self.errors[name] = 'timeout'
+                self.results[name] = None
+            except Exception as e:
+                log.warning("Section '%s' failed: %s", name, e)
+                self.errors[name] = str(e)
+                self.results[name] = None
+            if served_stale:
+                self._stale_notice(name)
+            for callback in self._callbacks.pop(name, []):
+                self._notify(callback, name)
+
+    def _stale_notice(self, name: str):
+        if not self.stale:
+            ui.notify(STALE_NOTICE, type='warning')
+        self.stale.append(name)
+
+    def _notify(self, callback: Callable[[Any], None], name: str):
+        try:
+            callback(self.results.get(name))
+        except Exception as e:
+            log.warning("Render of section '%s' failed: %s", name, e)
+
+    def is_ready(self, name: str) -> bool:
+        return name in self.results
+
+    def on_ready(self, name: str, callback: Callable[[Any], None]):
+        """Call callback(result) when the section resolves (immediately if it already has).
+
+        The result is None if the section failed or timed out; see errors[name].
+        """
+        if self.is_ready(name):
+            with self.client:
+                self._notify(callback, name)
+        else:
+            self._callbacks.setdefault(name, []).append(callback)
+
+    async def get(self, name: str) -> Any:
+        """Await a section's result (starting it if needed)."""
+        if name not in self._tasks:
+            self._tasks[name] = asyncio.ensure_future(self._run(name))
+        await asyncio.shield(self._tasks[name])
+        return self.results.get(name)
+
+    async def wait_all(self) -> Dict[str, Any]:
+        if self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        return self.results
@@ -0,0 +1,265 @@
+"""
+Job postings store for Dompell Africa
+Keeps job postings in a local SQLite database (WAL mode) shared by every
+session and worker, so a posting made on one employer dashboard shows up on
+/jobs and in site search straight away. Filtering, sorting and pagination
+run as indexed SQL queries; writes are queued and committed together in one
+transaction.
+
+Rows keep the queried fields in columns and the full posting as JSON:
+    {'id', 'title', 'location', 'type', 'experienceLevel', 'status',
+     'applications', 'postedDate', 'employerId', ...}
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+from app.config import JOB_STORE_PATH
+from app.services.log import get_logger
+
+log = get_logger('JOB_STORE')
+
+# Commit queued writes after this many seconds (or before the next read)
+WRITE_BATCH_DELAY = 0.05
+# Retry a batch that could not be committed (database locked, disk full) after this many seconds
+WRITE_RETRY_DELAY = 1.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    employer_id TEXT,
+    title TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL DEFAULT '',
+    type TEXT NOT NULL DEFAULT '',
+    experience_level TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT 'active',
+    applications INTEGER NOT NULL DEFAULT 0,
+    posted_date TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, posted_date);
+CREATE INDEX IF NOT EXISTS idx_jobs_type ON jobs (type, posted_date);
+CREATE INDEX IF NOT EXISTS idx_jobs_posted ON jobs (posted_date);
+CREATE INDEX IF NOT EXISTS idx_jobs_employer ON jobs (employer_id, status, posted_date);
+"""
+
+# Dashboard sort labels -> columns (also the whitelist for ORDER BY)
+SORT_COLUMNS = {
+    'Title': 'title',
+    'Location': 'location',
+    'Type': 'type',
+    'Experience': 'experience_level',
+    'Status': 'status',
+    'Applications': 'applications',
+    'Posted': 'posted_date',
+}
+
+UPSERT = """
+INSERT INTO jobs (id, employer_id, title, location, type, experience_level, status, applications, posted_date, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    employer_id = excluded.employer_id, title = excluded.title, location = excluded.location,
+    type = excluded.type, experience_level = excluded.experience_level, status = excluded.status,
+    applications = excluded.applications, posted_date = excluded.posted_date, data = excluded.data
+"""
+
+
+def _row_values(job: Dict[str, Any]) -> tuple:
+    employer_id = job.get('employerId')
+    return (
+        str(job['id']),
+        None if employer_id is None else str(employer_id),
+        job.get('title') or '',
+        job.get('location') or '',
+        job.get('type') or '',
+        job.get('experienceLevel') or job.get('experience') or '',
+        (job.get('status') or 'active').lower(),
+        int(job.get('applications') or 0),
+        job.get('postedDate') or '',
+        json.dumps(job, default=str),
+    )
+
+
+def _job(row: sqlite3.Row) -> Dict[str, Any]:
+    """Posting dict of a row; the columns win over the JSON copy (set_status only updates the column)."""
+    job = json.loads(row['data'])
+    job.update(status=row['status'], applications=row['applications'])
+    return job
+
+
+class JobStore:
+    """Job postings in SQLite with batched writes."""
+
+    def __init__(self, path: str = JOB_STORE_PATH):
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._pending: List[tuple] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            with self._lock:
+                if self._connection is None:
+                    self._connection = self._connect()
+        return self._connection
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute('PRAGMA busy_timeout=5000')
+        connection.executescript(SCHEMA)
+        if connection.execute('SELECT COUNT(*) FROM jobs').fetchone()[0] == 0:
+            self._seed(connection)
+        return connection
+
+    @staticmethod
+    def _seed(connection: sqlite3.Connection):
+        """Start an empty store with the sample jobs so /jobs is not blank."""
+        from app.data import SAMPLE_JOBS
+
+        today = datetime.now().strftime('%Y-%m-%d')
+        rows = [_row_values(dict(job, id=f"sample-{job['id']}", status='active', postedDate=today))
+                for job in SAMPLE_JOBS]
+        connection.execute('BEGIN IMMEDIATE')
+        connection.executemany(UPSERT, rows)
+        connection.execute('COMMIT')
+        log.info('Seeded %s sample job(s)', len(rows))
+
+    # ----- writes -----
+
+    def add(self, job: Dict[str, Any]):
+        """Insert or replace a posting (committed with the next batch)."""
+        self._queue(UPSERT, _row_values(job))
+
+    def set_status(self, job_id: str, status: str):
+        self._queue('UPDATE jobs SET status = ? WHERE id = ?', (status.lower(), str(job_id)))
+
+    def remove(self, job_id: str):
+        self._queue('DELETE FROM jobs WHERE id = ?', (str(job_id),))
+
+    def _queue(self, sql: str, params: tuple):
+        with self._lock:
+            self._pending.append((sql, params))
+            if self._flush_handle is not None:
+                return
+            if not self._schedule_flush(WRITE_BATCH_DELAY):
+                self.flush()
+
+    def _schedule_flush(self, delay: float) -> bool:
+        """Arm a flush on the running event loop; False outside one. Call with the lock held."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        self._flush_handle = loop.call_later(delay, self.flush)
+        return True
+
+    def flush(self):
+        """Commit the queued writes in one transaction.
+
+        A batch that cannot be committed for now (locked database, full disk)
+        goes back in the queue and is retried; a write SQLite rejects outright
+        is logged and dropped so it cannot hold up the others.
+        """
+        with self._lock:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+            try:
+                self._commit(pending)
+            except sqlite3.OperationalError as e:
+                self._pending = pending + self._pending
+                log.error('Could not commit %s job write(s), retrying: %s', len(pending), e)
+                self._schedule_flush(WRITE_RETRY_DELAY)
+            except sqlite3.Error:
+                for statement in pending:
+                    try:
+                        self._commit([statement])
+                    except sqlite3.OperationalError as e:
+                        self._pending.append(statement)
+                        log.error('Could not commit a job write, retrying: %s', e)
+                    except sqlite3.Error as e:
+                        log.error('Dropped a job write SQLite rejected (%s): %s', statement[0].split(None, 1)[0], e)
+                if self._pending and self._flush_handle is None:
+                    self._schedule_flush(WRITE_RETRY_DELAY)
+
+    def _commit(self, statements: List[tuple]):
+        connection = self.connection
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            for sql, params in statements:
+                connection.execute(sql, params)
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    # ----- reads -----
+
+    def query(self, employer_id: Optional[str] = None, status: Optional[str] = None,
+              type: Optional[str] = None, sort: str = 'Posted', direction: str = 'desc',
+              limit: Optional[int] = 20, offset: int = 0) -> Dict[str, Any]:
+        """One page of postings plus the total number matching the filters."""
+        where, params = [], []
+        if employer_id is not None:
+            where.append('employer_id = ?')
+            params.append(str(employer_id))
+        if status:
+            where.append('status = ?')
+            params.append(status.lower())
+        if type:
+            where.append('type = ?')
+            params.append(type)
+        clause = f"WHERE {' AND '.join(where)}" if where else ''
+        column = SORT_COLUMNS.get(sort, 'posted_date')
+        order = 'ASC' if direction == 'asc' else 'DESC'
+
+        self.flush()
+        with self._lock:
+            total = self.connection.execute(f'SELECT COUNT(*) FROM jobs {clause}', params).fetchone()[0]
+            sql = f'SELECT * FROM jobs {clause} ORDER BY {column} {order}, id {order}'
+            if limit is not None:
+                sql += ' LIMIT ? OFFSET ?'
+                params = params + [limit, max(offset, 0)]
+            rows = self.connection.execute(sql, params).fetchall()
+        return {'items': [_job(row) for row in rows], 'total': total}
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        self.flush()
+        with self._lock:
+            row = self.connection.execute('SELECT * FROM jobs WHERE id = ?', (str(job_id),)).fetchone()
+        return _job(row) if row else None
+
+    def summary(self, employer_id: Optional[str] = None) -> Dict[str, int]:
+        """Posting, active-posting and application counts (for one employer if given)."""
+        clause, params = ('WHERE employer_id = ?', [str(employer_id)]) if employer_id is not None else ('', [])
+        self.flush()
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(status = 'active'), 0), COALESCE(SUM(applications), 0) "
+                f"FROM jobs {clause}", params).fetchone()
+        return {'total': row[0], 'active': row[1], 'applications': row[2]}
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# Global job store instance
+job_store = JobStore()
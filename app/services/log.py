@@ -0,0 +1,167 @@
+"""
+Logging for Dompell Africa
+Replaces print() on request paths with stdlib logging that never makes the
+caller wait for I/O.
+
+- Records go through a bounded in-memory queue to a listener thread, which
+  formats and writes them. When the queue is full a record is dropped (and
+  counted) instead of blocking.
+- Messages are formatted lazily (log.info('... %s', value)) in the listener
+  thread, so a disabled level costs one comparison and an enabled one no
+  string work on the request path. Arguments must therefore not be mutated
+  after the call.
+- Levels are set per tag: LOG_LEVEL for everything, LOG_LEVELS to override
+  single tags ("API_SERVICE=DEBUG,DASHBOARD=WARNING").
+- Frequent messages are sampled: beyond LOG_SAMPLE_BURST records of one
+  message template per second the rest are counted, and the count is
+  reported with the next record that gets through. Errors are never sampled.
+- JWTs, Bearer credentials and token/password fields are redacted before
+  anything is written.
+
+Loggers are named after the [TAG] prefixes the code used with print():
+    log = get_logger('API_SERVICE')
+    log.info('Retry failed: %s', error)   # 12:00:00 INFO    [API_SERVICE] Retry failed: ...
+"""
+
+import atexit
+import logging
+import queue
+import re
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+from app.config import LOG_LEVEL, LOG_LEVELS, LOG_SAMPLE_BURST
+
+ROOT_LOGGER = 'dompell'
+QUEUE_SIZE = 10000
+SAMPLE_WINDOW = 1.0
+# Forget sampling windows beyond this many templates (f-string messages never repeat)
+MAX_SAMPLE_KEYS = 4096
+LOG_FORMAT = '%(asctime)s %(levelname)-7s [%(tag)s] %(message)s'
+DATE_FORMAT = '%H:%M:%S'
+
+_REDACTIONS = (
+    (re.compile(r'eyJ[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]*'), '[REDACTED]'),
+    (re.compile(r'(?i)(bearer\s+)[^\s\'",]+'), r'\1[REDACTED]'),
+    (re.compile(r'(?i)(["\']?(?:access_?token|refresh_?token|token|password|secret)["\']?\s*[:=]\s*["\']?)'
+                r'[^"\'\s,}&]+'), r'\1[REDACTED]'),
+)
+
+
+def redact(text: str) -> str:
+    for pattern, replacement in _REDACTIONS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+class _QueueHandler(QueueHandler):
+    """Hands records to the listener unformatted and drops them when the queue is full."""
+
+    def __init__(self, records: queue.Queue):
+        super().__init__(records)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Same process, no pickling: leave msg % args to the listener thread
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _Sampler(logging.Filter):
+    """Lets through at most `burst` records per message template and window."""
+
+    def __init__(self, burst: int, window: float = SAMPLE_WINDOW):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        # (logger, template) -> [window start, records let through, records suppressed]
+        self._windows: Dict[tuple, list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.ERROR or self.burst <= 0:
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= self.window:
+            if window is not None and window[2]:
+                record.suppressed = window[2]
+            if len(self._windows) >= MAX_SAMPLE_KEYS:
+                self._windows.clear()
+            self._windows[key] = [now, 1, 0]
+            return True
+        if window[1] < self.burst:
+            window[1] += 1
+            return True
+        window[2] += 1
+        return False
+
+
+class _Formatter(logging.Formatter):
+    """Adds the [TAG], the suppressed count and redaction."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.tag = record.name[len(ROOT_LOGGER) + 1:] if record.name.startswith(ROOT_LOGGER + '.') else record.name
+        text = super().format(record)
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            text += f' ({suppressed} similar suppressed)'
+        return redact(text)
+
+
+_lock = threading.Lock()
+_handler: Optional[_QueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+
+def configure_logging():
+    """Set up the queue, listener thread and levels (once; get_logger calls it)."""
+    global _handler, _listener
+    with _lock:
+        if _listener is not None:
+            return
+        records: queue.Queue = queue.Queue(QUEUE_SIZE)
+        _handler = _QueueHandler(records)
+        _handler.addFilter(_Sampler(LOG_SAMPLE_BURST))
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(_Formatter(LOG_FORMAT, DATE_FORMAT))
+
+        root = logging.getLogger(ROOT_LOGGER)
+        root.setLevel(LOG_LEVEL.upper())
+        root.addHandler(_handler)
+        root.propagate = False
+        for item in filter(None, (part.strip() for part in LOG_LEVELS.split(','))):
+            tag, _, level = item.partition('=')
+            logging.getLogger(f'{ROOT_LOGGER}.{tag.strip()}').setLevel(level.strip().upper())
+
+        _listener = QueueListener(records, output)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Write out what is still queued and stop the listener thread."""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+            logging.getLogger(ROOT_LOGGER).removeHandler(_handler)
+
+
+def dropped_records() -> int:
+    return _handler.dropped if _handler is not None else 0
+
+
+def get_logger(tag: str) -> logging.Logger:
+    """Logger for one [TAG]."""
+    if _listener is None:
+        configure_logging()
+    return logging.getLogger(f'{ROOT_LOGGER}.{tag}')
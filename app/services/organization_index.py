@@ -0,0 +1,147 @@
+"""
+Organization index for Dompell Africa
+Keeps a local userId -> organization map so dashboards can find the current
+user's organization with a dictionary lookup instead of downloading and
+scanning the full organization list on every render. The map is refreshed
+incrementally from GET /organization: on a lookup through the requesting
+session's own service, and in the background anonymously (or with
+API_SERVICE_TOKEN), never with a remembered user token.
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, Any, Optional, List
+from app.config import API_SERVICE_TOKEN
+from app.services.async_api_service import AsyncApiService
+from app.services.log import get_logger
+
+log = get_logger('ORG_INDEX')
+
+REFRESH_INTERVAL = 120
+# A lookup miss triggers an on-demand refresh at most this often (new sign-ups)
+MISS_REFRESH_AFTER = 30
+
+
+def _fingerprint(org: Dict[str, Any]) -> str:
+    return org.get('updatedAt') or json.dumps(org, sort_keys=True, default=str)
+
+
+class OrganizationIndex:
+    """Locally maintained organization lookup tables."""
+
+    def __init__(self, refresh_interval: float = REFRESH_INTERVAL):
+        self.refresh_interval = refresh_interval
+        self._by_user: Dict[str, Dict[str, Any]] = {}
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._refreshing: Optional[asyncio.Task] = None
+        self._background: Optional[asyncio.Task] = None
+        self.loaded = False
+        self.last_refresh = 0.0
+
+    # ----- lookups -----
+
+    def get_by_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        return self._by_user.get(user_id)
+
+    def get(self, org_id: str) -> Optional[Dict[str, Any]]:
+        return self._by_id.get(org_id)
+
+    async def lookup(self, user_id: str, service: Optional[Any] = None) -> Optional[Dict[str, Any]]:
+        """Return the organization owned by user_id, loading the index on first use.
+
+        service is the caller's (session-bound) async API service; an on-demand
+        refresh runs with it.
+        """
+        self.start()
+        if not self.loaded:
+            await self.refresh(service)
+        org = self._by_user.get(user_id)
+        if org is None and time.monotonic() - self.last_refresh > MISS_REFRESH_AFTER:
+            await self.refresh(service)
+            org = self._by_user.get(user_id)
+        return org
+
+    # ----- maintenance -----
+
+    def upsert(self, org: Optional[Dict[str, Any]]):
+        """Apply a locally known create/update (e.g. right after create_organization)."""
+        if not isinstance(org, dict) or not org:
+            return
+        org_id = org.get('id') or org.get('_id')
+        previous = self._by_id.get(org_id) if org_id else None
+        if previous and previous.get('userId') and previous.get('userId') != org.get('userId'):
+            self._by_user.pop(previous['userId'], None)
+        if org_id:
+            self._by_id[org_id] = org
+            self._fingerprints[org_id] = _fingerprint(org)
+        if org.get('userId'):
+            self._by_user[org['userId']] = org
+
+    def remove(self, org_id: str):
+        org = self._by_id.pop(org_id, None)
+        self._fingerprints.pop(org_id, None)
+        if org and org.get('userId'):
+            self._by_user.pop(org['userId'], None)
+
+    def _apply(self, orgs: List[Dict[str, Any]]) -> int:
+        """Merge a full list into the index, touching only changed entries."""
+        changed = 0
+        seen = set()
+        for org in orgs:
+            org_id = org.get('id') or org.get('_id')
+            if not org_id:
+                self.upsert(org)
+                continue
+            seen.add(org_id)
+            if self._fingerprints.get(org_id) != _fingerprint(org):
+                self.upsert(org)
+                changed += 1
+        for org_id in [oid for oid in self._by_id if oid not in seen]:
+            self.remove(org_id)
+            changed += 1
+        return changed
+
+    async def refresh(self, service: Optional[Any] = None):
+        """Refresh from the list endpoint; concurrent callers share one refresh."""
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.ensure_future(self._refresh(service))
+        await asyncio.shield(self._refreshing)
+
+    async def _refresh(self, service: Optional[Any]):
+        service = service or AsyncApiService(token=API_SERVICE_TOKEN or None)
+        try:
+            # Bypass the response cache: the index is itself the cached view
+            response = await service._make_request('GET', '/organization', cache=False)
+            if response.is_success and response.content:
+                orgs = response.json().get('data', [])
+                changed = self._apply(orgs if isinstance(orgs, list) else [])
+                self.loaded = True
+                if changed:
+                    log.info('Refreshed: %s change(s), %s organization(s)', changed, len(self._by_id))
+            else:
+                log.warning('Refresh failed: %s', response.status_code)
+        except Exception as e:
+            log.warning('Refresh error: %s', e)
+        finally:
+            self.last_refresh = time.monotonic()
+
+    def start(self):
+        """Start the background refresh loop (needs a running event loop)."""
+        if self._background is None or self._background.done():
+            self._background = asyncio.ensure_future(self._refresh_loop())
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh()
+
+    async def stop(self):
+        if self._background is not None:
+            self._background.cancel()
+            self._background = None
+
+
+# Global organization index instance
+organization_index = OrganizationIndex()
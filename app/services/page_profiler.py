@@ -0,0 +1,377 @@
+"""
+Page build profiler for Dompell Africa
+Opt-in (PAGE_PROFILE=1) instrumentation of page builds. Every @ui.page
+handler is wrapped to record, per route:
+
+- build time (until the page function returns, awaits included),
+- elements created (from the client's element id counter),
+- bytes sent to the browser: the initial HTML response and websocket
+  messages to clients of the route afterwards,
+- backend calls made while building (via api_metrics observers).
+
+Dashboard sections decorated with @profile_section (the render_* functions)
+get their build time and element count recorded per route as well, whether
+they run during the page build or later, e.g. when a sidebar item is
+clicked. With profiling off, profile_section returns the function unchanged
+and nothing is patched.
+
+Builds over their budget are logged. Budgets default to PAGE_BUDGET_MS and
+PAGE_BUDGET_ELEMENTS and can be set per route in PAGE_BUDGETS
+("/candidates/dashboard=1500:4000,/jobs=300:800"; ms:elements). The report is
+served on /metrics/pages and saved to PAGE_PROFILE_REPORT on shutdown;
+
+    python -m app.services.page_profiler [report.json]
+
+prints a saved report and exits with status 1 if a route's p95 build time or
+peak element count is over budget (for CI).
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable, List, Tuple
+from app.config import PAGE_PROFILE, PAGE_BUDGET_MS, PAGE_BUDGET_ELEMENTS, PAGE_BUDGETS, PAGE_PROFILE_REPORT
+from app.services.log import get_logger
+
+log = get_logger('PAGE_PROFILE')
+
+REPORT_PATH = '/metrics/pages'
+# Build times kept per route for the percentiles
+SAMPLES = 500
+
+
+def parse_budgets(text: str) -> Dict[str, Tuple[float, int]]:
+    """'/jobs=300:800,...' -> {'/jobs': (300.0, 800)}; a missing part takes the default."""
+    budgets = {}
+    for item in filter(None, (part.strip() for part in text.split(','))):
+        path, _, limits = item.partition('=')
+        ms, _, elements = limits.partition(':')
+        budgets[path.strip()] = (float(ms) if ms.strip() else PAGE_BUDGET_MS,
+                                 int(elements) if elements.strip() else PAGE_BUDGET_ELEMENTS)
+    return budgets
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class PageBuild:
+    """A page build in progress (held in a context variable)."""
+
+    __slots__ = ('route', 'client', 'calls', 'api_seconds')
+
+    def __init__(self, route: str, client: Any):
+        self.route = route
+        self.client = client
+        self.calls = 0
+        self.api_seconds = 0.0
+
+
+class RouteStats:
+    """Aggregated builds of one route."""
+
+    def __init__(self):
+        self.builds = 0
+        self.errors = 0
+        self.over_budget = 0
+        self.build_ms: deque = deque(maxlen=SAMPLES)
+        self.elements_total = 0
+        self.elements_max = 0
+        self.calls = 0
+        self.api_seconds = 0.0
+        self.html_responses = 0
+        self.html_bytes = 0
+        self.ws_messages = 0
+        self.ws_bytes = 0
+        # section name -> [runs, total ms, max ms, total elements]
+        self.sections: Dict[str, list] = {}
+
+
+_current: contextvars.ContextVar[Optional[PageBuild]] = contextvars.ContextVar('page_build', default=None)
+
+
+class PageProfiler:
+    """Collects RouteStats and checks them against the budgets."""
+
+    def __init__(self, budgets: str = PAGE_BUDGETS):
+        self.budgets = parse_budgets(budgets)
+        self.routes: Dict[str, RouteStats] = {}
+        self._lock = threading.Lock()
+        self._installed = False
+
+    def budget(self, route: str) -> Tuple[float, int]:
+        return self.budgets.get(route, (PAGE_BUDGET_MS, PAGE_BUDGET_ELEMENTS))
+
+    def _stats(self, route: str) -> RouteStats:
+        stats = self.routes.get(route)
+        if stats is None:
+            stats = self.routes[route] = RouteStats()
+        return stats
+
+    # ----- recording -----
+
+    def wrap_page(self, route: str, func: Callable) -> Callable:
+        """Page function that records its builds under route (signature preserved)."""
+        from nicegui import context
+
+        def start() -> tuple:
+            client = context.client
+            build = PageBuild(route, client)
+            return build, _current.set(build), client.next_element_id, time.perf_counter()
+
+        def finish(build: PageBuild, token, first_element: int, started: float, failed: bool):
+            _current.reset(token)
+            self.record_build(build, (time.perf_counter() - started) * 1000,
+                              build.client.next_element_id - first_element, failed)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def page(*args, **kwargs):
+                build, token, first_element, started = start()
+                failed = True
+                try:
+                    result = await func(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    finish(build, token, first_element, started, failed)
+        else:
+            @functools.wraps(func)
+            def page(*args, **kwargs):
+                build, token, first_element, started = start()
+                failed = True
+                try:
+                    result = func(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    finish(build, token, first_element, started, failed)
+        return page
+
+    def record_build(self, build: PageBuild, ms: float, elements: int, failed: bool = False):
+        budget_ms, budget_elements = self.budget(build.route)
+        over = ms > budget_ms or elements > budget_elements
+        with self._lock:
+            stats = self._stats(build.route)
+            stats.builds += 1
+            stats.errors += failed
+            stats.over_budget += over
+            stats.build_ms.append(ms)
+            stats.elements_total += elements
+            stats.elements_max = max(stats.elements_max, elements)
+            stats.calls += build.calls
+            stats.api_seconds += build.api_seconds
+        if over:
+            log.warning('%s took %.0fms and created %s elements (budget %.0fms / %s elements)',
+                        build.route, ms, elements, budget_ms, budget_elements)
+
+    def section(self, func: Callable) -> Callable:
+        """Decorator for render_* section functions."""
+        from nicegui import context
+
+        name = func.__name__
+
+        def client_of():
+            build = _current.get()
+            if build is not None:
+                return build.client
+            try:
+                return context.client
+            except RuntimeError:
+                return None
+
+        def record(client, first_element: int, started: float):
+            ms = (time.perf_counter() - started) * 1000
+            elements = client.next_element_id - first_element
+            with self._lock:
+                entry = self._stats(client.page.path).sections.setdefault(name, [0, 0.0, 0.0, 0])
+                entry[0] += 1
+                entry[1] += ms
+                entry[2] = max(entry[2], ms)
+                entry[3] += elements
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def run(*args, **kwargs):
+                client = client_of()
+                if client is None:
+                    return await func(*args, **kwargs)
+                first_element, started = client.next_element_id, time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    record(client, first_element, started)
+        else:
+            @functools.wraps(func)
+            def run(*args, **kwargs):
+                client = client_of()
+                if client is None:
+                    return func(*args, **kwargs)
+                first_element, started = client.next_element_id, time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    record(client, first_element, started)
+        return run
+
+    def _backend_call(self, client: str, method: str, endpoint: str, seconds: float):
+        build = _current.get()
+        if build is not None:
+            build.calls += 1
+            build.api_seconds += seconds
+
+    def _sent(self, route: str, size: int, html: bool):
+        with self._lock:
+            stats = self._stats(route)
+            if html:
+                stats.html_responses += 1
+                stats.html_bytes += size
+            else:
+                stats.ws_messages += 1
+                stats.ws_bytes += size
+
+    # ----- installation -----
+
+    def install(self):
+        """Wrap page handlers registered from now on and count what is sent to the browser."""
+        from nicegui import app
+        from nicegui.client import Client
+        from nicegui.outbox import Outbox
+        from nicegui.page import page
+        from app.services.api_metrics import api_metrics
+
+        if self._installed:
+            return
+        profiler = self
+        register = page.__call__
+
+        def __call__(self, func):
+            register(self, profiler.wrap_page(self.path, func))
+            # ui.navigate.to(func) looks the route up by the undecorated function
+            Client.page_routes[func] = self.path
+            return func
+
+        build_response = Client.build_response
+
+        def build_response_measured(self, request, status_code: int = 200):
+            response = build_response(self, request, status_code)
+            profiler._sent(self.page.path, len(getattr(response, 'body', b'')), html=True)
+            return response
+
+        emit = Outbox._emit
+
+        async def emit_measured(self, message):
+            client = self.client
+            if client is not None:
+                profiler._sent(client.page.path, len(json.dumps(message[2], default=str)), html=False)
+            await emit(self, message)
+
+        page.__call__ = __call__
+        Client.build_response = build_response_measured
+        Outbox._emit = emit_measured
+        api_metrics.observers.append(self._backend_call)
+        app.on_shutdown(lambda: self.save())
+        self._installed = True
+        log.info('Profiling page builds (report on %s)', REPORT_PATH)
+
+    # ----- reporting -----
+
+    def report(self) -> Dict[str, Any]:
+        """Per-route summary, slowest p95 first."""
+        routes = {}
+        with self._lock:
+            for route, stats in self.routes.items():
+                builds = stats.builds
+                samples = list(stats.build_ms)
+                budget_ms, budget_elements = self.budget(route)
+                routes[route] = {
+                    'builds': builds,
+                    'errors': stats.errors,
+                    'over_budget': stats.over_budget,
+                    'p50_ms': round(_percentile(samples, 0.5), 1),
+                    'p95_ms': round(_percentile(samples, 0.95), 1),
+                    'max_ms': round(max(samples, default=0.0), 1),
+                    'avg_elements': round(stats.elements_total / builds, 1) if builds else 0,
+                    'max_elements': stats.elements_max,
+                    'avg_backend_calls': round(stats.calls / builds, 2) if builds else 0,
+                    'backend_ms': round(stats.api_seconds * 1000, 1),
+                    'avg_html_bytes': stats.html_bytes // stats.html_responses if stats.html_responses else 0,
+                    'ws_messages': stats.ws_messages,
+                    'ws_bytes': stats.ws_bytes,
+                    'budget_ms': budget_ms,
+                    'budget_elements': budget_elements,
+                    'sections': {name: {'runs': runs, 'avg_ms': round(total / runs, 1), 'max_ms': round(peak, 1),
+                                        'avg_elements': round(elements / runs, 1)}
+                                 for name, (runs, total, peak, elements) in stats.sections.items()},
+                }
+        return dict(sorted(routes.items(), key=lambda item: -item[1]['p95_ms']))
+
+    def save(self, path: str = PAGE_PROFILE_REPORT):
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            Path(path).write_text(json.dumps(self.report(), indent=2), encoding='utf-8')
+            log.info('Saved page profile to %s', path)
+        except OSError as e:
+            log.warning('Could not save page profile: %s', e)
+
+    def register_route(self, path: str = REPORT_PATH):
+        """Serve the report as a text table on the NiceGUI app."""
+        from fastapi.responses import PlainTextResponse
+        from nicegui import app
+
+        @app.get(path, include_in_schema=False)
+        def page_profile():
+            return PlainTextResponse(format_report(self.report()))
+
+
+def over_budget(report: Dict[str, Any]) -> List[str]:
+    """Routes whose p95 build time or peak element count exceeds the budget."""
+    return [route for route, row in report.items()
+            if row['p95_ms'] > row['budget_ms'] or row['max_elements'] > row['budget_elements']]
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    over = set(over_budget(report))
+    lines = [f"{'route':<40} {'builds':>6} {'p50ms':>7} {'p95ms':>7} {'elements':>9} {'calls':>6} "
+             f"{'html KB':>8} {'ws KB':>8}  budget"]
+    for route, row in report.items():
+        lines.append(
+            f"{route:<40} {row['builds']:>6} {row['p50_ms']:>7.0f} {row['p95_ms']:>7.0f} {row['max_elements']:>9} "
+            f"{row['avg_backend_calls']:>6.1f} {row['avg_html_bytes'] / 1024:>8.1f} {row['ws_bytes'] / 1024:>8.1f}  "
+            f"{row['budget_ms']:.0f}ms/{row['budget_elements']}{' OVER' if route in over else ''}")
+        for name, section in sorted(row['sections'].items(), key=lambda item: -item[1]['max_ms']):
+            lines.append(f"    {name:<36} {section['runs']:>6} {section['avg_ms']:>7.0f} {section['max_ms']:>7.0f} "
+                         f"{section['avg_elements']:>9.0f}")
+    return '\n'.join(lines) + '\n'
+
+
+# Global page profiler instance
+page_profiler = PageProfiler()
+
+
+def profile_section(func: Callable) -> Callable:
+    """Record a render_* section's build time and elements (no-op unless PAGE_PROFILE=1)."""
+    return page_profiler.section(func) if PAGE_PROFILE else func
+
+
+def main(argv: List[str]) -> int:
+    path = argv[0] if argv else PAGE_PROFILE_REPORT
+    report = json.loads(Path(path).read_text(encoding='utf-8'))
+    print(format_report(report), end='')
+    over = over_budget(report)
+    if over:
+        print(f"{len(over)} route(s) over budget: {', '.join(over)}")
+    return 1 if over else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
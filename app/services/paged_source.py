@@ -0,0 +1,135 @@
+"""
+Cursor-paginated data source for Dompell Africa
+Holds only the current window of a result set plus the adjacent windows,
+which are prefetched in the background so next/prev usually resolve without
+waiting. Windows are addressed by opaque cursors rather than offsets, so the
+order stays stable when records are added or removed between page turns.
+
+fetch(after, before, limit) returns a page dict:
+    {'items': [...], 'total': int, 'offset': int,
+     'next': cursor or None, 'prev': cursor or None}
+and may be a plain function or a coroutine function.
+"""
+
+import asyncio
+import inspect
+from typing import Dict, Any, Optional, Callable
+from app.services.log import get_logger
+
+log = get_logger('PAGED_SOURCE')
+
+DEFAULT_PAGE_SIZE = 20
+
+EMPTY_PAGE = {'items': [], 'total': 0, 'offset': 0, 'next': None, 'prev': None}
+
+
+class PagedSource:
+    """Current window of a cursor-paginated result set with adjacent-page prefetch."""
+
+    def __init__(self, fetch: Callable[..., Any], page_size: int = DEFAULT_PAGE_SIZE):
+        self.fetch = fetch
+        self.page_size = page_size
+        self.page: Dict[str, Any] = dict(EMPTY_PAGE)
+        # ('after' | 'before', cursor) -> prefetched page or in-flight task
+        self._adjacent: Dict[tuple, Any] = {}
+        self._generation = 0
+        self.prefetch_hits = 0
+
+    @property
+    def items(self):
+        return self.page['items']
+
+    @property
+    def total(self) -> int:
+        return self.page['total']
+
+    @property
+    def number(self) -> int:
+        """1-based number of the current page."""
+        return self.page['offset'] // self.page_size + 1
+
+    @property
+    def pages(self) -> int:
+        return max((self.total + self.page_size - 1) // self.page_size, 1)
+
+    @property
+    def has_next(self) -> bool:
+        return self.page['next'] is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.page['prev'] is not None
+
+    async def first(self) -> Dict[str, Any]:
+        """Drop all windows (the query changed) and load the first page."""
+        self._generation += 1
+        self._cancel_prefetch()
+        return await self._show(await self._fetch(None, None))
+
+    async def next(self) -> Dict[str, Any]:
+        if not self.has_next:
+            return self.page
+        return await self._show(await self._adjacent_page('after', self.page['next']))
+
+    async def prev(self) -> Dict[str, Any]:
+        if not self.has_prev:
+            return self.page
+        return await self._show(await self._adjacent_page('before', self.page['prev']))
+
+    async def _fetch(self, after: Any, before: Any) -> Dict[str, Any]:
+        page = self.fetch(after, before, self.page_size)
+        if inspect.isawaitable(page):
+            page = await page
+        return page or dict(EMPTY_PAGE)
+
+    async def _adjacent_page(self, direction: str, cursor: Any) -> Dict[str, Any]:
+        page = self._adjacent.get((direction, cursor))
+        if isinstance(page, asyncio.Future):
+            page = await asyncio.shield(page)
+        if page is None:
+            # Not prefetched (or the prefetch failed)
+            return await self._fetch(cursor if direction == 'after' else None,
+                                     cursor if direction == 'before' else None)
+        self.prefetch_hits += 1
+        return page
+
+    async def _show(self, page: Dict[str, Any]) -> Dict[str, Any]:
+        self.page = page
+        self._prefetch()
+        return page
+
+    def _prefetch(self):
+        """Keep exactly the windows next to the current one."""
+        wanted = set()
+        if self.has_next:
+            wanted.add(('after', self.page['next']))
+        if self.has_prev:
+            wanted.add(('before', self.page['prev']))
+        for key in [key for key in self._adjacent if key not in wanted]:
+            pending = self._adjacent.pop(key)
+            if isinstance(pending, asyncio.Future):
+                pending.cancel()
+        for key in wanted - set(self._adjacent):
+            self._adjacent[key] = asyncio.ensure_future(self._prefetch_one(key, self._generation))
+
+    async def _prefetch_one(self, key: tuple, generation: int) -> Optional[Dict[str, Any]]:
+        direction, cursor = key
+        try:
+            page = await self._fetch(cursor if direction == 'after' else None,
+                                     cursor if direction == 'before' else None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.warning('Prefetch failed: %s', e)
+            self._adjacent.pop(key, None)
+            return None
+        if generation == self._generation and key in self._adjacent:
+            # Done: keep the page itself rather than the finished task
+            self._adjacent[key] = page
+        return page
+
+    def _cancel_prefetch(self):
+        for pending in self._adjacent.values():
+            if isinstance(pending, asyncio.Future):
+                pending.cancel()
+        self._adjacent = {}
@@ -0,0 +1,267 @@
+"""
+Read-through response cache for Dompell Africa API GET endpoints
+Entries are bounded by an LRU size limit, expire after a per-endpoint TTL and
+are revalidated with If-None-Match / If-Modified-Since when the backend sent
+validators. Successful mutating calls invalidate the tags they affect.
+
+Expired entries are kept for API_STALE_MAX_AGE seconds more: while the
+backend fails (or its circuit is open, see circuit_breaker) a GET gets the
+stale copy, marked with a 'Warning: 110' header, instead of an error.
+"""
+
+import copy
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Dict, Any, Optional, Tuple, List
+import httpx
+from requests.structures import CaseInsensitiveDict
+from app.config import API_STALE_MAX_AGE
+
+MAX_ENTRIES = 1024
+STALE_WARNING = '110 - "Response is Stale"'
+
+# (endpoint pattern, TTL in seconds, tags, shared across users)
+# Shared entries are keyed without the caller's token because the payload is
+# the same for everyone; all other entries are scoped to the caller's token.
+CACHE_RULES = [
+    (r'^/organization$', 300, ('organizations',), True),
+    (r'^/organization/programs/[^/]+$', 120, ('programs',), True),
+    (r'^/organization/[^/]+$', 300, ('organizations',), True),
+    (r'^/programs/(new|upcoming)/?[^/]+$', 120, ('programs',), False),
+    (r'^/employer$', 300, ('employers',), True),
+    (r'^/employer/[^/]+$', 300, ('employers',), True),
+    (r'^/users/all$', 60, ('users',), False),
+    (r'^/users/[^/]+$', 60, ('users',), False),
+    (r'^/trainee(/.*)?$', 60, ('trainee',), False),
+]
+
+# (endpoint pattern, tags invalidated by a successful POST/PATCH/DELETE)
+# User profiles embed the trainee profile, so trainee writes also drop 'users'.
+INVALIDATION_RULES = [
+    (r'^/users/', ('users',)),
+    (r'^/trainee/', ('trainee', 'users')),
+    (r'^/organization/', ('organizations', 'programs')),
+    (r'^/programs/', ('programs',)),
+    (r'^/employer/', ('employers',)),
+]
+
+# Endpoints served stale in the current context (see collect_stale)
+_stale_notes: ContextVar[Optional[List[str]]] = ContextVar('stale_notes', default=None)
+
+_compiled_cache_rules = [(re.compile(p), ttl, tags, shared) for p, ttl, tags, shared in CACHE_RULES]
+_compiled_invalidation_rules = [(re.compile(p), tags) for p, tags in INVALIDATION_RULES]
+
+
+def _auth_scope(token: Optional[str]) -> str:
+    if not token:
+        return 'anonymous'
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+class CacheEntry:
+    """A cached response with its expiry, validators and tags."""
+
+    __slots__ = ('response', 'expires_at', 'ttl', 'etag', 'last_modified', 'tags')
+
+    def __init__(self, response: Any, ttl: float, tags: Tuple[str, ...]):
+        self.response = response
+        self.ttl = ttl
+        self.expires_at = time.monotonic() + ttl
+        self.etag = response.headers.get('ETag')
+        self.last_modified = response.headers.get('Last-Modified')
+        self.tags = tags
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def can_revalidate(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def can_serve_stale(self) -> bool:
+        return time.monotonic() - self.expires_at < API_STALE_MAX_AGE
+
+
+def _stale_copy(response: Any) -> Any:
+    """Copy of a cached response carrying the stale warning (the cached one stays unmarked)."""
+    if isinstance(response, httpx.Response):
+        headers = httpx.Headers(response.headers)
+        # The body is already decoded
+        for name in ('Content-Encoding', 'Content-Length'):
+            headers.pop(name, None)
+        headers['Warning'] = STALE_WARNING
+        return httpx.Response(response.status_code, headers=headers, content=response.content,
+                              request=response.request)
+    stale = copy.copy(response)
+    stale.headers = CaseInsensitiveDict(response.headers)
+    stale.headers['Warning'] = STALE_WARNING
+    return stale
+
+
+def is_stale(response: Any) -> bool:
+    """Whether a response is a stale copy served in place of a failed request."""
+    return response is not None and response.headers.get('Warning') == STALE_WARNING
+
+
+def collect_stale() -> List[str]:
+    """Start noting the endpoints served stale in this context (and tasks it starts); returns the list."""
+    notes: List[str] = []
+    _stale_notes.set(notes)
+    return notes
+
+
+def note_stale(endpoint: str, response: Any) -> Any:
+    """Pass response through, noting it for collect_stale() if it is a stale copy."""
+    if is_stale(response):
+        notes = _stale_notes.get()
+        if notes is not None:
+            notes.append(endpoint)
+    return response
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of GET responses shared by ApiService and AsyncApiService."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.enabled = True
+        self._entries: 'OrderedDict[tuple, CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.stale_served = 0
+
+    @staticmethod
+    def _match(endpoint: str):
+        for pattern, ttl, tags, shared in _compiled_cache_rules:
+            if pattern.match(endpoint):
+                return ttl, tags, shared
+        return None
+
+    def scope_for(self, endpoint: str, token: Optional[str]) -> str:
+        """Auth scope of a GET: 'shared' for user-independent endpoints, else a token digest."""
+        rule = self._match(endpoint)
+        if rule is not None and rule[2]:
+            return 'shared'
+        return _auth_scope(token)
+
+    def _key(self, endpoint: str, params: Optional[Dict], token: Optional[str], shared: bool,
+             flavor: str) -> tuple:
+        # requests and httpx responses are not interchangeable, hence the flavor
+        frozen_params = tuple(sorted((params or {}).items()))
+        return (flavor, endpoint, frozen_params, 'shared' if shared else _auth_scope(token))
+
+    def lookup(self, endpoint: str, params: Optional[Dict], token: Optional[str],
+               flavor: str = 'sync') -> Optional[CacheEntry]:
+        """Return the entry for a GET (fresh or awaiting revalidation), or None."""
+        if not self.enabled:
+            return None
+        rule = self._match(endpoint)
+        if rule is None:
+            return None
+        key = self._key(endpoint, params, token, rule[2], flavor)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.is_fresh():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            if not entry.can_revalidate():
+                self.misses += 1
+                if not entry.can_serve_stale():
+                    del self._entries[key]
+                    return None
+            # Expired: to be revalidated or refetched, and served stale if that fails
+            return entry
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry], headers: Optional[Dict]) -> Optional[Dict]:
+        """Add If-None-Match / If-Modified-Since for a stale entry."""
+        if entry is None or entry.is_fresh():
+            return headers
+        hdrs = dict(headers or {})
+        if entry.etag:
+            hdrs['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            hdrs['If-Modified-Since'] = entry.last_modified
+        return hdrs
+
+    def store(self, endpoint: str, params: Optional[Dict], token: Optional[str],
+              response: Any, entry: Optional[CacheEntry] = None, flavor: str = 'sync') -> Any:
+        """Record a GET response and return what the caller should see."""
+        if response is None:
+            return response
+        rule = self._match(endpoint)
+        if rule is None:
+            return response
+        ttl, tags, shared = rule
+        key = self._key(endpoint, params, token, shared, flavor)
+        with self._lock:
+            if response.status_code == 304 and entry is not None:
+                # Not modified: keep the cached body and extend its lifetime
+                entry.expires_at = time.monotonic() + entry.ttl
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                self.revalidations += 1
+                return entry.response
+            if 200 <= response.status_code < 300:
+                self._entries[key] = CacheEntry(response, ttl, tags)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            elif response.status_code < 500 and response.status_code != 429:
+                # Gone or forbidden now; a server failure keeps the entry as the stale fallback
+                self._entries.pop(key, None)
+        return response
+
+    def stale_fallback(self, endpoint: str, entry: Optional[CacheEntry]) -> Optional[Any]:
+        """Marked copy of entry's response to serve while the backend fails, or None."""
+        if entry is None or not entry.can_serve_stale():
+            return None
+        with self._lock:
+            self.stale_served += 1
+        return _stale_copy(entry.response)
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """Drop every entry carrying any of the given tags. Returns the count removed."""
+        wanted = set(tags)
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if wanted.intersection(entry.tags)]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def invalidate_for(self, endpoint: str) -> int:
+        """Invalidate the tags affected by a successful mutation of an endpoint."""
+        tags = set()
+        for pattern, rule_tags in _compiled_invalidation_rules:
+            if pattern.match(endpoint):
+                tags.update(rule_tags)
+        return self.invalidate_tags(*tags) if tags else 0
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            size = len(self._entries)
+        return {
+            'size': size,
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidations': self.revalidations,
+            'stale_served': self.stale_served,
+        }
+
+
+# Global response cache instance
+response_cache = ResponseCache()
@@ -0,0 +1,118 @@
+"""
+Lazy page route registry for Dompell Africa
+Pages are declared as a route table (path -> 'module:function' plus layout)
+and registered as @ui.page handlers that import the page module on first hit,
+so starting the server no longer imports every page. Page modules can be
+preloaded in a background thread once the server is up.
+"""
+
+import importlib
+import inspect
+import threading
+import time
+from typing import Dict, Any, Optional, Callable, List, Iterable
+from nicegui import ui
+from app.components.header import header as render_header
+from app.components.footer import footer as render_footer
+from app.services.log import get_logger
+
+log = get_logger('ROUTES')
+
+
+class Route:
+    """One page route: URL path, page function target and layout."""
+
+    def __init__(self, path: str, target: str, header: bool = True, footer: bool = True,
+                 nav: str = ''):
+        self.path = path
+        self.target = target
+        self.header = header
+        self.footer = footer
+        # Path highlighted in the header navigation
+        self.nav = nav
+
+    def __repr__(self) -> str:
+        return f"Route({self.path!r} -> {self.target!r})"
+
+
+class RouteRegistry:
+    """Registers lazy page handlers and keeps track of loaded page modules."""
+
+    def __init__(self):
+        self.routes: Dict[str, Route] = {}
+        self.load_times: Dict[str, float] = {}
+        self._functions: Dict[str, Callable] = {}
+        self._preloader: Optional[threading.Thread] = None
+
+    def add(self, routes: Iterable[Route]):
+        """Add routes; a later route for the same path replaces the earlier one."""
+        for route in routes:
+            self.routes[route.path] = route
+        return self
+
+    def register(self):
+        """Create a @ui.page handler for every route in the table."""
+        for route in self.routes.values():
+            ui.page(route.path)(self._handler(route))
+        log.info('Registered %s lazy page route(s)', len(self.routes))
+
+    def _handler(self, route: Route) -> Callable:
+        async def page():
+            page_function = self.load(route.target)
+            if route.header:
+                render_header(route.nav)
+            result = page_function()
+            if inspect.isawaitable(result):
+                await result
+            if route.footer:
+                render_footer()
+
+        # NiceGUI keys page routes by function, so each route needs its own
+        page.__name__ = f"page_{route.path.strip('/').replace('/', '_').replace('-', '_') or 'index'}"
+        return page
+
+    def load(self, target: str) -> Callable:
+        """Import 'package.module:function' (once) and return the function."""
+        function = self._functions.get(target)
+        if function is not None:
+            return function
+        # importlib serializes imports per module, so a page being preloaded by
+        # the background thread is simply waited for rather than imported twice
+        module_name, _, attribute = target.partition(':')
+        start = time.perf_counter()
+        function = getattr(importlib.import_module(module_name), attribute)
+        if target not in self._functions:
+            self._functions[target] = function
+            self.load_times[target] = elapsed = (time.perf_counter() - start) * 1000
+            log.info('Loaded %s in %.1fms', module_name, elapsed)
+        return function
+
+    def preload(self, targets: Optional[List[str]] = None, delay: float = 0.0):
+        """Import page modules in a daemon thread so first hits skip the import."""
+        if self._preloader is not None and self._preloader.is_alive():
+            return
+        targets = targets or [route.target for route in self.routes.values()]
+
+        def run():
+            if delay:
+                time.sleep(delay)
+            for target in targets:
+                try:
+                    self.load(target)
+                except Exception as e:
+                    log.warning('Preloading %s failed: %s', target, e)
+            log.info('Preloaded %s page function(s)', len(self._functions))
+
+        self._preloader = threading.Thread(target=run, name='page-preloader', daemon=True)
+        self._preloader.start()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'routes': len(self.routes),
+            'loaded': len(self._functions),
+            'load_ms': dict(self.load_times),
+        }
+
+
+# Global route registry instance
+route_registry = RouteRegistry()
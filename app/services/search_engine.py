@@ -0,0 +1,335 @@
+"""
+Full-text search engine for Dompell Africa
+An in-process inverted index with BM25 ranking over small structured
+documents (title, subtitle, location, tags, body). Query words are expanded
+with prefix matches (for the word being typed) and single-edit spelling
+variants, and results carry an HTML snippet with the matched words marked.
+Documents can be added, replaced and removed one at a time.
+"""
+
+import bisect
+import heapq
+import html
+import math
+import re
+from collections import Counter
+from typing import Dict, Any, Optional, List, Iterable, Set, Tuple
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+# Term frequency weight of a word per field (a simple BM25F)
+FIELD_WEIGHTS = {'title': 3.0, 'tags': 2.0, 'subtitle': 1.5, 'location': 1.0, 'body': 1.0}
+# Score multipliers for expanded query words
+PREFIX_WEIGHT = 0.8
+TYPO_WEIGHT = 0.6
+# Prefix expansion keeps the most common completions only
+MAX_PREFIX_TERMS = 32
+# Fields that can be filtered on through indexed value -> ids sets
+FACET_FIELDS = ('kind', 'location')
+# Words shorter than this are only matched exactly (or as a prefix)
+MIN_TYPO_LENGTH = 4
+SNIPPET_WORDS = 28
+
+_WORD = re.compile(r'[A-Za-z0-9]+')
+
+
+def tokenize(text: Any) -> List[str]:
+    if not text:
+        return []
+    if isinstance(text, (list, tuple, set)):
+        text = ' '.join(str(item) for item in text)
+    return [word.lower() for word in _WORD.findall(str(text))]
+
+
+def _deletes(word: str) -> Set[str]:
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """True if a and b differ by one insertion, deletion, substitution or swap."""
+    if a == b:
+        return True
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+    if la == lb:
+        diff = [i for i in range(la) if a[i] != b[i]]
+        if len(diff) == 1:
+            return True
+        return (len(diff) == 2 and diff[1] == diff[0] + 1
+                and a[diff[0]] == b[diff[1]] and a[diff[1]] == b[diff[0]])
+    if la > lb:
+        a, b = b, a
+    # b is one longer: skipping one of its characters must give a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    return a[i:] == b[i + 1:]
+
+
+class SearchEngine:
+    """BM25-ranked inverted index with prefix and typo-tolerant matching."""
+
+    def __init__(self):
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._doc_terms: Dict[str, Dict[str, float]] = {}
+        self._doc_lengths: Dict[str, float] = {}
+        self._total_length = 0.0
+        self._postings: Dict[str, Dict[str, float]] = {}
+        # Single-deletion variants of every indexed word (SymSpell-style)
+        self._typo_variants: Dict[str, Set[str]] = {}
+        self._sorted_terms: Optional[List[str]] = None
+        self._facets: Dict[str, Dict[Any, Set[str]]] = {field: {} for field in FACET_FIELDS}
+        # term -> {doc id: BM25 score}; depends on corpus statistics, so any change clears it
+        self._impact_cache: Dict[str, Dict[str, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._docs
+
+    def get(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        return self._docs.get(doc_id)
+
+    def documents(self) -> Iterable[Dict[str, Any]]:
+        return self._docs.values()
+
+    # ----- indexing -----
+
+    def add(self, doc: Dict[str, Any]):
+        """Index doc (a dict with an 'id'), replacing any document with that id."""
+        doc_id = doc['id']
+        if doc_id in self._docs:
+            self.remove(doc_id)
+        terms: Dict[str, float] = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(doc.get(field)):
+                terms[term] = terms.get(term, 0.0) + weight
+        self._docs[doc_id] = doc
+        self._doc_terms[doc_id] = terms
+        self._impact_cache.clear()
+        for field in FACET_FIELDS:
+            self._facets[field].setdefault(doc.get(field), set()).add(doc_id)
+        length = sum(terms.values())
+        self._doc_lengths[doc_id] = length
+        self._total_length += length
+        for term, frequency in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._add_variants(term)
+            postings[doc_id] = frequency
+
+    def remove(self, doc_id: str):
+        if doc_id not in self._docs:
+            return
+        doc = self._docs.pop(doc_id)
+        self._impact_cache.clear()
+        for field in FACET_FIELDS:
+            docs = self._facets[field].get(doc.get(field))
+            if docs is not None:
+                docs.discard(doc_id)
+                if not docs:
+                    del self._facets[field][doc.get(field)]
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                self._remove_variants(term)
+
+    def clear(self):
+        self.__init__()
+
+    def _add_variants(self, term: str):
+        self._sorted_terms = None
+        if len(term) >= MIN_TYPO_LENGTH:
+            for variant in _deletes(term):
+                self._typo_variants.setdefault(variant, set()).add(term)
+
+    def _remove_variants(self, term: str):
+        self._sorted_terms = None
+        if len(term) >= MIN_TYPO_LENGTH:
+            for variant in _deletes(term):
+                terms = self._typo_variants.get(variant)
+                if terms is not None:
+                    terms.discard(term)
+                    if not terms:
+                        del self._typo_variants[variant]
+
+    # ----- query expansion -----
+
+    def _prefix_terms(self, prefix: str) -> List[str]:
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        start = bisect.bisect_left(self._sorted_terms, prefix)
+        end = bisect.bisect_left(self._sorted_terms, prefix + '\uffff', start)
+        terms = self._sorted_terms[start:end]
+        if len(terms) > MAX_PREFIX_TERMS:
+            terms = heapq.nlargest(MAX_PREFIX_TERMS, terms, key=lambda t: len(self._postings[t]))
+        return terms
+
+    def _typo_terms(self, word: str) -> Set[str]:
+        if len(word) < MIN_TYPO_LENGTH:
+            return set()
+        candidates = set(self._typo_variants.get(word, ()))
+        for variant in _deletes(word):
+            if variant in self._postings:
+                candidates.add(variant)
+            candidates.update(self._typo_variants.get(variant, ()))
+        return {term for term in candidates if term != word and _within_one_edit(word, term)}
+
+    def expand(self, query: str) -> List[Dict[str, float]]:
+        """For each query word, the indexed terms it matches and their weights."""
+        words = tokenize(query)
+        expansions = []
+        for i, word in enumerate(words):
+            terms: Dict[str, float] = {}
+            if word in self._postings:
+                terms[word] = 1.0
+            if i == len(words) - 1:
+                # The last word may still be being typed
+                for term in self._prefix_terms(word):
+                    terms.setdefault(term, PREFIX_WEIGHT)
+            if word not in self._postings:
+                for term in self._typo_terms(word):
+                    terms.setdefault(term, TYPO_WEIGHT)
+            expansions.append(terms)
+        return expansions
+
+    # ----- search -----
+
+    def _impacts(self, term: str) -> Dict[str, float]:
+        """BM25 score of term for every document containing it (cached until the index changes)."""
+        impacts = self._impact_cache.get(term)
+        if impacts is None:
+            n = len(self._docs)
+            df = len(self._postings[term])
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            average_length = self._total_length / n if n else 1.0
+            lengths = self._doc_lengths
+            impacts = self._impact_cache[term] = {
+                doc_id: idf * frequency * (K1 + 1) / (frequency + K1 * (1 - B + B * lengths[doc_id] / average_length))
+                for doc_id, frequency in self._postings[term].items()
+            }
+        return impacts
+
+    def _word_scores(self, terms: Dict[str, float]) -> Dict[str, float]:
+        """Best score per document over the terms one query word expanded to."""
+        if len(terms) == 1:
+            (term, weight), = terms.items()
+            impacts = self._impacts(term)
+            return impacts if weight == 1.0 else {doc_id: score * weight for doc_id, score in impacts.items()}
+        best: Dict[str, float] = {}
+        for term, weight in sorted(terms.items(), key=lambda item: -item[1]):
+            for doc_id, score in self._impacts(term).items():
+                score *= weight
+                if score > best.get(doc_id, 0.0):
+                    best[doc_id] = score
+        return best
+
+    def _allowed(self, where: Optional[Dict[str, Any]]) -> Optional[Set[str]]:
+        """Ids of documents matching every filter in where (None: no filter)."""
+        allowed = None
+        for field, value in (where or {}).items():
+            if value is None:
+                continue
+            if field in FACET_FIELDS:
+                docs = self._facets[field].get(value, set())
+            else:
+                docs = {doc_id for doc_id, doc in self._docs.items() if doc.get(field) == value}
+            allowed = docs if allowed is None else allowed & docs
+        return allowed
+
+    def search(self, query: str, limit: int = 20, offset: int = 0,
+               where: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Rank documents for query.
+
+        where filters on exact document fields, e.g. {'kind': 'job'}. Documents
+        matching more of the query words always rank above those matching
+        fewer. Returns {'total', 'hits': [{'doc', 'score', 'snippet', 'title'}]}.
+        """
+        allowed = self._allowed(where)
+        expansions = self.expand(query)
+        if not expansions:
+            doc_ids = [doc_id for doc_id in self._docs if allowed is None or doc_id in allowed]
+            return {'total': len(doc_ids),
+                    'hits': [self._hit(self._docs[doc_id], 0.0, set()) for doc_id in doc_ids[offset:offset + limit]]}
+
+        word_scores = [self._word_scores(terms) for terms in expansions if terms]
+        if len(word_scores) == 1:
+            scores = word_scores[0]
+            rank_key = scores.__getitem__
+        else:
+            scores = {}
+            matched_words: Counter = Counter()
+            for best in word_scores:
+                matched_words.update(best.keys())
+                for doc_id, score in best.items():
+                    scores[doc_id] = scores.get(doc_id, 0.0) + score
+            rank_key = lambda doc_id: (matched_words[doc_id], scores[doc_id])
+
+        candidates = scores.keys() if allowed is None else scores.keys() & allowed
+        ranked = heapq.nlargest(offset + limit, candidates, key=rank_key)
+        highlight_terms = set().union(*expansions)
+        return {
+            'total': len(candidates),
+            'hits': [self._hit(self._docs[doc_id], scores[doc_id], highlight_terms)
+                     for doc_id in ranked[offset:offset + limit]],
+        }
+
+    def _hit(self, doc: Dict[str, Any], score: float, terms: Set[str]) -> Dict[str, Any]:
+        return {
+            'doc': doc,
+            'score': round(score, 4),
+            'title': highlight(doc.get('title', ''), terms),
+            'snippet': snippet(doc.get('body', ''), terms),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {'documents': len(self._docs), 'terms': len(self._postings)}
+
+
+def highlight(text: str, terms: Set[str]) -> str:
+    """HTML-escape text and wrap words found in terms in <mark>."""
+    text = str(text or '')
+    parts = []
+    position = 0
+    for match in _WORD.finditer(text):
+        if match.group().lower() in terms:
+            parts.append(html.escape(text[position:match.start()]))
+            parts.append(f'<mark>{html.escape(match.group())}</mark>')
+            position = match.end()
+    parts.append(html.escape(text[position:]))
+    return ''.join(parts)
+
+
+def snippet(text: str, terms: Set[str], words: int = SNIPPET_WORDS) -> str:
+    """The window of text with the most distinct matched words, highlighted."""
+    text = str(text or '')
+    spans: List[Tuple[int, int, str]] = [(m.start(), m.end(), m.group().lower()) for m in _WORD.finditer(text)]
+    if len(spans) <= words:
+        return highlight(text, terms)
+    # Slide a window over the words, counting the distinct matches inside it
+    best_start = 0
+    inside = Counter(w for _, _, w in spans[:words] if w in terms)
+    best_count = len(inside)
+    for start in range(1, len(spans) - words + 1):
+        leaving, entering = spans[start - 1][2], spans[start + words - 1][2]
+        if leaving in terms:
+            inside[leaving] -= 1
+            if not inside[leaving]:
+                del inside[leaving]
+        if entering in terms:
+            inside[entering] += 1
+        if len(inside) > best_count:
+            best_start, best_count = start, len(inside)
+    end = min(best_start + words, len(spans))
+    fragment = text[spans[best_start][0]:spans[end - 1][1]]
+    prefix = '… ' if best_start else ''
+    suffix = ' …' if end < len(spans) else ''
+    return prefix + highlight(fragment, terms) + suffix
@@ -0,0 +1,287 @@
+"""
+Site search index for Dompell Africa
+Feeds the BM25 search engine (app.services.search_engine) with open job
+postings from the job store, and training programs and organizations from
+the API list endpoints. Refreshes re-index only records whose content changed, and the
+documents are saved to disk so a restart can serve searches straight away
+instead of crawling the backend first.
+
+/search is public, so the index holds only public listings: the backend is
+crawled anonymously (or with API_SERVICE_TOKEN), never with a visitor's
+token, and trainee profiles stay in the employer trainee directory.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+from app.config import SEARCH_INDEX_PATH, API_SERVICE_TOKEN
+from app.services.search_engine import SearchEngine
+from app.services.log import get_logger
+
+log = get_logger('SEARCH_INDEX')
+
+REFRESH_INTERVAL = 300
+# Program lists are fetched per organization; cap the parallel requests
+PROGRAM_FETCH_CONCURRENCY = 8
+# Bump when the document layout changes; older files are ignored
+# (2: trainee profiles are no longer indexed)
+INDEX_FORMAT = 2
+
+KINDS = ('job', 'program', 'organization')
+
+
+def _fingerprint(doc: Dict[str, Any]) -> str:
+    return json.dumps(doc, sort_keys=True, default=str)
+
+
+def _data(response) -> Optional[List[Dict[str, Any]]]:
+    """The list payload of a list endpoint, or None if the call failed."""
+    if response is None or not response.is_success or not response.content:
+        return None
+    body = response.json()
+    if isinstance(body, dict):
+        body = body.get('data', [])
+    return [item for item in body if isinstance(item, dict)] if isinstance(body, list) else []
+
+
+def _join(*parts: Any) -> str:
+    return ', '.join(str(part) for part in parts if part)
+
+
+def _names(items: Any) -> List[str]:
+    """Skill-like lists come as strings or as {'name': ...} objects."""
+    names = []
+    for item in items or []:
+        name = item.get('name') if isinstance(item, dict) else item
+        if name:
+            names.append(str(name))
+    return names
+
+
+# ----- API records -> search documents -----
+
+def job_document(job: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'id': f"job:{job.get('id')}",
+        'kind': 'job',
+        'title': job.get('title', ''),
+        'subtitle': job.get('company') or job.get('companyName', ''),
+        'location': job.get('location', ''),
+        'tags': _names(job.get('skills')) + [t for t in [job.get('type')] if t],
+        'body': job.get('description', ''),
+        'url': '/jobs',
+    }
+
+
+def program_document(program: Dict[str, Any], organization: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    organization = organization or {}
+    return {
+        'id': f"program:{program.get('id')}",
+        'kind': 'program',
+        'title': program.get('programName') or program.get('title') or program.get('name', ''),
+        'subtitle': organization.get('name', ''),
+        'location': program.get('location') or _join(organization.get('city'), organization.get('country')),
+        'tags': [t for t in [program.get('programType'), program.get('duration')] if t] + _names(program.get('skills')),
+        'body': program.get('description', ''),
+        'url': '/detailed-training-program-view',
+    }
+
+
+def organization_document(org: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'id': f"organization:{org.get('id')}",
+        'kind': 'organization',
+        'title': org.get('name', ''),
+        'subtitle': org.get('industry') or org.get('organizationType', ''),
+        'location': org.get('location') or _join(org.get('city'), org.get('country')) or org.get('address', ''),
+        'tags': [t for t in [org.get('industry'), org.get('companySize')] if t],
+        'body': org.get('description', ''),
+        'url': '/detailed-company-view',
+    }
+
+
+class SearchIndex:
+    """Search engine contents kept in sync with the backend and on disk."""
+
+    def __init__(self, path: Optional[str] = SEARCH_INDEX_PATH, refresh_interval: float = REFRESH_INTERVAL):
+        self.path = Path(path) if path else None
+        self.refresh_interval = refresh_interval
+        self.engine = SearchEngine()
+        self._fingerprints: Dict[str, str] = {}
+        self._refreshing: Optional[asyncio.Task] = None
+        self._background: Optional[asyncio.Task] = None
+        self.loaded = False
+        self.last_refresh = 0.0
+
+    # ----- queries -----
+
+    def search(self, query: str, kind: Optional[str] = None, location: Optional[str] = None,
+               limit: int = 10, offset: int = 0) -> Dict[str, Any]:
+        """Ranked hits for query (see SearchEngine.search), plus 'took_ms'."""
+        start = time.perf_counter()
+        result = self.engine.search(query, limit=limit, offset=offset,
+                                    where={'kind': kind, 'location': location})
+        result['took_ms'] = (time.perf_counter() - start) * 1000
+        return result
+
+    def locations(self, kind: Optional[str] = None) -> List[str]:
+        return sorted({doc['location'] for doc in self.engine.documents()
+                       if doc.get('location') and (kind is None or doc['kind'] == kind)})
+
+    def counts(self) -> Dict[str, int]:
+        counts = {kind: 0 for kind in KINDS}
+        for doc in self.engine.documents():
+            counts[doc['kind']] = counts.get(doc['kind'], 0) + 1
+        return counts
+
+    # ----- maintenance -----
+
+    def upsert(self, doc: Dict[str, Any]) -> bool:
+        """Index a document unless an identical one is already indexed."""
+        fingerprint = _fingerprint(doc)
+        if self._fingerprints.get(doc['id']) == fingerprint:
+            return False
+        self.engine.add(doc)
+        self._fingerprints[doc['id']] = fingerprint
+        return True
+
+    def remove(self, doc_id: str):
+        self.engine.remove(doc_id)
+        self._fingerprints.pop(doc_id, None)
+
+    def _apply(self, kind: str, docs: List[Dict[str, Any]]) -> int:
+        """Make the indexed documents of one kind match docs, touching only changes."""
+        changed = 0
+        seen = set()
+        for doc in docs:
+            seen.add(doc['id'])
+            if self.upsert(doc):
+                changed += 1
+        stale = [doc['id'] for doc in self.engine.documents() if doc['kind'] == kind and doc['id'] not in seen]
+        for doc_id in stale:
+            self.remove(doc_id)
+        return changed + len(stale)
+
+    async def _fetch_documents(self, service: Any) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """Documents per kind; None for a kind whose source could not be read."""
+        from app.services.job_store import job_store
+
+        # The backend has no job listing endpoint yet; /jobs shows the job store
+        documents: Dict[str, Optional[List[Dict[str, Any]]]] = {
+            'job': [job_document(job) for job in job_store.query(status='active', limit=None)['items']],
+        }
+        try:
+            organizations = _data(await service.get_all_organizations())
+        except Exception:
+            organizations = None
+        documents['organization'] = None if organizations is None else [
+            organization_document(org) for org in organizations if org.get('id')]
+
+        documents['program'] = None
+        if organizations is not None:
+            semaphore = asyncio.Semaphore(PROGRAM_FETCH_CONCURRENCY)
+
+            async def programs_of(org):
+                async with semaphore:
+                    return _data(await service.get_organization_programs(org['id']))
+
+            results = await asyncio.gather(*(programs_of(org) for org in organizations if org.get('id')),
+                                           return_exceptions=True)
+            orgs = [org for org in organizations if org.get('id')]
+            if not any(isinstance(r, BaseException) or r is None for r in results):
+                documents['program'] = [program_document(program, org)
+                                        for org, programs in zip(orgs, results)
+                                        for program in programs if program.get('id')]
+        return documents
+
+    async def refresh(self):
+        """Re-crawl the sources; concurrent callers share one refresh."""
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.ensure_future(self._refresh())
+        await asyncio.shield(self._refreshing)
+
+    async def _refresh(self):
+        from app.services.async_api_service import AsyncApiService
+        service = AsyncApiService(token=API_SERVICE_TOKEN or None)
+        try:
+            documents = await self._fetch_documents(service)
+            changed = 0
+            for kind, docs in documents.items():
+                if docs is None:
+                    # Keep what we have rather than dropping a kind on a failed fetch
+                    log.warning('Could not refresh %s documents', kind)
+                    continue
+                changed += self._apply(kind, docs)
+            self.loaded = True
+            if changed:
+                log.info('Refreshed: %s change(s), %s document(s)', changed, len(self.engine))
+                await asyncio.to_thread(self.save)
+        except Exception as e:
+            log.warning('Refresh error: %s', e)
+        finally:
+            self.last_refresh = time.monotonic()
+
+    # ----- persistence -----
+
+    def save(self):
+        """Write the indexed documents to disk (atomically)."""
+        if self.path is None:
+            return
+        payload = {'format': INDEX_FORMAT, 'saved_at': time.time(), 'documents': list(self.engine.documents())}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Per-process temporary name: several workers (serve.py) may save at once
+        temporary = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+        with gzip.open(temporary, 'wt', encoding='utf-8') as f:
+            json.dump(payload, f, default=str)
+        os.replace(temporary, self.path)
+
+    def load(self) -> bool:
+        """Rebuild the engine from the saved documents; False if there are none."""
+        if self.path is None or not self.path.exists():
+            return False
+        try:
+            with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning('Ignoring unreadable index file %s: %s', self.path, e)
+            return False
+        if payload.get('format') != INDEX_FORMAT:
+            return False
+        for doc in payload.get('documents', []):
+            self.upsert(doc)
+        self.loaded = bool(self.engine)
+        log.info('Loaded %s document(s) from %s', len(self.engine), self.path)
+        return self.loaded
+
+    # ----- lifecycle -----
+
+    async def ensure_loaded(self):
+        """Make sure there is something to search (first use on an empty index)."""
+        self.start()
+        if not self.loaded:
+            await self.refresh()
+
+    def start(self):
+        """Load the saved index and start the refresh loop (needs a running event loop)."""
+        if self._background is None or self._background.done():
+            if not self.loaded:
+                self.load()
+            self._background = asyncio.ensure_future(self._refresh_loop())
+
+    async def _refresh_loop(self):
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.refresh_interval)
+
+    async def stop(self):
+        if self._background is not None:
+            self._background.cancel()
+            self._background = None
+
+
+# Global search index instance
+search_index = SearchIndex()
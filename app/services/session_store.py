@@ -0,0 +1,359 @@
+"""
+Session storage backend for Dompell Africa
+Replaces NiceGUI's one-JSON-file-per-user persistence of app.storage.user
+(and app.storage.general) with a shared SQLite database that stores every
+top-level key as its own row.
+
+- Writes are debounced: changes within SESSION_WRITE_DELAY seconds are
+  coalesced and committed for all sessions in one transaction, off the event
+  loop, and only keys whose serialized value changed are written.
+- Values larger than COMPRESS_THRESHOLD bytes are stored zlib-compressed.
+- Sessions untouched for SESSION_MAX_AGE seconds are evicted.
+- Several server processes can share the database (serve.py): a page
+  request reloads the session if another process wrote it since.
+
+install() switches NiceGUI over; it must run before the first request.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Any, Optional
+from nicegui import app
+from nicegui.persistence import PersistentDict
+from nicegui.persistence.serialization import dumps
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from app.config import SESSION_STORE_PATH, SESSION_WRITE_DELAY, SESSION_MAX_AGE
+from app.services.log import get_logger
+
+log = get_logger('SESSION_STORE')
+
+COMPRESS_THRESHOLD = 1024
+EVICT_INTERVAL = 3600
+# NiceGUI's id of app.storage.general, which is never evicted
+GENERAL_ID = 'general'
+# Requests that never build a page (assets, websocket transport)
+SKIP_REFRESH_PATHS = ('/_nicegui', '/assets')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS session_values (
+    store TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    compressed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (store, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sessions (
+    store TEXT PRIMARY KEY,
+    touched REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_touched ON sessions (touched);
+"""
+
+
+def _encode(text: str) -> tuple:
+    data = text.encode('utf-8')
+    if len(data) > COMPRESS_THRESHOLD:
+        compressed = zlib.compress(data, 6)
+        if len(compressed) < len(data):
+            return compressed, 1
+    return data, 0
+
+
+def _decode(value: bytes, compressed: int) -> str:
+    return (zlib.decompress(value) if compressed else bytes(value)).decode('utf-8')
+
+
+class SqlitePersistentDict(PersistentDict):
+    """app.storage.user / general dict whose changes are written through a SessionStore."""
+
+    def __init__(self, store: 'SessionStore', id: str):
+        self.store = store
+        self.id = id
+        # key -> hash of the JSON last written for it
+        self._written: Dict[str, int] = {}
+        # 'touched' time of the stored copy this dict matches
+        self._synced = 0.0
+        # Set while applying another process's copy, which is not ours to write back
+        self._reloading = False
+        super().__init__(data={}, on_change=self._changed)
+
+    async def initialize(self) -> None:
+        self._loaded(*await asyncio.to_thread(self.store.load, self.id))
+
+    def initialize_sync(self) -> None:
+        self._loaded(*self.store.load(self.id))
+
+    def _loaded(self, values: Dict[str, str], touched: float):
+        self._written = {key: hash(text) for key, text in values.items()}
+        self._synced = touched
+        if values:
+            self.update({key: json.loads(text) for key, text in values.items()})
+        else:
+            # First load since the switch: take over NiceGUI's storage file, if any
+            self.update(self.store.legacy(self.id))
+
+    def _reloaded(self, values: Dict[str, str], touched: float):
+        """Replace the contents with a copy another process wrote."""
+        self._written = {key: hash(text) for key, text in values.items()}
+        self._synced = touched
+        self._reloading = True
+        try:
+            for key in [key for key in self if key not in values]:
+                del self[key]
+            self.update({key: json.loads(text) for key, text in values.items()})
+        finally:
+            self._reloading = False
+
+    def _changed(self):
+        if not self._reloading:
+            self.store.mark_dirty(self)
+
+    async def close(self) -> None:
+        await self.store.flush_async()
+
+
+class SessionStore:
+    """Shared SQLite database behind every SqlitePersistentDict."""
+
+    def __init__(self, path: str = SESSION_STORE_PATH, write_delay: float = SESSION_WRITE_DELAY,
+                 max_age: float = SESSION_MAX_AGE):
+        self.path = path
+        self.write_delay = write_delay
+        self.max_age = max_age
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._dirty: Dict[int, SqlitePersistentDict] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flushing: Optional[asyncio.Future] = None
+        self._evicting: Optional[asyncio.Task] = None
+        self._installed = False
+        self.writes = 0
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if self.path != ':memory:':
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute('PRAGMA busy_timeout=5000')
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def create(self, id: str) -> SqlitePersistentDict:
+        return SqlitePersistentDict(self, id)
+
+    def load(self, store_id: str) -> tuple:
+        """JSON text per key of one stored dict, and when it was last written."""
+        with self._lock:
+            rows = self.connection.execute(
+                'SELECT key, value, compressed FROM session_values WHERE store = ?', (store_id,)).fetchall()
+            touched = self._touched(store_id)
+        return {key: _decode(value, compressed) for key, value, compressed in rows}, touched
+
+    def _touched(self, store_id: str) -> float:
+        row = self.connection.execute('SELECT touched FROM sessions WHERE store = ?', (store_id,)).fetchone()
+        return row[0] if row else 0.0
+
+    async def refresh(self, store: SqlitePersistentDict):
+        """Reload store if another process has written it since this one last did."""
+        with self._lock:
+            touched = self._touched(store.id)
+        if touched <= store._synced:
+            return
+        if id(store) in self._dirty:
+            # Local changes first; the keys they touch win
+            await self.flush_async()
+        store._reloaded(*await asyncio.to_thread(self.load, store.id))
+
+    @staticmethod
+    def legacy(store_id: str) -> Dict[str, Any]:
+        """Contents of NiceGUI's JSON storage file for store_id (left in place), or {}."""
+        from nicegui.storage import Storage
+
+        filepath = Storage.path / f'storage-{store_id}.json'
+        try:
+            return json.loads(filepath.read_text(encoding='utf-8')) if filepath.exists() else {}
+        except (OSError, ValueError):
+            return {}
+
+    # ----- writing -----
+
+    def mark_dirty(self, store: SqlitePersistentDict):
+        self._dirty[id(store)] = store
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        self._flush_handle = loop.call_later(self.write_delay, lambda: asyncio.ensure_future(self.flush_async()))
+
+    def _collect(self) -> Optional[Dict[str, Any]]:
+        """Serialize the dirty dicts; returns the rows to write (and what to restore on failure).
+
+        A dict whose keys all serialize as last written is left alone: its
+        'touched' time is not bumped, so no other process reloads it.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._dirty:
+            return None
+        dirty, self._dirty = self._dirty, {}
+        batch = {'upserts': [], 'deletes': [], 'touched': [], 'previous': []}
+        now = time.time()
+        for store in dirty.values():
+            written, upserts = {}, []
+            for key, value in list(store.items()):
+                key = str(key)
+                text = dumps(value, f'{store.id}[{key!r}]')
+                written[key] = hash(text)
+                if store._written.get(key) != written[key]:
+                    upserts.append((store.id, key, *_encode(text)))
+            deletes = [(store.id, key) for key in store._written if key not in written]
+            if not upserts and not deletes:
+                continue
+            batch['upserts'].extend(upserts)
+            batch['deletes'].extend(deletes)
+            batch['touched'].append((store.id, now))
+            batch['previous'].append((store, store._written))
+            store._written = written
+            store._synced = now
+        return batch if batch['touched'] else None
+
+    def _write(self, batch: Dict[str, Any]):
+        with self._lock:
+            connection = self.connection
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.executemany(
+                    'INSERT OR REPLACE INTO session_values (store, key, value, compressed) VALUES (?, ?, ?, ?)',
+                    batch['upserts'])
+                connection.executemany('DELETE FROM session_values WHERE store = ? AND key = ?', batch['deletes'])
+                connection.executemany('INSERT OR REPLACE INTO sessions (store, touched) VALUES (?, ?)',
+                                       batch['touched'])
+                connection.execute('COMMIT')
+            except Exception:
+                connection.execute('ROLLBACK')
+                raise
+        self.writes += len(batch['upserts']) + len(batch['deletes'])
+
+    def _failed(self, batch: Dict[str, Any], error: Exception):
+        """Put the batch back so the next flush retries it."""
+        log.warning('Write failed, will retry: %s', error)
+        for store, written in batch['previous']:
+            store._written = written
+            self.mark_dirty(store)
+
+    def flush(self):
+        """Write pending changes now (blocking)."""
+        batch = self._collect()
+        if batch is not None:
+            try:
+                self._write(batch)
+            except Exception as e:
+                self._failed(batch, e)
+
+    async def flush_async(self):
+        """Write pending changes in a worker thread; one flush runs at a time."""
+        while self._flushing is not None and not self._flushing.done():
+            await asyncio.shield(self._flushing)
+        batch = self._collect()
+        if batch is None:
+            return
+        self._flushing = asyncio.ensure_future(asyncio.to_thread(self._write, batch))
+        try:
+            await asyncio.shield(self._flushing)
+        except Exception as e:
+            self._failed(batch, e)
+
+    # ----- eviction -----
+
+    def evict(self) -> int:
+        """Delete sessions that have not been written for max_age seconds."""
+        cutoff = time.time() - self.max_age
+        with self._lock:
+            connection = self.connection
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                stale = [row[0] for row in connection.execute(
+                    'SELECT store FROM sessions WHERE touched < ? AND store != ?', (cutoff, GENERAL_ID))]
+                connection.executemany('DELETE FROM session_values WHERE store = ?', [(s,) for s in stale])
+                connection.executemany('DELETE FROM sessions WHERE store = ?', [(s,) for s in stale])
+                connection.execute('COMMIT')
+            except Exception:
+                connection.execute('ROLLBACK')
+                raise
+        if stale:
+            log.info('Evicted %s stale session(s)', len(stale))
+        return len(stale)
+
+    async def _evict_loop(self):
+        while True:
+            try:
+                await asyncio.to_thread(self.evict)
+            except Exception as e:
+                log.warning('Eviction error: %s', e)
+            await asyncio.sleep(EVICT_INTERVAL)
+
+    # ----- lifecycle -----
+
+    def install(self):
+        """Make NiceGUI keep app.storage.user and app.storage.general in this store."""
+        from nicegui.storage import Storage
+
+        if self._installed:
+            return
+        if Storage.redis_url:
+            log.info("NICEGUI_REDIS_URL is set; keeping NiceGUI's Redis storage")
+            return
+        Storage._create_persistent_dict = staticmethod(self.create)
+        general = self.create(GENERAL_ID)
+        general.initialize_sync()
+        app.storage._general = general
+        app.add_middleware(SessionRefreshMiddleware)
+        app.on_startup(self.start)
+        app.on_shutdown(self.close)
+        self._installed = True
+
+    def start(self):
+        if self._evicting is None or self._evicting.done():
+            self._evicting = asyncio.ensure_future(self._evict_loop())
+
+    async def close(self):
+        if self._evicting is not None:
+            self._evicting.cancel()
+            self._evicting = None
+        await self.flush_async()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# Global session store instance
+session_store = SessionStore()
+
+
+class SessionRefreshMiddleware(BaseHTTPMiddleware):
+    """Picks up session changes made by other server processes before a page is built."""
+
+    async def dispatch(self, request: Request, call_next):
+        if 'session' in request.scope and not request.url.path.startswith(SKIP_REFRESH_PATHS):
+            store = app.storage._users.get(request.session.get('id'))
+            if isinstance(store, SqlitePersistentDict):
+                try:
+                    await session_store.refresh(store)
+                except Exception as e:
+                    log.warning('Refresh error: %s', e)
+        return await call_next(request)
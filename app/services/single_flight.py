@@ -0,0 +1,103 @@
+"""
+Request coalescing (single-flight) for Dompell Africa API calls
+Concurrent identical GETs share one upstream request; every waiter receives
+the same response object once it arrives. Where callers with different
+credentials share a key (the 'shared' cache scope), a share predicate keeps
+the leader's own failures (e.g. a 401 for its expired token) from being
+handed to the others: a waiter whose result fails the predicate makes its
+own call.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, Optional, Callable, Awaitable
+
+
+class SingleFlight:
+    """Deduplicates in-flight calls by key for both threads and coroutines."""
+
+    def __init__(self):
+        self._calls: Dict[tuple, Future] = {}
+        self._tasks: Dict[tuple, asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+        self.rerun = 0
+
+    def do(self, key: tuple, fn: Callable[[], Any], share: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Run fn() unless an identical call is already running in another thread.
+
+        share(result) False: a waiter does not take the leader's result but runs fn() itself.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            result = future.result()
+            if share is None or share(result):
+                return result
+            self.rerun += 1
+            return fn()
+        try:
+            result = fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    async def do_async(self, key: tuple, fn: Callable[[], Awaitable[Any]],
+                       share: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Await fn() unless an identical coroutine call is already in flight (share: see do())."""
+        task = self._tasks.get(key)
+        leader = task is None
+        if leader:
+            # Run upstream in its own task so one caller's cancellation
+            # (e.g. a closed browser tab) does not fail the other waiters
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _t, k=key: self._tasks.pop(k, None))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+        result = await asyncio.shield(task)
+        if leader or share is None or share(result):
+            return result
+        self.rerun += 1
+        return await fn()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls) + len(self._tasks)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'in_flight': self.in_flight(),
+            'leaders': self.leaders,
+            'coalesced': self.coalesced,
+            'rerun': self.rerun,
+        }
+
+
+def successful(response: Any) -> bool:
+    """share predicate for the 'shared' scope: only 2xx responses are handed on."""
+    return response is not None and 200 <= response.status_code < 300
+
+
+def request_key(flavor: str, endpoint: str, params: Optional[Dict], scope: str) -> tuple:
+    """Key identifying a GET by endpoint, params and auth scope."""
+    return (flavor, endpoint, tuple(sorted((params or {}).items())), scope)
+
+
+# Global single-flight group for API GET requests
+single_flight = SingleFlight()
@@ -0,0 +1,219 @@
+"""
+Static asset bundling for Dompell Africa
+Page styles live as CSS files under app/static/css instead of inline <style>
+blocks. They are built into content-hashed files (plus .gz / .br variants)
+under app/static/dist and served from /assets with far-future cache headers,
+so the browser downloads each stylesheet once rather than on every page view.
+
+The purged Tailwind stylesheet (see app.services.tailwind_css) is built the
+same way. Build ahead of deployment with `python -m app.services.static_assets`;
+the server also rebuilds anything missing at startup, and never while
+rendering a page: a stylesheet missing from the manifest is linked by its
+unfingerprinted name and served from SOURCE_DIR until the next build.
+
+Builds dropped from the manifest are kept for RETIRED_MAX_AGE, because pages
+rendered by workers that have not restarted yet (serve.py restarts them one
+at a time) still link them.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from nicegui import ui, app
+from nicegui.staticfiles import CacheControlledStaticFiles
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import Scope
+
+from app.services.tailwind_css import build_tailwind_css
+from app.services.log import get_logger
+
+log = get_logger('ASSETS')
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip variants are produced without it
+    brotli = None
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / 'static'
+SOURCE_DIR = STATIC_DIR / 'css'
+DIST_DIR = STATIC_DIR / 'dist'
+MANIFEST_FILE = DIST_DIR / 'manifest.json'
+# When each build that left the manifest was first seen unreferenced
+RETIRED_FILE = DIST_DIR / 'retired.json'
+# Longer than any rolling restart
+RETIRED_MAX_AGE = 24 * 3600
+ASSET_URL = '/assets'
+# Fingerprinted names change with their content, so they can be cached forever
+ASSET_MAX_AGE = 365 * 24 * 3600
+# Compressing tiny files costs more in headers than it saves
+COMPRESS_MIN_SIZE = 512
+
+# Stylesheets generated from the code base rather than read from SOURCE_DIR
+GENERATED = {
+    'tailwind.css': build_tailwind_css,
+}
+
+_manifest: Dict[str, str] = {}
+# Names asset_url() was asked for but found no build of (warned once each)
+_unbuilt: Set[str] = set()
+
+
+def _minify_css(css: str) -> str:
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    lines = (line.strip() for line in css.splitlines())
+    return '\n'.join(line for line in lines if line) + '\n'
+
+
+def _fingerprint(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def _write_if_missing(path: Path, data: bytes):
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+
+def _emit(dist_dir: Path, name: str, css: str) -> str:
+    """Write one minified, fingerprinted stylesheet (plus compressed variants)."""
+    data = _minify_css(css).encode('utf-8')
+    built = f"{name[:-len('.css')]}.{_fingerprint(data)}.css"
+    target = dist_dir / built
+    _write_if_missing(target, data)
+    if len(data) >= COMPRESS_MIN_SIZE:
+        _write_if_missing(target.with_name(target.name + '.gz'), gzip.compress(data, 9, mtime=0))
+        if brotli is not None:
+            _write_if_missing(target.with_name(target.name + '.br'), brotli.compress(data, quality=11))
+    return built
+
+
+def build_assets(source_dir: Path = SOURCE_DIR, dist_dir: Path = DIST_DIR) -> Dict[str, str]:
+    """
+    Build every stylesheet under source_dir into dist_dir.
+
+    Returns the manifest mapping logical names ('pages/shared/auth.css') to
+    fingerprinted paths relative to dist_dir. Outputs whose hash is unchanged
+    are left alone, and builds unreferenced for RETIRED_MAX_AGE are removed.
+    """
+    manifest: Dict[str, str] = {}
+    for source in sorted(source_dir.rglob('*.css')):
+        name = source.relative_to(source_dir).as_posix()
+        manifest[name] = _emit(dist_dir, name, source.read_text(encoding='utf-8'))
+    for name, generate in GENERATED.items():
+        manifest[name] = _emit(dist_dir, name, generate())
+
+    dist_dir.mkdir(parents=True, exist_ok=True)
+    _prune(dist_dir, set(manifest.values()))
+    _write_json(dist_dir / MANIFEST_FILE.name, manifest)
+    return manifest
+
+
+def _write_json(path: Path, payload: Dict):
+    """Replace a JSON file atomically (several workers may build at once)."""
+    temporary = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    temporary.write_text(json.dumps(payload, indent=2, sort_keys=True))
+    os.replace(temporary, path)
+
+
+def _prune(dist_dir: Path, keep: Set[str]):
+    """Remove builds (and their variants) that have been out of the manifest for RETIRED_MAX_AGE."""
+    retired_file = dist_dir / RETIRED_FILE.name
+    try:
+        retired = json.loads(retired_file.read_text())
+    except (OSError, ValueError):
+        retired = {}
+    now = time.time()
+    still_retired = {}
+    for path in dist_dir.rglob('*.css'):
+        built = path.relative_to(dist_dir).as_posix()
+        if built in keep:
+            continue
+        retired_at = retired.get(built, now)
+        if now - retired_at < RETIRED_MAX_AGE:
+            still_retired[built] = retired_at
+            continue
+        for variant in (path, path.with_name(path.name + '.gz'), path.with_name(path.name + '.br')):
+            variant.unlink(missing_ok=True)
+    _write_json(retired_file, still_retired)
+
+
+def load_manifest() -> Dict[str, str]:
+    global _manifest
+    try:
+        _manifest = json.loads(MANIFEST_FILE.read_text())
+    except (OSError, ValueError):
+        _manifest = {}
+    return _manifest
+
+
+def asset_url(name: str) -> str:
+    """Public URL of a built asset, e.g. asset_url('components/header.css')."""
+    built = _manifest.get(name)
+    if built is None:
+        # Not built (e.g. a stylesheet added while the server runs): the
+        # source is served as is, uncached, until the next build
+        if name not in _unbuilt:
+            _unbuilt.add(name)
+            log.warning("No build of '%s'; serving the source (run python -m app.services.static_assets)", name)
+        return f"{ASSET_URL}/{name}"
+    return f"{ASSET_URL}/{built}"
+
+
+def stylesheet(name: str):
+    """Link a bundled stylesheet into the current page, e.g. stylesheet('pages/shared/auth')."""
+    ui.add_head_html(f'<link rel="stylesheet" href="{asset_url(name + ".css")}">')
+
+
+class PrecompressedStaticFiles(CacheControlledStaticFiles):
+    """Serves a prebuilt .br/.gz variant when the client accepts it."""
+
+    ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        accepted = Request(scope).headers.get('accept-encoding', '')
+        for encoding, suffix in self.ENCODINGS:
+            if encoding in accepted and (Path(self.directory) / (path + suffix)).is_file():
+                response = await super().get_response(path + suffix, scope)
+                if response.status_code == 200:
+                    response.headers['Content-Encoding'] = encoding
+                    response.headers['Content-Type'] = 'text/css; charset=utf-8'
+                    response.headers['Vary'] = 'Accept-Encoding'
+                    break
+        else:
+            response = await super().get_response(path, scope)
+        response.headers['Cache-Control'] = f'public, max-age={self.max_cache_age}, immutable'
+        return response
+
+
+def register_static_assets(url_path: str = ASSET_URL, dist_dir: Optional[Path] = None):
+    """Build missing assets and serve them; call once at startup."""
+    dist_dir = dist_dir or DIST_DIR
+    manifest = build_assets(dist_dir=dist_dir)
+    load_manifest()
+    handler = PrecompressedStaticFiles(directory=dist_dir, max_cache_age=ASSET_MAX_AGE)
+    sources = CacheControlledStaticFiles(directory=SOURCE_DIR, max_cache_age=0)
+
+    # Same route shape as app.add_static_files, with the precompressing handler
+    @app.get(url_path.rstrip('/') + '/{path:path}')
+    async def static_asset(request: Request, path: str = '') -> Response:
+        if not (dist_dir / path).is_file() and (SOURCE_DIR / path).is_file():
+            # Unbuilt stylesheet linked by asset_url()
+            return await sources.get_response(path, request.scope)
+        return await handler.get_response(path, request.scope)
+
+    # Purged Tailwind build, linked once for every page (replaces the runtime compiler)
+    ui.add_head_html(f'<link rel="stylesheet" href="{asset_url("tailwind.css")}">', shared=True)
+
+    log.info('Serving %s stylesheet(s) from %s', len(manifest), url_path)
+
+
+if __name__ == '__main__':
+    built = build_assets()
+    log.info('Built %s stylesheet(s) into %s', len(built), DIST_DIR)
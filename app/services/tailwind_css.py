@@ -0,0 +1,763 @@
+"""
+Purged Tailwind stylesheet generator for Dompell Africa
+Scans the class strings used in app/pages, app/components and main.py and
+emits CSS for just the Tailwind utilities that appear there, so browsers load
+a small static stylesheet instead of compiling Tailwind at runtime.
+
+Output follows NiceGUI's cascade layers (preflight in `base`, utilities in
+`utilities`), the same place its bundled runtime compiler puts them. Classes
+built dynamically (e.g. f'text-{color}') are invisible to the scan and must
+be listed in SAFELIST. Scanned classes that look like Tailwind but compile to
+nothing (a name Tailwind v4 dropped such as `bg-opacity-20`, a typo) are
+logged when the stylesheet is built.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Iterable
+from app.services.log import get_logger
+
+log = get_logger('TAILWIND')
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+SCAN_PATHS = [
+    PROJECT_ROOT / 'app' / 'pages',
+    PROJECT_ROOT / 'app' / 'components',
+    PROJECT_ROOT / 'main.py',
+]
+# Classes assembled at runtime that the scanner cannot see
+SAFELIST = {'items-start', 'items-end'}
+
+BREAKPOINTS = {'sm': '640px', 'md': '768px', 'lg': '1024px', 'xl': '1280px', '2xl': '1536px'}
+PSEUDO_VARIANTS = {
+    'hover': ':hover', 'focus': ':focus', 'focus-within': ':focus-within', 'focus-visible': ':focus-visible',
+    'active': ':active', 'disabled': ':disabled', 'first': ':first-child', 'last': ':last-child',
+    'odd': ':nth-child(odd)', 'even': ':nth-child(even)', 'visited': ':visited', 'checked': ':checked',
+    'placeholder': '::placeholder',
+}
+
+_SHADES = ('50', '100', '200', '300', '400', '500', '600', '700', '800', '900', '950')
+_PALETTE = {
+    'slate': 'f8fafc f1f5f9 e2e8f0 cbd5e1 94a3b8 64748b 475569 334155 1e293b 0f172a 020617',
+    'gray': 'f9fafb f3f4f6 e5e7eb d1d5db 9ca3af 6b7280 4b5563 374151 1f2937 111827 030712',
+    'zinc': 'fafafa f4f4f5 e4e4e7 d4d4d8 a1a1aa 71717a 52525b 3f3f46 27272a 18181b 09090b',
+    'neutral': 'fafafa f5f5f5 e5e5e5 d4d4d4 a3a3a3 737373 525252 404040 262626 171717 0a0a0a',
+    'stone': 'fafaf9 f5f5f4 e7e5e4 d6d3d1 a8a29e 78716c 57534e 44403c 292524 1c1917 0c0a09',
+    'red': 'fef2f2 fee2e2 fecaca fca5a5 f87171 ef4444 dc2626 b91c1c 991b1b 7f1d1d 450a0a',
+    'orange': 'fff7ed ffedd5 fed7aa fdba74 fb923c f97316 ea580c c2410c 9a3412 7c2d12 431407',
+    'amber': 'fffbeb fef3c7 fde68a fcd34d fbbf24 f59e0b d97706 b45309 92400e 78350f 451a03',
+    'yellow': 'fefce8 fef9c3 fef08a fde047 facc15 eab308 ca8a04 a16207 854d0e 713f12 422006',
+    'lime': 'f7fee7 ecfccb d9f99d bef264 a3e635 84cc16 65a30d 4d7c0f 3f6212 365314 1a2e05',
+    'green': 'f0fdf4 dcfce7 bbf7d0 86efac 4ade80 22c55e 16a34a 15803d 166534 14532d 052e16',
+    'emerald': 'ecfdf5 d1fae5 a7f3d0 6ee7b7 34d399 10b981 059669 047857 065f46 064e3b 022c22',
+    'teal': 'f0fdfa ccfbf1 99f6e4 5eead4 2dd4bf 14b8a6 0d9488 0f766e 115e59 134e4a 042f2e',
+    'cyan': 'ecfeff cffafe a5f3fc 67e8f9 22d3ee 06b6d4 0891b2 0e7490 155e75 164e63 083344',
+    'sky': 'f0f9ff e0f2fe bae6fd 7dd3fc 38bdf8 0ea5e9 0284c7 0369a1 075985 0c4a6e 082f49',
+    'blue': 'eff6ff dbeafe bfdbfe 93c5fd 60a5fa 3b82f6 2563eb 1d4ed8 1e40af 1e3a8a 172554',
+    'indigo': 'eef2ff e0e7ff c7d2fe a5b4fc 818cf8 6366f1 4f46e5 4338ca 3730a3 312e81 1e1b4b',
+    'violet': 'f5f3ff ede9fe ddd6fe c4b5fd a78bfa 8b5cf6 7c3aed 6d28d9 5b21b6 4c1d95 2e1065',
+    'purple': 'faf5ff f3e8ff e9d5ff d8b4fe c084fc a855f7 9333ea 7e22ce 6b21a8 581c87 3b0764',
+    'fuchsia': 'fdf4ff fae8ff f5d0fe f0abfc e879f9 d946ef c026d3 a21caf 86198f 701a75 4a044e',
+    'pink': 'fdf2f8 fce7f3 fbcfe8 f9a8d4 f472b6 ec4899 db2777 be185d 9d174d 831843 500724',
+    'rose': 'fff1f2 ffe4e6 fecdd3 fda4af fb7185 f43f5e e11d48 be123c 9f1239 881337 4c0519',
+}
+COLORS: Dict[str, str] = {'white': '#ffffff', 'black': '#000000'}
+for _name, _hexes in _PALETTE.items():
+    for _shade, _hex in zip(_SHADES, _hexes.split()):
+        COLORS[f'{_name}-{_shade}'] = f'#{_hex}'
+KEYWORD_COLORS = {'transparent': 'transparent', 'current': 'currentColor', 'inherit': 'inherit'}
+
+FONT_SIZES = {
+    'xs': ('0.75rem', '1rem'), 'sm': ('0.875rem', '1.25rem'), 'base': ('1rem', '1.5rem'),
+    'lg': ('1.125rem', '1.75rem'), 'xl': ('1.25rem', '1.75rem'), '2xl': ('1.5rem', '2rem'),
+    '3xl': ('1.875rem', '2.25rem'), '4xl': ('2.25rem', '2.5rem'), '5xl': ('3rem', '1'),
+    '6xl': ('3.75rem', '1'), '7xl': ('4.5rem', '1'), '8xl': ('6rem', '1'), '9xl': ('8rem', '1'),
+}
+FONT_WEIGHTS = {
+    'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500',
+    'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900',
+}
+FONT_FAMILIES = {
+    'sans': 'ui-sans-serif, system-ui, sans-serif, "Apple Color Emoji", "Segoe UI Emoji"',
+    'serif': 'ui-serif, Georgia, Cambria, "Times New Roman", Times, serif',
+    'mono': 'ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, monospace',
+}
+LEADING = {'none': '1', 'tight': '1.25', 'snug': '1.375', 'normal': '1.5', 'relaxed': '1.625', 'loose': '2'}
+TRACKING = {'tighter': '-0.05em', 'tight': '-0.025em', 'normal': '0em', 'wide': '0.025em',
+            'wider': '0.05em', 'widest': '0.1em'}
+RADII = {'none': '0px', 'sm': '0.125rem', '': '0.25rem', 'md': '0.375rem', 'lg': '0.5rem',
+         'xl': '0.75rem', '2xl': '1rem', '3xl': '1.5rem', 'full': '9999px'}
+SHADOWS = {
+    'sm': '0 1px 2px 0 rgb(0 0 0 / 0.05)',
+    '': '0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)',
+    'md': '0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)',
+    'lg': '0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)',
+    'xl': '0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)',
+    '2xl': '0 25px 50px -12px rgb(0 0 0 / 0.25)',
+    'inner': 'inset 0 2px 4px 0 rgb(0 0 0 / 0.05)',
+    'none': '0 0 #0000',
+}
+MAX_WIDTHS = {
+    'xs': '20rem', 'sm': '24rem', 'md': '28rem', 'lg': '32rem', 'xl': '36rem', '2xl': '42rem',
+    '3xl': '48rem', '4xl': '56rem', '5xl': '64rem', '6xl': '72rem', '7xl': '80rem', 'prose': '65ch',
+    'none': 'none', **{f'screen-{k}': v for k, v in BREAKPOINTS.items()},
+}
+BLURS = {'none': '0', 'sm': '4px', '': '8px', 'md': '12px', 'lg': '16px', 'xl': '24px', '2xl': '40px', '3xl': '64px'}
+GRADIENT_DIRECTIONS = {'t': 'to top', 'tr': 'to top right', 'r': 'to right', 'br': 'to bottom right',
+                       'b': 'to bottom', 'bl': 'to bottom left', 'l': 'to left', 'tl': 'to top left'}
+EASINGS = {'linear': 'linear', 'in': 'cubic-bezier(0.4, 0, 1, 1)', 'out': 'cubic-bezier(0, 0, 0.2, 1)',
+           'in-out': 'cubic-bezier(0.4, 0, 0.2, 1)'}
+TRANSITIONS = {
+    '': 'color, background-color, border-color, text-decoration-color, fill, stroke, opacity, '
+        'box-shadow, transform, translate, scale, rotate, filter, backdrop-filter',
+    'all': 'all',
+    'colors': 'color, background-color, border-color, text-decoration-color, fill, stroke',
+    'opacity': 'opacity',
+    'shadow': 'box-shadow',
+    'transform': 'transform, translate, scale, rotate',
+}
+ANIMATIONS = {
+    'spin': ('spin 1s linear infinite', '@keyframes spin { to { transform: rotate(360deg); } }'),
+    'ping': ('ping 1s cubic-bezier(0, 0, 0.2, 1) infinite',
+             '@keyframes ping { 75%, 100% { transform: scale(2); opacity: 0; } }'),
+    'pulse': ('pulse 2s cubic-bezier(0.4, 0, 0.6, 1) infinite',
+              '@keyframes pulse { 50% { opacity: .5; } }'),
+    'bounce': ('bounce 1s infinite',
+               '@keyframes bounce { 0%, 100% { transform: translateY(-25%); '
+               'animation-timing-function: cubic-bezier(0.8, 0, 1, 1); } '
+               '50% { transform: none; animation-timing-function: cubic-bezier(0, 0, 0.2, 1); } }'),
+    'none': ('none', ''),
+}
+DISPLAYS = {
+    'block', 'inline-block', 'inline', 'flex', 'inline-flex', 'grid', 'inline-grid', 'table',
+    'table-row', 'table-cell', 'contents', 'list-item', 'flow-root',
+}
+STATIC = {
+    'hidden': [('display', 'none')],
+    'static': [('position', 'static')], 'fixed': [('position', 'fixed')],
+    'absolute': [('position', 'absolute')], 'relative': [('position', 'relative')],
+    'sticky': [('position', 'sticky')],
+    'flex-row': [('flex-direction', 'row')], 'flex-row-reverse': [('flex-direction', 'row-reverse')],
+    'flex-col': [('flex-direction', 'column')], 'flex-col-reverse': [('flex-direction', 'column-reverse')],
+    'flex-wrap': [('flex-wrap', 'wrap')], 'flex-nowrap': [('flex-wrap', 'nowrap')],
+    'flex-wrap-reverse': [('flex-wrap', 'wrap-reverse')],
+    'flex-1': [('flex', '1 1 0%')], 'flex-auto': [('flex', '1 1 auto')],
+    'flex-initial': [('flex', '0 1 auto')], 'flex-none': [('flex', 'none')],
+    'grow': [('flex-grow', '1')], 'grow-0': [('flex-grow', '0')],
+    'flex-grow': [('flex-grow', '1')], 'flex-grow-0': [('flex-grow', '0')],
+    'shrink': [('flex-shrink', '1')], 'shrink-0': [('flex-shrink', '0')],
+    'flex-shrink': [('flex-shrink', '1')], 'flex-shrink-0': [('flex-shrink', '0')],
+    'italic': [('font-style', 'italic')], 'not-italic': [('font-style', 'normal')],
+    'underline': [('text-decoration-line', 'underline')],
+    'line-through': [('text-decoration-line', 'line-through')],
+    'no-underline': [('text-decoration-line', 'none')],
+    'uppercase': [('text-transform', 'uppercase')], 'lowercase': [('text-transform', 'lowercase')],
+    'capitalize': [('text-transform', 'capitalize')], 'normal-case': [('text-transform', 'none')],
+    'truncate': [('overflow', 'hidden'), ('text-overflow', 'ellipsis'), ('white-space', 'nowrap')],
+    'antialiased': [('-webkit-font-smoothing', 'antialiased'), ('-moz-osx-font-smoothing', 'grayscale')],
+    'break-words': [('overflow-wrap', 'break-word')], 'break-all': [('word-break', 'break-all')],
+    'break-normal': [('overflow-wrap', 'normal'), ('word-break', 'normal')],
+    'border-solid': [('border-style', 'solid')], 'border-dashed': [('border-style', 'dashed')],
+    'border-dotted': [('border-style', 'dotted')], 'border-none': [('border-style', 'none')],
+    'outline-none': [('outline', '2px solid transparent'), ('outline-offset', '2px')],
+    'select-none': [('user-select', 'none')], 'select-text': [('user-select', 'text')],
+    'select-all': [('user-select', 'all')],
+    'pointer-events-none': [('pointer-events', 'none')], 'pointer-events-auto': [('pointer-events', 'auto')],
+    'visible': [('visibility', 'visible')], 'invisible': [('visibility', 'hidden')],
+    'sr-only': [('position', 'absolute'), ('width', '1px'), ('height', '1px'), ('padding', '0'),
+                ('margin', '-1px'), ('overflow', 'hidden'), ('clip', 'rect(0, 0, 0, 0)'),
+                ('white-space', 'nowrap'), ('border-width', '0')],
+    'list-none': [('list-style-type', 'none')], 'list-disc': [('list-style-type', 'disc')],
+    'list-decimal': [('list-style-type', 'decimal')],
+    'aspect-square': [('aspect-ratio', '1 / 1')], 'aspect-video': [('aspect-ratio', '16 / 9')],
+    'resize-none': [('resize', 'none')], 'resize': [('resize', 'both')],
+    'box-border': [('box-sizing', 'border-box')], 'box-content': [('box-sizing', 'content-box')],
+    'isolate': [('isolation', 'isolate')],
+    'mx-auto': [('margin-left', 'auto'), ('margin-right', 'auto')],
+    'container': [('width', '100%')],
+}
+ALIGNMENTS = {
+    'start': 'flex-start', 'end': 'flex-end', 'center': 'center', 'between': 'space-between',
+    'around': 'space-around', 'evenly': 'space-evenly', 'stretch': 'stretch', 'baseline': 'baseline',
+    'normal': 'normal', 'auto': 'auto',
+}
+SIDES = {
+    '': ('',), 'x': ('-left', '-right'), 'y': ('-top', '-bottom'), 't': ('-top',), 'r': ('-right',),
+    'b': ('-bottom',), 'l': ('-left',), 's': ('-inline-start',), 'e': ('-inline-end',),
+}
+CORNERS = {
+    '': ('',), 't': ('-top-left', '-top-right'), 'r': ('-top-right', '-bottom-right'),
+    'b': ('-bottom-right', '-bottom-left'), 'l': ('-top-left', '-bottom-left'),
+    'tl': ('-top-left',), 'tr': ('-top-right',), 'br': ('-bottom-right',), 'bl': ('-bottom-left',),
+}
+
+PREFLIGHT = """
+*, ::before, ::after, ::backdrop { box-sizing: border-box; margin: 0; padding: 0; border: 0 solid; }
+html, :host { line-height: 1.5; -webkit-text-size-adjust: 100%; tab-size: 4; }
+hr { height: 0; color: inherit; border-top-width: 1px; }
+h1, h2, h3, h4, h5, h6 { font-size: inherit; font-weight: inherit; }
+a { color: inherit; text-decoration: inherit; }
+b, strong { font-weight: bolder; }
+small { font-size: 80%; }
+table { text-indent: 0; border-color: inherit; border-collapse: collapse; }
+ol, ul, menu { list-style: none; }
+img, svg, video, canvas, audio, iframe, embed, object { display: block; vertical-align: middle; }
+img, video { max-width: 100%; height: auto; }
+button, input, select, optgroup, textarea { font: inherit; letter-spacing: inherit; color: inherit; background-color: transparent; border-radius: 0; }
+button, input:where([type='button'], [type='reset'], [type='submit']) { appearance: button; }
+textarea { resize: vertical; }
+::placeholder { opacity: 1; color: color-mix(in oklab, currentColor 50%, transparent); }
+[hidden]:where(:not([hidden='until-found'])) { display: none !important; }
+"""
+
+
+# ----- scanning -----
+
+# Runs of ordinary characters and [bracketed] arbitrary values; brackets may
+# hold the parentheses and commas of h-[calc(100vh-5rem)] or grid-cols-[repeat(2,1fr)]
+_TOKEN = re.compile(r"(?:[^\s\"'`<>=\{\}\(\),;\[\]]|\[[^\s\"'`\[\]]*\])+")
+
+
+def scan_classes(paths: Iterable[Path] = SCAN_PATHS) -> set:
+    """Collect every candidate class token from Python sources (Tailwind-style raw scan)."""
+    tokens = set(SAFELIST)
+    for path in paths:
+        files = [path] if path.is_file() else sorted(path.rglob('*.py'))
+        for file in files:
+            try:
+                tokens.update(_TOKEN.findall(file.read_text(encoding='utf-8')))
+            except (OSError, UnicodeDecodeError):
+                continue
+    return tokens
+
+
+# ----- values -----
+
+def _spacing(value: str) -> Optional[str]:
+    if value == 'px':
+        return '1px'
+    if value in ('0', '0.0'):
+        return '0px'
+    if re.fullmatch(r'\d+(\.5)?', value):
+        return f"{float(value) * 0.25:g}rem"
+    return None
+
+
+def _fraction(value: str) -> Optional[str]:
+    match = re.fullmatch(r'(\d+)/(\d+)', value)
+    if match and int(match.group(2)):
+        return f"{int(match.group(1)) / int(match.group(2)) * 100:g}%"
+    return None
+
+
+_MATH_FUNCTIONS = ('calc', 'min', 'max', 'clamp')
+
+
+def _math_spacing(value: str) -> str:
+    """Spaces around operators in CSS math, as Tailwind adds them: calc(100vh-5rem) -> calc(100vh - 5rem)."""
+    if '(' not in value:
+        return value
+    out = ''
+    math = []  # per open parenthesis: whether its contents are a math expression
+    i = 0
+    while i < len(value):
+        char = value[i]
+        if char == '(':
+            name = re.search(r'[a-z-]*$', out).group()
+            math.append(name in _MATH_FUNCTIONS or (not name and bool(math) and math[-1]))
+        elif char == ')' and math:
+            math.pop()
+        elif math and math[-1] and char in '+-*/':
+            previous = out.rstrip()[-1:]
+            # Binary unless it signs a number: (-1rem), 2*-1
+            if char in '*/' or (previous.isalnum() or previous in '%)'):
+                out = out.rstrip() + f' {char} '
+                i += 1
+                while i < len(value) and value[i] == ' ':
+                    i += 1
+                continue
+        out += char
+        i += 1
+    return out
+
+
+def _arbitrary(value: str) -> Optional[str]:
+    if value.startswith('[') and value.endswith(']'):
+        return _math_spacing(value[1:-1].replace('_', ' '))
+    return None
+
+
+def _length(value: str, extra: Optional[Dict[str, str]] = None) -> Optional[str]:
+    extra = extra or {}
+    if value in extra:
+        return extra[value]
+    return _spacing(value) or _fraction(value) or _arbitrary(value) or {
+        'auto': 'auto', 'full': '100%', 'min': 'min-content', 'max': 'max-content', 'fit': 'fit-content',
+    }.get(value)
+
+
+def _color(value: str) -> Optional[str]:
+    base, _, alpha = value.partition('/')
+    if base in KEYWORD_COLORS and not alpha:
+        return KEYWORD_COLORS[base]
+    color = COLORS.get(base)
+    if color is None:
+        arbitrary = _arbitrary(base)
+        # text-[14px] is a size and border-[3px] a width, not colors
+        if not arbitrary or not arbitrary.startswith(('#', 'rgb', 'hsl', 'var(', 'oklch')):
+            return None
+        color = arbitrary
+    if alpha:
+        if not alpha.isdigit() or not color.startswith('#'):
+            return None
+        r, g, b = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+        return f"rgb({r} {g} {b} / {int(alpha) / 100:g})"
+    return color
+
+
+# ----- utilities -----
+
+Declarations = List[Tuple[str, str]]
+
+
+def _sided(prop: str, sides: Tuple[str, ...], value: str) -> Declarations:
+    return [(f"{prop}{side}", value) for side in sides]
+
+
+def resolve_utility(utility: str, negative: bool = False) -> Optional[Tuple[int, Declarations, str]]:
+    """
+    Return (rank, declarations, selector suffix) for a bare utility, or None if
+    it is not a Tailwind utility we generate. rank orders families the way
+    Tailwind does, so e.g. px-* always overrides p-*.
+    """
+    neg = (lambda v: f"calc({v} * -1)" if v not in ('0px', 'auto') else v) if negative else (lambda v: v)
+
+    if not negative:
+        if utility in STATIC:
+            return 10, STATIC[utility], ''
+        if utility in DISPLAYS:
+            return 5, [('display', utility)], ''
+
+    # margin / padding
+    match = re.fullmatch(r'([mp])([xytrblse]?)-(.+)', utility)
+    if match:
+        kind, side, value = match.groups()
+        length = _length(value) if kind == 'm' else (_spacing(value) or _arbitrary(value))
+        if length is None or (kind == 'p' and negative):
+            return None
+        prop = 'margin' if kind == 'm' else 'padding'
+        rank = {'': 20, 'x': 21, 'y': 21}.get(side, 22) + (0 if kind == 'm' else 10)
+        return rank, _sided(prop, SIDES[side], neg(length)), ''
+
+    # space between
+    match = re.fullmatch(r'space-([xy])-(.+)', utility)
+    if match:
+        axis, value = match.groups()
+        length = _spacing(value) or _arbitrary(value)
+        if length is None:
+            return None
+        prop = 'margin-left' if axis == 'x' else 'margin-top'
+        return 40, [(prop, neg(length))], ' > :not([hidden]) ~ :not([hidden])'
+
+    # inset / position offsets
+    match = re.fullmatch(r'(inset-x|inset-y|inset|top|right|bottom|left)-(.+)', utility)
+    if match:
+        prop, value = match.groups()
+        length = _length(value)
+        if length is None:
+            return None
+        props = {'inset': ('top', 'right', 'bottom', 'left'), 'inset-x': ('left', 'right'),
+                 'inset-y': ('top', 'bottom')}.get(prop, (prop,))
+        return 12, [(p, neg(length)) for p in props], ''
+
+    if negative and not utility.startswith(('translate', 'rotate', 'z-', 'order-', 'tracking-')):
+        return None
+
+    match = re.fullmatch(r'z-(\d+|auto|\[.+\])', utility)
+    if match:
+        value = _arbitrary(match.group(1)) or match.group(1)
+        return 13, [('z-index', f"-{value}" if negative else value)], ''
+
+    match = re.fullmatch(r'order-(\d+|first|last|none)', utility)
+    if match:
+        value = {'first': '-9999', 'last': '9999', 'none': '0'}.get(match.group(1), match.group(1))
+        return 14, [('order', f"-{value}" if negative else value)], ''
+
+    # sizing
+    match = re.fullmatch(r'(min-w|max-w|min-h|max-h|w|h|size)-(.+)', utility)
+    if match:
+        prop, value = match.groups()
+        extra = {'screen': '100vw' if prop.endswith('w') else '100vh', 'svh': '100svh', 'dvh': '100dvh'}
+        if prop == 'max-w':
+            extra.update(MAX_WIDTHS)
+        length = _length(value, extra)
+        if length is None:
+            return None
+        props = {'w': ('width',), 'h': ('height',), 'size': ('width', 'height'), 'min-w': ('min-width',),
+                 'max-w': ('max-width',), 'min-h': ('min-height',), 'max-h': ('max-height',)}[prop]
+        return 50, [(p, length) for p in props], ''
+
+    # flexbox / grid alignment
+    match = re.fullmatch(r'(items|justify|content|self|place-items|place-content|justify-items|justify-self)-(.+)',
+                         utility)
+    if match:
+        prop, value = match.groups()
+        css_value = ALIGNMENTS.get(value)
+        if css_value is None:
+            return None
+        if prop in ('place-items', 'justify-items', 'justify-self') and value in ('start', 'end'):
+            css_value = value
+        css_prop = {'items': 'align-items', 'justify': 'justify-content', 'content': 'align-content',
+                    'self': 'align-self'}.get(prop, prop)
+        return 15, [(css_prop, css_value)], ''
+
+    match = re.fullmatch(r'(basis|flex)-(.+)', utility)
+    if match and match.group(1) == 'basis':
+        length = _length(match.group(2))
+        return (16, [('flex-basis', length)], '') if length else None
+    if match and _arbitrary(match.group(2)):
+        return 16, [('flex', _arbitrary(match.group(2)))], ''
+
+    match = re.fullmatch(r'grid-(cols|rows)-(\d+|none|\[.+\])', utility)
+    if match:
+        axis, value = match.groups()
+        template = (_arbitrary(value) or
+                    ('none' if value == 'none' else f"repeat({value}, minmax(0, 1fr))"))
+        return 17, [(f"grid-template-{'columns' if axis == 'cols' else 'rows'}", template)], ''
+
+    match = re.fullmatch(r'(col|row)-(span-(\d+|full)|start-(\d+)|end-(\d+)|auto)', utility)
+    if match:
+        axis = 'column' if match.group(1) == 'col' else 'row'
+        if match.group(3):
+            span = match.group(3)
+            value = '1 / -1' if span == 'full' else f"span {span} / span {span}"
+            return 18, [(f"grid-{axis}", value)], ''
+        if match.group(4):
+            return 18, [(f"grid-{axis}-start", match.group(4))], ''
+        if match.group(5):
+            return 18, [(f"grid-{axis}-end", match.group(5))], ''
+        return 18, [(f"grid-{axis}", 'auto')], ''
+
+    match = re.fullmatch(r'gap(-[xy])?-(.+)', utility)
+    if match:
+        axis, value = match.groups()
+        length = _spacing(value) or _arbitrary(value)
+        if length is None:
+            return None
+        prop = {'': 'gap', '-x': 'column-gap', '-y': 'row-gap'}[axis or '']
+        return 19 if not axis else 19.5, [(prop, length)], ''
+
+    # typography
+    if utility.startswith('text-'):
+        value = utility[5:]
+        if value in FONT_SIZES:
+            size, line_height = FONT_SIZES[value]
+            return 60, [('font-size', size), ('line-height', line_height)], ''
+        if value in ('left', 'center', 'right', 'justify', 'start', 'end'):
+            return 61, [('text-align', value)], ''
+        if value in ('wrap', 'nowrap', 'balance', 'pretty'):
+            return 61, [('text-wrap', value)], ''
+        if value in ('ellipsis', 'clip'):
+            return 61, [('text-overflow', value)], ''
+        color = _color(value)
+        if color:
+            return 70, [('color', color)], ''
+        arbitrary = _arbitrary(value)
+        if arbitrary:
+            return 60, [('font-size', arbitrary)], ''
+        return None
+
+    if utility.startswith('font-'):
+        value = utility[5:]
+        if value in FONT_WEIGHTS:
+            return 62, [('font-weight', FONT_WEIGHTS[value])], ''
+        if value in FONT_FAMILIES:
+            return 62, [('font-family', FONT_FAMILIES[value])], ''
+        return None
+
+    match = re.fullmatch(r'leading-(.+)', utility)
+    if match:
+        value = match.group(1)
+        css_value = LEADING.get(value) or _spacing(value) or _arbitrary(value)
+        return (63, [('line-height', css_value)], '') if css_value else None
+
+    match = re.fullmatch(r'tracking-(.+)', utility)
+    if match:
+        css_value = TRACKING.get(match.group(1)) or _arbitrary(match.group(1))
+        return (63, [('letter-spacing', neg(css_value))], '') if css_value else None
+
+    match = re.fullmatch(r'whitespace-(normal|nowrap|pre|pre-line|pre-wrap|break-spaces)', utility)
+    if match:
+        return 64, [('white-space', match.group(1))], ''
+
+    match = re.fullmatch(r'line-clamp-(\d+|none)', utility)
+    if match:
+        if match.group(1) == 'none':
+            return 64, [('overflow', 'visible'), ('display', 'block'), ('-webkit-box-orient', 'horizontal'),
+                        ('-webkit-line-clamp', 'unset')], ''
+        return 64, [('overflow', 'hidden'), ('display', '-webkit-box'), ('-webkit-box-orient', 'vertical'),
+                    ('-webkit-line-clamp', match.group(1))], ''
+
+    match = re.fullmatch(r'align-(baseline|top|middle|bottom|text-top|text-bottom)', utility)
+    if match:
+        return 64, [('vertical-align', match.group(1))], ''
+
+    # overflow / object fit / cursor
+    match = re.fullmatch(r'overflow(-[xy])?-(auto|hidden|visible|scroll|clip)', utility)
+    if match:
+        return 11, [(f"overflow{match.group(1) or ''}", match.group(2))], ''
+
+    match = re.fullmatch(r'object-(contain|cover|fill|none|scale-down|center|top|bottom)', utility)
+    if match:
+        value = match.group(1)
+        prop = 'object-position' if value in ('center', 'top', 'bottom') else 'object-fit'
+        return 65, [(prop, value)], ''
+
+    match = re.fullmatch(r'cursor-(.+)', utility)
+    if match:
+        return 90, [('cursor', match.group(1))], ''
+
+    # backgrounds and gradients
+    match = re.fullmatch(r'bg-(?:gradient|linear)-to-(t|tr|r|br|b|bl|l|tl)', utility)
+    if match:
+        return 71, [('background-image', f"linear-gradient({GRADIENT_DIRECTIONS[match.group(1)]}, "
+                                         f"var(--tw-gradient-stops))")], ''
+    if utility.startswith('bg-'):
+        value = utility[3:]
+        if value in ('cover', 'contain', 'auto'):
+            return 72, [('background-size', value)], ''
+        if value in ('center', 'top', 'bottom', 'left', 'right'):
+            return 72, [('background-position', value)], ''
+        if value in ('no-repeat', 'repeat'):
+            return 72, [('background-repeat', value)], ''
+        if value == 'none':
+            return 71, [('background-image', 'none')], ''
+        color = _color(value)
+        return (70, [('background-color', color)], '') if color else None
+
+    match = re.fullmatch(r'(from|via|to)-(.+)', utility)
+    if match:
+        stop, value = match.groups()
+        color = _color(value)
+        if color is None:
+            return None
+        if stop == 'from':
+            return 73, [('--tw-gradient-from', color), ('--tw-gradient-to', 'transparent'),
+                        ('--tw-gradient-stops', 'var(--tw-gradient-from), var(--tw-gradient-to)')], ''
+        if stop == 'via':
+            return 74, [('--tw-gradient-to', 'transparent'),
+                        ('--tw-gradient-stops', f"var(--tw-gradient-from), {color}, var(--tw-gradient-to)")], ''
+        return 75, [('--tw-gradient-to', color)], ''
+
+    # borders
+    match = re.fullmatch(r'rounded(?:-(t|r|b|l|tl|tr|br|bl))?(?:-(.+))?', utility)
+    if match:
+        corner, size = match.group(1) or '', match.group(2) or ''
+        radius = RADII.get(size) or _arbitrary(size)
+        if radius is None:
+            return None
+        props = [f"border{c}-radius" for c in CORNERS[corner]]
+        return 80 + (1 if corner else 0), [(p, radius) for p in props], ''
+
+    match = re.fullmatch(r'border(?:-([xytrbl]))?(?:-(\d+))?', utility)
+    if match:
+        side, width = match.group(1) or '', match.group(2)
+        props = [f"border{s}-width" for s in SIDES[side]]
+        return 82 + (1 if side else 0), [(p, f"{width or 1}px") for p in props] + [('border-style', 'solid')], ''
+    match = re.fullmatch(r'border(?:-([xytrbl]))?-(.+)', utility)
+    if match:
+        side, value = match.group(1) or '', match.group(2)
+        color = _color(value)
+        if color is None:
+            return None
+        return 84 + (1 if side else 0), [(f"border{s}-color", color) for s in SIDES[side]], ''
+
+    match = re.fullmatch(r'divide-([xy])(?:-(\d+))?', utility)
+    if match:
+        prop = 'border-left-width' if match.group(1) == 'x' else 'border-top-width'
+        return 86, [(prop, f"{match.group(2) or 1}px"), ('border-style', 'solid')], ' > :not([hidden]) ~ :not([hidden])'
+    match = re.fullmatch(r'divide-(.+)', utility)
+    if match and _color(match.group(1)):
+        return 86, [('border-color', _color(match.group(1)))], ' > :not([hidden]) ~ :not([hidden])'
+
+    match = re.fullmatch(r'ring(?:-(\d+))?', utility)
+    if match:
+        return 87, [('box-shadow', f"0 0 0 {match.group(1) or 3}px var(--tw-ring-color, rgb(59 130 246 / 0.5))")], ''
+    match = re.fullmatch(r'ring-(.+)', utility)
+    if match and _color(match.group(1)):
+        return 88, [('--tw-ring-color', _color(match.group(1)))], ''
+
+    # effects
+    match = re.fullmatch(r'shadow(?:-(.+))?', utility)
+    if match:
+        shadow = SHADOWS.get(match.group(1) or '') or _arbitrary(match.group(1) or '')
+        return (89, [('box-shadow', shadow)], '') if shadow else None
+
+    match = re.fullmatch(r'opacity-(\d+)', utility)
+    if match:
+        return 91, [('opacity', f"{int(match.group(1)) / 100:g}")], ''
+
+    match = re.fullmatch(r'(backdrop-)?blur(?:-(.+))?', utility)
+    if match:
+        amount = BLURS.get(match.group(2) or '') or _arbitrary(match.group(2) or '')
+        if amount is None:
+            return None
+        prop = 'backdrop-filter' if match.group(1) else 'filter'
+        return 92, [(prop, f"blur({amount})")], ''
+
+    # transitions and transforms
+    match = re.fullmatch(r'transition(?:-(.+))?', utility)
+    if match:
+        props = TRANSITIONS.get(match.group(1) or '')
+        if match.group(1) == 'none':
+            return 93, [('transition-property', 'none')], ''
+        if props is None:
+            return None
+        return 93, [('transition-property', props), ('transition-timing-function', EASINGS['in-out']),
+                    ('transition-duration', '150ms')], ''
+    match = re.fullmatch(r'(duration|delay)-(\d+)', utility)
+    if match:
+        prop = 'transition-duration' if match.group(1) == 'duration' else 'transition-delay'
+        return 94, [(prop, f"{match.group(2)}ms")], ''
+    match = re.fullmatch(r'ease-(linear|in|out|in-out)', utility)
+    if match:
+        return 94, [('transition-timing-function', EASINGS[match.group(1)])], ''
+
+    match = re.fullmatch(r'scale(-[xy])?-(\d+)', utility)
+    if match:
+        factor = f"{int(match.group(2)) / 100:g}"
+        value = {'': f"{factor} {factor}", '-x': f"{factor} 1", '-y': f"1 {factor}"}[match.group(1) or '']
+        return 95, [('scale', value)], ''
+    match = re.fullmatch(r'rotate-(\d+)', utility)
+    if match:
+        return 95, [('rotate', f"{'-' if negative else ''}{match.group(1)}deg")], ''
+    match = re.fullmatch(r'translate-([xy])-(.+)', utility)
+    if match:
+        length = _length(match.group(2))
+        if length is None:
+            return None
+        var = f"--tw-translate-{match.group(1)}"
+        return 95, [(var, neg(length)), ('translate', 'var(--tw-translate-x, 0) var(--tw-translate-y, 0)')], ''
+
+    match = re.fullmatch(r'animate-(.+)', utility)
+    if match and match.group(1) in ANIMATIONS:
+        return 96, [('animation', ANIMATIONS[match.group(1)][0])], ''
+
+    # arbitrary property, e.g. [animation-delay:-0.15s]
+    match = re.fullmatch(r'\[([a-z-]+):(.+)\]', utility)
+    if match:
+        return 99, [(match.group(1), _math_spacing(match.group(2).replace('_', ' ')))], ''
+
+    return None
+
+
+# ----- variants and output -----
+
+def _escape(class_name: str) -> str:
+    escaped = re.sub(r'([^a-zA-Z0-9_-])', r'\\\1', class_name)
+    if escaped[0].isdigit():
+        escaped = f"\\3{escaped[0]} {escaped[1:]}"
+    return escaped
+
+
+def _split_variants(class_name: str) -> List[str]:
+    parts, depth, current = [], 0, ''
+    for char in class_name:
+        if char == '[':
+            depth += 1
+        elif char == ']':
+            depth -= 1
+        if char == ':' and depth == 0:
+            parts.append(current)
+            current = ''
+        else:
+            current += char
+    parts.append(current)
+    return parts
+
+
+def compile_class(class_name: str) -> Optional[Tuple[tuple, str, Optional[str]]]:
+    """Compile one class into (sort key, css rule, keyframes) or None."""
+    *variants, utility = _split_variants(class_name)
+    if not utility:
+        return None
+    important = utility.startswith('!') or utility.endswith('!')
+    utility = utility.strip('!')
+    negative = utility.startswith('-')
+    resolved = resolve_utility(utility[1:] if negative else utility, negative)
+    if resolved is None:
+        return None
+    rank, declarations, suffix = resolved
+
+    breakpoint = None
+    selector = f".{_escape(class_name)}"
+    for variant in variants:
+        if variant in BREAKPOINTS and breakpoint is None:
+            breakpoint = variant
+        elif variant in PSEUDO_VARIANTS:
+            selector += PSEUDO_VARIANTS[variant]
+        elif variant.startswith('group-') and variant[6:] in PSEUDO_VARIANTS:
+            selector = f".group{PSEUDO_VARIANTS[variant[6:]]} {selector}"
+        else:
+            return None
+    selector += suffix
+
+    body = '; '.join(f"{prop}: {value}{' !important' if important else ''}" for prop, value in declarations)
+    rule = f"{selector} {{ {body}; }}"
+    if breakpoint:
+        rule = f"@media (min-width: {BREAKPOINTS[breakpoint]}) {{ {rule} }}"
+    keyframes = None
+    if utility.startswith('animate-'):
+        keyframes = ANIMATIONS[utility[8:]][1] or None
+    bp_index = list(BREAKPOINTS).index(breakpoint) + 1 if breakpoint else 0
+    return (bp_index, len(variants), rank, class_name), rule, keyframes
+
+
+def generate_css(classes: Iterable[str]) -> str:
+    """Build the purged stylesheet for the given class names."""
+    compiled = []
+    keyframes = set()
+    for class_name in set(classes):
+        result = compile_class(class_name)
+        if result:
+            key, rule, frames = result
+            compiled.append((key, rule))
+            if frames:
+                keyframes.add(frames)
+    compiled.sort(key=lambda item: item[0])
+    rules = '\n'.join(rule for _, rule in compiled)
+    return (f"@layer base {{{PREFLIGHT}}}\n"
+            f"@layer utilities {{\n{rules}\n}}\n"
+            + ''.join(f"{frames}\n" for frames in sorted(keyframes)))
+
+
+# Classes of Tailwind's own families: colors, opacity modifiers, spacing,
+# sizing and arbitrary values, plus names Tailwind v4 dropped (bare
+# `transform` is left out: the raw scan also reads English prose)
+_TAILWIND_LIKE = re.compile(
+    r'(transform-(gpu|cpu|none)'
+    r'|(bg|text|border|ring|divide|placeholder)-opacity-\d+'
+    r'|(bg|text|border|ring|divide|outline|decoration|from|via|to|fill|stroke|accent|caret)-'
+    r'(' + '|'.join(_PALETTE) + r'|white|black)(-\d+)?(/\d+)?'
+    r'|-?[mp][xytrblse]?-[\d.]+'
+    r'|-?(w|h|min-w|max-w|min-h|max-h|size|gap|gap-[xy]|space-[xy]|inset|top|right|bottom|left|z|opacity'
+    r'|duration|delay|scale|rotate|translate-[xy])-(\d[\d./]*|px|auto|full|screen)'
+    r'|[\w-]+-\[.+\])')
+
+
+def unsupported_classes(classes: Iterable[str]) -> List[str]:
+    """Classes that look like Tailwind utilities but compile to no CSS."""
+    unsupported = []
+    for class_name in classes:
+        utility = _split_variants(class_name)[-1]
+        if _TAILWIND_LIKE.fullmatch(utility.strip('!')) and compile_class(class_name) is None:
+            unsupported.append(class_name)
+    return sorted(unsupported)
+
+
+def build_tailwind_css(paths: Iterable[Path] = SCAN_PATHS) -> str:
+    classes = scan_classes(paths)
+    unsupported = unsupported_classes(classes)
+    if unsupported:
+        log.warning('%s Tailwind-like class(es) produce no CSS: %s', len(unsupported), ' '.join(unsupported))
+    return generate_css(classes)
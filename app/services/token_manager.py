@@ -0,0 +1,276 @@
+"""
+Access token renewal for Dompell Africa
+Renews a session's JWT access token before it expires, instead of waiting
+for the backend to answer 401 and replaying the request.
+
+- The expiry comes from the token's own `exp` claim (decoded, not verified).
+- Within TOKEN_RENEW_MARGIN seconds of expiry a request goes out with the
+  still-valid token while the renewal runs in the background; a request
+  holding an expired token waits for the renewal instead of failing first.
+- One renewal per session is in flight at a time, whether the blocking
+  ApiService or the AsyncApiService started it; every request waiting on it
+  gets its token. A 401 that still slips through joins the same renewal.
+- A timer renews ahead of expiry if the session has made a request with
+  the current token; idle sessions let their token lapse.
+- A refresh token rotated by the backend is kept along with the new access
+  token.
+
+Tokens without a readable `exp` are left to the 401 path.
+"""
+
+import asyncio
+import base64
+import json
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+from app.config import TOKEN_RENEW_MARGIN
+from app.services.async_api_service import extract_access_token
+from app.services.log import get_logger
+
+log = get_logger('TOKEN_MANAGER')
+
+# A token this close to expiry is treated as expired (clock skew, time in flight)
+EXPIRY_SKEW = 5.0
+# Pause between background renewals after one failed
+RETRY_DELAY = 10.0
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def token_expiry(token: Optional[str]) -> Optional[float]:
+    """Unix time of a JWT's exp claim, or None."""
+    try:
+        payload = token.split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        return float(claims['exp'])
+    except Exception:
+        return None
+
+
+def extract_refresh_token(payload: Dict[str, Any]) -> Optional[str]:
+    """The rotated refresh token in a refresh-token response, if any."""
+    return (
+        (payload.get('data') or {}).get('refreshToken')
+        or payload.get('refreshToken')
+        or ((payload.get('token') or {}).get('refreshToken'))
+    )
+
+
+class TokenManager:
+    """Keeps one session's access token fresh (see SessionClientContext)."""
+
+    def __init__(self, context: Any, margin: float = TOKEN_RENEW_MARGIN):
+        self.context = context
+        self.margin = margin
+        self.renewals = 0
+        self.failures = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._armed_for: Optional[str] = None
+        self._used = False
+        self._retry_at = 0.0
+        # Refresh token the backend rejected; not sent again
+        self._rejected: Optional[str] = None
+        # The renewal in flight (from renew() or renew_sync()) and whether it runs as a task
+        self._renewal: Optional[Tuple[Future, bool]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def token(self) -> Optional[str]:
+        return self.context.aio.token
+
+    def remaining(self) -> Optional[float]:
+        """Seconds until the access token expires (None if unknown)."""
+        expiry = token_expiry(self.token)
+        return None if expiry is None else expiry - time.time()
+
+    # ----- before a request -----
+
+    def _renewable(self, refresh_token: Optional[str]) -> bool:
+        return bool(refresh_token) and refresh_token != self._rejected
+
+    async def ensure_fresh(self):
+        """Called before an API request: renew ahead of expiry, wait only if already expired."""
+        remaining = self.remaining()
+        if remaining is None or not self._renewable(self.context.aio.refresh_token):
+            return
+        self._used = True
+        if remaining <= EXPIRY_SKEW:
+            await self.renew()
+        elif remaining <= self.margin:
+            self.renew_in_background()
+        else:
+            self._arm(remaining)
+
+    def ensure_fresh_sync(self):
+        """ensure_fresh() for the blocking ApiService."""
+        remaining = self.remaining()
+        if remaining is None or not self._renewable(self.context.api.refresh_token):
+            return
+        self._used = True
+        if remaining <= EXPIRY_SKEW:
+            self.renew_sync()
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Worker thread: the token is still valid, a later async request renews it
+            return
+        if remaining <= self.margin:
+            self.renew_in_background()
+        else:
+            self._arm(remaining)
+
+    # ----- renewal -----
+
+    async def renew(self, stale_token: Optional[str] = None) -> Optional[str]:
+        """Renewed access token, shared with every other caller waiting for it.
+
+        With stale_token (the token a request was rejected with), a token that
+        has been renewed since is returned without another refresh.
+        """
+        if stale_token is not None and self.token and self.token != stale_token:
+            return self.token
+        future, leader, _ = self._join(is_async=True)
+        if leader:
+            # Own task, so one caller's cancellation does not fail the other waiters
+            task = asyncio.ensure_future(self._refresh())
+
+            def _done(task: asyncio.Task):
+                if task.cancelled():
+                    self._settle(future, None)
+                elif task.exception() is not None:
+                    self._settle(future, error=task.exception())
+                else:
+                    self._settle(future, task.result())
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def renew_sync(self, stale_token: Optional[str] = None) -> Optional[str]:
+        """renew() for the blocking ApiService.
+
+        Joins a renewal the AsyncApiService started, except on the event
+        loop's own thread, where waiting would stall that renewal: there it
+        returns None and the request goes out with the token it has.
+        """
+        if stale_token is not None and self.token and self.token != stale_token:
+            return self.token
+        future, leader, run_async = self._join(is_async=False)
+        if leader:
+            try:
+                token = self._refresh_sync()
+            except BaseException as e:
+                self._settle(future, error=e)
+                raise
+            self._settle(future, token)
+            return token
+        if run_async and _on_event_loop():
+            return None
+        return future.result()
+
+    def _join(self, is_async: bool) -> Tuple[Future, bool, bool]:
+        """The renewal in flight, or a new one the caller has to run (leader), and whether it runs async."""
+        with self._lock:
+            if self._renewal is None:
+                self._renewal = (Future(), is_async)
+                return self._renewal[0], True, is_async
+            return self._renewal[0], False, self._renewal[1]
+
+    def _settle(self, future: Future, token: Optional[str] = None, error: Optional[BaseException] = None):
+        """End the renewal in flight and hand its outcome to the waiters."""
+        with self._lock:
+            if self._renewal is not None and self._renewal[0] is future:
+                self._renewal = None
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(token)
+
+    def renew_in_background(self):
+        """Start a renewal unless one is running or one just failed; the caller does not wait."""
+        if time.monotonic() >= self._retry_at:
+            asyncio.ensure_future(self.renew())
+
+    async def _refresh(self) -> Optional[str]:
+        refresh_token = self.context.aio.refresh_token
+        if not self._renewable(refresh_token):
+            return None
+        try:
+            resp = await self.context.aio.refresh_access_token(refresh_token)
+        except Exception as e:
+            return self._failed(e)
+        return self._accept(refresh_token, resp)
+
+    def _refresh_sync(self) -> Optional[str]:
+        refresh_token = self.context.api.refresh_token
+        if not self._renewable(refresh_token):
+            return None
+        try:
+            resp = self.context.api.refresh_access_token(refresh_token)
+        except Exception as e:
+            return self._failed(e)
+        return self._accept(refresh_token, resp)
+
+    def _accept(self, refresh_token: str, resp: Any) -> Optional[str]:
+        """Store the tokens of a refresh-token response (requests or httpx)."""
+        if resp.status_code in (401, 403):
+            self._rejected = refresh_token
+            return self._failed(f'refresh token rejected ({resp.status_code})')
+        if not 200 <= resp.status_code < 300:
+            return self._failed(f'status {resp.status_code}')
+        try:
+            payload = resp.json() if resp.content else {}
+        except ValueError:
+            payload = {}
+        token = extract_access_token(payload) if isinstance(payload, dict) else None
+        if not token:
+            return self._failed('no access token in response')
+        self.context.store_tokens(token, extract_refresh_token(payload))
+        self.renewals += 1
+        self._used = False
+        remaining = self.remaining()
+        if remaining is not None:
+            self._arm(remaining)
+        log.debug('Renewed access token for session %s', self.context.session_id)
+        return token
+
+    def _failed(self, reason: Any) -> None:
+        self.failures += 1
+        self._retry_at = time.monotonic() + RETRY_DELAY
+        log.warning('Token renewal failed: %s', reason)
+        return None
+
+    # ----- timer -----
+
+    def _arm(self, remaining: float):
+        """Schedule the renewal of the current token ahead of its expiry."""
+        if self._armed_for == self.token:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self.close()
+        self._armed_for = self.token
+        self._timer = loop.call_later(max(0.0, remaining - self.margin), self._due)
+
+    def _due(self):
+        self._timer = None
+        if self._used:
+            self.renew_in_background()
+
+    def close(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._armed_for = None
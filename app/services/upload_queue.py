@@ -0,0 +1,319 @@
+"""
+Background upload queue for Dompell Africa
+Upload handlers enqueue the file and return immediately; a small worker pool
+streams queued files to /upload with a global concurrency cap, a per-user
+fair share and exponential-backoff retries. Pages follow a job by polling
+its status or subscribing to changes.
+"""
+
+import asyncio
+import itertools
+import random
+import time
+import uuid
+from collections import deque
+from typing import Dict, Any, Optional, Callable, List, Deque
+from app.services.upload_stream import UploadSource, UploadTooLarge, MAX_UPLOAD_SIZE, open_upload_source, stream_upload
+from app.services.log import get_logger
+
+log = get_logger('UPLOAD_QUEUE')
+
+MAX_CONCURRENT_UPLOADS = 4
+PER_USER_CONCURRENCY = 2
+MAX_ATTEMPTS = 4
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+RETRY_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+# Finished jobs are kept this long so pages can still read their result
+JOB_RETENTION = 900
+
+QUEUED = 'queued'
+UPLOADING = 'uploading'
+RETRYING = 'retrying'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class UploadJob:
+    """One queued file upload and its observable status."""
+
+    def __init__(self, source: UploadSource, owner: str, service: Any,
+                 extra_fields: Optional[Dict[str, Any]] = None, max_size: Optional[int] = MAX_UPLOAD_SIZE,
+                 max_attempts: int = MAX_ATTEMPTS):
+        self.id = uuid.uuid4().hex
+        self.source = source
+        self.owner = owner
+        self.service = service
+        self.extra_fields = extra_fields or {}
+        self.max_size = max_size
+        self.max_attempts = max_attempts
+        self.status = QUEUED
+        self.attempts = 0
+        self.progress = 0.0
+        self.response = None
+        self.error: Optional[str] = None
+        self.created_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self.client = _current_client()
+        self._listeners: List[Callable[['UploadJob'], None]] = []
+        self._done = asyncio.Event()
+
+    @property
+    def name(self) -> str:
+        return self.source.name
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+    def subscribe(self, callback: Callable[['UploadJob'], None]):
+        """Call callback(job) on every status change (and once right away)."""
+        self._listeners.append(callback)
+        self._notify(callback)
+
+    def unsubscribe(self, callback: Callable[['UploadJob'], None]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    async def wait(self) -> 'UploadJob':
+        await self._done.wait()
+        return self
+
+    def _set(self, status: str, error: Optional[str] = None):
+        self.status = status
+        if error is not None:
+            self.error = error
+        if self.finished:
+            self.finished_at = time.monotonic()
+            self._done.set()
+        for callback in list(self._listeners):
+            self._notify(callback)
+
+    def _notify(self, callback: Callable[['UploadJob'], None]):
+        try:
+            if self.client is not None:
+                # Listeners usually update UI elements of the submitting page
+                with self.client:
+                    callback(self)
+            else:
+                callback(self)
+        except Exception as e:
+            log.warning('Listener for job %s failed: %s', self.id, e)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'status': self.status,
+            'attempts': self.attempts,
+            'progress': self.progress,
+            'bytes_sent': self.source.bytes_sent,
+            'size': self.source.size,
+            'status_code': getattr(self.response, 'status_code', None),
+            'error': self.error,
+        }
+
+
+def _current_client():
+    try:
+        from nicegui import ui
+        return ui.context.client
+    except Exception:
+        return None
+
+
+def _current_owner_and_service():
+    from app.services.client_registry import client_registry
+    from app.services.async_api_service import async_api_service
+    context = client_registry.current()
+    if context is None:
+        return 'anonymous', async_api_service._resolve()
+    return context.session_id, context.aio
+
+
+class UploadQueue:
+    """Worker pool draining per-user upload queues round-robin."""
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENT_UPLOADS,
+                 per_user_concurrency: int = PER_USER_CONCURRENCY,
+                 backoff_base: float = BACKOFF_BASE, backoff_max: float = BACKOFF_MAX):
+        self.max_concurrency = max_concurrency
+        self.per_user_concurrency = per_user_concurrency
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._jobs: Dict[str, UploadJob] = {}
+        self._pending: Dict[str, Deque[UploadJob]] = {}
+        self._active: Dict[str, int] = {}
+        self._rotation = itertools.count()
+        self._wakeup: Optional[asyncio.Condition] = None
+        self._workers: List[asyncio.Task] = []
+        self.completed = 0
+        self.failed = 0
+        self.retries = 0
+
+    # ----- submitting and status -----
+
+    def submit(self, file: Any, name: Optional[str] = None, content_type: Optional[str] = None,
+               extra_fields: Optional[Dict[str, Any]] = None, max_size: Optional[int] = MAX_UPLOAD_SIZE,
+               owner: Optional[str] = None, service: Optional[Any] = None) -> Optional[UploadJob]:
+        """
+        Queue an upload and return its job (None if there is nothing to upload).
+
+        file is anything open_upload_source accepts (an upload event, a NiceGUI
+        FileUpload, a spool or bytes). owner and service default to the current
+        browser session and its API client.
+        """
+        source = open_upload_source(file, name, content_type)
+        if source is None:
+            return None
+        if owner is None or service is None:
+            default_owner, default_service = _current_owner_and_service()
+            owner = owner or default_owner
+            service = service or default_service
+        job = UploadJob(source, owner, service, extra_fields, max_size)
+        if max_size and source.size is not None and source.size > max_size:
+            # Known to be too large; fail without taking a worker slot
+            job.error = str(UploadTooLarge(max_size))
+            job.status = FAILED
+            job.finished_at = time.monotonic()
+            job._done.set()
+            self._jobs[job.id] = job
+            self.failed += 1
+            return job
+        self._jobs[job.id] = job
+        self._pending.setdefault(owner, deque()).append(job)
+        self._ensure_workers()
+        self._wake()
+        log.info('Queued %s (%s) for %s', source.name, job.id, owner)
+        return job
+
+    def get(self, job_id: str) -> Optional[UploadJob]:
+        return self._jobs.get(job_id)
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        return job.snapshot() if job else None
+
+    def jobs_for(self, owner: str) -> List[UploadJob]:
+        return [job for job in self._jobs.values() if job.owner == owner]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'queued': sum(len(q) for q in self._pending.values()),
+            'active': sum(self._active.values()),
+            'workers': len(self._workers),
+            'completed': self.completed,
+            'failed': self.failed,
+            'retries': self.retries,
+        }
+
+    # ----- scheduling -----
+
+    def _ensure_workers(self):
+        if self._wakeup is None:
+            self._wakeup = asyncio.Condition()
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self.max_concurrency:
+            self._workers.append(asyncio.ensure_future(self._worker()))
+
+    def _wake(self):
+        async def notify():
+            async with self._wakeup:
+                self._wakeup.notify_all()
+        asyncio.ensure_future(notify())
+
+    def _next_job(self) -> Optional[UploadJob]:
+        """Pick the next job round-robin over owners below their fair share."""
+        owners = [o for o, q in self._pending.items()
+                  if q and self._active.get(o, 0) < self.per_user_concurrency]
+        if not owners:
+            return None
+        owner = owners[next(self._rotation) % len(owners)]
+        job = self._pending[owner].popleft()
+        if not self._pending[owner]:
+            del self._pending[owner]
+        self._active[owner] = self._active.get(owner, 0) + 1
+        return job
+
+    async def _worker(self):
+        while True:
+            async with self._wakeup:
+                job = self._next_job()
+                while job is None:
+                    await self._wakeup.wait()
+                    job = self._next_job()
+            try:
+                await self._run(job)
+            finally:
+                self._active[job.owner] -= 1
+                if not self._active[job.owner]:
+                    del self._active[job.owner]
+                self._prune()
+                self._wake()
+
+    async def _run(self, job: UploadJob):
+        def report_progress(sent, total):
+            if total:
+                job.progress = sent / total
+
+        while True:
+            job.attempts += 1
+            job.progress = 0.0
+            job._set(UPLOADING)
+            retry_reason = None
+            try:
+                # Each attempt re-reads the spool from the start; /upload has no
+                # ranged-upload protocol to resume a partial body against
+                response = await stream_upload(job.source, job.service, extra_fields=job.extra_fields,
+                                               max_size=job.max_size, on_progress=report_progress)
+                job.response = response
+                if response.is_success:
+                    job.progress = 1.0
+                    self.completed += 1
+                    job._set(DONE)
+                    log.info('Uploaded %s (%s) after %s attempt(s)', job.name, job.id, job.attempts)
+                    return
+                if response.status_code not in RETRY_STATUS_CODES:
+                    self.failed += 1
+                    job._set(FAILED, f"Upload failed with status {response.status_code}")
+                    return
+                retry_reason = f"status {response.status_code}"
+            except UploadTooLarge as e:
+                self.failed += 1
+                job._set(FAILED, str(e))
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                retry_reason = str(e) or e.__class__.__name__
+
+            if job.attempts >= job.max_attempts:
+                self.failed += 1
+                job._set(FAILED, f"Upload failed after {job.attempts} attempts: {retry_reason}")
+                log.warning('Giving up on %s (%s): %s', job.name, job.id, retry_reason)
+                return
+            delay = self._backoff(job.attempts)
+            self.retries += 1
+            job._set(RETRYING, retry_reason)
+            log.info('Retrying %s (%s) in %.1fs: %s', job.name, job.id, delay, retry_reason)
+            await asyncio.sleep(delay)
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        # Full jitter so a burst of failed uploads does not retry in lockstep
+        return random.uniform(delay / 2, delay)
+
+    def _prune(self):
+        cutoff = time.monotonic() - JOB_RETENTION
+        for job_id in [jid for jid, job in self._jobs.items()
+                       if job.finished and job.finished_at and job.finished_at < cutoff]:
+            del self._jobs[job_id]
+
+    async def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+
+
+# Global upload queue instance
+upload_queue = UploadQueue()
@@ -0,0 +1,163 @@
+"""
+Streaming file uploads for Dompell Africa
+Sends NiceGUI upload spools to the backend /upload endpoint as a chunked
+multipart/form-data body, so a file is never held in memory as a whole.
+The size limit is enforced while streaming and progress is reported per chunk.
+"""
+
+import inspect
+import os
+import uuid
+from typing import Dict, Any, Optional, Callable, AsyncIterator
+
+CHUNK_SIZE = 256 * 1024
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds its size limit (checked incrementally)."""
+
+    def __init__(self, limit: int):
+        super().__init__(f"File too large. Maximum size is {limit // (1024 * 1024)}MB.")
+        self.limit = limit
+
+
+class UploadSource:
+    """A named file whose contents are read lazily, chunk by chunk."""
+
+    def __init__(self, name: str, content_type: str, chunks: Callable[[], AsyncIterator[bytes]],
+                 size: Optional[int] = None):
+        self.name = name
+        self.content_type = content_type or 'application/octet-stream'
+        self.size = size
+        self.bytes_sent = 0
+        self._chunks = chunks
+
+    def chunks(self) -> AsyncIterator[bytes]:
+        return self._chunks()
+
+
+def _bytes_chunks(data: bytes, chunk_size: int):
+    async def generator():
+        view = memoryview(data)
+        for i in range(0, len(data), chunk_size):
+            yield bytes(view[i:i + chunk_size])
+    return generator
+
+
+def _file_chunks(file_obj: Any, chunk_size: int):
+    async def generator():
+        if hasattr(file_obj, 'seek'):
+            file_obj.seek(0)
+        while True:
+            chunk = file_obj.read(chunk_size)
+            if inspect.isawaitable(chunk):
+                chunk = await chunk
+            if not chunk:
+                break
+            yield chunk
+    return generator
+
+
+def _file_size(file_obj: Any) -> Optional[int]:
+    try:
+        return os.fstat(file_obj.fileno()).st_size
+    except Exception:
+        pass
+    try:
+        position = file_obj.tell()
+        file_obj.seek(0, os.SEEK_END)
+        size = file_obj.tell()
+        file_obj.seek(position)
+        return size
+    except Exception:
+        return None
+
+
+def open_upload_source(obj: Any, name: Optional[str] = None, content_type: Optional[str] = None,
+                       chunk_size: int = CHUNK_SIZE) -> Optional[UploadSource]:
+    """
+    Wrap whatever a NiceGUI upload handler holds as an UploadSource.
+
+    Accepts an upload event (NiceGUI 3 `e.file` or NiceGUI 2 `e.content`), a
+    NiceGUI FileUpload, a file-like spool, or raw bytes. Returns None if there
+    is nothing to upload.
+    """
+    if obj is None:
+        return None
+    if isinstance(obj, UploadSource):
+        return obj
+    # Upload event arguments
+    if getattr(obj, 'file', None) is not None and not hasattr(obj, 'iterate'):
+        return open_upload_source(obj.file, name, content_type, chunk_size)
+    if getattr(obj, 'content', None) is not None and not hasattr(obj, 'read'):
+        return open_upload_source(obj.content, name or getattr(obj, 'name', None),
+                                  content_type or getattr(obj, 'type', None), chunk_size)
+    # NiceGUI 3 FileUpload (small ones in memory, large ones spooled to disk)
+    if hasattr(obj, 'iterate'):
+        return UploadSource(
+            name or obj.name,
+            content_type or getattr(obj, 'content_type', None),
+            lambda: obj.iterate(chunk_size=chunk_size),
+            obj.size(),
+        )
+    if isinstance(obj, (bytes, bytearray)):
+        return UploadSource(name or 'upload', content_type, _bytes_chunks(bytes(obj), chunk_size), len(obj))
+    if hasattr(obj, 'read'):
+        return UploadSource(name or getattr(obj, 'name', None) or 'upload', content_type,
+                            _file_chunks(obj, chunk_size), _file_size(obj))
+    return None
+
+
+def _quote_header_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '%22').replace('\r', '').replace('\n', '')
+
+
+async def _multipart_body(source: UploadSource, boundary: str, field: str, extra_fields: Dict[str, Any],
+                          max_size: Optional[int],
+                          on_progress: Optional[Callable[[int, Optional[int]], None]]) -> AsyncIterator[bytes]:
+    for key, value in extra_fields.items():
+        yield (f'--{boundary}\r\n'
+               f'Content-Disposition: form-data; name="{_quote_header_value(key)}"\r\n\r\n'
+               f'{value}\r\n').encode()
+    yield (f'--{boundary}\r\n'
+           f'Content-Disposition: form-data; name="{_quote_header_value(field)}"; '
+           f'filename="{_quote_header_value(source.name)}"\r\n'
+           f'Content-Type: {source.content_type}\r\n\r\n').encode()
+    async for chunk in source.chunks():
+        source.bytes_sent += len(chunk)
+        if max_size and source.bytes_sent > max_size:
+            raise UploadTooLarge(max_size)
+        yield chunk
+        if on_progress:
+            on_progress(source.bytes_sent, source.size)
+    yield f'\r\n--{boundary}--\r\n'.encode()
+
+
+async def stream_upload(source: UploadSource, service: Optional[Any] = None, field: str = 'file',
+                        extra_fields: Optional[Dict[str, Any]] = None,
+                        max_size: Optional[int] = MAX_UPLOAD_SIZE,
+                        on_progress: Optional[Callable[[int, Optional[int]], None]] = None):
+    """
+    Stream source to /upload and return the httpx response.
+
+    Raises UploadTooLarge as soon as the limit is crossed (or up front when
+    the size is already known).
+    """
+    if service is None:
+        from app.services.async_api_service import async_api_service
+        service = async_api_service
+    if max_size and source.size is not None and source.size > max_size:
+        raise UploadTooLarge(max_size)
+    source.bytes_sent = 0
+    boundary = uuid.uuid4().hex
+    body = _multipart_body(source, boundary, field, extra_fields or {}, max_size, on_progress)
+    try:
+        return await service.upload_file_stream(body, f'multipart/form-data; boundary={boundary}')
+    except UploadTooLarge:
+        raise
+    except Exception:
+        # The transport may wrap errors raised from inside the body iterator
+        if max_size and source.bytes_sent > max_size:
+            raise UploadTooLarge(max_size)
+        raise
@@ -0,0 +1,220 @@
+"""
+Startup warm-up for Dompell Africa
+Gets a worker ready before it is given traffic, so the first visitors do not
+pay for a sleeping backend, cold connection pools and an empty response
+cache.
+
+- Pings API_BASE_URL until the backend answers (a cold-starting host can
+  take most of a minute), for at most WARMUP_TIMEOUT seconds.
+- Opens WARMUP_CONNECTIONS pooled connections in the shared requests
+  session, and the shared httpx client's connection (it speaks HTTP/2, so
+  one connection carries all of its requests).
+- Prefetches the top-level shared lists (organizations, employers) into the
+  response cache, anonymously or with API_SERVICE_TOKEN; per-organization
+  program lists are left to the pages, so each worker adds two requests per
+  cycle rather than one per organization. Only 2xx answers are stored, and a
+  backend that wants a token for the lists (401/403) while none is
+  configured is not asked again.
+- Then keeps warm: a ping every WARMUP_INTERVAL seconds holds a connection
+  per pool open and the backend awake, and the hot lists are fetched again
+  every WARMUP_PREFETCH_INTERVAL seconds, before their cache entries expire.
+
+GET /ready answers 503 until the warm-up is over (also when it gave up on
+the backend, which then just starts cold) and 200 after; serve.py waits for
+it before counting a worker as started.
+"""
+
+import asyncio
+import time
+from typing import Dict, Any, Optional, List
+import httpx
+from app.config import (API_BASE_URL, API_SERVICE_TOKEN, WARMUP, WARMUP_CONNECTIONS, WARMUP_TIMEOUT,
+                        WARMUP_INTERVAL, WARMUP_PREFETCH_INTERVAL)
+from app.services.log import get_logger
+
+log = get_logger('WARMUP')
+
+READY_PATH = '/ready'
+# Shared (user-independent) lists kept in the response cache
+HOT_ENDPOINTS = ('/organization', '/employer')
+# Timeout of one ping; a sleeping host may hold the request until it is up
+PING_TIMEOUT = 30.0
+# Pause between pings while the backend does not answer, doubling up to the max
+PING_BACKOFF = 1.0
+PING_MAX_BACKOFF = 8.0
+
+
+def _data(response: Any) -> Optional[List[Dict[str, Any]]]:
+    """The list payload of a list endpoint, or None if the call failed."""
+    if isinstance(response, BaseException) or response is None or not response.is_success:
+        return None
+    try:
+        body = response.json()
+    except ValueError:
+        return None
+    if isinstance(body, dict):
+        body = body.get('data', [])
+    return [item for item in body if isinstance(item, dict)] if isinstance(body, list) else None
+
+
+class Warmup:
+    """Warm-up and keep-warm of one worker's backend connections and hot cache entries."""
+
+    def __init__(self, enabled: bool = WARMUP, connections: int = WARMUP_CONNECTIONS,
+                 timeout: float = WARMUP_TIMEOUT, interval: float = WARMUP_INTERVAL,
+                 prefetch_interval: float = WARMUP_PREFETCH_INTERVAL):
+        self.enabled = enabled
+        self.connections = connections
+        self.timeout = timeout
+        self.interval = interval
+        self.prefetch_interval = prefetch_interval
+        self.ready = False
+        self.backend_up = False
+        self.warmup_seconds: Optional[float] = None
+        self.prefetched = 0
+        self.pings = 0
+        self.ping_failures = 0
+        # The lists need a token and API_SERVICE_TOKEN is not set
+        self.prefetch_denied = False
+        self._background: Optional[asyncio.Task] = None
+
+    # ----- lifecycle -----
+
+    def start(self):
+        """Start the warm-up and keep-warm loop (register with app.on_startup)."""
+        if not self.enabled:
+            self.ready = True
+            return
+        if self._background is None or self._background.done():
+            self._background = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._background is not None:
+            self._background.cancel()
+            self._background = None
+
+    async def _run(self):
+        started = time.monotonic()
+        try:
+            self.backend_up = await self.wait_for_backend()
+            if self.backend_up:
+                await asyncio.gather(self.open_connections(), self.prefetch())
+            else:
+                log.warning('Backend did not answer within %ss; starting cold', self.timeout)
+            await asyncio.to_thread(self._open_local_stores)
+        except Exception as e:
+            log.warning('Warm-up error: %s', e)
+        finally:
+            self.warmup_seconds = time.monotonic() - started
+            self.ready = True
+            log.info('Ready after %.1fs (backend %s, %s list(s) prefetched)', self.warmup_seconds,
+                     'up' if self.backend_up else 'down', self.prefetched)
+        last_prefetch = time.monotonic()
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.backend_up = await asyncio.gather(self.ping(), self._ping_sync()) == [True, True]
+                if self.backend_up and time.monotonic() - last_prefetch >= self.prefetch_interval:
+                    await self.prefetch()
+                    last_prefetch = time.monotonic()
+            except Exception as e:
+                log.warning('Keep-warm error: %s', e)
+
+    # ----- backend -----
+
+    async def ping(self, timeout: float = PING_TIMEOUT) -> bool:
+        """Whether the backend answers at all (any status below 500).
+
+        Sent straight through the shared client: the circuit breakers would
+        answer for a backend that is still starting.
+        """
+        from app.services.async_api_service import get_shared_client
+        self.pings += 1
+        try:
+            resp = await get_shared_client().get(API_BASE_URL, timeout=timeout)
+            if resp.status_code < 500:
+                return True
+        except httpx.HTTPError:
+            pass
+        self.ping_failures += 1
+        return False
+
+    async def _ping_sync(self, timeout: float = PING_TIMEOUT) -> bool:
+        """ping() through the shared requests session."""
+        import requests
+        from app.services.api_service import get_shared_session
+        try:
+            resp = await asyncio.to_thread(get_shared_session().get, API_BASE_URL, timeout=timeout)
+            return resp.status_code < 500
+        except requests.RequestException:
+            return False
+
+    async def wait_for_backend(self) -> bool:
+        """Ping until the backend answers or self.timeout runs out."""
+        deadline = time.monotonic() + self.timeout
+        backoff = PING_BACKOFF
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if await self.ping(timeout=min(PING_TIMEOUT, remaining)):
+                return True
+            await asyncio.sleep(min(backoff, max(0.0, deadline - time.monotonic())))
+            backoff = min(backoff * 2, PING_MAX_BACKOFF)
+
+    async def open_connections(self):
+        """Open self.connections connections in the requests pool by pinging concurrently."""
+        results = await asyncio.gather(self.ping(), *(self._ping_sync() for _ in range(self.connections)))
+        log.debug('Opened pooled connections (%s of %s pings answered)', sum(results), len(results))
+
+    async def prefetch(self) -> int:
+        """Fetch the hot shared lists into the response cache, replacing older copies."""
+        from app.services.async_api_service import AsyncApiService
+        from app.services.response_cache import response_cache
+        if self.prefetch_denied:
+            return 0
+        # The lists are cached for everyone, so never fetched with a user's token
+        service = AsyncApiService(token=API_SERVICE_TOKEN or None)
+
+        async def fetch(endpoint: str):
+            resp = await service._make_request('GET', endpoint, cache=False)
+            # A failed fetch must not replace the copy a signed-in page request cached
+            if 200 <= resp.status_code < 300:
+                return response_cache.store(endpoint, None, service.token, resp, flavor='async')
+            return resp
+
+        results = await asyncio.gather(*(fetch(endpoint) for endpoint in HOT_ENDPOINTS), return_exceptions=True)
+        if not service.token and any(getattr(r, 'status_code', None) in (401, 403) for r in results):
+            self.prefetch_denied = True
+            log.info('Shared lists need a token; prefetching off (set API_SERVICE_TOKEN to enable it)')
+        fetched = sum(1 for r in results if _data(r) is not None)
+        self.prefetched = fetched
+        return fetched
+
+    # ----- local -----
+
+    def _open_local_stores(self):
+        """Open the job store's database (and run its migrations) ahead of the first page."""
+        from app.services.job_store import job_store
+        job_store.summary()
+
+    # ----- readiness -----
+
+    def status(self) -> Dict[str, Any]:
+        return {'ready': self.ready, 'backend_up': self.backend_up, 'warmup_seconds': self.warmup_seconds,
+                'prefetched': self.prefetched, 'prefetch_denied': self.prefetch_denied,
+                'pings': self.pings, 'ping_failures': self.ping_failures}
+
+
+def register_ready_route(path: str = READY_PATH):
+    """Serve the worker's readiness (200 once warmed up, 503 before) on the NiceGUI app."""
+    from fastapi.responses import JSONResponse
+    from nicegui import app
+
+    @app.get(path, include_in_schema=False)
+    def ready():
+        return JSONResponse(warmup.status(), status_code=200 if warmup.ready else 503)
+
+
+# Global warm-up instance
+warmup = Warmup()
@@ -61,20 +61,19 @@ def handle_login(user_data: dict, token: str, refresh_token: str = None):
         'token': token,
         'refresh_token': refresh_token,
     })
-    # Set the token in the API service for subsequent requests
-    from .services.api_service import api_service
-    api_service.set_auth_token(token)
-    if refresh_token:
-        api_service.set_refresh_token(refresh_token)
+    # Bind the tokens to this browser session's API clients
+    from .services.client_registry import client_registry
+    context = client_registry.current()
+    if context is not None:
+        context.set_credentials(token, refresh_token)
     print(f"User {user_data.get('email')} logged in.")
 
 @auth_events.on('logout')
 def handle_logout():
     """Handle user logout state."""
-    # Clear the token from the API service
-    from .services.api_service import api_service
-    api_service.clear_auth_token()
-    api_service.refresh_token = None
+    # Drop this browser session's API clients and their tokens
+    from .services.client_registry import client_registry
+    client_registry.evict_current()
     
     # Clear user session
     app.storage.user.clear()
@@ -0,0 +1,399 @@
+"""
+Load benchmark for Dompell Africa
+Drives many concurrent simulated browser sessions through
+login -> candidate dashboard -> profile edit against the real app (main.py)
+and the local stand-in backend (stub_backend.py), then reports throughput,
+p50/p95/p99 latency per step and memory per session.
+
+    python bench.py --sessions 100 --concurrency 20 --latency 80 --jitter 40
+    python bench.py --backend http://127.0.0.1:8900/api   # an already running stand-in
+    python bench.py --record run.jsonl.gz                  # also capture the backend traffic
+    python bench.py --replay run.jsonl.gz                  # offline, from a capture
+
+The app runs in this process in NiceGUI's user simulation mode: each session has
+its own cookies (so its own app.storage.user and API clients), requests pages
+over ASGI, completes the page handshake, fills in inputs and clicks buttons
+the way the browser would, and follows ui.navigate.to(). Socket.IO transport
+and browser rendering are not part of the numbers; page building, event
+handlers, session storage and backend calls are.
+
+Steps (latencies in ms):
+    auth-form        GET /auth-form until the page is connected
+    login            click on "Log In" until "Login successful"
+    dashboard        GET of the page login navigated to, until connected
+    dashboard-ready  start of the dashboard GET until its last UI update
+    profile-section  click on "My Profile" until its last UI update
+    profile-save     click on "Save Profile" until "Profile updated"
+
+Memory per session is the growth of this process's RSS while the sessions'
+dashboards are open, divided by the number of sessions.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent
+# A page counts as loaded once it sent no UI update for this long
+QUIET_PERIOD = 0.25
+STEP_TIMEOUT = 30.0
+STEPS = ('auth-form', 'login', 'dashboard', 'dashboard-ready', 'profile-section', 'profile-save')
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _rss_bytes() -> int:
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class StepError(Exception):
+    pass
+
+
+class SimulatedSession:
+    """One browser session: its own cookies, the open page's client and what was sent to it."""
+
+    def __init__(self, index: int, email: str, password: str):
+        from nicegui import core
+
+        self.index = index
+        self.email = email
+        self.password = password
+        self.http = httpx.AsyncClient(transport=httpx.ASGITransport(core.app), base_url='http://bench')
+        self.client = None
+        self.last_update = 0.0
+        self.notifications: List[str] = []
+        self.navigation: Optional[str] = None
+        self.timings: Dict[str, float] = {}
+
+    async def open(self, path: str) -> float:
+        """Load a page and connect to it like the browser would; returns the start time."""
+        from nicegui import Client
+        from nicegui.nicegui import _on_handshake
+
+        if self.client is not None:
+            # The browser leaves the previous page
+            self.client.delete()
+        started = time.perf_counter()
+        response = await self.http.get(path, follow_redirects=True)
+        if response.status_code != 200:
+            raise StepError(f'GET {path} returned {response.status_code}')
+        match = re.search(r"'client_id': '([0-9a-f-]+)'", response.text)
+        if match is None:
+            raise StepError(f'GET {path} did not return a page')
+        self.client = Client.instances[match.group(1)]
+        self.navigation = None
+        self.last_update = time.perf_counter()
+        self._watch_outbox()
+        await _on_handshake(f'test-{uuid.uuid4()}', {
+            'client_id': self.client.id, 'tab_id': str(uuid.uuid4()), 'document_id': str(uuid.uuid4()),
+        })
+        return started
+
+    def _watch_outbox(self):
+        outbox = self.client.outbox
+        emit = outbox._emit
+
+        async def watched(message):
+            await emit(message)
+            _, message_type, data = message
+            if message_type == 'update':
+                self.last_update = time.perf_counter()
+            elif message_type == 'notify':
+                self.notifications.append(str(data.get('message', '')))
+            elif message_type == 'open':
+                self.navigation = data.get('path')
+
+        outbox._emit = watched
+
+    async def settle(self, timeout: float = STEP_TIMEOUT) -> float:
+        """Wait until the page stops changing; returns the time of its last update."""
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(QUIET_PERIOD / 5)
+            if time.perf_counter() - self.last_update >= QUIET_PERIOD:
+                return self.last_update
+        raise StepError('page kept updating')
+
+    async def notified(self, *phrases: str, timeout: float = STEP_TIMEOUT) -> str:
+        """Wait for a notification containing one of the phrases (others are failures)."""
+        seen = len(self.notifications)
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            for text in self.notifications[seen:]:
+                if any(phrase in text for phrase in phrases):
+                    return text
+                if any(word in text.lower() for word in ('fail', 'error', 'invalid', 'expired')):
+                    raise StepError(text)
+            await asyncio.sleep(0.01)
+        raise StepError(f'no notification containing {phrases!r}')
+
+    async def navigated(self, timeout: float = STEP_TIMEOUT) -> str:
+        deadline = time.perf_counter() + timeout
+        while self.navigation is None:
+            if time.perf_counter() > deadline:
+                raise StepError('no navigation')
+            await asyncio.sleep(0.01)
+        return self.navigation
+
+    # ----- element lookup and interaction -----
+
+    def find(self, kind: Any, text: Optional[str] = None, placeholder: Optional[str] = None):
+        for element in list(self.client.elements.values()):
+            if not isinstance(element, kind):
+                continue
+            if text is not None and getattr(element, 'text', None) != text:
+                continue
+            if placeholder is not None and not str(element.props.get('placeholder', '')).startswith(placeholder):
+                continue
+            return element
+        raise StepError(f'no {kind.__name__} {text or placeholder!r} on {self.client.page.path}')
+
+    def type(self, element: Any, value: str):
+        with self.client:
+            element.value = value
+
+    def click(self, element: Any):
+        """Run the element's click handlers (or those of the nearest ancestor that has some)."""
+        from nicegui import events
+
+        while element is not None and not any(l.type == 'click' for l in element._event_listeners.values()):
+            element = element.parent_slot.parent if element.parent_slot else None
+        if element is None:
+            raise StepError('nothing to click')
+        with self.client:
+            for listener in list(element._event_listeners.values()):
+                if listener.type == 'click':
+                    events.handle_event(listener.handler,
+                                        events.GenericEventArguments(sender=element, client=self.client, args={}))
+
+    async def close(self):
+        if self.client is not None:
+            self.client.delete()
+            self.client = None
+        await self.http.aclose()
+
+
+async def run_session(session: SimulatedSession, results: Dict[str, Any]):
+    """login -> dashboard -> profile edit, recording each step's latency in ms."""
+    from nicegui import ui
+
+    step = 'auth-form'
+    try:
+        started = await session.open('/auth-form')
+        results['latency'][step].append((time.perf_counter() - started) * 1000)
+
+        step = 'login'
+        session.type(session.find(ui.input, placeholder='Email Address'), session.email)
+        session.type(session.find(ui.input, placeholder='Password'), session.password)
+        started = time.perf_counter()
+        session.click(session.find(ui.button, text='Log In'))
+        await session.notified('Login successful')
+        results['latency'][step].append((time.perf_counter() - started) * 1000)
+        target = await session.navigated()
+
+        step = 'dashboard'
+        started = await session.open(target)
+        results['latency'][step].append((time.perf_counter() - started) * 1000)
+        step = 'dashboard-ready'
+        results['latency'][step].append((await session.settle() - started) * 1000)
+
+        step = 'profile-section'
+        started = time.perf_counter()
+        session.click(session.find(ui.label, text='My Profile'))
+        results['latency'][step].append((max(await session.settle(), started) - started) * 1000)
+
+        step = 'profile-save'
+        session.type(session.find(ui.input, placeholder='e.g., Full Stack Developer'), f'Engineer {session.index}')
+        session.type(session.find(ui.input, placeholder='e.g., Accra'), 'Accra, Ghana')
+        session.type(session.find(ui.textarea, placeholder='Tell us about yourself'), 'Benchmark profile.')
+        started = time.perf_counter()
+        session.click(session.find(ui.button, text='Save Profile'))
+        await session.notified('Profile updated')
+        results['latency'][step].append((time.perf_counter() - started) * 1000)
+        await session.settle()
+        results['completed'] += 1
+    except Exception as e:
+        results['errors'].setdefault(step, []).append(str(e) or type(e).__name__)
+
+
+def load_app():
+    """Import main.py with ui.run() in simulation mode: pages and startup hooks, no server."""
+    import runpy
+
+    os.environ['NICEGUI_USER_SIMULATION'] = 'true'
+    runpy.run_path(str(ROOT / 'main.py'), run_name='__main__')
+
+
+async def benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    from nicegui import core
+    from stub_backend import SEED_PASSWORD
+
+    results: Dict[str, Any] = {'latency': {step: [] for step in STEPS}, 'errors': {}, 'completed': 0}
+    async with core.app.router.lifespan_context(core.app):
+        def session(index: int) -> SimulatedSession:
+            return SimulatedSession(index, f'bench{index % args.users}@dompell.test', SEED_PASSWORD)
+
+        # Warm up: import the pages and fill caches before measuring
+        warmup = session(0)
+        await run_session(warmup, {'latency': {step: [] for step in STEPS}, 'errors': {}, 'completed': 0})
+        await warmup.close()
+        gc.collect()
+        baseline = _rss_bytes()
+
+        sessions = [session(i) for i in range(args.sessions)]
+        limit = asyncio.Semaphore(args.concurrency)
+
+        async def limited(s: SimulatedSession):
+            async with limit:
+                await run_session(s, results)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(limited(s) for s in sessions))
+        elapsed = time.perf_counter() - started
+        gc.collect()
+        grown = _rss_bytes() - baseline
+        for s in sessions:
+            await s.close()
+
+    results.update(elapsed=elapsed, sessions=args.sessions, concurrency=args.concurrency,
+                   rss_per_session=grown / max(args.sessions, 1))
+    return results
+
+
+def report(results: Dict[str, Any]) -> str:
+    elapsed = results['elapsed']
+    pages = sum(len(results['latency'][step]) for step in ('auth-form', 'dashboard'))
+    lines = [
+        f"{results['completed']}/{results['sessions']} sessions completed in {elapsed:.1f}s "
+        f"(concurrency {results['concurrency']})",
+        f"throughput: {results['completed'] / elapsed:.2f} sessions/s, {pages / elapsed:.2f} pages/s",
+        f"memory: {results['rss_per_session'] / 1024 / 1024:.2f} MiB RSS per session",
+        '',
+        f"{'step':<16} {'count':>6} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}",
+    ]
+    for step in STEPS:
+        values = results['latency'][step]
+        lines.append(f"{step:<16} {len(values):>6} {len(results['errors'].get(step, [])):>6} "
+                     f"{_percentile(values, 0.5):>8.0f} {_percentile(values, 0.95):>8.0f} "
+                     f"{_percentile(values, 0.99):>8.0f} {max(values, default=0):>8.0f}")
+    for step, errors in results['errors'].items():
+        lines.append(f"errors in {step}: {errors[0]}" + (f' (+{len(errors) - 1} more)' if len(errors) > 1 else ''))
+    if 'backend_requests' in results:
+        lines.append(f"backend: {results['backend_requests']} requests")
+    if 'backend_replayed' in results:
+        lines.append(f"backend: {results['backend_replayed']} replayed, {results['backend_misses']} not recorded")
+    return '\n'.join(lines)
+
+
+def start_stub(args: argparse.Namespace) -> tuple:
+    port = _free_port()
+    process = subprocess.Popen([
+        sys.executable, str(ROOT / 'stub_backend.py'), '--port', str(port), '--users', str(args.users),
+        '--latency', str(args.latency), '--jitter', str(args.jitter), '--error-rate', str(args.error_rate),
+    ], cwd=ROOT)
+    base = f'http://127.0.0.1:{port}'
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f'{base}/_stub/config', timeout=1)
+            return process, f'{base}/api'
+        except httpx.TransportError:
+            time.sleep(0.2)
+    process.terminate()
+    raise SystemExit('stand-in backend did not start')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark login -> dashboard -> profile edit sessions.')
+    parser.add_argument('--sessions', type=int, default=50, help='sessions to run')
+    parser.add_argument('--concurrency', type=int, default=10, help='sessions running at once')
+    parser.add_argument('--users', type=int, default=200, help='seeded accounts the sessions log in as')
+    parser.add_argument('--backend', help='API base URL of a running stand-in (default: start one)')
+    parser.add_argument('--latency', type=float, default=50.0, help='stand-in latency per request in ms')
+    parser.add_argument('--jitter', type=float, default=25.0, help='stand-in random extra latency in ms')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of stand-in requests that fail')
+    parser.add_argument('--record', metavar='CASSETTE', help='record the backend traffic to this cassette')
+    parser.add_argument('--replay', metavar='CASSETTE',
+                        help='answer backend requests from this cassette instead of a stand-in')
+    parser.add_argument('--time-scale', type=float, default=1.0,
+                        help='replayed latency as a multiple of the recorded one')
+    parser.add_argument('--json', help='also write the raw results to this file')
+    args = parser.parse_args()
+
+    process = None
+    backend = args.backend
+    if args.replay:
+        backend = 'http://replay.invalid/api'
+        os.environ.update({'API_CASSETTE_MODE': 'replay', 'API_CASSETTE_PATH': args.replay,
+                           'API_CASSETTE_TIME_SCALE': str(args.time_scale)})
+    elif args.record:
+        os.environ.update({'API_CASSETTE_MODE': 'record', 'API_CASSETTE_PATH': args.record})
+    if backend is None:
+        process, backend = start_stub(args)
+    workdir = tempfile.mkdtemp(prefix='dompell-bench-')
+    # Must be set before app.config is imported (by main.py)
+    os.environ.update({
+        'API_BASE_URL': backend,
+        'SESSION_STORE_PATH': os.path.join(workdir, 'sessions.db'),
+        'JOB_STORE_PATH': os.path.join(workdir, 'jobs.db'),
+        'SEARCH_INDEX_PATH': os.path.join(workdir, 'search_index.json.gz'),
+        'LOG_LEVEL': os.environ.get('LOG_LEVEL', 'WARNING'),
+    })
+    sys.path.insert(0, str(ROOT))
+    try:
+        load_app()
+        results = asyncio.run(benchmark(args))
+        if args.replay:
+            from app.services.api_cassette import api_cassette
+            results['backend_replayed'] = api_cassette.replayed
+            results['backend_misses'] = api_cassette.misses
+        else:
+            try:
+                stats = httpx.get(backend.rsplit('/api', 1)[0] + '/_stub/stats', timeout=5).json()
+                results['backend_requests'] = stats['requests']
+            except (httpx.HTTPError, ValueError, KeyError):
+                pass
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    print(report(results))
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding='utf-8')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+"""
+Production server for Dompell Africa
+Runs WORKERS copies of the app (main.py with the reloader off), one per port
+from WORKER_BASE_PORT, and restarts any that exit. NiceGUI keeps a page's
+state and websocket in the process that built it, so a browser has to keep
+talking to the same worker: put a proxy with sticky routing in front
+(`python serve.py --nginx` prints an nginx config that pins each client IP
+to a worker). Sessions live in the shared SQLite session store
+(app.services.session_store), so a client that fails over to another worker
+stays logged in.
+
+    python serve.py                  # start the workers
+    python serve.py --nginx          # print the nginx config for them
+    kill -HUP <pid of serve.py>      # rolling restart, one worker at a time
+
+A worker counts as started once its /ready answers 200, i.e. after its
+backend warm-up (app.services.warmup); during a rolling restart the next
+worker is only stopped then.
+
+Settings come from app.config (WORKERS, WORKER_BASE_PORT, WORKER_HOST,
+GRACEFUL_TIMEOUT, WARMUP_TIMEOUT and the API_POOL_* sizes, which apply per
+worker).
+"""
+
+import argparse
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Dict, Optional
+from app.config import WORKERS, WORKER_BASE_PORT, WORKER_HOST, GRACEFUL_TIMEOUT, WARMUP_TIMEOUT
+
+ROOT = Path(__file__).resolve().parent
+# Startup plus the backend warm-up
+READY_TIMEOUT = 60 + WARMUP_TIMEOUT
+# Wait before restarting a worker that keeps crashing
+RESTART_BACKOFF = 5
+
+NGINX_TEMPLATE = """\
+# Generated by `python serve.py --nginx`
+map $http_upgrade $connection_upgrade {{
+    default upgrade;
+    '' close;
+}}
+
+upstream dompell {{
+    # Sticky: a page and its websocket must reach the worker that built it
+    ip_hash;
+{servers}
+}}
+
+server {{
+    listen {listen};
+
+    location / {{
+        proxy_pass http://dompell;
+        proxy_http_version 1.1;
+        proxy_set_header Upgrade $http_upgrade;
+        proxy_set_header Connection $connection_upgrade;
+        proxy_set_header Host $host;
+        proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
+        proxy_set_header X-Forwarded-Proto $scheme;
+        proxy_read_timeout 1h;
+        # A restarting worker is skipped until it is back
+        proxy_next_upstream error timeout http_502 http_503;
+    }}
+}}
+"""
+
+
+def _local_host() -> str:
+    """Address to reach the workers at: loopback when they bind every interface."""
+    return '127.0.0.1' if WORKER_HOST in ('0.0.0.0', '::', '') else WORKER_HOST
+
+
+def nginx_config(workers: int, base_port: int, listen: int) -> str:
+    servers = '\n'.join(f'    server {_local_host()}:{base_port + i} max_fails=1 fail_timeout=5s;'
+                         for i in range(workers))
+    return NGINX_TEMPLATE.format(servers=servers, listen=listen)
+
+
+def _listening(port: int) -> bool:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.settimeout(0.5)
+        return s.connect_ex((_local_host(), port)) == 0
+
+
+def _ready(port: int) -> bool:
+    """Whether the worker on port has finished its warm-up (GET /ready is 200)."""
+    try:
+        with urllib.request.urlopen(f'http://{_local_host()}:{port}/ready', timeout=2) as resp:
+            return resp.status == 200
+    except (urllib.error.URLError, OSError):
+        return False
+
+
+class Worker:
+    """One app process on its own port."""
+
+    def __init__(self, index: int, port: int):
+        self.index = index
+        self.port = port
+        self.process: Optional[subprocess.Popen] = None
+        self.started = 0.0
+
+    def start(self):
+        env = dict(os.environ, HOST=WORKER_HOST, PORT=str(self.port), RELOAD='0', WORKER_ID=str(self.index))
+        self.process = subprocess.Popen([sys.executable, str(ROOT / 'main.py')], cwd=ROOT, env=env)
+        self.started = time.monotonic()
+        print(f"[SERVE] Worker {self.index} started on port {self.port} (pid {self.process.pid})")
+
+    def wait_ready(self) -> bool:
+        deadline = time.monotonic() + READY_TIMEOUT
+        while time.monotonic() < deadline:
+            if not self.alive:
+                return False
+            if _listening(self.port) and _ready(self.port):
+                return True
+            time.sleep(0.5)
+        return False
+
+    def stop(self):
+        """Let the worker finish open requests (SIGTERM), then kill it after GRACEFUL_TIMEOUT."""
+        if not self.alive:
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(GRACEFUL_TIMEOUT + 5)
+        except subprocess.TimeoutExpired:
+            print(f"[SERVE] Worker {self.index} did not stop in time; killing it")
+            self.process.kill()
+            self.process.wait()
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+
+class Supervisor:
+    """Starts the workers, restarts crashed ones and performs rolling restarts."""
+
+    def __init__(self, workers: int = WORKERS, base_port: int = WORKER_BASE_PORT):
+        self.workers: Dict[int, Worker] = {i: Worker(i, base_port + i) for i in range(workers)}
+        self.running = True
+        self.reload_requested = False
+
+    def run(self):
+        signal.signal(signal.SIGINT, self._on_stop)
+        signal.signal(signal.SIGTERM, self._on_stop)
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, self._on_reload)
+        for worker in self.workers.values():
+            worker.start()
+        for worker in self.workers.values():
+            if not worker.wait_ready():
+                print(f"[SERVE] Worker {worker.index} did not come up on port {worker.port}")
+        print(f"[SERVE] {len(self.workers)} worker(s) on ports "
+              f"{min(w.port for w in self.workers.values())}-{max(w.port for w in self.workers.values())}")
+        try:
+            while self.running:
+                if self.reload_requested:
+                    self.reload_requested = False
+                    self.rolling_restart()
+                for worker in self.workers.values():
+                    if self.running and not worker.alive and time.monotonic() - worker.started > RESTART_BACKOFF:
+                        print(f"[SERVE] Worker {worker.index} exited ({worker.process.returncode}); restarting")
+                        worker.start()
+                time.sleep(1)
+        finally:
+            for worker in self.workers.values():
+                if worker.alive:
+                    worker.process.terminate()
+            for worker in self.workers.values():
+                worker.stop()
+            print("[SERVE] Stopped")
+
+    def rolling_restart(self):
+        """Restart one worker at a time so the others keep serving."""
+        print("[SERVE] Rolling restart")
+        for worker in self.workers.values():
+            if not self.running:
+                return
+            worker.stop()
+            worker.start()
+            if not worker.wait_ready():
+                print(f"[SERVE] Worker {worker.index} did not come back; stopping the rolling restart")
+                return
+        print("[SERVE] Rolling restart done")
+
+    def _on_stop(self, signum, frame):
+        self.running = False
+
+    def _on_reload(self, signum, frame):
+        self.reload_requested = True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the Dompell Africa workers.')
+    parser.add_argument('--workers', type=int, default=WORKERS, help='number of worker processes')
+    parser.add_argument('--base-port', type=int, default=WORKER_BASE_PORT, help='port of the first worker')
+    parser.add_argument('--nginx', action='store_true', help='print an nginx config for the workers and exit')
+    parser.add_argument('--listen', type=int, default=80, help='port nginx listens on (with --nginx)')
+    args = parser.parse_args()
+
+    if args.nginx:
+        print(nginx_config(args.workers, args.base_port, args.listen))
+        return
+    Supervisor(args.workers, args.base_port).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,537 @@
+"""
+Local stand-in backend for Dompell Africa
+A FastAPI app that answers the endpoints ApiService and AsyncApiService call
+(auth, users, trainee/*, organization, programs, employer, upload) from
+in-memory data, so the frontend can be load-tested without touching the
+shared, rate-limited server. Every response can be delayed (latency plus
+random jitter) and a share of them replaced by errors.
+
+    python stub_backend.py --port 8900 --latency 80 --jitter 40 --error-rate 0.01
+    API_BASE_URL=http://127.0.0.1:8900/api python main.py
+
+Seeded accounts: bench<N>@dompell.test (trainees, N from 0 to --users - 1),
+employer<N>@dompell.test and institution<N>@dompell.test, all with the
+password SEED_PASSWORD. Access tokens are JWT-shaped with an `exp` claim and
+expire after --token-ttl seconds; /auth/refresh-token issues new ones.
+
+The fault settings can be changed while running:
+    curl -X POST localhost:8900/_stub/config -d '{"latency_ms": 300, "error_rate": 0.05}'
+GET /_stub/stats returns the request count per endpoint.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import secrets
+import time
+import uuid
+from collections import Counter
+from typing import Dict, Any, Optional, List
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+API_PREFIX = '/api'
+SEED_PASSWORD = 'Password123!'
+TRAINEE_LISTS = ('education', 'experience', 'certification', 'portfolio')
+
+
+class FaultSettings:
+    """Latency and error injection applied to every /api request."""
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 503):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+
+    def update(self, values: Dict[str, Any]):
+        for key in ('latency_ms', 'jitter_ms', 'error_rate'):
+            if key in values:
+                setattr(self, key, float(values[key]))
+        if 'error_status' in values:
+            self.error_status = int(values['error_status'])
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'latency_ms': self.latency_ms, 'jitter_ms': self.jitter_ms,
+                'error_rate': self.error_rate, 'error_status': self.error_status}
+
+
+def _b64(data: Dict[str, Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b'=').decode()
+
+
+def _envelope(data: Any, status: int = 200, message: str = 'Success') -> JSONResponse:
+    return JSONResponse({'status': status, 'message': message, 'data': data}, status_code=status)
+
+
+def _error(status: int, message: str) -> JSONResponse:
+    return JSONResponse({'status': status, 'message': message, 'error': message}, status_code=status)
+
+
+async def _body(request: Request) -> Any:
+    """JSON body, or the form fields of a multipart/urlencoded body."""
+    content_type = request.headers.get('content-type', '')
+    if content_type.startswith(('multipart/', 'application/x-www-form-urlencoded')):
+        form = await request.form()
+        return {key: value for key, value in form.items() if isinstance(value, str)}
+    raw = await request.body()
+    if not raw:
+        return {}
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return raw.decode('utf-8', 'replace')
+
+
+class StubData:
+    """In-memory users, profiles, organizations, programs and employers."""
+
+    def __init__(self, trainees: int = 200, organizations: int = 20, token_ttl: float = 900):
+        self.token_ttl = token_ttl
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.users_by_email: Dict[str, str] = {}
+        self.trainees: Dict[str, Dict[str, Any]] = {}          # user id -> trainee profile
+        self.trainee_items: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}  # profile id -> list -> items
+        self.items: Dict[str, Dict[str, Any]] = {}             # item id -> education/experience/... item
+        self.organizations: Dict[str, Dict[str, Any]] = {}
+        self.programs: Dict[str, List[Dict[str, Any]]] = {}    # organization id -> programs
+        self.employers: Dict[str, Dict[str, Any]] = {}         # user id -> employer profile
+        self.access_tokens: Dict[str, tuple] = {}              # token -> (user id, expiry)
+        self.refresh_tokens: Dict[str, str] = {}               # token -> user id
+        self._seed(trainees, organizations)
+
+    def _seed(self, trainees: int, organizations: int):
+        rng = random.Random(7)
+        for i in range(organizations):
+            owner = self.add_user(f'institution{i}@dompell.test', f'Institution Admin {i}', 'INSTITUTION')
+            org_id = str(uuid.UUID(int=rng.getrandbits(128)))
+            self.organizations[org_id] = {
+                'id': org_id, 'userId': owner['id'], 'name': f'Dompell Academy {i}',
+                'description': 'Hands-on training in software, data and design.',
+                'city': rng.choice(['Accra', 'Kumasi', 'Lagos', 'Nairobi']), 'country': 'Ghana',
+                'industry': rng.choice(['Technology', 'Finance', 'Health']), 'createdAt': '2025-01-01T00:00:00Z',
+            }
+            self.programs[org_id] = [{
+                'id': str(uuid.UUID(int=rng.getrandbits(128))), 'organizationId': org_id,
+                'title': f'{topic} Bootcamp', 'description': f'Twelve weeks of {topic.lower()}.',
+                'startDate': '2026-01-15', 'duration': '12 weeks', 'status': 'UPCOMING',
+            } for topic in ('Python', 'Data Analysis', 'UX Design')]
+        for i in range(max(1, organizations // 4)):
+            user = self.add_user(f'employer{i}@dompell.test', f'Employer {i}', 'EMPLOYER')
+            self.employers[user['id']] = {'id': str(uuid.uuid4()), 'userId': user['id'],
+                                          'companyName': f'Employer {i} Ltd', 'industry': 'Technology'}
+        for i in range(trainees):
+            user = self.add_user(f'bench{i}@dompell.test', f'Bench Trainee {i}', 'TRAINEE')
+            profile = self.save_trainee(user['id'], {
+                'headline': 'Junior Python Developer', 'bio': 'Building web apps with NiceGUI and FastAPI.',
+                'location': rng.choice(['Accra, Ghana', 'Lagos, Nigeria', 'Nairobi, Kenya']),
+                'github': f'https://github.com/bench{i}', 'portfolio': f'https://bench{i}.dompell.test',
+                'skills': ['Python', 'SQL', 'Git'],
+            })
+            for kind, fields in (
+                ('education', {'institution': 'University of Ghana', 'degree': 'BSc Computer Science'}),
+                ('experience', {'company': 'Dompell Labs', 'title': 'Intern'}),
+                ('certification', {'name': 'Python Fundamentals', 'issuer': 'Dompell Academy'}),
+                ('portfolio', {'title': 'Job board', 'url': 'https://example.com'}),
+            ):
+                self.add_item(profile['id'], kind, fields)
+
+    # ----- users and tokens -----
+
+    def add_user(self, email: str, name: str, role: str) -> Dict[str, Any]:
+        user = {'id': str(uuid.uuid4()), 'email': email, 'name': name, 'role': role,
+                'isVerified': True, 'createdAt': '2025-01-01T00:00:00Z'}
+        self.users[user['id']] = user
+        self.users_by_email[email] = user['id']
+        return user
+
+    def issue_tokens(self, user_id: str) -> Dict[str, str]:
+        now = int(time.time())
+        expires = now + int(self.token_ttl)
+        claims = {'sub': user_id, 'role': self.users[user_id]['role'], 'iat': now, 'exp': expires,
+                  'jti': secrets.token_hex(8)}
+        access = f"{_b64({'alg': 'HS256', 'typ': 'JWT'})}.{_b64(claims)}.{secrets.token_urlsafe(32)}"
+        refresh = secrets.token_urlsafe(48)
+        self.access_tokens[access] = (user_id, expires)
+        self.refresh_tokens[refresh] = user_id
+        return {'accessToken': access, 'refreshToken': refresh}
+
+    def authenticate(self, request: Request) -> Optional[str]:
+        """User id of a valid Bearer token, or None."""
+        header = request.headers.get('authorization', '')
+        if not header.lower().startswith('bearer '):
+            return None
+        entry = self.access_tokens.get(header[7:].strip())
+        if entry is None or entry[1] < time.time():
+            return None
+        return entry[0]
+
+    def user_view(self, user_id: str) -> Dict[str, Any]:
+        user = dict(self.users[user_id])
+        if user_id in self.trainees:
+            user['traineeProfile'] = self.trainee_view(user_id)
+        if user_id in self.employers:
+            user['employerProfile'] = self.employers[user_id]
+        return user
+
+    # ----- trainee profiles -----
+
+    def save_trainee(self, user_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        profile = self.trainees.get(user_id)
+        if profile is None:
+            profile = self.trainees[user_id] = {'id': str(uuid.uuid4()), 'userId': user_id, 'skills': []}
+            self.trainee_items[profile['id']] = {kind: [] for kind in TRAINEE_LISTS}
+        profile.update({key: value for key, value in fields.items() if key not in ('id', 'userId')})
+        return profile
+
+    def trainee_view(self, user_id: str) -> Dict[str, Any]:
+        # Items are served by the list endpoints; 'portfolio' on the profile is a URL
+        return dict(self.trainees[user_id])
+
+    def add_item(self, profile_id: str, kind: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        item = dict(fields, id=str(uuid.uuid4()), traineeProfileId=profile_id)
+        self.trainee_items[profile_id][kind].append(item)
+        self.items[item['id']] = item
+        return item
+
+    def remove_item(self, item_id: str) -> bool:
+        item = self.items.pop(item_id, None)
+        if item is None:
+            return False
+        for items in self.trainee_items.get(item['traineeProfileId'], {}).values():
+            if item in items:
+                items.remove(item)
+        return True
+
+
+def create_app(data: StubData, faults: FaultSettings) -> FastAPI:
+    app = FastAPI(title='Dompell stand-in backend')
+    stats: Counter = Counter()
+
+    @app.middleware('http')
+    async def inject_faults(request: Request, call_next):
+        if not request.url.path.startswith(API_PREFIX):
+            return await call_next(request)
+        stats[f'{request.method} {request.url.path}'] += 1
+        delay = faults.latency_ms + (random.uniform(0, faults.jitter_ms) if faults.jitter_ms else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if faults.error_rate and random.random() < faults.error_rate:
+            return _error(faults.error_status, 'Injected error')
+        return await call_next(request)
+
+    def authorized(request: Request) -> Optional[str]:
+        return data.authenticate(request)
+
+    def unauthorized() -> JSONResponse:
+        return _error(401, 'Unauthorized')
+
+    # ----- stub control -----
+
+    @app.get('/_stub/config')
+    def get_config():
+        return faults.as_dict()
+
+    @app.post('/_stub/config')
+    async def set_config(request: Request):
+        faults.update(await _body(request) or {})
+        return faults.as_dict()
+
+    @app.get('/_stub/stats')
+    def get_stats():
+        return {'requests': sum(stats.values()), 'endpoints': dict(stats.most_common())}
+
+    @app.get(API_PREFIX)
+    def api_status():
+        return {'status': 'ok'}
+
+    # ----- auth -----
+
+    @app.post(f'{API_PREFIX}/auth/login')
+    async def login(request: Request):
+        body = await _body(request)
+        user_id = data.users_by_email.get(str(body.get('email', '')).strip().lower())
+        if user_id is None or body.get('password') != SEED_PASSWORD:
+            return _error(401, 'Invalid email or password')
+        return _envelope({'user': data.users[user_id], 'token': data.issue_tokens(user_id)},
+                         message='Login successful')
+
+    @app.post(f'{API_PREFIX}/auth/refresh-token')
+    async def refresh_token(request: Request):
+        body = await _body(request)
+        token = body.get('refreshToken') if isinstance(body, dict) else body
+        user_id = data.refresh_tokens.pop(token, None) if isinstance(token, str) else None
+        if user_id is None:
+            return _error(401, 'Invalid refresh token')
+        return _envelope(data.issue_tokens(user_id))
+
+    @app.post(f'{API_PREFIX}/auth/register')
+    async def register(request: Request):
+        body = await _body(request)
+        email = str(body.get('email', '')).strip().lower()
+        if not email or email in data.users_by_email:
+            return _error(400, 'Email already registered')
+        data.add_user(email, body.get('name') or email, (body.get('role') or 'TRAINEE').upper())
+        return _envelope({'token': secrets.token_urlsafe(24)}, status=201, message='Account created')
+
+    @app.post(f'{API_PREFIX}/auth/{{action}}')
+    async def auth_action(action: str):
+        # verify-account, forgot-password, reset-password, resend-code, resend-email
+        return _envelope({}, message=f'{action} accepted')
+
+    # ----- users -----
+
+    @app.get(f'{API_PREFIX}/users/all')
+    def all_users(request: Request):
+        if not authorized(request):
+            return unauthorized()
+        return _envelope(list(data.users.values()))
+
+    @app.get(f'{API_PREFIX}/users/{{user_id}}')
+    def get_user(user_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        if user_id not in data.users:
+            return _error(404, 'User not found')
+        return _envelope(data.user_view(user_id))
+
+    @app.patch(f'{API_PREFIX}/users/{{user_id}}')
+    async def update_user(user_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        if user_id not in data.users:
+            return _error(404, 'User not found')
+        body = await _body(request)
+        data.users[user_id].update({k: v for k, v in body.items() if k in ('name', 'email', 'phone')})
+        return _envelope(data.user_view(user_id))
+
+    @app.delete(f'{API_PREFIX}/users/{{user_id}}')
+    def delete_user(user_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        user = data.users.pop(user_id, None)
+        if user is not None:
+            data.users_by_email.pop(user['email'], None)
+        return _envelope({})
+
+    # ----- trainee -----
+
+    @app.get(f'{API_PREFIX}/trainee')
+    def list_trainees(request: Request):
+        if not authorized(request):
+            return unauthorized()
+        return _envelope([dict(data.trainee_view(uid), user=data.users[uid]) for uid in data.trainees])
+
+    @app.post(f'{API_PREFIX}/trainee/create/{{user_id}}')
+    async def create_trainee(user_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        if user_id not in data.users:
+            return _error(404, 'User not found')
+        return _envelope(data.save_trainee(user_id, await _body(request)), status=201)
+
+    @app.post(f'{API_PREFIX}/trainee/skill/{{profile_id}}')
+    async def add_skill(profile_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        body = await _body(request)
+        for profile in data.trainees.values():
+            if profile['id'] == profile_id:
+                skill = {'id': str(uuid.uuid4()), 'name': body.get('name', '')}
+                profile['skills'].append(skill)
+                return _envelope(skill, status=201)
+        return _error(404, 'Trainee profile not found')
+
+    @app.api_route(f'{API_PREFIX}/trainee/skill/{{skill_id}}', methods=['PATCH'])
+    @app.api_route(f'{API_PREFIX}/trainee/skill/{{skill_id}}/{{profile_id}}', methods=['DELETE'])
+    async def change_skill(skill_id: str, request: Request, profile_id: str = ''):
+        if not authorized(request):
+            return unauthorized()
+        return _envelope({'id': skill_id})
+
+    @app.post(f'{API_PREFIX}/trainee/{{kind}}/create/{{profile_id}}')
+    async def create_item(kind: str, profile_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        if kind not in TRAINEE_LISTS or profile_id not in data.trainee_items:
+            return _error(404, 'Not found')
+        return _envelope(data.add_item(profile_id, kind, await _body(request)), status=201)
+
+    @app.get(f'{API_PREFIX}/trainee/{{kind}}/{{item_id}}')
+    def get_items(kind: str, item_id: str, request: Request):
+        # The backend uses the same path for "list of a profile" and "one item"
+        if not authorized(request):
+            return unauthorized()
+        if kind not in TRAINEE_LISTS:
+            return _error(404, 'Not found')
+        if item_id in data.trainee_items:
+            return _envelope(data.trainee_items[item_id][kind])
+        item = data.items.get(item_id)
+        return _envelope(item) if item else _error(404, 'Not found')
+
+    @app.patch(f'{API_PREFIX}/trainee/{{kind}}/{{item_id}}')
+    async def update_item(kind: str, item_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        item = data.items.get(item_id)
+        if item is None:
+            return _error(404, 'Not found')
+        item.update({k: v for k, v in (await _body(request)).items() if k not in ('id', 'traineeProfileId')})
+        return _envelope(item)
+
+    @app.delete(f'{API_PREFIX}/trainee/{{kind}}/{{item_id}}')
+    def delete_item(kind: str, item_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        return _envelope({}) if data.remove_item(item_id) else _error(404, 'Not found')
+
+    @app.get(f'{API_PREFIX}/trainee/{{user_id}}')
+    def get_trainee(user_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        if user_id not in data.trainees:
+            return _error(404, 'Trainee profile not found')
+        return _envelope(data.trainee_view(user_id))
+
+    @app.delete(f'{API_PREFIX}/trainee/{{trainee_id}}')
+    def delete_trainee(trainee_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        for user_id, profile in list(data.trainees.items()):
+            if profile['id'] == trainee_id:
+                del data.trainees[user_id]
+        return _envelope({})
+
+    # ----- organizations and programs -----
+
+    @app.get(f'{API_PREFIX}/organization')
+    def list_organizations(request: Request):
+        if not authorized(request):
+            return unauthorized()
+        return _envelope(list(data.organizations.values()))
+
+    @app.post(f'{API_PREFIX}/organization/create/{{user_id}}')
+    async def create_organization(user_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        organization = dict(await _body(request), id=str(uuid.uuid4()), userId=user_id)
+        data.organizations[organization['id']] = organization
+        data.programs[organization['id']] = []
+        return _envelope(organization, status=201)
+
+    @app.get(f'{API_PREFIX}/organization/programs/{{org_id}}')
+    def organization_programs(org_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        return _envelope(data.programs.get(org_id, []))
+
+    @app.get(f'{API_PREFIX}/organization/{{org_id}}')
+    def get_organization(org_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        organization = data.organizations.get(org_id)
+        return _envelope(organization) if organization else _error(404, 'Organization not found')
+
+    @app.delete(f'{API_PREFIX}/organization/{{org_id}}')
+    def delete_organization(org_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        data.organizations.pop(org_id, None)
+        data.programs.pop(org_id, None)
+        return _envelope({})
+
+    def _programs_of(user_id: str) -> List[Dict[str, Any]]:
+        return [program for org_id, org in data.organizations.items() if org['userId'] == user_id
+                for program in data.programs.get(org_id, [])]
+
+    @app.post(f'{API_PREFIX}/programs/create/{{user_id}}')
+    async def create_program(user_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        org_id = next((oid for oid, org in data.organizations.items() if org['userId'] == user_id), None)
+        if org_id is None:
+            return _error(404, 'Organization not found')
+        program = dict(await _body(request), id=str(uuid.uuid4()), organizationId=org_id)
+        data.programs[org_id].append(program)
+        return _envelope(program, status=201)
+
+    @app.get(f'{API_PREFIX}/programs/new/{{user_id}}')
+    @app.get(f'{API_PREFIX}/programs/upcoming/{{user_id}}')
+    def user_programs(user_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        return _envelope(_programs_of(user_id))
+
+    # ----- employers -----
+
+    @app.get(f'{API_PREFIX}/employer')
+    def list_employers(request: Request):
+        if not authorized(request):
+            return unauthorized()
+        return _envelope(list(data.employers.values()))
+
+    @app.post(f'{API_PREFIX}/employer/create/{{user_id}}')
+    async def create_employer(user_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        employer = dict(await _body(request), id=str(uuid.uuid4()), userId=user_id)
+        data.employers[user_id] = employer
+        return _envelope(employer, status=201)
+
+    @app.get(f'{API_PREFIX}/employer/{{employer_id}}')
+    def get_employer(employer_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        employer = data.employers.get(employer_id) or next(
+            (e for e in data.employers.values() if e['id'] == employer_id), None)
+        return _envelope(employer) if employer else _error(404, 'Employer not found')
+
+    @app.delete(f'{API_PREFIX}/employer/{{employer_id}}')
+    def delete_employer(employer_id: str, request: Request):
+        if not authorized(request):
+            return unauthorized()
+        data.employers.pop(employer_id, None)
+        return _envelope({})
+
+    # ----- uploads -----
+
+    @app.post(f'{API_PREFIX}/upload')
+    async def upload(request: Request):
+        if not authorized(request):
+            return unauthorized()
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+        name = f'{uuid.uuid4().hex}'
+        return _envelope({'url': f'{request.base_url}uploads/{name}', 'key': name, 'size': size}, status=201)
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a local stand-in for the Dompell backend.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8900)
+    parser.add_argument('--latency', type=float, default=0.0, help='added latency per request in ms')
+    parser.add_argument('--jitter', type=float, default=0.0, help='random extra latency up to this many ms')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of requests answered with an error')
+    parser.add_argument('--error-status', type=int, default=503, help='status code of injected errors')
+    parser.add_argument('--users', type=int, default=200, help='seeded trainee accounts')
+    parser.add_argument('--organizations', type=int, default=20, help='seeded organizations')
+    parser.add_argument('--token-ttl', type=float, default=900, help='access token lifetime in seconds')
+    args = parser.parse_args()
+
+    import uvicorn
+
+    app = create_app(StubData(args.users, args.organizations, args.token_ttl),
+                     FaultSettings(args.latency, args.jitter, args.error_rate, args.error_status))
+    print(f"[STUB] Serving {API_PREFIX} on http://{args.host}:{args.port} "
+          f"({args.users} trainee accounts, password {SEED_PASSWORD!r})")
+    uvicorn.run(app, host=args.host, port=args.port, log_level='warning')
+
+
+if __name__ == '__main__':
+    main()